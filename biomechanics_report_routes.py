@@ -0,0 +1,81 @@
+"""
+Biomechanics Report Routes
+HTML analysis reports streamed from the compiled Jinja2 template, with
+charts served as content-hashed, immutable assets
+
+POST /api/biomechanics-reports/html       - report for player + analysis data
+GET  /api/biomechanics-reports/charts/... - chart PNG / SVG referenced by the report
+
+Charts are rendered in the chart process pool (matplotlib never runs on
+the event loop) and cached by input, so re-generating a report only
+re-renders the template. Published charts are kept on disk
+(CHART_ASSET_DIR, swept by age and total size), so a linked chart
+outlives the render cache and is served by every worker. With inline_charts the report is one standalone
+file with base64 charts, as the file-based generator produced.
+"""
+
+from typing import Any, Dict, Literal
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
+from pydantic import BaseModel
+import logging
+
+from physics_engine.chart_renderer import get_chart_renderer
+from physics_engine.report_generator import ReportGenerator
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/biomechanics-reports", tags=["Biomechanics Reports"])
+
+# Asset names are content hashes and assets are persisted, so a URL never changes meaning
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class BiomechanicsReportRequest(BaseModel):
+    """Player and analysis data as used by BiomechanicsVisualizer / ReportGenerator"""
+    player: Dict[str, Any]
+    analysis: Dict[str, Any]
+    chart_format: Literal['png', 'svg'] = 'png'
+    inline_charts: bool = False
+
+
+@router.post("/html", response_class=HTMLResponse)
+async def biomechanics_report_html(report: BiomechanicsReportRequest, request: Request):
+    """
+    Render the biomechanics HTML report
+
+    Charts are linked as /charts/<content hash>.<format> (browser-cacheable),
+    or inlined as data URIs when inline_charts is set.
+    """
+    renderer = get_chart_renderer()
+    try:
+        if report.inline_charts:
+            charts = await renderer.report_charts_async(report.player, report.analysis, report.chart_format)
+        else:
+            assets = await renderer.report_chart_assets_async(report.player, report.analysis, report.chart_format)
+            charts = {
+                kind: request.app.url_path_for("biomechanics_report_chart", asset_name=name)
+                for kind, name in assets.items()
+            }
+    except (ValueError, TypeError, KeyError) as e:
+        raise HTTPException(status_code=422, detail=f"Cannot chart analysis data: {e}")
+
+    return StreamingResponse(
+        ReportGenerator().stream_html_report(report.player, report.analysis, charts),
+        media_type="text/html; charset=utf-8"
+    )
+
+
+@router.get("/charts/{asset_name}", name="biomechanics_report_chart")
+def biomechanics_report_chart(asset_name: str, request: Request):
+    """Chart image referenced by a report (PNG or SVG); sync, as it may read from disk"""
+    asset = get_chart_renderer().asset(asset_name)
+    if asset is None:
+        raise HTTPException(status_code=404, detail=f"Chart {asset_name} not found")
+
+    image, media_type = asset
+    headers = {"Cache-Control": ASSET_CACHE_CONTROL, "ETag": f'"{asset_name.split(".")[0]}"'}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(image, media_type=media_type, headers=headers)
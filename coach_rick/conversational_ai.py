@@ -2,17 +2,54 @@
 Coach Rick Conversational AI Module
 Generates natural, encouraging coaching messages using GPT-4
 
+Messages are cached under semantic keys (prompt template + bucketed
+metrics, see response_cache.py) with the player's name factored out, so
+repeat analyses skip the API call. The *_async methods share one pooled
+httpx client, coalesce identical in-flight prompts, and fall back to the
+template message once the latency budget is spent - the analysis
+response is never held up by GPT-4.
+
 Author: Builder 2
 Date: 2024-12-24
 Status: Phase 2 - Day 2
 """
 
+import asyncio
 import os
 import json
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+import httpx
 import requests
 
+try:
+    from .response_cache import ResponseCache, bucket, semantic_key
+except ImportError:
+    from response_cache import ResponseCache, bucket, semantic_key
+from stage_metrics import timed
+
+DEFAULT_LATENCY_BUDGET_SECONDS = 4.0  # Longest the caller waits for GPT-4
+BACKGROUND_TIMEOUT_SECONDS = 30.0     # A late call may still fill the cache
+PLAYER_TOKEN = "{player}"
+FIRST_NAME_TOKEN = "{first_name}"
+
+# Bucket widths shared by the analysis prompt and its cache key, so a
+# cached message never quotes values another player didn't have
+CONFIDENCE_BUCKET = 10          # %
+METRIC_BUCKETS = {
+    'bat_speed_mph': 2,         # mph
+    'exit_velocity_mph': 2,     # mph
+    'efficiency_percent': 5     # %
+}
+
+
+def _bucket_range(value, width: float) -> str:
+    """A metric's bucket as "low-high" text ("N/A" and other non-numbers pass through)"""
+    low = bucket(value, width)
+    if low is value:
+        return str(value)
+    return f"{low:g}-{low + width:g}"
+
 
 @dataclass
 class CoachMessage:
@@ -34,15 +71,35 @@ class ConversationalAI:
     - Drill introductions and motivation
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        latency_budget_seconds: float = DEFAULT_LATENCY_BUDGET_SECONDS,
+        max_connections: int = 10,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         """
         Initialize Conversational AI
         
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            cache: Response cache (a private one is created by default)
+            latency_budget_seconds: Wait at most this long for GPT-4,
+                then use the template message
+            max_connections: Async connection pool size
+            transport: httpx transport override (tests)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.api_url = "https://api.openai.com/v1/chat/completions"
+        self.cache = cache if cache is not None else ResponseCache()
+        self.latency_budget_seconds = latency_budget_seconds
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections
+        )
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
         
         # Coach Rick personality traits
         self.coach_personality = {
@@ -78,9 +135,10 @@ class ConversationalAI:
         prompt = self._build_analysis_prompt(
             player_name, motor_profile, confidence, patterns, metrics
         )
+        cache_key = self._analysis_key(motor_profile, confidence, patterns, metrics)
         
         # Call GPT-4
-        content = self._call_gpt4(prompt, max_tokens=300)
+        content = self._call_gpt4(prompt, max_tokens=300, cache_key=cache_key, player_name=player_name)
         
         return CoachMessage(
             message_type="analysis",
@@ -108,26 +166,10 @@ class ConversationalAI:
             CoachMessage with drill intro
         """
         
-        prompt = f"""
-You are Coach Rick, an experienced hitting coach known for your encouraging approach.
-
-Write a short, motivating introduction for a drill prescription.
-
-Player: {player_name}
-Issue: {primary_issue}
-Drill: {drill_name}
-Expected Gains: {expected_gains}
-
-Guidelines:
-- 2-3 sentences max
-- Acknowledge the issue positively ("I see you're working on...")
-- Explain WHY this drill will help
-- End with encouragement
-
-Keep it conversational and upbeat.
-"""
+        prompt = self._build_drill_prompt(player_name, primary_issue, drill_name, expected_gains)
+        cache_key = semantic_key("drill_intro_v1", issue=primary_issue, drill=drill_name, gains=expected_gains)
         
-        content = self._call_gpt4(prompt, max_tokens=150)
+        content = self._call_gpt4(prompt, max_tokens=150, cache_key=cache_key, player_name=player_name)
         
         return CoachMessage(
             message_type="drill_intro",
@@ -151,14 +193,9 @@ Keep it conversational and upbeat.
             CoachMessage with encouragement
         """
         
-        prompts = {
-            "general": f"Write 1-2 encouraging sentences for {player_name} as Coach Rick, their hitting coach. Be brief and positive.",
-            "improvement": f"Write 1-2 sentences celebrating {player_name}'s recent improvements. Be specific about effort, not results.",
-            "struggle": f"Write 1-2 sentences encouraging {player_name} through a difficult training period. Emphasize process over results."
-        }
-        
-        prompt = prompts.get(context, prompts["general"])
-        content = self._call_gpt4(prompt, max_tokens=100)
+        prompt = self._build_encouragement_prompt(player_name, context)
+        cache_key = semantic_key("encouragement_v1", context=context)
+        content = self._call_gpt4(prompt, max_tokens=100, cache_key=cache_key, player_name=player_name)
         
         return CoachMessage(
             message_type="encouragement",
@@ -166,6 +203,59 @@ Keep it conversational and upbeat.
             player_name=player_name
         )
     
+    # ========================================
+    # ASYNC (request path)
+    # ========================================
+    
+    async def generate_analysis_message_async(
+        self,
+        player_name: str,
+        motor_profile: str,
+        confidence: float,
+        patterns: List[Dict],
+        metrics: Dict
+    ) -> CoachMessage:
+        """generate_analysis_message without blocking the event loop"""
+        prompt = self._build_analysis_prompt(
+            player_name, motor_profile, confidence, patterns, metrics
+        )
+        cache_key = self._analysis_key(motor_profile, confidence, patterns, metrics)
+        content = await self._call_gpt4_async(prompt, max_tokens=300, cache_key=cache_key, player_name=player_name)
+        return CoachMessage(message_type="analysis", content=content, player_name=player_name)
+    
+    async def generate_drill_introduction_async(
+        self,
+        player_name: str,
+        primary_issue: str,
+        drill_name: str,
+        expected_gains: str
+    ) -> CoachMessage:
+        """generate_drill_introduction without blocking the event loop"""
+        prompt = self._build_drill_prompt(player_name, primary_issue, drill_name, expected_gains)
+        cache_key = semantic_key("drill_intro_v1", issue=primary_issue, drill=drill_name, gains=expected_gains)
+        content = await self._call_gpt4_async(prompt, max_tokens=150, cache_key=cache_key, player_name=player_name)
+        return CoachMessage(message_type="drill_intro", content=content, player_name=player_name)
+    
+    async def generate_encouragement_async(
+        self,
+        player_name: str,
+        context: str = "general"
+    ) -> CoachMessage:
+        """generate_encouragement without blocking the event loop"""
+        prompt = self._build_encouragement_prompt(player_name, context)
+        cache_key = semantic_key("encouragement_v1", context=context)
+        content = await self._call_gpt4_async(prompt, max_tokens=100, cache_key=cache_key, player_name=player_name)
+        return CoachMessage(message_type="encouragement", content=content, player_name=player_name)
+    
+    async def aclose(self):
+        """Close the pooled HTTP client"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+    
+    # ========================================
+    # PROMPTS & CACHE KEYS
+    # ========================================
+    
     def _build_analysis_prompt(
         self,
         player_name: str,
@@ -181,17 +271,19 @@ Keep it conversational and upbeat.
         for p in patterns[:2]:  # Top 2 patterns
             patterns_text += f"- {p['name']}: {p['description']}\n"
         
-        # Format key metrics
-        bat_speed = metrics.get('bat_speed_mph', 'N/A')
-        exit_velo = metrics.get('exit_velocity_mph', 'N/A')
-        efficiency = metrics.get('efficiency_percent', 'N/A')
+        # Format key metrics as the cache key's buckets (the message is
+        # shared by every swing in them)
+        bat_speed, exit_velo, efficiency = (
+            _bucket_range(metrics.get(name, 'N/A'), width) for name, width in METRIC_BUCKETS.items()
+        )
+        confidence_range = _bucket_range(confidence, CONFIDENCE_BUCKET)
         
         prompt = f"""
 You are Coach Rick, an experienced hitting coach with 20+ years working with players from Little League to MLB.
 
 Analyze this swing for {player_name}:
 
-MOTOR PROFILE: {motor_profile} (Confidence: {confidence:.0f}%)
+MOTOR PROFILE: {motor_profile} (Confidence: {confidence_range}%)
 
 KEY METRICS:
 - Bat Speed: {bat_speed} mph
@@ -212,16 +304,105 @@ Guidelines:
 - Be conversational, not clinical
 - Use baseball terminology naturally
 - Stay positive and encouraging
+- Quote metrics only as the ranges given above
 - Keep it under 100 words
 """
         
         return prompt
     
+    def _build_drill_prompt(
+        self,
+        player_name: str,
+        primary_issue: str,
+        drill_name: str,
+        expected_gains: str
+    ) -> str:
+        """Build GPT-4 prompt for a drill introduction"""
+        
+        prompt = f"""
+You are Coach Rick, an experienced hitting coach known for your encouraging approach.
+
+Write a short, motivating introduction for a drill prescription.
+
+Player: {player_name}
+Issue: {primary_issue}
+Drill: {drill_name}
+Expected Gains: {expected_gains}
+
+Guidelines:
+- 2-3 sentences max
+- Acknowledge the issue positively ("I see you're working on...")
+- Explain WHY this drill will help
+- End with encouragement
+
+Keep it conversational and upbeat.
+"""
+        
+        return prompt
+    
+    def _build_encouragement_prompt(self, player_name: str, context: str) -> str:
+        """Build GPT-4 prompt for encouragement"""
+        
+        prompts = {
+            "general": f"Write 1-2 encouraging sentences for {player_name} as Coach Rick, their hitting coach. Be brief and positive.",
+            "improvement": f"Write 1-2 sentences celebrating {player_name}'s recent improvements. Be specific about effort, not results.",
+            "struggle": f"Write 1-2 sentences encouraging {player_name} through a difficult training period. Emphasize process over results."
+        }
+        
+        return prompts.get(context, prompts["general"])
+    
+    def _analysis_key(
+        self,
+        motor_profile: str,
+        confidence: float,
+        patterns: List[Dict],
+        metrics: Dict
+    ) -> str:
+        """
+        Semantic cache key for an analysis message
+        
+        Swings with the same profile and top patterns whose metrics fall in
+        the same buckets (2 mph, 5% efficiency, 10% confidence) share one
+        message; the prompt shows those buckets, not the exact values. The
+        player's name is not part of the key.
+        """
+        return semantic_key(
+            "analysis_v2",
+            motor_profile=motor_profile,
+            confidence=bucket(confidence, CONFIDENCE_BUCKET),
+            patterns=[p.get('pattern_id', p['name']) for p in patterns[:2]],
+            bat_speed=bucket(metrics.get('bat_speed_mph', 'N/A'), METRIC_BUCKETS['bat_speed_mph']),
+            exit_velo=bucket(metrics.get('exit_velocity_mph', 'N/A'), METRIC_BUCKETS['exit_velocity_mph']),
+            efficiency=bucket(metrics.get('efficiency_percent', 'N/A'), METRIC_BUCKETS['efficiency_percent'])
+        )
+    
+    def _depersonalize(self, content: str, player_name: Optional[str]) -> str:
+        """Replace the player's name with tokens before caching"""
+        if not player_name:
+            return content
+        content = content.replace(player_name, PLAYER_TOKEN)
+        first_name = player_name.split()[0]
+        if first_name != player_name:
+            content = content.replace(first_name, FIRST_NAME_TOKEN)
+        return content
+    
+    def _personalize(self, content: str, player_name: Optional[str]) -> str:
+        """Fill the name tokens of a cached message"""
+        if not player_name:
+            return content
+        return content.replace(PLAYER_TOKEN, player_name).replace(FIRST_NAME_TOKEN, player_name.split()[0])
+    
+    # ========================================
+    # GPT-4 CALLS
+    # ========================================
+    
     def _call_gpt4(
         self,
         prompt: str,
         max_tokens: int = 200,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        cache_key: Optional[str] = None,
+        player_name: Optional[str] = None
     ) -> str:
         """
         Call OpenAI GPT-4 API
@@ -230,15 +411,115 @@ Guidelines:
             prompt: System prompt
             max_tokens: Max response length
             temperature: Creativity (0-1)
+            cache_key: Semantic cache key (defaults to the exact prompt)
+            player_name: Name factored out of the cached message
         
         Returns:
             Generated text
         """
         
         # FALLBACK MODE: If no API key, return template response
-        if not self.api_key or self.api_key == "your-openai-key-here":
+        if not self._has_api_key():
+            return self._generate_fallback_message(prompt)
+        
+        cache_key = cache_key or semantic_key("prompt", prompt=prompt, max_tokens=max_tokens)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return self._personalize(cached, player_name)
+        
+        headers, data = self._request_payload(prompt, max_tokens, temperature)
+        
+        try:
+            with timed("http.openai"):
+                response = requests.post(
+                    self.api_url,
+                    headers=headers,
+                    json=data,
+                    timeout=self.latency_budget_seconds
+                )
+                response.raise_for_status()
+            content = self._parse_content(response.json())
+            
+        except Exception as e:
+            print(f"⚠️  GPT-4 API Error: {e}")
+            print("    Falling back to template responses...")
             return self._generate_fallback_message(prompt)
         
+        self.cache.put(cache_key, self._depersonalize(content, player_name))
+        return content
+    
+    async def _call_gpt4_async(
+        self,
+        prompt: str,
+        max_tokens: int = 200,
+        temperature: float = 0.7,
+        cache_key: Optional[str] = None,
+        player_name: Optional[str] = None
+    ) -> str:
+        """
+        Async GPT-4 call with caching, coalescing and a latency budget
+        
+        Identical in-flight prompts (same cache key) share one API call.
+        If the call has not finished within latency_budget_seconds the
+        template message is returned; the call keeps running and caches
+        its result for the next request.
+        """
+        if not self._has_api_key():
+            return self._generate_fallback_message(prompt)
+        
+        cache_key = cache_key or semantic_key("prompt", prompt=prompt, max_tokens=max_tokens)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return self._personalize(cached, player_name)
+        
+        task = self.cache.load(
+            cache_key,
+            lambda: self._fetch_gpt4_async(prompt, max_tokens, temperature, player_name)
+        )
+        try:
+            content = await asyncio.wait_for(asyncio.shield(task), self.latency_budget_seconds)
+        except asyncio.TimeoutError:
+            print(f"⚠️  GPT-4 over {self.latency_budget_seconds}s latency budget, using template response")
+            return self._generate_fallback_message(prompt)
+        
+        if content is None:
+            return self._generate_fallback_message(prompt)
+        return self._personalize(content, player_name)
+    
+    async def _fetch_gpt4_async(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        player_name: Optional[str]
+    ) -> Optional[str]:
+        """One API call; returns the depersonalized text, or None on error"""
+        headers, data = self._request_payload(prompt, max_tokens, temperature)
+        try:
+            with timed("http.openai"):
+                response = await self._get_client().post(self.api_url, headers=headers, json=data)
+                response.raise_for_status()
+            content = self._parse_content(response.json())
+        except Exception as e:
+            print(f"⚠️  GPT-4 API Error: {e}")
+            print("    Falling back to template responses...")
+            return None
+        return self._depersonalize(content, player_name)
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(BACKGROUND_TIMEOUT_SECONDS, connect=2.0),
+                limits=self.limits,
+                transport=self.transport
+            )
+        return self._client
+    
+    def _has_api_key(self) -> bool:
+        return bool(self.api_key) and self.api_key != "your-openai-key-here"
+    
+    def _request_payload(self, prompt: str, max_tokens: int, temperature: float) -> Tuple[Dict, Dict]:
+        """Headers and body for a chat completion request"""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -253,24 +534,10 @@ Guidelines:
             "max_tokens": max_tokens,
             "temperature": temperature
         }
-        
-        try:
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            content = result['choices'][0]['message']['content'].strip()
-            return content
-            
-        except Exception as e:
-            print(f"⚠️  GPT-4 API Error: {e}")
-            print("    Falling back to template responses...")
-            return self._generate_fallback_message(prompt)
+        return headers, data
+    
+    def _parse_content(self, result: Dict) -> str:
+        return result['choices'][0]['message']['content'].strip()
     
     def _generate_fallback_message(self, prompt: str) -> str:
         """
@@ -307,6 +574,18 @@ Guidelines:
             return "Looking good! Let's keep building on this foundation. I'm here to help you reach the next level."
 
 
+# Shared instance for the API (one cache and connection pool per worker)
+_conversational_ai: Optional[ConversationalAI] = None
+
+
+def get_conversational_ai() -> ConversationalAI:
+    """Get singleton Conversational AI"""
+    global _conversational_ai
+    if _conversational_ai is None:
+        _conversational_ai = ConversationalAI()
+    return _conversational_ai
+
+
 # ============================================================================
 # TESTING
 # ============================================================================
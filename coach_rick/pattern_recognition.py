@@ -10,18 +10,28 @@ Uses rule-based pattern matching to diagnose:
 - Torquer-specific patterns
 - Universal patterns (any motor profile)
 
+The rule set is compiled once into a PatternRulePlan: every metric the
+rules reference gets one extractor (run once per swing), every condition
+becomes a predicate closure, and rules are pre-sorted by priority. The
+same plan evaluates many swings at once as NumPy masks (analyze_batch /
+analyze_session) for session-level diagnostics.
+
 Author: Builder 2
 Date: 2024-12-24
 """
 
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, field
+
+import numpy as np
 
 try:
     from .knowledge_base import PATTERN_RULES
 except ImportError:
     from knowledge_base import PATTERN_RULES
 
+PRIORITY_ORDER = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
+
 
 @dataclass
 class PatternMatch:
@@ -34,6 +44,233 @@ class PatternMatch:
     confidence: float = 1.0
 
 
+@dataclass
+class SessionPattern:
+    """A pattern's frequency across a session of swings"""
+    pattern_id: str
+    diagnosis: str
+    root_cause: str
+    priority: str
+    swings_matched: int
+    match_rate: float  # 0-1
+    swing_indices: List[int] = field(default_factory=list)
+
+
+# ============================================================
+# METRIC EXTRACTION
+# ============================================================
+
+def _hip_shoulder_gap(kinematic_seq: Dict) -> Optional[float]:
+    """Time gap between hip and shoulder peaks (ms)"""
+    # Try specific keys first
+    if 'hips_peak_time' in kinematic_seq and 'shoulders_peak_time' in kinematic_seq:
+        return abs(kinematic_seq['shoulders_peak_time'] - kinematic_seq['hips_peak_time'])
+    
+    # Fallback to torso/arms
+    if 'torso_peak_ms' in kinematic_seq and 'arms_peak_ms' in kinematic_seq:
+        return abs(kinematic_seq['arms_peak_ms'] - kinematic_seq['torso_peak_ms'])
+    
+    return None
+
+
+def _hands_bat_gap(kinematic_seq: Dict) -> Optional[float]:
+    """Time gap between hands and bat peaks (ms)"""
+    # Try specific keys first
+    if 'hands_peak_time' in kinematic_seq and 'bat_peak_time' in kinematic_seq:
+        return abs(kinematic_seq['bat_peak_time'] - kinematic_seq['hands_peak_time'])
+    
+    # Fallback to arms/bat
+    if 'arms_peak_ms' in kinematic_seq and 'bat_peak_ms' in kinematic_seq:
+        return abs(kinematic_seq['bat_peak_ms'] - kinematic_seq['arms_peak_ms'])
+    
+    return None
+
+
+# Computed metrics (anything else is a dotted path into swing_data)
+COMPUTED_METRICS: Dict[str, Callable[[Dict], Optional[float]]] = {
+    'hip_shoulder_gap_ms': lambda swing: _hip_shoulder_gap(swing.get('kinematic_sequence', {})),
+    'hands_bat_gap_ms': lambda swing: _hands_bat_gap(swing.get('kinematic_sequence', {})),
+    'tempo_ratio': lambda swing: swing.get('tempo', {}).get('ratio'),
+    'stability_score': lambda swing: swing.get('stability', {}).get('score'),
+    'sequence_grade': lambda swing: swing.get('kinematic_sequence', {}).get('grade'),
+}
+
+
+def _path_extractor(metric: str) -> Callable[[Dict], Optional[float]]:
+    """Extractor for nested keys like 'tempo.ratio' (split once, at compile time)"""
+    keys = tuple(metric.split('.'))
+    
+    def extract(swing_data: Dict):
+        value = swing_data
+        for key in keys:
+            if isinstance(value, dict):
+                value = value.get(key)
+            else:
+                return None
+            if value is None:
+                return None
+        return value
+    
+    return extract
+
+
+def metric_extractor(metric: str) -> Callable[[Dict], Optional[float]]:
+    return COMPUTED_METRICS.get(metric) or _path_extractor(metric)
+
+
+# ============================================================
+# COMPILED RULE PLAN
+# ============================================================
+
+def _range_predicate(low: Optional[float], high: Optional[float]) -> Callable[[object], bool]:
+    if low is not None and high is not None:
+        return lambda value: not (value < low or value > high)
+    if low is not None:
+        return lambda value: not value < low
+    if high is not None:
+        return lambda value: not value > high
+    return lambda value: True
+
+
+def _member_predicate(allowed: list) -> Callable[[object], bool]:
+    return lambda value: value in allowed
+
+
+@dataclass
+class CompiledRule:
+    """One PATTERN_RULES entry with its conditions resolved to predicates"""
+    pattern_id: str
+    rule: Dict
+    motor_profile: Optional[str]
+    # (metric slot, predicate) — a missing metric skips its condition
+    predicates: Tuple[Tuple[int, Callable[[object], bool]], ...]
+    # (metric slot, min, max) / (metric slot, allowed values) for batch masks
+    ranges: Tuple[Tuple[int, Optional[float], Optional[float]], ...]
+    members: Tuple[Tuple[int, list], ...]
+    
+    def to_match(self) -> PatternMatch:
+        rule = self.rule
+        return PatternMatch(
+            pattern_id=self.pattern_id,
+            diagnosis=rule['diagnosis'],
+            symptoms=rule['symptoms'],
+            root_cause=rule['root_cause'],
+            priority=rule['priority'],
+            confidence=1.0  # TODO: Calculate confidence based on how well conditions match
+        )
+
+
+class PatternRulePlan:
+    """
+    PATTERN_RULES compiled for evaluation.
+    
+    metrics lists every metric referenced by any rule; extract() reads them
+    from a swing once, in that order. rules are stable-sorted by priority,
+    so matches come out in the order analyze() has always returned.
+    """
+    
+    def __init__(self, rules: Dict[str, Dict]):
+        slots: Dict[str, int] = {}
+        compiled = []
+        for pattern_id, rule in rules.items():
+            predicates, ranges, members = [], [], []
+            for metric, constraint in rule['conditions'].items():
+                if metric == 'motor_profile':
+                    continue
+                slot = slots.setdefault(metric, len(slots))
+                if isinstance(constraint, dict):
+                    # Range constraint (min/max)
+                    low, high = constraint.get('min'), constraint.get('max')
+                    predicates.append((slot, _range_predicate(low, high)))
+                    ranges.append((slot, low, high))
+                elif isinstance(constraint, list):
+                    # List constraint (value must be in list)
+                    predicates.append((slot, _member_predicate(constraint)))
+                    members.append((slot, constraint))
+            compiled.append(CompiledRule(
+                pattern_id=pattern_id,
+                rule=rule,
+                motor_profile=rule['conditions'].get('motor_profile'),
+                predicates=tuple(predicates),
+                ranges=tuple(ranges),
+                members=tuple(members)
+            ))
+        
+        compiled.sort(key=lambda r: PRIORITY_ORDER[r.rule['priority']])
+        self.rules: List[CompiledRule] = compiled
+        self.metrics: List[str] = list(slots)
+        self._extractors = [metric_extractor(metric) for metric in self.metrics]
+        self._range_slots = {slot for rule in compiled for slot, _, _ in rule.ranges}
+    
+    def extract(self, swing_data: Dict) -> List[Optional[object]]:
+        """Every referenced metric for one swing"""
+        return [extract(swing_data) for extract in self._extractors]
+    
+    def evaluate(self, swing_data: Dict, motor_profile: str) -> List[PatternMatch]:
+        """Matches for one swing, priority ordered"""
+        values = self.extract(swing_data)
+        matches = []
+        for rule in self.rules:
+            if rule.motor_profile is not None and rule.motor_profile != motor_profile:
+                continue
+            for slot, predicate in rule.predicates:
+                value = values[slot]
+                if value is not None and not predicate(value):
+                    break
+            else:
+                matches.append(rule.to_match())
+        return matches
+    
+    def match_matrix(self, swings: Sequence[Dict], motor_profiles: Union[str, Sequence[str]]) -> np.ndarray:
+        """
+        Boolean (rules x swings) matrix, one vectorized mask per rule
+        
+        Range metrics become float columns (missing = NaN, which passes
+        every comparison like a skipped condition); list metrics are object
+        columns checked with np.isin.
+        """
+        n = len(swings)
+        columns = [[extract(swing) for swing in swings] for extract in self._extractors]
+        numeric: Dict[int, np.ndarray] = {}
+        for slot in self._range_slots:
+            numeric[slot] = np.array(
+                [np.nan if value is None else value for value in columns[slot]], dtype=float
+            )
+        
+        if isinstance(motor_profiles, str):
+            profiles = np.full(n, motor_profiles, dtype=object)
+        else:
+            profiles = np.asarray(motor_profiles, dtype=object)
+        
+        matrix = np.ones((len(self.rules), n), dtype=bool)
+        for i, rule in enumerate(self.rules):
+            mask = matrix[i]
+            if rule.motor_profile is not None:
+                mask &= profiles == rule.motor_profile
+            for slot, low, high in rule.ranges:
+                column = numeric[slot]
+                if low is not None:
+                    mask &= ~(column < low)
+                if high is not None:
+                    mask &= ~(column > high)
+            for slot, allowed in rule.members:
+                column = np.array(columns[slot], dtype=object)
+                present = column != None  # noqa: E711 (elementwise)
+                mask &= ~present | np.isin(column, allowed)
+        return matrix
+
+
+_default_plan: Optional[PatternRulePlan] = None
+
+
+def get_default_plan() -> PatternRulePlan:
+    """Compiled PATTERN_RULES, shared by every engine using the default rules"""
+    global _default_plan
+    if _default_plan is None:
+        _default_plan = PatternRulePlan(PATTERN_RULES)
+    return _default_plan
+
+
 class PatternRecognitionEngine:
     """
     Pattern recognition engine for diagnosing mechanical issues.
@@ -41,10 +278,16 @@ class PatternRecognitionEngine:
     Uses rule-based pattern matching against PATTERN_RULES from knowledge base.
     """
     
-    def __init__(self):
+    def __init__(self, rules: Optional[Dict[str, Dict]] = None):
         """Initialize pattern recognition engine"""
-        self.rules = PATTERN_RULES
-        self.priority_order = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
+        self.rules = PATTERN_RULES if rules is None else rules
+        self.priority_order = PRIORITY_ORDER
+        self.plan = get_default_plan() if rules is None else PatternRulePlan(rules)
+    
+    def compile(self) -> PatternRulePlan:
+        """Recompile the plan (call after editing self.rules in place)"""
+        self.plan = PatternRulePlan(self.rules)
+        return self.plan
     
     def analyze(self, swing_data: Dict, motor_profile: str) -> List[PatternMatch]:
         """
@@ -57,23 +300,61 @@ class PatternRecognitionEngine:
         Returns:
             List of PatternMatch objects, sorted by priority
         """
-        matched_patterns = []
+        return self.plan.evaluate(swing_data, motor_profile)
+    
+    def analyze_batch(
+        self,
+        swings: Sequence[Dict],
+        motor_profiles: Union[str, Sequence[str]]
+    ) -> List[List[PatternMatch]]:
+        """
+        Analyze many swings at once.
         
-        for pattern_id, pattern_rule in self.rules.items():
-            if self._matches_conditions(swing_data, motor_profile, pattern_rule['conditions']):
-                matched_patterns.append(PatternMatch(
-                    pattern_id=pattern_id,
-                    diagnosis=pattern_rule['diagnosis'],
-                    symptoms=pattern_rule['symptoms'],
-                    root_cause=pattern_rule['root_cause'],
-                    priority=pattern_rule['priority'],
-                    confidence=1.0  # TODO: Calculate confidence based on how well conditions match
-                ))
+        Args:
+            swings: Swing analysis data dictionaries
+            motor_profiles: One profile for every swing, or one per swing
         
-        # Sort by priority (HIGH > MEDIUM > LOW)
-        matched_patterns.sort(key=lambda x: self.priority_order[x.priority])
+        Returns:
+            Per swing, the same list analyze() would return
+        """
+        matrix = self.plan.match_matrix(swings, motor_profiles)
+        results: List[List[PatternMatch]] = [[] for _ in swings]
+        for rule, row in zip(self.plan.rules, matrix):
+            for swing_index in np.flatnonzero(row):
+                results[swing_index].append(rule.to_match())
+        return results
+    
+    def analyze_session(
+        self,
+        swings: Sequence[Dict],
+        motor_profiles: Union[str, Sequence[str]]
+    ) -> List[SessionPattern]:
+        """
+        Session-level diagnostics: how often each pattern shows up.
         
-        return matched_patterns
+        Returns:
+            Patterns matched by at least one swing, by priority then
+            match rate (most frequent first)
+        """
+        if not swings:
+            return []
+        matrix = self.plan.match_matrix(swings, motor_profiles)
+        counts = matrix.sum(axis=1)
+        summary = []
+        for rule, row, count in zip(self.plan.rules, matrix, counts):
+            if not count:
+                continue
+            summary.append(SessionPattern(
+                pattern_id=rule.pattern_id,
+                diagnosis=rule.rule['diagnosis'],
+                root_cause=rule.rule['root_cause'],
+                priority=rule.rule['priority'],
+                swings_matched=int(count),
+                match_rate=round(float(count) / len(swings), 3),
+                swing_indices=np.flatnonzero(row).tolist()
+            ))
+        summary.sort(key=lambda p: (self.priority_order[p.priority], -p.swings_matched))
+        return summary
     
     def _matches_conditions(self, swing_data: Dict, motor_profile: str, conditions: Dict) -> bool:
         """
@@ -130,53 +411,15 @@ class PatternRecognitionEngine:
         Returns:
             Metric value or None if not found
         """
-        # Special computed metrics
-        if metric == 'hip_shoulder_gap_ms':
-            return self._calculate_hip_shoulder_gap(swing_data.get('kinematic_sequence', {}))
-        elif metric == 'hands_bat_gap_ms':
-            return self._calculate_hands_bat_gap(swing_data.get('kinematic_sequence', {}))
-        elif metric == 'tempo_ratio':
-            return swing_data.get('tempo', {}).get('ratio')
-        elif metric == 'stability_score':
-            return swing_data.get('stability', {}).get('score')
-        elif metric == 'sequence_grade':
-            return swing_data.get('kinematic_sequence', {}).get('grade')
-        
-        # Handle nested keys like 'tempo.ratio'
-        keys = metric.split('.')
-        value = swing_data
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-            else:
-                return None
-            if value is None:
-                return None
-        return value
+        return metric_extractor(metric)(swing_data)
     
     def _calculate_hip_shoulder_gap(self, kinematic_seq: Dict) -> Optional[float]:
         """Calculate time gap between hip and shoulder peaks (ms)"""
-        # Try specific keys first
-        if 'hips_peak_time' in kinematic_seq and 'shoulders_peak_time' in kinematic_seq:
-            return abs(kinematic_seq['shoulders_peak_time'] - kinematic_seq['hips_peak_time'])
-        
-        # Fallback to torso/arms
-        if 'torso_peak_ms' in kinematic_seq and 'arms_peak_ms' in kinematic_seq:
-            return abs(kinematic_seq['arms_peak_ms'] - kinematic_seq['torso_peak_ms'])
-        
-        return None
+        return _hip_shoulder_gap(kinematic_seq)
     
     def _calculate_hands_bat_gap(self, kinematic_seq: Dict) -> Optional[float]:
         """Calculate time gap between hands and bat peaks (ms)"""
-        # Try specific keys first
-        if 'hands_peak_time' in kinematic_seq and 'bat_peak_time' in kinematic_seq:
-            return abs(kinematic_seq['bat_peak_time'] - kinematic_seq['hands_peak_time'])
-        
-        # Fallback to arms/bat
-        if 'arms_peak_ms' in kinematic_seq and 'bat_peak_ms' in kinematic_seq:
-            return abs(kinematic_seq['bat_peak_ms'] - kinematic_seq['arms_peak_ms'])
-        
-        return None
+        return _hands_bat_gap(kinematic_seq)
 
 
 # Example usage and testing
@@ -0,0 +1,115 @@
+"""
+Coach Rick Response Cache
+=========================
+
+Caches generated coaching messages under semantic keys so repeat
+analyses do not wait on GPT-4.
+
+- Keys are a prompt template ID plus bucketed inputs (see semantic_key):
+  two swings whose metrics land in the same buckets share a message
+- Entries expire after a TTL; the cache holds at most max_entries
+  (least recently used are evicted first)
+- Concurrent requests for the same key share one in-flight call
+  (single-flight), so a burst of identical prompts costs one API call
+
+Usage:
+    cache = ResponseCache(ttl_seconds=3600, max_entries=1000)
+    key = semantic_key("analysis", motor_profile="Spinner", bat_speed=bucket(82, 2))
+    text = cache.get(key)
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 1000
+
+
+def bucket(value, width: float):
+    """Round a numeric value down to its bucket; non-numeric values pass through"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return value
+    return round((value // width) * width, 6)
+
+
+def semantic_key(template_id: str, **fields) -> str:
+    """Stable cache key for a prompt template and its (already bucketed) inputs"""
+    payload = json.dumps(fields, sort_keys=True, default=str)
+    return f"{template_id}:{hashlib.sha1(payload.encode()).hexdigest()}"
+
+
+class ResponseCache:
+    """TTL + LRU response cache with single-flight async loads"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # key -> (text, expires_at)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "loads": 0}
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached text if present and not expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        text, expires_at = entry
+        if self.clock() >= expires_at:
+            del self._entries[key]
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return text
+
+    def put(self, key: str, text: str):
+        self._entries[key] = (text, self.clock() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def load(self, key: str, loader: Callable[[], Awaitable[Optional[str]]]) -> asyncio.Task:
+        """
+        Start (or join) the single in-flight load for a key
+
+        The loader's result is cached unless it is None. The returned task
+        keeps running if a caller stops waiting for it, so a slow call
+        still fills the cache for the next request.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            return task
+
+        async def run() -> Optional[str]:
+            self.stats["loads"] += 1
+            text = await loader()
+            if text is not None:
+                self.put(key, text)
+            return text
+
+        task = asyncio.ensure_future(run())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        return task
+
+    def _forget_inflight(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
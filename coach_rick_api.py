@@ -10,6 +10,7 @@ Date: 2024-12-24
 Status: Phase 4 - Unified API
 """
 
+import asyncio
 import os
 import sys
 import uuid
@@ -23,7 +24,8 @@ import json
 from coach_rick.motor_profile_classifier import classify_motor_profile
 from coach_rick.pattern_recognition import PatternRecognitionEngine
 from coach_rick.drill_prescription import DrillPrescriptionEngine
-from coach_rick.conversational_ai import ConversationalAI
+from coach_rick.conversational_ai import get_conversational_ai
+from stage_metrics import timed
 
 # Reboot Lite components (existing)
 # These would be imported from your existing Reboot Lite API
@@ -175,12 +177,13 @@ async def analyze_swing_with_coach(
         # ====================================================================
         # STEP 2: MOTOR PROFILE CLASSIFICATION
         # ====================================================================
-        motor_profile_result = classify_motor_profile({
-            'hip_shoulder_gap_ms': reboot_lite_metrics['hip_shoulder_gap_ms'],
-            'hands_bat_gap_ms': reboot_lite_metrics['hands_bat_gap_ms'],
-            'tempo_ratio': reboot_lite_metrics['tempo_ratio'],
-            'stability_score': reboot_lite_metrics['stability_score']
-        })
+        with timed("coach_rick.motor_profile"):
+            motor_profile_result = classify_motor_profile({
+                'hip_shoulder_gap_ms': reboot_lite_metrics['hip_shoulder_gap_ms'],
+                'hands_bat_gap_ms': reboot_lite_metrics['hands_bat_gap_ms'],
+                'tempo_ratio': reboot_lite_metrics['tempo_ratio'],
+                'stability_score': reboot_lite_metrics['stability_score']
+            })
         
         motor_profile = MotorProfileResponse(
             type=motor_profile_result.profile,
@@ -193,10 +196,11 @@ async def analyze_swing_with_coach(
         # ====================================================================
         pattern_engine = PatternRecognitionEngine()
         
-        pattern_matches = pattern_engine.analyze(
-            swing_data=reboot_lite_metrics,
-            motor_profile=motor_profile.type
-        )
+        with timed("coach_rick.pattern_recognition"):
+            pattern_matches = pattern_engine.analyze(
+                swing_data=reboot_lite_metrics,
+                motor_profile=motor_profile.type
+            )
         
         # Convert PatternMatch objects to dictionaries for response
         detected_patterns = [
@@ -265,34 +269,38 @@ async def analyze_swing_with_coach(
         # ====================================================================
         # STEP 5: COACH RICK AI MESSAGES
         # ====================================================================
-        coach_ai = ConversationalAI()
-        
-        # Analysis message
-        analysis_msg = coach_ai.generate_analysis_message(
-            player_name=player_name,
-            motor_profile=motor_profile.type,
-            confidence=motor_profile.confidence,
-            patterns=[p.dict() for p in patterns],
-            metrics={
-                'bat_speed_mph': reboot_lite_metrics['bat_speed_mph'],
-                'exit_velocity_mph': reboot_lite_metrics['exit_velocity_mph'],
-                'efficiency_percent': reboot_lite_metrics['efficiency_percent']
-            }
-        )
-        
-        # Drill introduction
-        drill_intro_msg = coach_ai.generate_drill_introduction(
-            player_name=player_name,
-            primary_issue=primary_issue,
-            drill_name=drills[0].name if drills else "Training",
-            expected_gains=prescription.expected_gains
-        )
+        # Shared instance: cached messages and one connection pool per worker.
+        # The three messages are generated concurrently, and each one falls
+        # back to its template if GPT-4 exceeds the latency budget.
+        coach_ai = get_conversational_ai()
         
-        # Encouragement
-        encouragement_msg = coach_ai.generate_encouragement(
-            player_name=player_name,
-            context="general"
-        )
+        with timed("coach_rick.messages"):
+            analysis_msg, drill_intro_msg, encouragement_msg = await asyncio.gather(
+                # Analysis message
+                coach_ai.generate_analysis_message_async(
+                    player_name=player_name,
+                    motor_profile=motor_profile.type,
+                    confidence=motor_profile.confidence,
+                    patterns=[p.dict() for p in patterns],
+                    metrics={
+                        'bat_speed_mph': reboot_lite_metrics['bat_speed_mph'],
+                        'exit_velocity_mph': reboot_lite_metrics['exit_velocity_mph'],
+                        'efficiency_percent': reboot_lite_metrics['efficiency_percent']
+                    }
+                ),
+                # Drill introduction
+                coach_ai.generate_drill_introduction_async(
+                    player_name=player_name,
+                    primary_issue=primary_issue,
+                    drill_name=drills[0].name if drills else "Training",
+                    expected_gains=prescription.expected_gains
+                ),
+                # Encouragement
+                coach_ai.generate_encouragement_async(
+                    player_name=player_name,
+                    context="general"
+                )
+            )
         
         coach_messages = CoachMessagesResponse(
             analysis=analysis_msg.content,
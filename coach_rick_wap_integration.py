@@ -10,7 +10,7 @@ import os
 import sys
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse
 from typing import Optional
 import uvicorn
 
@@ -23,9 +23,11 @@ print(f"PORT env var: {os.getenv('PORT', 'NOT SET')}", file=sys.stderr)
 print(f"Working directory: {os.getcwd()}", file=sys.stderr)
 print("Importing modules...", file=sys.stderr)
 
-# Import Coach Rick API router
-from coach_rick_api import router as coach_rick_router
-print("✓ Imported coach_rick_api", file=sys.stderr)
+# Coach Rick AI and Swing DNA are lazy routers: their engines (httpx,
+# pandas, coach_rick) are imported on first use or by the startup warm-up
+from lazy_routes import include_lazy_router, lazy_router_status, warm_up_lazy_routers
+from compression import add_compression
+from stage_metrics import StageTimingMiddleware, render_metrics, PROMETHEUS_CONTENT_TYPE
 
 # Import Whop integration
 from whop_webhooks import router as whop_webhook_router
@@ -33,10 +35,6 @@ print("✓ Imported whop_webhooks", file=sys.stderr)
 from whop_middleware import router as whop_subscription_router
 print("✓ Imported whop_middleware", file=sys.stderr)
 
-# Import Swing DNA API
-from swing_dna.api import router as swing_dna_router
-print("✓ Imported swing_dna.api", file=sys.stderr)
-
 # Import Session API
 from session_api import router as session_router
 print("✓ Imported session_api", file=sys.stderr)
@@ -51,6 +49,10 @@ app = FastAPI(
 )
 print("✓ FastAPI app initialized", file=sys.stderr)
 
+# Stage timings: request latency histogram + optional Server-Timing trace
+app.add_middleware(StageTimingMiddleware)
+print("✓ Stage timing middleware added", file=sys.stderr)
+
 # CORS middleware - allow all origins for development
 app.add_middleware(
     CORSMiddleware,
@@ -61,9 +63,13 @@ app.add_middleware(
 )
 print("✓ CORS middleware added", file=sys.stderr)
 
-# Include Coach Rick AI router
-app.include_router(coach_rick_router, tags=["Coach Rick AI"])
-print("✓ Mounted coach_rick_router", file=sys.stderr)
+# Brotli / gzip for HTML reports and JSON payloads
+add_compression(app)
+print("✓ Compression middleware added", file=sys.stderr)
+
+# Include Coach Rick AI router (lazy)
+include_lazy_router(app, "coach_rick_api:router", prefixes=["/api/v1/reboot-lite"], tags=["Coach Rick AI"])
+print("✓ Registered coach_rick_router (lazy)", file=sys.stderr)
 
 # Include Whop routers
 app.include_router(whop_webhook_router, tags=["Whop Webhooks"])
@@ -71,9 +77,14 @@ print("✓ Mounted whop_webhook_router", file=sys.stderr)
 app.include_router(whop_subscription_router, tags=["Whop Subscription"])
 print("✓ Mounted whop_subscription_router", file=sys.stderr)
 
-# Include Swing DNA router
-app.include_router(swing_dna_router, tags=["Swing DNA"])
-print("✓ Mounted swing_dna_router", file=sys.stderr)
+# Include Swing DNA router (lazy)
+include_lazy_router(app, "swing_dna.api:router", prefixes=["/api/swing-dna"], tags=["Swing DNA"])
+print("✓ Registered swing_dna_router (lazy)", file=sys.stderr)
+
+# Include Biomechanics HTML report router (lazy; loads matplotlib)
+include_lazy_router(app, "biomechanics_report_routes:router", prefixes=["/api/biomechanics-reports"],
+                    tags=["Biomechanics Reports"])
+print("✓ Registered biomechanics_report_router (lazy)", file=sys.stderr)
 
 # Include Session API router
 app.include_router(session_router, tags=["Sessions & Progress"])
@@ -83,6 +94,13 @@ print("=" * 70, file=sys.stderr)
 print("✅ ALL ROUTERS MOUNTED SUCCESSFULLY", file=sys.stderr)
 print("=" * 70, file=sys.stderr)
 
+
+@app.on_event("startup")
+async def warm_up_routers():
+    """Import the lazy routers in the background once the server is accepting requests"""
+    warm_up_lazy_routers(app)
+
+
 # Serve the Coach Rick UI (original route)
 @app.get("/coach-rick-ui", response_class=HTMLResponse)
 async def coach_rick_ui():
@@ -313,11 +331,23 @@ def health_check():
         "endpoints": {
             "analyze": "/api/v1/reboot-lite/analyze-with-coach",
             "health": "/api/v1/reboot-lite/coach-rick/health",
-            "docs": "/docs"
-        }
+            "docs": "/docs",
+            "metrics": "/metrics"
+        },
+        "routers": lazy_router_status(app)
     }
 
 
+# Prometheus metrics
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_prometheus_metrics():
+    """
+    Stage and request latency histograms (including the OpenAI and Whop
+    calls) for this worker process, in Prometheus text format
+    """
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 if __name__ == "__main__":
     print("\n" + "="*70)
     print("🧠 COACH RICK AI - WHOP INTEGRATION SERVER")
@@ -328,6 +358,7 @@ if __name__ == "__main__":
     print("   GET  /api/v1/reboot-lite/coach-rick/health")
     print("   GET  /docs (Swagger UI)")
     print("   GET  /health")
+    print("   GET  /metrics")
     print("\n" + "="*70)
     print("✅ Coach Rick AI Engine: READY")
     print("="*70 + "\n")
@@ -0,0 +1,50 @@
+"""
+Response Compression
+
+Brotli (when brotli-asgi is installed) or gzip for text responses: HTML
+reports, JSON analysis payloads and /metrics. Clients that accept
+neither get the response unchanged; streamed responses are compressed
+chunk by chunk.
+
+- COMPRESSION_MIN_SIZE: responses smaller than this many bytes are sent
+  as-is (default 1000)
+- COMPRESSION_LEVEL: gzip level 1-9 (default 6; 9 costs far more CPU for
+  a few percent)
+
+Usage:
+    app = FastAPI()
+    add_compression(app)
+"""
+
+import logging
+import os
+
+from fastapi import FastAPI
+
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # gzip only
+    BrotliMiddleware = None
+from starlette.middleware.gzip import GZipMiddleware
+
+logger = logging.getLogger(__name__)
+
+MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", "1000"))
+GZIP_LEVEL = int(os.environ.get("COMPRESSION_LEVEL", "6"))
+
+
+def add_compression(app: FastAPI, minimum_size: int = MIN_SIZE) -> str:
+    """
+    Add the compression middleware (outermost of those added so far)
+
+    Returns:
+        "br" (brotli, gzip fallback) or "gzip"
+    """
+    if BrotliMiddleware is not None:
+        app.add_middleware(BrotliMiddleware, minimum_size=minimum_size, gzip_fallback=True)
+        encoding = "br"
+    else:
+        app.add_middleware(GZipMiddleware, minimum_size=minimum_size, compresslevel=GZIP_LEVEL)
+        encoding = "gzip"
+    logger.info(f"🗜️  Response compression: {encoding} (>= {minimum_size} bytes)")
+    return encoding
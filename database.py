@@ -3,11 +3,14 @@ Database Configuration and Connection
 """
 
 import os
-from sqlalchemy import create_engine
+import time
+from sqlalchemy import create_engine, event, exc
 from sqlalchemy.orm import sessionmaker, scoped_session
-from sqlalchemy.pool import QueuePool
 import logging
 
+from db_pool_metrics import pool_metrics, InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool
+from stage_metrics import instrument_engine
+
 logger = logging.getLogger(__name__)
 
 # Get DATABASE_URL from environment (Railway provides this automatically)
@@ -18,15 +21,105 @@ if not DATABASE_URL:
     logger.warning("⚠️ DATABASE_URL not set, using SQLite fallback")
     DATABASE_URL = "sqlite:///./catching_barrels.db"
 
+# ========================================
+# POOL CONFIGURATION
+# ========================================
+# Size the pool per uvicorn worker: workers × (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+# must stay below PostgreSQL's max_connections (see /metrics/db-pool).
+#
+# DB_POOL_PRE_PING strategies:
+#   always - ping on every checkout (extra round trip per request)
+#   idle   - ping only connections idle longer than DB_POOL_PRE_PING_IDLE_SECONDS
+#   never  - no ping; rely on DB_POOL_RECYCLE and invalidation on error
+
+PRE_PING_STRATEGIES = ("always", "idle", "never")
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"⚠️ Invalid {name}={value!r}, using {default}")
+        return default
+
+
+def get_pool_config() -> dict:
+    """Pool settings from the environment (with production defaults)"""
+    pre_ping = os.environ.get("DB_POOL_PRE_PING", "idle").lower()
+    if pre_ping not in PRE_PING_STRATEGIES:
+        logger.warning(f"⚠️ Invalid DB_POOL_PRE_PING={pre_ping!r}, using 'idle'")
+        pre_ping = "idle"
+    
+    return {
+        "pool_size": _env_int("DB_POOL_SIZE", 5),
+        "max_overflow": _env_int("DB_MAX_OVERFLOW", 10),
+        "pool_timeout": _env_int("DB_POOL_TIMEOUT", 30),
+        "pool_recycle": _env_int("DB_POOL_RECYCLE", 1800),
+        "pre_ping": pre_ping,
+        "pre_ping_idle_seconds": _env_int("DB_POOL_PRE_PING_IDLE_SECONDS", 30)
+    }
+
+
+def install_idle_pre_ping(pool, idle_seconds: float, metrics=None):
+    """
+    Ping a connection on checkout only if it sat idle in the pool for more
+    than `idle_seconds`. A failed ping raises DisconnectionError, which makes
+    the pool discard the connection and retry with a fresh one.
+    """
+    @event.listens_for(pool, "checkin")
+    def _record_checkin(dbapi_connection, connection_record):
+        connection_record.info["last_checkin"] = time.monotonic()
+    
+    @event.listens_for(pool, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        last_checkin = connection_record.info.get("last_checkin")
+        if last_checkin is None or time.monotonic() - last_checkin < idle_seconds:
+            return
+        if metrics is not None:
+            metrics.record_pre_ping()
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        except Exception:
+            raise exc.DisconnectionError()
+        finally:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+
+
+def _engine_options(config: dict, async_pool: bool = False) -> dict:
+    return {
+        "poolclass": InstrumentedAsyncAdaptedQueuePool if async_pool else InstrumentedQueuePool,
+        "pool_size": config["pool_size"],
+        "max_overflow": config["max_overflow"],
+        "pool_timeout": config["pool_timeout"],
+        "pool_recycle": config["pool_recycle"],
+        "pool_pre_ping": config["pre_ping"] == "always",
+    }
+
+
+def _instrument(name: str, pool, config: dict):
+    metrics = pool_metrics.register(name, pool)
+    if config["pre_ping"] == "idle":
+        install_idle_pre_ping(pool, config["pre_ping_idle_seconds"], metrics)
+    return metrics
+
+
+POOL_CONFIG = get_pool_config()
+
 # Create engine with connection pooling
 engine = create_engine(
     DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=5,
-    max_overflow=10,
-    pool_pre_ping=True,  # Verify connections before using
-    echo=False  # Set to True for SQL debugging
+    echo=False,  # Set to True for SQL debugging
+    **_engine_options(POOL_CONFIG)
 )
+_instrument("sync", engine.pool, POOL_CONFIG)
+instrument_engine(engine)  # SQL statement timings -> "db" stage
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -47,6 +140,87 @@ def get_db():
         db.close()
 
 
+# ========================================
+# ASYNC ENGINE (SQLAlchemy asyncio)
+# ========================================
+# Async routes use get_async_db() so database I/O doesn't block the event loop.
+# Drivers: asyncpg for PostgreSQL, aiosqlite for the local SQLite fallback.
+# The engine is created lazily so sync-only scripts never import the drivers.
+
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def to_async_url(url: str) -> str:
+    """
+    Map a sync DATABASE_URL to its async driver equivalent.
+
+    postgres:// and postgresql:// (Railway) -> postgresql+asyncpg://
+    sqlite:// -> sqlite+aiosqlite://
+    """
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+    if url.startswith("postgresql+psycopg2://"):
+        url = "postgresql://" + url[len("postgresql+psycopg2://"):]
+    if url.startswith("postgresql://"):
+        return "postgresql+asyncpg://" + url[len("postgresql://"):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+ASYNC_DATABASE_URL = os.environ.get('ASYNC_DATABASE_URL') or to_async_url(DATABASE_URL)
+
+
+def get_async_engine():
+    """Get (creating on first use) the shared async engine"""
+    global _async_engine
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+        
+        # aiosqlite keeps a worker thread per open connection, so the SQLite
+        # fallback keeps the dialect's default NullPool (no idle connections
+        # left alive at interpreter exit).
+        options = {} if ASYNC_DATABASE_URL.startswith("sqlite") else _engine_options(POOL_CONFIG, async_pool=True)
+        _async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=False, **options)
+        _instrument("async", _async_engine.sync_engine.pool, POOL_CONFIG)
+        instrument_engine(_async_engine.sync_engine)
+    return _async_engine
+
+
+async def dispose_async_engine():
+    """Close pooled async connections (call on app shutdown)"""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _AsyncSessionLocal = None
+
+
+def get_async_sessionmaker():
+    """Get (creating on first use) the async session factory"""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+        
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=get_async_engine(),
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False
+        )
+    return _AsyncSessionLocal
+
+
+async def get_async_db():
+    """
+    Async dependency for FastAPI routes
+    Usage: db: AsyncSession = Depends(get_async_db)
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
 def init_db():
     """
     Initialize database - create all tables
@@ -0,0 +1,225 @@
+"""
+Database Connection Pool Instrumentation
+
+Tracks checkout wait time, in-use connections, overflow usage and connection
+age for the SQLAlchemy engine pools in database.py, so pool size / worker
+count can be tuned against PostgreSQL's max_connections.
+
+Usage:
+    from db_pool_metrics import pool_metrics
+    pool_metrics.snapshot()   # dict for the /metrics/db-pool endpoint
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# Number of recent checkout wait samples kept for percentiles
+WAIT_SAMPLE_SIZE = 1024
+
+
+class PoolMetrics:
+    """Thread-safe counters for one connection pool"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.checkout_timeouts = 0
+            self.overflow_checkouts = 0
+            self.connections_opened = 0
+            self.connections_closed = 0
+            self.invalidations = 0
+            self.pre_pings = 0
+            self.in_use = 0
+            self.peak_in_use = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            self._wait_samples = deque(maxlen=WAIT_SAMPLE_SIZE)
+            self._created_at: Dict[int, float] = {}
+
+    # ---- recorders (called from pool hooks) ----
+
+    def record_wait(self, wait_ms: float):
+        with self._lock:
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            self._wait_samples.append(wait_ms)
+
+    def record_timeout(self):
+        with self._lock:
+            self.checkout_timeouts += 1
+
+    def record_connect(self, record_id: int):
+        with self._lock:
+            self.connections_opened += 1
+            self._created_at[record_id] = time.monotonic()
+
+    def record_close(self, record_id: int):
+        with self._lock:
+            self.connections_closed += 1
+            self._created_at.pop(record_id, None)
+
+    def record_checkout(self, overflow: bool):
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            if overflow:
+                self.overflow_checkouts += 1
+
+    def record_checkin(self):
+        with self._lock:
+            self.in_use = max(0, self.in_use - 1)
+
+    def record_invalidate(self):
+        with self._lock:
+            self.invalidations += 1
+
+    def record_pre_ping(self):
+        with self._lock:
+            self.pre_pings += 1
+
+    # ---- reporting ----
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current pool state and cumulative counters"""
+        with self._lock:
+            samples = sorted(self._wait_samples)
+            now = time.monotonic()
+            ages = [now - created for created in self._created_at.values()]
+            checkouts = self.checkouts
+
+            result = {
+                "pool": self.name,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "checkouts": checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "connections_opened": self.connections_opened,
+                "connections_closed": self.connections_closed,
+                "invalidations": self.invalidations,
+                "pre_pings": self.pre_pings,
+                "checkout_wait_ms": {
+                    "avg": round(self.wait_total_ms / checkouts, 3) if checkouts else 0.0,
+                    "p50": round(_percentile(samples, 0.50), 3),
+                    "p95": round(_percentile(samples, 0.95), 3),
+                    "p99": round(_percentile(samples, 0.99), 3),
+                    "max": round(self.wait_max_ms, 3)
+                },
+                "connection_age_seconds": {
+                    "open": len(ages),
+                    "oldest": round(max(ages), 1) if ages else 0.0,
+                    "avg": round(sum(ages) / len(ages), 1) if ages else 0.0
+                }
+            }
+
+        pool = self.pool
+        if pool is not None and hasattr(pool, "size"):
+            result.update({
+                "pool_size": pool.size(),
+                "max_overflow": getattr(pool, "_max_overflow", None),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "current_overflow": max(0, pool.overflow())
+            })
+        return result
+
+
+def _percentile(sorted_samples, fraction: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout (queue wait + connect + pre-ping) in Pool.connect()"""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout()
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_wait((time.perf_counter() - start) * 1000)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool with checkout wait timing"""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout wait timing"""
+
+
+def instrument_pool(pool, metrics: PoolMetrics) -> PoolMetrics:
+    """
+    Attach pool event listeners that feed `metrics`.
+
+    Works on any pool; checkout wait time is only recorded for the
+    Instrumented*Pool classes above.
+    """
+    metrics.pool = pool
+    if isinstance(pool, _InstrumentedPoolMixin):
+        pool.metrics = metrics
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.record_connect(id(connection_record))
+
+    @event.listens_for(pool, "close")
+    def _on_close(dbapi_connection, connection_record):
+        metrics.record_close(id(connection_record))
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        overflow = hasattr(pool, "size") and pool.checkedout() > pool.size()
+        metrics.record_checkout(overflow)
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        metrics.record_checkin()
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.record_invalidate()
+
+    return metrics
+
+
+class PoolMetricsRegistry:
+    """All instrumented pools in this process, keyed by name"""
+
+    def __init__(self):
+        self._pools: Dict[str, PoolMetrics] = {}
+
+    def register(self, name: str, pool) -> PoolMetrics:
+        metrics = PoolMetrics(name)
+        self._pools[name] = metrics
+        return instrument_pool(pool, metrics)
+
+    def get(self, name: str) -> Optional[PoolMetrics]:
+        return self._pools.get(name)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: metrics.snapshot() for name, metrics in self._pools.items()}
+
+
+pool_metrics = PoolMetricsRegistry()
@@ -0,0 +1,246 @@
+"""
+Columnar Frame Store
+Packs frame-level biomechanics into per-session float32 channels
+
+`BiomechanicsData` keeps one JSON row per frame, so any time-series analysis
+has to load and parse every blob. This module flattens those rows once into
+one packed array per channel (stored in `session_frame_channels`) and reads
+back only the channels a caller asks for, as NumPy views over the stored
+bytes.
+
+Channel names:
+    frame_number                      - frame index
+    time_s                            - seconds since the session's first timestamp
+    joint_angles.<key>[.<subkey>...]  - numeric leaves of the JSON columns
+    joint_positions.<joint>.<i>       - list elements are indexed
+    joint_velocities.<key>
+
+Usage:
+    from frame_store import pack_session_frames, load_session_channels
+    pack_session_frames(db, session_id)
+    channels = load_session_channels(db, session_id, ["time_s", "joint_angles.pelvis_rot"])
+"""
+
+from typing import Dict, List, Optional, Iterable, Any
+import logging
+import numpy as np
+from sqlalchemy import select, delete
+from sqlalchemy.orm import Session, load_only
+
+from models import BiomechanicsData, SessionFrameChannel, Session as SessionModel
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_DTYPE = np.dtype('<f4')
+JSON_GROUPS = ('joint_angles', 'joint_positions', 'joint_velocities')
+
+
+def _flatten(value: Any, prefix: str, out: Dict[str, float]):
+    """Collect numeric leaves of a JSON value under dotted channel names"""
+    if isinstance(value, bool) or value is None:
+        return
+    if isinstance(value, (int, float)):
+        out[prefix] = float(value)
+    elif isinstance(value, dict):
+        for key, child in value.items():
+            _flatten(child, f"{prefix}.{key}", out)
+    elif isinstance(value, (list, tuple)):
+        for index, child in enumerate(value):
+            _flatten(child, f"{prefix}.{index}", out)
+
+
+def extract_channels(frames: Iterable[BiomechanicsData]) -> Dict[str, np.ndarray]:
+    """
+    Flatten frame rows (ordered as given) into float32 channel arrays.
+
+    Frames missing a channel get NaN at that position.
+    """
+    frames = list(frames)
+    n = len(frames)
+    if n == 0:
+        return {}
+
+    channels: Dict[str, np.ndarray] = {
+        'frame_number': np.array(
+            [f.frame_number if f.frame_number is not None else np.nan for f in frames],
+            dtype=CHANNEL_DTYPE
+        )
+    }
+
+    timestamps = [f.timestamp for f in frames]
+    known = [t for t in timestamps if t is not None]
+    if known:
+        start = min(known)
+        channels['time_s'] = np.array(
+            [(t - start).total_seconds() if t is not None else np.nan for t in timestamps],
+            dtype=CHANNEL_DTYPE
+        )
+
+    for i, frame in enumerate(frames):
+        values: Dict[str, float] = {}
+        for group in JSON_GROUPS:
+            _flatten(getattr(frame, group), group, values)
+        for name, value in values.items():
+            column = channels.get(name)
+            if column is None:
+                column = np.full(n, np.nan, dtype=CHANNEL_DTYPE)
+                channels[name] = column
+            column[i] = value
+
+    return channels
+
+
+def write_session_channels(db: Session, session_id: int, channels: Dict[str, np.ndarray]) -> int:
+    """
+    Replace a session's stored channels (caller commits).
+
+    Returns:
+        Number of channels written
+    """
+    db.execute(delete(SessionFrameChannel).where(SessionFrameChannel.session_id == session_id))
+    for name, values in channels.items():
+        packed = np.ascontiguousarray(values, dtype=CHANNEL_DTYPE)
+        db.add(SessionFrameChannel(
+            session_id=session_id,
+            channel=name,
+            dtype=CHANNEL_DTYPE.str,
+            frame_count=int(packed.shape[0]),
+            data=packed.tobytes()
+        ))
+    return len(channels)
+
+
+def pack_session_frames(
+    db: Session,
+    session_id: int,
+    frames: Optional[List[BiomechanicsData]] = None
+) -> int:
+    """
+    Build the columnar store for one session.
+
+    Args:
+        db: SQLAlchemy database session (caller commits)
+        session_id: sessions.id primary key
+        frames: Frame rows to pack; read from biomechanics_data (ordered by
+            frame_number) when omitted
+
+    Returns:
+        Number of channels written
+    """
+    if frames is None:
+        frames = db.execute(
+            select(BiomechanicsData)
+            .where(BiomechanicsData.session_id == session_id)
+            .order_by(BiomechanicsData.frame_number)
+        ).scalars().all()
+    else:
+        frames = sorted(frames, key=lambda f: (f.frame_number is None, f.frame_number or 0))
+
+    return write_session_channels(db, session_id, extract_channels(frames))
+
+
+def get_channel_manifest(db: Session, session_id: int) -> List[Dict[str, Any]]:
+    """Channel names, dtype and frame counts for a session (no data loaded)"""
+    rows = db.execute(
+        select(SessionFrameChannel)
+        .options(load_only(
+            SessionFrameChannel.channel,
+            SessionFrameChannel.dtype,
+            SessionFrameChannel.frame_count,
+            SessionFrameChannel.created_at
+        ))
+        .where(SessionFrameChannel.session_id == session_id)
+        .order_by(SessionFrameChannel.channel)
+    ).scalars().all()
+    return [row.to_dict() for row in rows]
+
+
+def load_session_channels(
+    db: Session,
+    session_id: int,
+    channels: Optional[List[str]] = None,
+    prefix: Optional[str] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Load selected channels for a session as read-only NumPy views.
+
+    Only the requested rows are fetched from the database; each array is a
+    zero-copy view over the stored bytes.
+
+    Args:
+        db: SQLAlchemy database session
+        session_id: sessions.id primary key
+        channels: Exact channel names to load (None = all)
+        prefix: Alternatively, load every channel starting with this prefix
+            (e.g. 'joint_angles.')
+
+    Returns:
+        Dict of channel name -> 1-D float32 array, in the requested order.
+        Unknown channel names are omitted.
+    """
+    stmt = select(SessionFrameChannel.channel, SessionFrameChannel.dtype, SessionFrameChannel.data)\
+        .where(SessionFrameChannel.session_id == session_id)
+    if channels is not None:
+        stmt = stmt.where(SessionFrameChannel.channel.in_(channels))
+    if prefix:
+        stmt = stmt.where(SessionFrameChannel.channel.startswith(prefix, autoescape=True))
+
+    loaded = {
+        name: np.frombuffer(data, dtype=np.dtype(dtype))
+        for name, dtype, data in db.execute(stmt)
+    }
+
+    if channels is not None:
+        return {name: loaded[name] for name in channels if name in loaded}
+    return dict(sorted(loaded.items()))
+
+
+def load_session_matrix(db: Session, session_id: int, channels: List[str]) -> np.ndarray:
+    """
+    Stack channels into a (frames × channels) float32 matrix.
+
+    Raises:
+        KeyError: If a channel is not stored for the session
+    """
+    loaded = load_session_channels(db, session_id, channels)
+    missing = [name for name in channels if name not in loaded]
+    if missing:
+        raise KeyError(f"Channels not stored for session {session_id}: {missing}")
+    if not channels:
+        return np.empty((0, 0), dtype=CHANNEL_DTYPE)
+    return np.column_stack([loaded[name] for name in channels])
+
+
+def backfill_frame_channels(db: Session, limit: Optional[int] = None) -> int:
+    """
+    Pack sessions that have frame rows but no columnar channels yet.
+
+    Returns:
+        Number of sessions packed
+    """
+    packed_sessions = select(SessionFrameChannel.session_id).distinct()
+    stmt = select(SessionModel.id)\
+        .where(SessionModel.biomechanics_data.any())\
+        .where(SessionModel.id.not_in(packed_sessions))\
+        .order_by(SessionModel.id)
+    if limit:
+        stmt = stmt.limit(limit)
+
+    session_ids = db.execute(stmt).scalars().all()
+    for session_id in session_ids:
+        channel_count = pack_session_frames(db, session_id)
+        db.commit()
+        logger.info(f"✅ Packed {channel_count} channels for session {session_id}")
+    return len(session_ids)
+
+
+if __name__ == "__main__":
+    from database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        count = backfill_frame_channels(db)
+        print(f"✅ Backfilled columnar channels for {count} sessions")
+    finally:
+        db.close()
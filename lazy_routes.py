@@ -0,0 +1,168 @@
+"""
+Lazy Routers
+============
+
+Register feature routers without importing them at startup.
+
+Routers for heavy features (video/pose pipeline, pandas CSV parsing, the
+Coach Rick engine) pull in OpenCV, MediaPipe, pandas, httpx and most of
+physics_engine. Importing them all at module load delays the first
+response by seconds, which hurts Railway cold starts and health-check
+deadlines.
+
+include_lazy_router() adds one placeholder route for the router's path
+prefixes. The first request under those prefixes (or the background
+warm-up started by warm_up_lazy_routers()) imports the module and swaps
+the placeholder for the router's real routes, at the same position, and
+the request is dispatched normally. After that there is no extra hop.
+Until a router is loaded its endpoints are missing from /openapi.json.
+
+Usage:
+    app = FastAPI()
+    include_lazy_router(app, "swing_dna.api:router", prefixes=["/api/swing-dna"], tags=["Swing DNA"])
+
+    @app.on_event("startup")
+    async def warm_up():
+        warm_up_lazy_routers(app)
+"""
+
+import importlib
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from fastapi import APIRouter, FastAPI
+from starlette._utils import get_route_path
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import BaseRoute, Match
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Background warm-up after startup; LAZY_ROUTER_WARMUP=0 loads on first use only
+WARMUP_ENABLED = os.environ.get("LAZY_ROUTER_WARMUP", "1").lower() not in ("0", "false", "no", "off")
+
+
+class LazyRouter(BaseRoute):
+    """Placeholder route that imports "module:attribute" on first use"""
+
+    def __init__(self, app: FastAPI, target: str, prefixes: Sequence[str], **include_kwargs):
+        if ":" not in target:
+            raise ValueError(f"Lazy router target must be 'module:attribute', got {target!r}")
+        if not prefixes:
+            raise ValueError(f"Lazy router {target} needs at least one path prefix")
+        self.app = app
+        self.target = target
+        self.prefixes = tuple(prefix.rstrip("/") for prefix in prefixes)
+        self.include_kwargs = include_kwargs
+        self.loaded = False
+        self.load_ms: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"LazyRouter(target={self.target!r}, prefixes={list(self.prefixes)!r}, loaded={self.loaded})"
+
+    def matches(self, scope: Scope):
+        if scope["type"] in ("http", "websocket"):
+            path = get_route_path(scope)
+            for prefix in self.prefixes:
+                if path == prefix or path.startswith(prefix + "/"):
+                    return Match.FULL, {}
+        return Match.NONE, {}
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Import off the event loop, then dispatch again with the real routes
+        await run_in_threadpool(self.load)
+        await self.app.router(scope, receive, send)
+
+    def load(self) -> None:
+        """Import the router and swap it in for this placeholder (idempotent, thread-safe)"""
+        if self.loaded:
+            return
+        with self._lock:
+            if self.loaded:
+                return
+            start = time.perf_counter()
+            module_name, attribute = self.target.split(":", 1)
+            router = getattr(importlib.import_module(module_name), attribute)
+
+            staging = APIRouter()
+            staging.include_router(router, **self.include_kwargs)
+
+            # Build a new list and assign it so requests iterating the old
+            # list (on other threads) never see a half-updated one
+            routes = list(self.app.router.routes)
+            if self in routes:
+                index = routes.index(self)
+                routes[index:index + 1] = staging.routes
+            else:
+                routes.extend(staging.routes)
+            self.app.router.routes = routes
+            self.app.openapi_schema = None
+
+            self.load_ms = (time.perf_counter() - start) * 1000
+            self.loaded = True
+            logger.info(f"📦 Loaded {self.target} ({len(staging.routes)} routes) in {self.load_ms:.0f} ms")
+
+
+def include_lazy_router(app: FastAPI, target: str, prefixes: Sequence[str], **include_kwargs) -> LazyRouter:
+    """
+    Register a router to be imported on first use
+
+    Args:
+        app: Application to add it to
+        target: "module:attribute" of the APIRouter
+        prefixes: Path prefixes served by the router (its own prefix, or
+            each top-level path when it has none)
+        include_kwargs: Passed to include_router (tags, dependencies, ...)
+
+    Returns:
+        The placeholder route (loaded / load_ms for status endpoints)
+    """
+    placeholder = LazyRouter(app, target, prefixes, **include_kwargs)
+    app.router.routes.append(placeholder)
+    _registry(app).append(placeholder)
+    return placeholder
+
+
+def _registry(app: FastAPI) -> List[LazyRouter]:
+    if not hasattr(app.state, "lazy_routers"):
+        app.state.lazy_routers = []
+    return app.state.lazy_routers
+
+
+def lazy_router_status(app: FastAPI) -> Dict[str, Dict]:
+    """{target: {"loaded": bool, "load_ms": float | None}}"""
+    return {
+        placeholder.target: {
+            "loaded": placeholder.loaded,
+            "load_ms": round(placeholder.load_ms, 1) if placeholder.load_ms is not None else None
+        }
+        for placeholder in _registry(app)
+    }
+
+
+def load_lazy_routers(app: FastAPI) -> None:
+    """Import every lazy router now (failures are logged; the first request retries)"""
+    for placeholder in _registry(app):
+        try:
+            placeholder.load()
+        except Exception as e:
+            logger.error(f"❌ Warm-up import of {placeholder.target} failed: {e}")
+
+
+def warm_up_lazy_routers(app: FastAPI) -> Optional[threading.Thread]:
+    """
+    Import the lazy routers in a background thread, so the server answers
+    health checks immediately and the first real request finds them loaded
+
+    Returns:
+        The warm-up thread, or None when LAZY_ROUTER_WARMUP is off
+    """
+    if not WARMUP_ENABLED:
+        return None
+    thread = threading.Thread(target=load_lazy_routers, args=(app,), name="lazy-router-warmup", daemon=True)
+    thread.start()
+    return thread
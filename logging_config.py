@@ -0,0 +1,126 @@
+"""
+Logging Configuration
+=====================
+
+One place to configure logging for the API, workers and batch jobs.
+
+Analysis code (event detection, CSV import, tempo, kinetic capacity) logs
+its step-by-step detail at DEBUG with lazy %-style arguments, so a
+disabled message costs one level check: no f-string, no float
+formatting, no write to stdout.
+
+Environment:
+    LOG_LEVEL   Root level (default INFO)
+    LOG_FORMAT  "json" for one JSON object per line (python-json-logger),
+                "text" otherwise (default text)
+    LOG_LEVELS  Per-module levels, e.g.
+                "physics_engine.event_detection_v3=DEBUG,reboot_csv_importer=INFO"
+    LOG_QUIET   Quiet mode (default on): analysis modules only log
+                WARNING and above unless LOG_LEVELS says otherwise
+
+Usage:
+    from logging_config import configure_logging
+    configure_logging()                     # production / batch defaults
+    configure_logging(quiet=False, level="DEBUG", module_levels={"tempo_calculator": "DEBUG"})
+"""
+
+import logging
+import os
+import sys
+from typing import Dict, Optional, Union
+
+from pythonjsonlogger import jsonlogger
+
+# Per-swing / per-file detail loggers silenced by quiet mode. physics_engine
+# modules are also imported by bare module name (sys.path), hence both forms.
+ANALYSIS_LOGGERS = (
+    "physics_engine",
+    "event_detection",
+    "event_detection_v3",
+    "kinetic_capacity_calculator_v21",
+    "reboot_csv_importer",
+    "tempo_calculator",
+)
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+JSON_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+
+# Marks the handler this module installed so reconfiguring replaces it
+_HANDLER_NAME = "logging_config"
+
+
+def _replaceable(handler: logging.Handler) -> bool:
+    """Our handler or a plain basicConfig() stream handler (not pytest's capture handlers)"""
+    return handler.get_name() == _HANDLER_NAME or type(handler) is logging.StreamHandler
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() not in ("0", "false", "no", "off", "")
+
+
+def parse_module_levels(spec: str) -> Dict[str, str]:
+    """'a=DEBUG, b.c=info' -> {'a': 'DEBUG', 'b.c': 'INFO'} (malformed items skipped)"""
+    levels = {}
+    for item in spec.split(","):
+        name, sep, level = item.partition("=")
+        if sep and name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def build_formatter(fmt: str = "text") -> logging.Formatter:
+    """JSON (one object per record, extra= fields included) or plain text"""
+    if fmt == "json":
+        return jsonlogger.JsonFormatter(
+            JSON_FORMAT,
+            rename_fields={"asctime": "timestamp", "levelname": "level", "name": "logger"}
+        )
+    return logging.Formatter(TEXT_FORMAT)
+
+
+def configure_logging(level: Union[str, int, None] = None,
+                      fmt: Optional[str] = None,
+                      module_levels: Optional[Dict[str, Union[str, int]]] = None,
+                      quiet: Optional[bool] = None,
+                      stream=None) -> logging.Handler:
+    """
+    Configure the root logger (idempotent: replaces its own handler and
+    any plain basicConfig() stream handler)
+
+    Args:
+        level: Root level (LOG_LEVEL, default INFO)
+        fmt: "json" or "text" (LOG_FORMAT, default text)
+        module_levels: {logger name: level}, applied after quiet mode and
+            merged over LOG_LEVELS
+        quiet: Cap analysis loggers at WARNING (LOG_QUIET, default on)
+        stream: Output stream (default stderr)
+
+    Returns:
+        The installed handler
+    """
+    level = level if level is not None else os.environ.get("LOG_LEVEL", "INFO")
+    fmt = (fmt or os.environ.get("LOG_FORMAT", "text")).lower()
+    quiet = _env_flag("LOG_QUIET", True) if quiet is None else quiet
+
+    levels = parse_module_levels(os.environ.get("LOG_LEVELS", ""))
+    levels.update(module_levels or {})
+
+    root = logging.getLogger()
+    for handler in [h for h in root.handlers if _replaceable(h)]:
+        root.removeHandler(handler)
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.set_name(_HANDLER_NAME)
+    handler.setFormatter(build_formatter(fmt))
+    root.addHandler(handler)
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+
+    for name in ANALYSIS_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING if quiet else logging.NOTSET)
+    for name, module_level in levels.items():
+        logging.getLogger(name).setLevel(module_level.upper() if isinstance(module_level, str) else module_level)
+
+    return handler
@@ -5,37 +5,41 @@ With PostgreSQL Database Integration
 
 from fastapi import FastAPI, HTTPException, Query, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
 from datetime import datetime
 import os
 import logging
 
 # Import database and models
-from database import get_db, init_db, check_db_connection, migrate_db
+from database import get_db, get_async_db, dispose_async_engine, init_db, check_db_connection, migrate_db, POOL_CONFIG
+from db_pool_metrics import pool_metrics
+from stage_metrics import StageTimingMiddleware, render_metrics, PROMETHEUS_CONTENT_TYPE
+from logging_config import configure_logging
+from lazy_routes import include_lazy_router, lazy_router_status, warm_up_lazy_routers
+from compression import add_compression
+from frame_store import get_channel_manifest, load_session_channels
 from models import Player, Session as SessionModel, BiomechanicsData, SyncLog
 from sync_service import RebootMotionSync
+from session_queries import (
+    get_player_async, get_players_page_async, get_player_sessions_async,
+    get_session_with_player_async, get_session_frames_async, get_session_frame_summary_async,
+    get_latest_sync_log_async, get_database_stats_async, StatsSnapshot
+)
 
-# Import CSV upload routes
-from csv_upload_routes import router as csv_router
-
-# Import Reboot Lite routes
-from reboot_lite_routes import router as reboot_lite_router
-
-# Import Coach Rick AI routes
-from coach_rick_api import router as coach_rick_router
-
-# Import Priority 12 enhancement
-from priority_12_api_enhancement import enhance_analysis_with_priority_10_11
+# CSV upload, Reboot Lite and Coach Rick AI routes are lazy routers (below):
+# pandas, OpenCV/MediaPipe and the physics engine load on first use or in
+# the startup warm-up, not before the first health check
 
 # Import Player Report routes (Phase 1 Week 3-4)
 from player_report_routes import router as player_report_router
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging (LOG_LEVEL / LOG_FORMAT / LOG_LEVELS, analysis detail quiet)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
@@ -45,6 +49,9 @@ app = FastAPI(
     version="2.0.0"
 )
 
+# Stage timings: request latency histogram + optional Server-Timing trace
+app.add_middleware(StageTimingMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -54,18 +61,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Brotli / gzip for HTML reports and JSON payloads
+add_compression(app)
+
 # Mount static files and templates
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
-# Include CSV upload router
-app.include_router(csv_router, tags=["CSV Import"])
+# Include CSV upload router (lazy; no prefix, so list its paths)
+include_lazy_router(app, "csv_upload_routes:router", prefixes=["/upload-reboot-csv", "/csv-upload-info"],
+                    tags=["CSV Import"])
 
-# Include Reboot Lite router
-app.include_router(reboot_lite_router, tags=["Reboot Lite"])
+# Include Reboot Lite router (lazy)
+include_lazy_router(app, "reboot_lite_routes:router", prefixes=["/api/reboot-lite"], tags=["Reboot Lite"])
 
-# Include Coach Rick AI router
-app.include_router(coach_rick_router, tags=["Coach Rick AI"])
+# Include Coach Rick AI router (lazy)
+include_lazy_router(app, "coach_rick_api:router", prefixes=["/api/v1/reboot-lite"], tags=["Coach Rick AI"])
+
+# Include Biomechanics HTML report router (lazy; loads matplotlib)
+include_lazy_router(app, "biomechanics_report_routes:router", prefixes=["/api/biomechanics-reports"],
+                    tags=["Biomechanics Reports"])
 
 # Include Player Report router (Phase 1 Week 3-4)
 app.include_router(player_report_router, tags=["Player Reports"])
@@ -89,6 +104,15 @@ async def startup_event():
             logger.error(f"❌ Error initializing database: {e}")
     else:
         logger.error("❌ Database connection failed - API will use limited functionality")
+    
+    # Import the lazy routers in the background
+    warm_up_lazy_routers(app)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled async database connections"""
+    await dispose_async_engine()
 
 
 # Root endpoint
@@ -106,6 +130,7 @@ def read_root():
             "player_detail": "/players/{id}",
             "player_sessions": "/players/{id}/sessions",
             "session_data": "/sessions/{id}/data",
+            "session_channels": "/sessions/{id}/channels",
             "enhanced_analysis": "POST /analyze/enhanced (Priority 9+10+11)",
             "reboot_data_export": "POST /reboot/data-export?session_id={uuid}",
             "csv_upload": "POST /upload-reboot-csv (fallback for Reboot API)",
@@ -114,6 +139,8 @@ def read_root():
             "coach_rick_health": "GET /api/v1/reboot-lite/coach-rick/health",
             "coach_rick_analysis_ui": "GET /coach-rick-analysis (NEW - Phase 2 UI)",
             "sync_status": "/sync/status",
+            "db_pool_metrics": "/metrics/db-pool",
+            "prometheus_metrics": "/metrics",
             "docs": "/docs"
         }
     }
@@ -144,38 +171,22 @@ def health_check(db: Session = Depends(get_db)):
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "database": db_status
+        "database": db_status,
+        "routers": lazy_router_status(app)
     }
 
 
 # Get all players
 @app.get("/players")
-def get_players(
+async def get_players(
     skip: int = Query(0, description="Number of records to skip"),
     limit: int = Query(100, description="Maximum number of records to return"),
     search: Optional[str] = Query(None, description="Search by player name"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get list of all players from database"""
     try:
-        query = db.query(Player)
-        
-        # Search filter
-        if search:
-            search_filter = f"%{search}%"
-            query = query.filter(
-                (Player.first_name.ilike(search_filter)) |
-                (Player.last_name.ilike(search_filter))
-            )
-        
-        # Get total count
-        total = query.count()
-        
-        # Apply pagination
-        players = query.order_by(Player.last_name, Player.first_name)\
-                      .offset(skip)\
-                      .limit(limit)\
-                      .all()
+        total, players = await get_players_page_async(db, search=search, skip=skip, limit=limit)
         
         return {
             "total": total,
@@ -190,9 +201,9 @@ def get_players(
 
 # Get specific player
 @app.get("/players/{player_id}")
-def get_player(player_id: int, db: Session = Depends(get_db)):
+async def get_player(player_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get specific player details"""
-    player = db.query(Player).filter(Player.id == player_id).first()
+    player = await get_player_async(db, player_id)
     
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
@@ -202,32 +213,24 @@ def get_player(player_id: int, db: Session = Depends(get_db)):
 
 # Get player's sessions
 @app.get("/players/{player_id}/sessions")
-def get_player_sessions(
+async def get_player_sessions(
     player_id: int,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     limit: int = Query(50, description="Maximum number of sessions to return"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all sessions for a specific player"""
     # Verify player exists
-    player = db.query(Player).filter(Player.id == player_id).first()
+    player = await get_player_async(db, player_id)
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
     
-    # Query sessions
-    query = db.query(SessionModel).filter(SessionModel.player_id == player_id)
-    
-    # Date filters
-    if start_date:
-        query = query.filter(SessionModel.session_date >= start_date)
-    if end_date:
-        query = query.filter(SessionModel.session_date <= end_date)
-    
-    # Get sessions ordered by date
-    sessions = query.order_by(SessionModel.session_date.desc())\
-                   .limit(limit)\
-                   .all()
+    # Get sessions ordered by date (player eager-loaded, no per-session query)
+    try:
+        sessions = await get_player_sessions_async(db, player_id, start_date=start_date, end_date=end_date, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid date filter: {e}")
     
     return {
         "sessions": [session.to_dict(include_player=True) for session in sessions],
@@ -238,9 +241,9 @@ def get_player_sessions(
 
 # Get session details
 @app.get("/sessions/{session_id}")
-def get_session(session_id: int, db: Session = Depends(get_db)):
+async def get_session(session_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get specific session details"""
-    session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
+    session = await get_session_with_player_async(db, session_id)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -250,23 +253,19 @@ def get_session(session_id: int, db: Session = Depends(get_db)):
 
 # Get session biomechanics data
 @app.get("/sessions/{session_id}/data")
-def get_session_data(
+async def get_session_data(
     session_id: int,
     limit: int = Query(1000, description="Maximum number of data points to return"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get biomechanics data for a session"""
-    session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
+    session = await get_session_with_player_async(db, session_id)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
     # Get biomechanics data
-    data_points = db.query(BiomechanicsData)\
-                   .filter(BiomechanicsData.session_id == session_id)\
-                   .order_by(BiomechanicsData.frame_number)\
-                   .limit(limit)\
-                   .all()
+    data_points = await get_session_frames_async(db, session_id, limit=limit)
     
     return {
         "session": session.to_dict(include_player=True),
@@ -277,36 +276,68 @@ def get_session_data(
 
 # Get session metrics
 @app.get("/sessions/{session_id}/metrics")
-def get_session_metrics(session_id: int, db: Session = Depends(get_db)):
+async def get_session_metrics(session_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get aggregated metrics for a session"""
-    session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
+    session = await get_session_with_player_async(db, session_id)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    # Get biomechanics data count
-    frame_count = db.query(BiomechanicsData)\
-                   .filter(BiomechanicsData.session_id == session_id)\
-                   .count()
-    
-    # Get first and last timestamps
-    data_points = db.query(BiomechanicsData)\
-                   .filter(BiomechanicsData.session_id == session_id)\
-                   .order_by(BiomechanicsData.timestamp)\
-                   .all()
-    
-    start_time = data_points[0].timestamp if data_points else None
-    end_time = data_points[-1].timestamp if data_points else None
+    # Frame count + first/last timestamps in one aggregate query
+    summary = await get_session_frame_summary_async(db, session_id)
+    start_time = summary["start_time"]
+    end_time = summary["end_time"]
     
     return {
         "session_id": session_id,
-        "total_frames": frame_count,
+        "total_frames": summary["total_frames"],
         "start_time": start_time.isoformat() if start_time else None,
         "end_time": end_time.isoformat() if end_time else None,
         "movement_type": session.movement_type_name
     }
 
 
+# Get session frame channel manifest (columnar store)
+@app.get("/sessions/{session_id}/channels")
+def get_session_channels(session_id: int, db: Session = Depends(get_db)):
+    """List the packed float32 channels stored for a session"""
+    manifest = get_channel_manifest(db, session_id)
+    
+    return {
+        "session_id": session_id,
+        "channels": manifest,
+        "total_channels": len(manifest)
+    }
+
+
+# Get selected channel data for charting / analytics
+@app.get("/sessions/{session_id}/channels/data")
+def get_session_channel_data(
+    session_id: int,
+    channels: Optional[str] = Query(None, description="Comma-separated channel names"),
+    prefix: Optional[str] = Query(None, description="Load all channels with this prefix (e.g. joint_angles.)"),
+    db: Session = Depends(get_db)
+):
+    """Get selected frame channels for a session (reads only those channels)"""
+    if not channels and not prefix:
+        raise HTTPException(status_code=400, detail="Provide channels or prefix")
+    
+    names = [c.strip() for c in channels.split(",") if c.strip()] if channels else None
+    data = load_session_channels(db, session_id, channels=names, prefix=prefix)
+    
+    if not data:
+        raise HTTPException(status_code=404, detail="No matching channels for session")
+    
+    return {
+        "session_id": session_id,
+        # NaN (missing sample) -> null for JSON
+        "channels": {
+            name: [None if v != v else float(v) for v in values.tolist()]
+            for name, values in data.items()
+        }
+    }
+
+
 # Get Reboot Motion Data Export
 @app.post("/reboot/data-export")
 def create_reboot_data_export(
@@ -419,11 +450,9 @@ def create_reboot_data_export(
 
 # Get sync status
 @app.get("/sync/status")
-def get_sync_status(db: Session = Depends(get_db)):
+async def get_sync_status(db: AsyncSession = Depends(get_async_db)):
     """Get status of last data sync"""
-    last_sync = db.query(SyncLog)\
-                 .order_by(SyncLog.started_at.desc())\
-                 .first()
+    last_sync = await get_latest_sync_log_async(db)
     
     if not last_sync:
         return {
@@ -474,6 +503,7 @@ async def trigger_sync(db: Session = Depends(get_db)):
             sync_log.biomechanics_synced = result.get("biomechanics_synced", 0)
             sync_log.error_message = None
             db.commit()
+            stats_snapshot.invalidate()
             
             logger.info(f"✅ Sync completed: {result['players_synced']} players, {result['sessions_synced']} sessions")
             
@@ -500,28 +530,54 @@ async def trigger_sync(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Cached stats snapshot for dashboard polling (TTL in seconds, env-configurable)
+stats_snapshot = StatsSnapshot(ttl_seconds=float(os.environ.get("STATS_CACHE_TTL_SECONDS", "30")))
+
+
 # Get database stats
 @app.get("/stats")
-def get_stats(db: Session = Depends(get_db)):
+async def get_stats(
+    cached: bool = Query(False, description="Serve a cached snapshot (refreshed every STATS_CACHE_TTL_SECONDS)"),
+    db: AsyncSession = Depends(get_async_db)
+):
     """Get database statistics"""
     try:
-        player_count = db.query(Player).count()
-        session_count = db.query(SessionModel).count()
-        biomech_count = db.query(BiomechanicsData).count()
-        synced_sessions = db.query(SessionModel).filter(SessionModel.data_synced == True).count()
+        if cached:
+            return await stats_snapshot.get_async(db)
         
-        return {
-            "total_players": player_count,
-            "total_sessions": session_count,
-            "synced_sessions": synced_sessions,
-            "pending_sessions": session_count - synced_sessions,
-            "biomechanics_records": biomech_count
-        }
+        return await get_database_stats_async(db)
     except Exception as e:
         logger.error(f"Error getting stats: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Prometheus metrics
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_prometheus_metrics():
+    """
+    Stage and request latency histograms plus pool gauges for this worker
+    process, in Prometheus text format. Scrape every worker (or run one
+    scrape target per process).
+    """
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+# Database connection pool metrics
+@app.get("/metrics/db-pool")
+def get_db_pool_metrics():
+    """
+    Connection pool metrics for this worker process.
+    
+    Use to size uvicorn workers against PostgreSQL's max_connections:
+    workers × (pool_size + max_overflow) must stay below the DB limit.
+    """
+    return {
+        "worker_pid": os.getpid(),
+        "config": POOL_CONFIG,
+        "pools": pool_metrics.snapshot()
+    }
+
+
 # ========================================
 # PRIORITY 12: ENHANCED ANALYSIS API
 # ========================================
@@ -565,6 +621,9 @@ def enhanced_analysis(request: EnhancedAnalysisRequest):
     - Energy leak identification
     - Personalized correction plan (drills, strength work, timeline)
     """
+    # Deferred: pulls in the physics_engine analyzers
+    from priority_12_api_enhancement import enhance_analysis_with_priority_10_11
+    
     try:
         result = enhance_analysis_with_priority_10_11(
             ground_score=request.ground_score,
@@ -0,0 +1,14 @@
+-- Persistent ProgressTracker sessions (see progress_session_store.py)
+-- payload holds TrainingSession.to_dict(); (athlete_id, session_date) is the
+-- history index used to load an athlete's sessions in date order
+CREATE TABLE IF NOT EXISTS progress_sessions (
+    id SERIAL PRIMARY KEY,
+    session_id VARCHAR(100) NOT NULL UNIQUE,
+    athlete_id VARCHAR(100) NOT NULL,
+    session_date TIMESTAMP NOT NULL,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_progress_sessions_athlete_date ON progress_sessions(athlete_id, session_date);
@@ -0,0 +1,14 @@
+-- Columnar frame storage: one packed float32 array per channel per session
+-- (see frame_store.py). Backfill existing sessions with: python frame_store.py
+CREATE TABLE IF NOT EXISTS session_frame_channels (
+    id SERIAL PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    channel VARCHAR(200) NOT NULL,      -- e.g. 'joint_angles.pelvis_rot'
+    dtype VARCHAR(10) NOT NULL DEFAULT '<f4',
+    frame_count INTEGER NOT NULL,
+    data BYTEA NOT NULL,                -- little-endian float32, NaN = missing
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_frame_channel_session_channel UNIQUE (session_id, channel)
+);
+
+CREATE INDEX IF NOT EXISTS ix_session_frame_channels_session_id ON session_frame_channels(session_id);
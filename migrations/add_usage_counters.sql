@@ -0,0 +1,15 @@
+-- Durable usage metering (see usage_metering.py)
+-- One row per (user_id, usage_type, period_start); limit checks are a
+-- conditional UPDATE ... RETURNING on that row
+CREATE TABLE IF NOT EXISTS usage_counters (
+    id SERIAL PRIMARY KEY,
+    user_id VARCHAR(100) NOT NULL,
+    usage_type VARCHAR(50) NOT NULL,
+    period_start TIMESTAMP NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_usage_counters_user_type_period UNIQUE (user_id, usage_type, period_start)
+);
+
+CREATE INDEX IF NOT EXISTS ix_usage_counters_period ON usage_counters(period_start);
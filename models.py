@@ -3,7 +3,7 @@ Database Models for Reboot Motion Athlete App
 SQLAlchemy ORM models for PostgreSQL
 """
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, JSON, Text, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, JSON, Text, UniqueConstraint, LargeBinary, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -70,6 +70,7 @@ class Session(Base):
     # Relationships
     player = relationship("Player", back_populates="sessions")
     biomechanics_data = relationship("BiomechanicsData", back_populates="session", cascade="all, delete-orphan")
+    frame_channels = relationship("SessionFrameChannel", back_populates="session", cascade="all, delete-orphan")
     
     def to_dict(self, include_player=True):
         """Convert to dictionary"""
@@ -120,6 +121,40 @@ class BiomechanicsData(Base):
         }
 
 
+class SessionFrameChannel(Base):
+    """
+    Columnar frame storage: one packed little-endian float32 array per
+    channel per session (e.g. 'joint_angles.pelvis_rot'), so time-series
+    analysis reads only the channels it needs instead of every JSON blob.
+    Missing samples are stored as NaN. See frame_store.py.
+    """
+    __tablename__ = 'session_frame_channels'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    session_id = Column(Integer, ForeignKey('sessions.id', ondelete='CASCADE'), nullable=False, index=True)
+    channel = Column(String(200), nullable=False)
+    dtype = Column(String(10), nullable=False, default='<f4')
+    frame_count = Column(Integer, nullable=False)
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        UniqueConstraint('session_id', 'channel', name='uq_frame_channel_session_channel'),
+    )
+    
+    # Relationship
+    session = relationship("Session", back_populates="frame_channels")
+    
+    def to_dict(self):
+        """Manifest entry (without the packed data)"""
+        return {
+            'channel': self.channel,
+            'dtype': self.dtype,
+            'frame_count': self.frame_count,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+
 class SyncLog(Base):
     """Log of sync operations"""
     __tablename__ = 'sync_log'
@@ -272,3 +307,48 @@ class PlayerReport(Base):
             result['player'] = self.player.to_dict()
         
         return result
+
+
+class ProgressSession(Base):
+    """
+    Persisted ProgressTracker session (physics_engine/progress_tracker.py).
+    The full TrainingSession is kept as a JSON payload; athlete_id and
+    session_date are columns so an athlete's history loads in date order
+    straight off the composite index. See progress_session_store.py.
+    """
+    __tablename__ = 'progress_sessions'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    session_id = Column(String(100), unique=True, nullable=False, index=True)
+    athlete_id = Column(String(100), nullable=False)
+    session_date = Column(DateTime, nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        Index('ix_progress_sessions_athlete_date', 'athlete_id', 'session_date'),
+    )
+
+
+class UsageCounter(Base):
+    """
+    Metered usage per user, usage type and billing period (see
+    usage_metering.py). Limit checks are a single conditional
+    UPDATE ... RETURNING on this row, so concurrent uploads from any
+    number of workers cannot overshoot a tier's swing limit.
+    """
+    __tablename__ = 'usage_counters'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(100), nullable=False)
+    usage_type = Column(String(50), nullable=False)  # 'swings', 'sessions', 'videos'
+    period_start = Column(DateTime, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        UniqueConstraint('user_id', 'usage_type', 'period_start', name='uq_usage_counters_user_type_period'),
+        Index('ix_usage_counters_period', 'period_start'),
+    )
@@ -23,6 +23,13 @@ from enum import Enum
 import statistics
 import json
 
+import numpy as np
+
+try:
+    from .streaming_stats import RunningStats, RunningRegression, QuantileSketch
+except ImportError:
+    from streaming_stats import RunningStats, RunningRegression, QuantileSketch
+
 
 # ============================================================================
 # ENUMERATIONS
@@ -192,6 +199,168 @@ class CorrelationAnalysis:
         }
 
 
+# ============================================================================
+# TREND & PREDICTION HELPERS
+# ============================================================================
+
+def _days_since(timestamps: List[datetime], origin: datetime) -> np.ndarray:
+    """Timestamps as fractional days from origin"""
+    return np.array([(t - origin).total_seconds() for t in timestamps], dtype=float) / 86400
+
+
+def _trend_from_regression(regression: RunningRegression, metric_name: str,
+                           start_value: float, end_value: float) -> TrendAnalysis:
+    """Classify a fitted regression (x = days) into a TrendAnalysis"""
+    n = regression.count
+    
+    # Slope (rate of change per day) and R-squared (goodness of fit)
+    slope = regression.slope
+    r_squared = regression.r_squared
+    
+    total_change = end_value - start_value
+    percent_change = (total_change / start_value * 100) if start_value != 0 else 0
+    
+    # Classify trend
+    if abs(slope) < 0.01:  # Minimal change
+        direction = TrendDirection.STABLE
+    elif r_squared < 0.3:  # Poor fit, volatile
+        direction = TrendDirection.VOLATILE
+    elif slope > 0:
+        direction = TrendDirection.IMPROVING
+    else:
+        direction = TrendDirection.DECLINING
+    
+    # Confidence based on R-squared and sample size
+    confidence = min(100, r_squared * 100 * (1 + (n / 10)))
+    
+    return TrendAnalysis(
+        metric_name=metric_name,
+        direction=direction,
+        slope=slope,
+        r_squared=r_squared,
+        confidence=confidence,
+        start_value=start_value,
+        end_value=end_value,
+        total_change=total_change,
+        percent_change=percent_change
+    )
+
+
+def _project_performance(trend: TrendAnalysis, metric_name: str, current_value: float,
+                         last_timestamp: datetime, std_dev: float,
+                         days_ahead: int) -> PerformancePrediction:
+    """Extend a trend days_ahead with a ±2 standard deviation interval"""
+    predicted_value = current_value + trend.slope * days_ahead
+    
+    # Prediction confidence based on trend confidence and time horizon
+    time_discount = max(0, 1 - (days_ahead / 180))  # Confidence decreases over time
+    
+    return PerformancePrediction(
+        metric_name=metric_name,
+        current_value=current_value,
+        predicted_value=predicted_value,
+        prediction_date=last_timestamp + timedelta(days=days_ahead),
+        confidence_interval_low=predicted_value - (2 * std_dev),
+        confidence_interval_high=predicted_value + (2 * std_dev),
+        confidence=trend.confidence * time_discount
+    )
+
+
+# ============================================================================
+# STREAMING METRIC SUMMARIES
+# ============================================================================
+
+class StreamingMetricSummary:
+    """
+    Online summary of one athlete metric
+    
+    Each session is folded in with O(1) work (Welford mean/variance,
+    regression co-moments, P² percentile markers), so statistics, trend and
+    prediction are available without revisiting the full history. Median and
+    percentiles are P² estimates once more than 5 sessions have been added.
+    """
+    
+    def __init__(self, metric_name: str):
+        self.metric_name = metric_name
+        self.stats = RunningStats()
+        self.regression = RunningRegression()
+        self.quantiles = QuantileSketch((0.25, 0.5, 0.75, 0.9))
+        self.origin: Optional[datetime] = None  # regression x = days since origin
+        self.first_timestamp: Optional[datetime] = None
+        self.first_value: Optional[float] = None
+        self.last_timestamp: Optional[datetime] = None
+        self.last_value: Optional[float] = None
+    
+    @classmethod
+    def from_history(cls, metric_name: str, timestamps: List[datetime],
+                     values: List[float]) -> 'StreamingMetricSummary':
+        """Seed a summary from existing history (vectorized moments)"""
+        if len(timestamps) != len(values):
+            raise ValueError("timestamps and values must be the same length")
+        summary = cls(metric_name)
+        if not values:
+            return summary
+        
+        order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        summary.origin = timestamps[order[0]]
+        summary.stats = RunningStats.from_array(values)
+        summary.regression = RunningRegression.from_arrays(
+            _days_since(timestamps, summary.origin), values
+        )
+        summary.quantiles.extend(values)
+        summary.first_timestamp, summary.first_value = timestamps[order[0]], values[order[0]]
+        summary.last_timestamp, summary.last_value = timestamps[order[-1]], values[order[-1]]
+        return summary
+    
+    @property
+    def count(self) -> int:
+        return self.stats.count
+    
+    def add(self, timestamp: datetime, value: float):
+        """Fold in one session's value"""
+        if self.origin is None:
+            self.origin = timestamp
+        self.stats.update(value)
+        self.regression.update((timestamp - self.origin).total_seconds() / 86400, value)
+        self.quantiles.update(value)
+        
+        if self.first_timestamp is None or timestamp < self.first_timestamp:
+            self.first_timestamp, self.first_value = timestamp, value
+        if self.last_timestamp is None or timestamp >= self.last_timestamp:
+            self.last_timestamp, self.last_value = timestamp, value
+    
+    def to_statistics(self) -> StatisticalSummary:
+        if self.count < 2:
+            raise ValueError("Need at least 2 data points for statistics")
+        return StatisticalSummary(
+            metric_name=self.metric_name,
+            count=self.count,
+            mean=self.stats.mean,
+            median=self.quantiles.quantile(0.5),
+            std_dev=self.stats.std_dev,
+            min_value=self.stats.min_value,
+            max_value=self.stats.max_value,
+            percentile_25=self.quantiles.quantile(0.25),
+            percentile_75=self.quantiles.quantile(0.75),
+            percentile_90=self.quantiles.quantile(0.9)
+        )
+    
+    def to_trend(self) -> TrendAnalysis:
+        if self.count < 2:
+            raise ValueError("Need at least 2 data points with timestamps")
+        return _trend_from_regression(
+            self.regression, self.metric_name, self.first_value, self.last_value
+        )
+    
+    def to_prediction(self, days_ahead: int = 30) -> PerformancePrediction:
+        if self.count < 3:
+            raise ValueError("Need at least 3 data points for prediction")
+        return _project_performance(
+            self.to_trend(), self.metric_name, self.last_value, self.last_timestamp,
+            self.stats.std_dev, days_ahead
+        )
+
+
 # ============================================================================
 # ANALYTICS ENGINE
 # ============================================================================
@@ -206,10 +375,12 @@ class AdvancedAnalyticsEngine:
     - Performance predictions
     - Comparative analytics
     - Correlation analysis
+    - Online per-athlete summaries (update_metric)
     """
     
     def __init__(self):
-        self.data_cache = {}
+        # athlete_id -> metric_name -> StreamingMetricSummary
+        self.data_cache: Dict[str, Dict[str, StreamingMetricSummary]] = {}
     
     # ========================================================================
     # STATISTICAL ANALYSIS
@@ -220,35 +391,23 @@ class AdvancedAnalyticsEngine:
         if not values or len(values) < 2:
             raise ValueError("Need at least 2 data points for statistics")
         
-        sorted_values = sorted(values)
+        data = np.asarray(values, dtype=float)
+        # One partition pass for the median and all percentiles (no full sort)
+        median, p25, p75, p90 = np.percentile(data, [50, 25, 75, 90])
         
         return StatisticalSummary(
             metric_name=metric_name,
-            count=len(values),
-            mean=statistics.mean(values),
-            median=statistics.median(values),
-            std_dev=statistics.stdev(values) if len(values) > 1 else 0,
-            min_value=min(values),
-            max_value=max(values),
-            percentile_25=self._percentile(sorted_values, 25),
-            percentile_75=self._percentile(sorted_values, 75),
-            percentile_90=self._percentile(sorted_values, 90)
+            count=int(data.size),
+            mean=float(data.mean()),
+            median=float(median),
+            std_dev=float(data.std(ddof=1)),
+            min_value=float(data.min()),
+            max_value=float(data.max()),
+            percentile_25=float(p25),
+            percentile_75=float(p75),
+            percentile_90=float(p90)
         )
     
-    def _percentile(self, sorted_values: List[float], percentile: int) -> float:
-        """Calculate percentile from sorted values"""
-        if not sorted_values:
-            return 0.0
-        
-        k = (len(sorted_values) - 1) * (percentile / 100)
-        f = int(k)
-        c = f + 1
-        
-        if c >= len(sorted_values):
-            return sorted_values[-1]
-        
-        return sorted_values[f] + (k - f) * (sorted_values[c] - sorted_values[f])
-    
     # ========================================================================
     # TREND ANALYSIS
     # ========================================================================
@@ -264,99 +423,37 @@ class AdvancedAnalyticsEngine:
             raise ValueError("Need at least 2 data points with timestamps")
         
         # Convert timestamps to days from start
-        start_time = timestamps[0]
-        days = [(t - start_time).total_seconds() / 86400 for t in timestamps]
-        
-        # Calculate linear regression
-        n = len(days)
-        sum_x = sum(days)
-        sum_y = sum(values)
-        sum_xy = sum(x * y for x, y in zip(days, values))
-        sum_x2 = sum(x * x for x in days)
-        sum_y2 = sum(y * y for y in values)
-        
-        # Slope (rate of change per day)
-        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-        
-        # R-squared (goodness of fit)
-        mean_y = sum_y / n
-        ss_tot = sum((y - mean_y) ** 2 for y in values)
-        ss_res = sum((values[i] - (slope * days[i] + (sum_y - slope * sum_x) / n)) ** 2 
-                     for i in range(n))
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
+        days = _days_since(timestamps, timestamps[0])
         
-        # Determine trend direction
-        start_value = values[0]
-        end_value = values[-1]
-        total_change = end_value - start_value
-        percent_change = (total_change / start_value * 100) if start_value != 0 else 0
+        # Linear regression from centred co-moments (vectorized)
+        regression = RunningRegression.from_arrays(days, values)
         
-        # Classify trend
-        if abs(slope) < 0.01:  # Minimal change
-            direction = TrendDirection.STABLE
-        elif r_squared < 0.3:  # Poor fit, volatile
-            direction = TrendDirection.VOLATILE
-        elif slope > 0:
-            direction = TrendDirection.IMPROVING
-        else:
-            direction = TrendDirection.DECLINING
-        
-        # Confidence based on R-squared and sample size
-        confidence = min(100, r_squared * 100 * (1 + (n / 10)))
-        
-        return TrendAnalysis(
-            metric_name=metric_name,
-            direction=direction,
-            slope=slope,
-            r_squared=r_squared,
-            confidence=confidence,
-            start_value=start_value,
-            end_value=end_value,
-            total_change=total_change,
-            percent_change=percent_change
-        )
+        return _trend_from_regression(regression, metric_name, values[0], values[-1])
     
     # ========================================================================
     # PERFORMANCE PREDICTION
     # ========================================================================
     
     def predict_performance(self, timestamps: List[datetime], values: List[float],
-                           metric_name: str, days_ahead: int = 30) -> PerformancePrediction:
+                           metric_name: str, days_ahead: int = 30,
+                           trend: Optional[TrendAnalysis] = None) -> PerformancePrediction:
         """
         Predict future performance based on historical trend
         
-        Uses linear regression with confidence intervals
+        Uses linear regression with confidence intervals. Pass `trend` if it
+        was already computed for the same data to skip the regression.
         """
         if len(timestamps) != len(values) or len(values) < 3:
             raise ValueError("Need at least 3 data points for prediction")
         
         # Analyze trend
-        trend = self.analyze_trend(timestamps, values, metric_name)
-        
-        # Calculate prediction
-        current_value = values[-1]
-        predicted_change = trend.slope * days_ahead
-        predicted_value = current_value + predicted_change
-        
-        # Calculate confidence interval (±2 standard deviations)
-        std_dev = statistics.stdev(values)
-        confidence_interval_low = predicted_value - (2 * std_dev)
-        confidence_interval_high = predicted_value + (2 * std_dev)
+        if trend is None:
+            trend = self.analyze_trend(timestamps, values, metric_name)
         
-        # Prediction confidence based on trend confidence and time horizon
-        time_discount = max(0, 1 - (days_ahead / 180))  # Confidence decreases over time
-        confidence = trend.confidence * time_discount
+        std_dev = float(np.std(np.asarray(values, dtype=float), ddof=1))
         
-        prediction_date = timestamps[-1] + timedelta(days=days_ahead)
-        
-        return PerformancePrediction(
-            metric_name=metric_name,
-            current_value=current_value,
-            predicted_value=predicted_value,
-            prediction_date=prediction_date,
-            confidence_interval_low=confidence_interval_low,
-            confidence_interval_high=confidence_interval_high,
-            confidence=confidence
+        return _project_performance(
+            trend, metric_name, values[-1], timestamps[-1], std_dev, days_ahead
         )
     
     # ========================================================================
@@ -420,16 +517,9 @@ class AdvancedAnalyticsEngine:
         if len(values_x) != len(values_y) or len(values_x) < 3:
             raise ValueError("Need at least 3 paired data points for correlation")
         
-        # Calculate Pearson correlation
+        # Calculate Pearson correlation (vectorized co-moments)
         n = len(values_x)
-        mean_x = statistics.mean(values_x)
-        mean_y = statistics.mean(values_y)
-        
-        numerator = sum((x - mean_x) * (y - mean_y) for x, y in zip(values_x, values_y))
-        denominator_x = sum((x - mean_x) ** 2 for x in values_x) ** 0.5
-        denominator_y = sum((y - mean_y) ** 2 for y in values_y) ** 0.5
-        
-        correlation = numerator / (denominator_x * denominator_y) if denominator_x * denominator_y != 0 else 0
+        correlation = RunningRegression.from_arrays(values_x, values_y).correlation
         
         # Rough p-value approximation
         # In production, use scipy.stats.pearsonr
@@ -459,6 +549,47 @@ class AdvancedAnalyticsEngine:
             interpretation=interpretation
         )
     
+    # ========================================================================
+    # ONLINE (STREAMING) ANALYTICS
+    # ========================================================================
+    
+    def update_metric(self, athlete_id: str, metric_name: str,
+                      timestamp: datetime, value: float) -> StreamingMetricSummary:
+        """
+        Fold a new session value into the athlete's running summary (O(1))
+        """
+        metrics = self.data_cache.setdefault(athlete_id, {})
+        summary = metrics.get(metric_name)
+        if summary is None:
+            summary = metrics[metric_name] = StreamingMetricSummary(metric_name)
+        summary.add(timestamp, value)
+        return summary
+    
+    def load_metric_history(self, athlete_id: str, metric_name: str,
+                            timestamps: List[datetime], values: List[float]) -> StreamingMetricSummary:
+        """Replace an athlete's running summary with one seeded from history"""
+        summary = StreamingMetricSummary.from_history(metric_name, timestamps, values)
+        self.data_cache.setdefault(athlete_id, {})[metric_name] = summary
+        return summary
+    
+    def get_metric_summary(self, athlete_id: str, metric_name: str) -> Optional[StreamingMetricSummary]:
+        return self.data_cache.get(athlete_id, {}).get(metric_name)
+    
+    def get_streaming_report(self, athlete_id: str, days_ahead: int = 30) -> Dict[str, Any]:
+        """
+        Statistics, trends and predictions from the running summaries
+        
+        Cost depends on the number of metrics, not the length of history.
+        """
+        report = {'athlete_id': athlete_id, 'statistics': {}, 'trends': {}, 'predictions': {}}
+        for metric_name, summary in self.data_cache.get(athlete_id, {}).items():
+            if summary.count >= 2:
+                report['statistics'][metric_name] = summary.to_statistics().to_dict()
+                report['trends'][metric_name] = summary.to_trend().to_dict()
+            if summary.count >= 3:
+                report['predictions'][metric_name] = summary.to_prediction(days_ahead).to_dict()
+        return report
+    
     # ========================================================================
     # COMPREHENSIVE ANALYTICS
     # ========================================================================
@@ -505,9 +636,11 @@ class AdvancedAnalyticsEngine:
                             f"{metric_name}: Declining trend ({trend.percent_change:.1f}% over period) - needs attention"
                         )
                     
-                    # Prediction
+                    # Prediction (reuses the trend computed above)
                     if len(values) >= 3:
-                        prediction = self.predict_performance(timestamps, values, metric_name, days_ahead=30)
+                        prediction = self.predict_performance(
+                            timestamps, values, metric_name, days_ahead=30, trend=trend
+                        )
                         report['predictions'][metric_name] = prediction.to_dict()
         
         # Correlation analysis between key metrics
@@ -11,16 +11,89 @@ Features:
 - Body-to-bat energy transfer efficiency
 - Optimal bat weight recommendations
 - Exit velocity prediction with different bat weights
+- Vectorized weight x length sweeps over a memoized MOI table
 
 Author: Builder 2
 Date: 2024-12-24
 Version: 1.0.0
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import math
 
+import numpy as np
+
+# Bat constants (also exposed on BatModule)
+OZ_TO_KG = 0.0283495  # 1 oz = 0.0283495 kg
+INCHES_TO_M = 0.0254  # 1 inch = 0.0254 m
+MPH_TO_MS = 0.44704   # 1 mph = 0.44704 m/s
+MOI_COEFFICIENTS = {
+    "balanced": 0.25,    # For balanced bats
+    "end_loaded": 0.27,  # For end-loaded bats
+    "light": 0.23,       # For light/whippy bats
+}
+
+# Sweep grid defaults: realistic weights, current length +/- 2"
+SWEEP_WEIGHT_RANGE_OZ = (26.0, 36.0)
+SWEEP_WEIGHT_STEP_OZ = 0.5
+SWEEP_LENGTH_SPAN_INCHES = 2.0
+SWEEP_LENGTH_STEP_INCHES = 0.5
+MOI_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=MOI_CACHE_SIZE)
+def _moi(
+    bat_weight_oz: float,
+    bat_length_inches: float,
+    balance_point_inches: Optional[float],
+    bat_type: str
+) -> float:
+    """Memoized body of BatModule.calculate_moi"""
+    mass_kg = bat_weight_oz * OZ_TO_KG
+    length_m = bat_length_inches * INCHES_TO_M
+    k = MOI_COEFFICIENTS.get(bat_type, MOI_COEFFICIENTS["balanced"])
+    
+    if balance_point_inches:
+        # Method 1: Use balance point (more accurate)
+        balance_point_m = balance_point_inches * INCHES_TO_M
+        moi = mass_kg * (balance_point_m ** 2) * k
+    else:
+        # Method 2: Estimate from total length
+        moi = mass_kg * (length_m ** 2) * k
+    
+    return round(moi, 4)
+
+
+@lru_cache(maxsize=256)
+def moi_table(
+    weights_oz: Tuple[float, ...],
+    lengths_inches: Tuple[float, ...],
+    bat_type: str = "balanced"
+) -> np.ndarray:
+    """
+    MOI (kg·m², rounded like calculate_moi) for every weight x length pair
+    
+    Memoized per (weights, lengths, bat_type); the returned array is
+    read-only and shaped (len(weights_oz), len(lengths_inches)).
+    """
+    table = np.array([
+        [_moi(weight, length, None, bat_type) for length in lengths_inches]
+        for weight in weights_oz
+    ])
+    table.setflags(write=False)
+    return table
+
+
+def default_sweep_weights(include: Optional[float] = None) -> np.ndarray:
+    """Swept weights (26-36 oz in 0.5 oz steps), plus `include` when it is in range"""
+    low, high = SWEEP_WEIGHT_RANGE_OZ
+    weights = np.arange(low, high + SWEEP_WEIGHT_STEP_OZ / 2, SWEEP_WEIGHT_STEP_OZ)
+    if include is not None and low <= include <= high:
+        weights = np.union1d(weights, [include])
+    return weights
+
 
 @dataclass
 class BatSpecifications:
@@ -43,6 +116,75 @@ class BatOptimizationResult:
     recommended_weights: List[Dict]
     exit_velo_predictions: List[Dict]
     optimization_notes: List[str]
+    response_surface: Optional[Dict] = None
+
+
+@dataclass
+class BatSweepResult:
+    """Weight x length response surface (arrays shaped weights x lengths)"""
+    weights_oz: np.ndarray
+    lengths_inches: np.ndarray
+    bat_type: str
+    moi_kgm2: np.ndarray
+    bat_speed_mph: np.ndarray  # per weight (length does not change speed in this model)
+    bat_ke_joules: np.ndarray
+    exit_velo_mph: np.ndarray
+    efficiency_percent: np.ndarray
+    
+    def best(self, weight_range_oz: Optional[Tuple[float, float]] = None) -> Dict:
+        """Highest predicted exit velo cell, optionally within a weight range"""
+        exit_velo = self.exit_velo_mph
+        if weight_range_oz is not None:
+            low, high = weight_range_oz
+            outside = (self.weights_oz < low) | (self.weights_oz > high)
+            exit_velo = np.where(outside[:, None], -np.inf, exit_velo)
+        i, j = np.unravel_index(np.argmax(exit_velo), exit_velo.shape)
+        return self.cell(i, j)
+    
+    def recommendations(
+        self,
+        current_bat_weight_oz: float,
+        bat_length_inches: float,
+        weight_range_oz: Tuple[float, float]
+    ) -> List[Dict]:
+        """
+        Cells at the length closest to bat_length_inches for every swept
+        weight in weight_range_oz (the recommended weights to test)
+        """
+        low, high = weight_range_oz
+        j = int(np.argmin(np.abs(self.lengths_inches - bat_length_inches)))
+        rows = np.flatnonzero((self.weights_oz >= low - 1e-9) & (self.weights_oz <= high + 1e-9))
+        recommendations = []
+        for i in rows:
+            cell = self.cell(i, j)
+            cell["weight_change_oz"] = round(cell["bat_weight_oz"] - current_bat_weight_oz, 1)
+            cell["is_current"] = abs(cell["bat_weight_oz"] - current_bat_weight_oz) < 1e-9
+            recommendations.append(cell)
+        return recommendations
+    
+    def cell(self, i: int, j: int) -> Dict:
+        return {
+            "bat_weight_oz": float(self.weights_oz[i]),
+            "bat_length_inches": float(self.lengths_inches[j]),
+            "predicted_bat_speed_mph": round(float(self.bat_speed_mph[i]), 1),
+            "predicted_moi_kgm2": float(self.moi_kgm2[i, j]),
+            "predicted_bat_ke_joules": round(float(self.bat_ke_joules[i, j]), 1),
+            "predicted_exit_velo_mph": round(float(self.exit_velo_mph[i, j]), 1),
+            "predicted_efficiency_percent": round(float(self.efficiency_percent[i, j]), 1),
+        }
+    
+    def to_dict(self) -> Dict:
+        """JSON-ready surface (values rounded like the scalar predictions)"""
+        return {
+            "bat_type": self.bat_type,
+            "weights_oz": self.weights_oz.tolist(),
+            "lengths_inches": self.lengths_inches.tolist(),
+            "moi_kgm2": self.moi_kgm2.tolist(),
+            "bat_speed_mph": np.round(self.bat_speed_mph, 1).tolist(),
+            "bat_ke_joules": np.round(self.bat_ke_joules, 1).tolist(),
+            "exit_velo_mph": np.round(self.exit_velo_mph, 1).tolist(),
+            "efficiency_percent": np.round(self.efficiency_percent, 1).tolist(),
+        }
 
 
 class BatModule:
@@ -63,14 +205,14 @@ class BatModule:
     """
     
     # Constants
-    OZ_TO_KG = 0.0283495  # 1 oz = 0.0283495 kg
-    INCHES_TO_M = 0.0254  # 1 inch = 0.0254 m
-    MPH_TO_MS = 0.44704   # 1 mph = 0.44704 m/s
+    OZ_TO_KG = OZ_TO_KG
+    INCHES_TO_M = INCHES_TO_M
+    MPH_TO_MS = MPH_TO_MS
     
     # Bat MOI coefficient (dimensionless)
-    MOI_COEFFICIENT_BALANCED = 0.25  # For balanced bats
-    MOI_COEFFICIENT_END_LOADED = 0.27  # For end-loaded bats
-    MOI_COEFFICIENT_LIGHT = 0.23  # For light/whippy bats
+    MOI_COEFFICIENT_BALANCED = MOI_COEFFICIENTS["balanced"]
+    MOI_COEFFICIENT_END_LOADED = MOI_COEFFICIENTS["end_loaded"]
+    MOI_COEFFICIENT_LIGHT = MOI_COEFFICIENTS["light"]
     
     # Exit velocity model coefficients (empirical)
     EXIT_VELO_MOI_FACTOR = 15.0  # mph per 0.01 kg·m² MOI
@@ -107,27 +249,8 @@ class BatModule:
             MOI = m * L² * k
             k = 0.23-0.27 depending on bat type
         """
-        # Convert to SI units
-        mass_kg = bat_weight_oz * self.OZ_TO_KG
-        length_m = bat_length_inches * self.INCHES_TO_M
-        
-        # Select MOI coefficient based on bat type
-        if bat_type == "end_loaded":
-            k = self.MOI_COEFFICIENT_END_LOADED
-        elif bat_type == "light":
-            k = self.MOI_COEFFICIENT_LIGHT
-        else:
-            k = self.MOI_COEFFICIENT_BALANCED
-        
-        if balance_point_inches:
-            # Method 1: Use balance point (more accurate)
-            balance_point_m = balance_point_inches * self.INCHES_TO_M
-            moi = mass_kg * (balance_point_m ** 2) * k
-        else:
-            # Method 2: Estimate from total length
-            moi = mass_kg * (length_m ** 2) * k
-        
-        return round(moi, 4)
+        # Memoized per (weight, length, balance point, bat type)
+        return _moi(bat_weight_oz, bat_length_inches, balance_point_inches, bat_type)
     
     def calculate_bat_kinetic_energy(
         self,
@@ -330,6 +453,82 @@ class BatModule:
         
         return recommendations
     
+    def sweep_bat_grid(
+        self,
+        current_bat_weight_oz: float,
+        bat_length_inches: float,
+        bat_speed_mph: float,
+        body_kinetic_energy: float,
+        bat_type: str = "balanced",
+        weights_oz: Optional[Sequence[float]] = None,
+        lengths_inches: Optional[Sequence[float]] = None,
+        pitch_speed_mph: float = 85.0,
+        contact_quality: float = 1.0
+    ) -> BatSweepResult:
+        """
+        Evaluate a dense weight x length grid in one vectorized pass.
+        
+        Same models as recommend_bat_weights (-0.5 mph bat speed per oz,
+        calculate_bat_kinetic_energy, predict_exit_velocity,
+        calculate_transfer_efficiency), with MOI read from the memoized
+        moi_table. Values are left unrounded.
+        
+        Args:
+            current_bat_weight_oz: Current bat weight
+            bat_length_inches: Current bat length
+            bat_speed_mph: Current bat speed
+            body_kinetic_energy: Body KE in joules
+            bat_type: "balanced", "end_loaded", or "light"
+            weights_oz: Weights to sweep (default 26-36 oz in 0.5 oz steps)
+            lengths_inches: Lengths to sweep (default current ±2" in 0.5" steps)
+        
+        Returns:
+            BatSweepResult with arrays shaped (weights, lengths)
+        """
+        if weights_oz is None:
+            weights_oz = default_sweep_weights()
+        if lengths_inches is None:
+            lengths_inches = np.arange(
+                bat_length_inches - SWEEP_LENGTH_SPAN_INCHES,
+                bat_length_inches + SWEEP_LENGTH_SPAN_INCHES + SWEEP_LENGTH_STEP_INCHES / 2,
+                SWEEP_LENGTH_STEP_INCHES
+            )
+        weights = tuple(float(w) for w in weights_oz)
+        lengths = tuple(float(l) for l in lengths_inches)
+        weight_array = np.array(weights)
+        length_array = np.array(lengths)
+        
+        moi = moi_table(weights, lengths, bat_type)
+        
+        # Heavier = slower: -0.5 mph per oz
+        bat_speed = bat_speed_mph - 0.5 * (weight_array - current_bat_weight_oz)
+        
+        # KE_bat = 0.5 * MOI * (v / (2/3 L))²
+        bat_speed_ms = bat_speed[:, None] * self.MPH_TO_MS
+        rotation_radius_m = (2.0 / 3.0) * (length_array[None, :] * self.INCHES_TO_M)
+        bat_ke = 0.5 * moi * (bat_speed_ms / rotation_radius_m) ** 2
+        
+        exit_velo = (
+            self.EXIT_VELO_BAT_SPEED_FACTOR * bat_speed[:, None] + 0.15 * pitch_speed_mph
+            + self.EXIT_VELO_MOI_FACTOR * (moi - 0.17)
+        ) * contact_quality
+        
+        if body_kinetic_energy == 0:
+            efficiency = np.zeros_like(bat_ke)
+        else:
+            efficiency = bat_ke / body_kinetic_energy * 100.0
+        
+        return BatSweepResult(
+            weights_oz=weight_array,
+            lengths_inches=length_array,
+            bat_type=bat_type,
+            moi_kgm2=moi,
+            bat_speed_mph=bat_speed,
+            bat_ke_joules=bat_ke,
+            exit_velo_mph=exit_velo,
+            efficiency_percent=efficiency
+        )
+    
     def analyze_bat_optimization(
         self,
         bat_weight_oz: float,
@@ -340,7 +539,8 @@ class BatModule:
         player_weight_lbs: float,
         bat_model: Optional[str] = None,
         balance_point_inches: Optional[float] = None,
-        bat_type: str = "balanced"
+        bat_type: str = "balanced",
+        include_surface: bool = False
     ) -> BatOptimizationResult:
         """
         Complete bat optimization analysis.
@@ -355,6 +555,7 @@ class BatModule:
             bat_model: Bat model name (optional)
             balance_point_inches: Balance point from knob (optional)
             bat_type: "balanced", "end_loaded", or "light"
+            include_surface: Attach the weight x length sweep (response_surface)
         
         Returns:
             BatOptimizationResult with complete analysis
@@ -375,20 +576,26 @@ class BatModule:
         # Predict current exit velocity
         current_exit_velo = self.predict_exit_velocity(bat_speed_mph, current_moi)
         
-        # Get bat weight recommendations
-        recommendations = self.recommend_bat_weights(
-            bat_weight_oz, bat_length_inches, bat_speed_mph,
-            body_kinetic_energy, efficiency,
-            player_height_inches, player_weight_lbs
-        )
-        
-        # Determine optimal weight range
+        # Weight windows by efficiency tier (same strategy as
+        # recommend_bat_weights): weights to test, optimal range
         if efficiency >= 100:
+            test_range = (bat_weight_oz - 1, bat_weight_oz + 2)
             optimal_range = (bat_weight_oz, bat_weight_oz + 2)
         elif efficiency >= 80:
-            optimal_range = (bat_weight_oz - 1, bat_weight_oz + 1)
+            test_range = optimal_range = (bat_weight_oz - 1, bat_weight_oz + 1)
         else:
-            optimal_range = (bat_weight_oz - 2, bat_weight_oz)
+            test_range = optimal_range = (bat_weight_oz - 2, bat_weight_oz)
+        
+        # One vectorized sweep (26-36 oz in 0.5 oz steps, plus the current
+        # weight) gives the recommended weights and the optional surface;
+        # without the surface only the current length is swept
+        sweep = self.sweep_bat_grid(
+            bat_weight_oz, bat_length_inches, bat_speed_mph,
+            body_kinetic_energy, bat_type,
+            weights_oz=default_sweep_weights(include=bat_weight_oz),
+            lengths_inches=None if include_surface else (bat_length_inches,)
+        )
+        recommendations = sweep.recommendations(bat_weight_oz, bat_length_inches, test_range)
         
         # Generate optimization notes
         notes = []
@@ -439,6 +646,12 @@ class BatModule:
             for rec in recommendations
         ]
         
+        response_surface = None
+        if include_surface:
+            response_surface = sweep.to_dict()
+            response_surface["best_in_optimal_range"] = sweep.best(optimal_range)
+            response_surface["best_overall"] = sweep.best()
+        
         return BatOptimizationResult(
             current_bat=current_bat_summary,
             bat_kinetic_energy_joules=bat_ke,
@@ -447,7 +660,8 @@ class BatModule:
             optimal_weight_range_oz=optimal_range,
             recommended_weights=recommendations,
             exit_velo_predictions=exit_velo_predictions,
-            optimization_notes=notes
+            optimization_notes=notes,
+            response_surface=response_surface
         )
 
 
@@ -0,0 +1,115 @@
+"""
+Nearest Benchmark Index
+=======================
+
+Immutable lookup structure for the (height, weight) benchmark tables used by
+the kinetic capacity calculator and the exit velocity predictor.
+
+Both predictors find the nearest table entries by
+
+    distance = sqrt(((height - h) * 5)^2 + (weight - w)^2)
+
+and blend them with inverse distance weighting. Instead of scanning and
+sorting the whole table on every call, entries are bucketed by height once at
+import. A query walks height rows outward from the query height and stops as
+soon as the height term alone exceeds the k-th best distance. Ties are broken
+by table order, so results are bit-for-bit identical to a full stable sort.
+Small tables (<= FLAT_SCAN_MAX_SIZE entries) skip the row walk. Query results
+are memoized per (height, weight).
+"""
+
+import math
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Tuple
+
+HEIGHT_SCALE = 5
+DEFAULT_CACHE_SIZE = 4096
+# Tables this small are faster to scan flat than to walk row by row
+FLAT_SCAN_MAX_SIZE = 16
+
+
+class NearestBenchmarkIndex:
+    """
+    Height-bucketed nearest neighbour index over a {(height, weight): value} table.
+
+    Usage:
+        index = NearestBenchmarkIndex(BASELINE_TABLE)
+        index.nearest(68, 190, 4)      # ((distance, (h, w), value), ...)
+        index.interpolate(68.5, 190)   # IDW blend of the 4 nearest values
+    """
+
+    def __init__(self, table: Dict[Tuple[float, float], Any], cache_size: int = DEFAULT_CACHE_SIZE):
+        self._exact = dict(table)
+        self._entries = tuple((order, key, value) for order, (key, value) in enumerate(table.items()))
+        rows: Dict[float, list] = {}
+        for order, key, value in self._entries:
+            rows.setdefault(key[0], []).append((order, key, value))
+        self._heights = tuple(sorted(rows))
+        self._rows = tuple(tuple(rows[h]) for h in self._heights)
+        self._size = len(self._exact)
+
+        self.nearest = lru_cache(maxsize=cache_size)(self._nearest)
+        self.interpolate = lru_cache(maxsize=cache_size)(self._interpolate)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get(self, key: Hashable, default=None):
+        """Exact table lookup"""
+        return self._exact.get(key, default)
+
+    def _nearest(self, height: float, weight: float, k: int) -> Tuple[Tuple[float, Hashable, Any], ...]:
+        """
+        The k nearest entries as (distance, key, value), closest first.
+
+        Equivalent to computing every distance and stable-sorting the table.
+        """
+        k = min(k, self._size)
+        if k <= 0:
+            return ()
+        if self._size <= FLAT_SCAN_MAX_SIZE:
+            entries = self._entries
+            distances = [
+                math.sqrt(((height - h) * HEIGHT_SCALE) ** 2 + (weight - w) ** 2)
+                for _, (h, w), _ in entries
+            ]
+            nearest = sorted(range(self._size), key=distances.__getitem__)[:k]  # stable
+            return tuple((distances[i], entries[i][1], entries[i][2]) for i in nearest)
+
+        heights = self._heights
+        rows = self._rows
+        right = bisect_left(heights, height)
+        left = right - 1
+        found = []  # (distance, order, key, value), trimmed to the k best
+        kth_distance = math.inf
+
+        while left >= 0 or right < len(heights):
+            # Next row: whichever side is closer in height
+            if right >= len(heights) or (left >= 0 and height - heights[left] <= heights[right] - height):
+                row_index, left = left, left - 1
+            else:
+                row_index, right = right, right + 1
+
+            height_term = ((height - heights[row_index]) * HEIGHT_SCALE) ** 2
+            if math.sqrt(height_term) > kth_distance:
+                break  # every remaining row is at least this far away
+
+            for order, key, value in rows[row_index]:
+                found.append((math.sqrt(height_term + (weight - key[1]) ** 2), order, key, value))
+            if len(found) >= k:
+                found.sort()
+                del found[k:]
+                kth_distance = found[-1][0]
+
+        return tuple((distance, key, value) for distance, _, key, value in found[:k])
+
+    def _interpolate(self, height: float, weight: float, k: int = 4) -> float:
+        """Inverse distance weighting (1 / (d^2 + 0.1)) over the k nearest values"""
+        total_weight = 0
+        weighted_sum = 0
+        for distance, _, value in self.nearest(height, weight, k):
+            idw = 1 / (distance ** 2 + 0.1)
+            weighted_sum += value * idw
+            total_weight += idw
+        return weighted_sum / total_weight
@@ -0,0 +1,447 @@
+"""
+Chart Render Service
+====================
+
+Renders BiomechanicsVisualizer charts straight to bytes (PNG or SVG)
+instead of writing PNG files and reading them back for the HTML report.
+
+- Each process keeps one pre-styled Figure per chart kind and clears it
+  between renders, so pyplot's figure manager is never involved.
+- Rendered charts are cached (LRU) by a hash of their kind, format and
+  input data; identical concurrent requests share one render.
+- render_async() runs matplotlib in a process pool, so the CPU-bound,
+  GIL-holding rendering does not stall the API event loop.
+- SVG output scales on the client; PNG stays the default for the report.
+- publish() stores a rendered chart under a content-hash asset name, so
+  reports can link charts (cached by browsers for good) instead of
+  inlining megabytes of base64. Assets are written to CHART_ASSET_DIR
+  (shared by all workers on the host; point it at a persistent volume so
+  links survive redeploys) with a small in-memory LRU in front. A sweep
+  removes assets unused for CHART_ASSET_TTL_SECONDS and, oldest first,
+  keeps the directory under CHART_ASSET_MAX_MB.
+
+Usage:
+    renderer = get_chart_renderer()
+    png = renderer.render('gap', {'actual_bat_speed': 57.9, 'potential_bat_speed': 76.0})
+    charts = await renderer.report_charts_async(player_data, analysis_data, fmt='svg')
+    html = ReportGenerator().render_html_report(player_data, analysis_data, charts)
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+try:
+    from .visualizations import BiomechanicsVisualizer
+except ImportError:
+    from visualizations import BiomechanicsVisualizer
+
+logger = logging.getLogger(__name__)
+
+# Chart kind -> BiomechanicsVisualizer draw method (data is passed as kwargs)
+CHART_KINDS = {
+    'gap': 'draw_gap_chart',
+    'radar': 'draw_gew_radar_chart',
+    'sequence': 'draw_kinematic_sequence_waterfall',
+    'energy': 'draw_energy_distribution_pie',
+    'composite': 'draw_composite_report'
+}
+
+FORMATS = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+    'pdf': 'application/pdf'  # printable reports (team batch bundles)
+}
+
+CACHE_SIZE = int(os.environ.get("CHART_CACHE_SIZE", "256"))
+RENDER_WORKERS = int(os.environ.get("CHART_RENDER_WORKERS", "2"))
+ASSET_DIR = os.environ.get("CHART_ASSET_DIR", os.path.join(tempfile.gettempdir(), "chart_assets"))
+ASSET_TTL_SECONDS = float(os.environ.get("CHART_ASSET_TTL_SECONDS", str(30 * 24 * 3600)))
+ASSET_MAX_BYTES = int(float(os.environ.get("CHART_ASSET_MAX_MB", "512")) * 1024 * 1024)
+ASSET_SWEEP_SECONDS = 60.0  # sweep at most once a minute, or after writing a tenth of the cap
+
+# "<sha256 prefix>.<fmt>"; anything else is never looked up on disk
+ASSET_NAME = re.compile(r"^[0-9a-f]{24}\.(%s)$" % "|".join(FORMATS))
+
+# Per-process rendering state (one copy in each pool worker)
+_visualizer: Optional[BiomechanicsVisualizer] = None
+_templates: Dict[str, Figure] = {}
+_render_lock = threading.Lock()
+
+
+def _template(kind: str) -> Figure:
+    """Cleared, reusable figure for a chart kind"""
+    global _visualizer
+    if _visualizer is None:
+        _visualizer = BiomechanicsVisualizer()  # applies the style before any figure exists
+    fig = _templates.get(kind)
+    if fig is None:
+        fig = Figure(figsize=_visualizer.FIGURE_SIZES[kind])
+        FigureCanvasAgg(fig)
+        _templates[kind] = fig
+    else:
+        fig.clear()
+    return fig
+
+
+def render_chart(kind: str, data: Dict, fmt: str = 'png') -> bytes:
+    """
+    Render one chart to bytes in this process (no cache)
+
+    Args:
+        kind: One of CHART_KINDS
+        data: Keyword arguments of the chart's draw method
+        fmt: 'png', 'svg' or 'pdf'
+
+    Returns:
+        Encoded image
+    """
+    if kind not in CHART_KINDS:
+        raise ValueError(f"Unknown chart kind {kind!r} (expected one of {sorted(CHART_KINDS)})")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown chart format {fmt!r} (expected one of {sorted(FORMATS)})")
+
+    with _render_lock:
+        fig = _template(kind)
+        getattr(_visualizer, CHART_KINDS[kind])(fig, **data)
+        buffer = io.BytesIO()
+        if fmt == 'svg':
+            # No creation date or random element ids, so identical input gives identical output
+            with matplotlib.rc_context({'svg.hashsalt': 'chart_renderer'}):
+                _visualizer.save_figure(fig, buffer, fmt, metadata={'Date': None})
+        elif fmt == 'pdf':
+            _visualizer.save_figure(fig, buffer, fmt, metadata={'CreationDate': None})
+        else:
+            _visualizer.save_figure(fig, buffer, fmt)
+        fig.clear()
+    return buffer.getvalue()
+
+
+def _touch(path: str) -> bool:
+    """Mark an asset file as used (the sweep goes by mtime); False if it does not exist"""
+    try:
+        os.utime(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _warm_worker():
+    """Pool initializer: import matplotlib and build the style once per worker"""
+    _template('gap')
+
+
+def _json_default(value):
+    # numpy scalars / arrays from the analysis pipeline
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Chart data of type {type(value).__name__} is not JSON serializable")
+
+
+def chart_cache_key(kind: str, data: Dict, fmt: str = 'png') -> str:
+    """Stable hash of a chart request"""
+    payload = json.dumps([kind, fmt, data], sort_keys=True, default=_json_default)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def report_chart_data(player_data: Dict, analysis_data: Dict) -> Dict[str, Dict]:
+    """
+    Draw-method inputs for the report's charts, for those the analysis
+    has data for (keys as in ReportGenerator's template)
+    """
+    charts = {}
+    has_gap = 'actual_bat_speed' in analysis_data and 'potential_bat_speed' in analysis_data
+    has_scores = all(key in analysis_data for key in ('ground_score', 'engine_score', 'weapon_score'))
+    if has_gap:
+        charts['gap'] = {
+            'actual_bat_speed': analysis_data['actual_bat_speed'],
+            'potential_bat_speed': analysis_data['potential_bat_speed']
+        }
+    if has_scores:
+        charts['radar'] = {
+            'ground_score': analysis_data['ground_score'],
+            'engine_score': analysis_data['engine_score'],
+            'weapon_score': analysis_data['weapon_score']
+        }
+    if analysis_data.get('sequence'):
+        charts['sequence'] = {'sequence_data': analysis_data['sequence']}
+    if analysis_data.get('energy'):
+        charts['energy'] = {
+            'lowerhalf_pct': analysis_data['energy'].get('lowerhalf_pct', 0),
+            'torso_pct': analysis_data['energy'].get('torso_pct', 0),
+            'arms_pct': analysis_data['energy'].get('arms_pct', 0)
+        }
+    has_player = all(key in player_data for key in ('name', 'age', 'height_inches', 'weight_lbs'))
+    if has_gap and has_scores and has_player:
+        charts['composite'] = {'player_data': player_data, 'analysis_data': analysis_data}
+    return charts
+
+
+class ChartRenderer:
+    """
+    Cached chart rendering, in-process (render) or in a process pool
+    (render_async)
+    """
+
+    def __init__(self, max_entries: int = CACHE_SIZE, max_workers: int = RENDER_WORKERS,
+                 executor: Optional[ProcessPoolExecutor] = None, asset_dir: Optional[str] = ASSET_DIR):
+        self.max_entries = max_entries
+        self.max_workers = max_workers
+        self.asset_dir = asset_dir  # None: assets only live in this process
+        self.asset_ttl_seconds = ASSET_TTL_SECONDS
+        self.asset_max_bytes = ASSET_MAX_BYTES
+        self._last_sweep = time.monotonic()
+        self._written_since_sweep = 0
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._assets: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.RLock()  # _finish may run inline under it
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            image = self._cache.get(key)
+            if image is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            return image
+
+    def _put(self, key: str, image: bytes):
+        with self._lock:
+            self._cache[key] = image
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a threaded server process can deadlock the children
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_warm_worker
+                )
+            return self._executor
+
+    def render(self, kind: str, data: Dict, fmt: str = 'png') -> bytes:
+        """Render in this process (blocking), or return the cached image"""
+        key = chart_cache_key(kind, data, fmt)
+        image = self._get(key)
+        if image is None:
+            with self._lock:
+                self.misses += 1
+            image = render_chart(kind, data, fmt)
+            self._put(key, image)
+        return image
+
+    async def render_async(self, kind: str, data: Dict, fmt: str = 'png') -> bytes:
+        """Render in the process pool without blocking the event loop"""
+        key = chart_cache_key(kind, data, fmt)
+        image = self._get(key)
+        if image is not None:
+            return image
+
+        pool = self._pool()
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+            else:
+                self.misses += 1
+                future = pool.submit(render_chart, kind, data, fmt)
+                self._inflight[key] = future
+                future.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.wrap_future(future)
+
+    def _finish(self, key: str, future: Future):
+        # Runs on the pool's management thread (or inline if already done)
+        error = 'cancelled' if future.cancelled() else future.exception()
+        if error is None:
+            self._put(key, future.result())
+        else:
+            logger.error(f"❌ Chart render {key[:8]} failed: {error}")
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    @staticmethod
+    def data_uri(image: bytes, fmt: str = 'png') -> str:
+        """data: URI for embedding in HTML / JSON"""
+        return f"data:{FORMATS[fmt]};base64,{base64.b64encode(image).decode('ascii')}"
+
+    def report_charts(self, player_data: Dict, analysis_data: Dict, fmt: str = 'png') -> Dict[str, str]:
+        """The report's charts as data URIs, rendered in this process"""
+        return {
+            kind: self.data_uri(self.render(kind, data, fmt), fmt)
+            for kind, data in report_chart_data(player_data, analysis_data).items()
+        }
+
+    async def report_charts_async(self, player_data: Dict, analysis_data: Dict, fmt: str = 'png') -> Dict[str, str]:
+        """The report's charts as data URIs, rendered in parallel in the process pool"""
+        charts = report_chart_data(player_data, analysis_data)
+        images = await asyncio.gather(*(self.render_async(kind, data, fmt) for kind, data in charts.items()))
+        return {kind: self.data_uri(image, fmt) for kind, image in zip(charts, images)}
+
+    def _remember_asset(self, name: str, image: bytes):
+        with self._lock:
+            self._assets[name] = image
+            self._assets.move_to_end(name)
+            while len(self._assets) > self.max_entries:
+                self._assets.popitem(last=False)
+
+    def publish(self, image: bytes, fmt: str = 'png') -> str:
+        """
+        Keep a rendered chart as an asset (written once to asset_dir)
+
+        Returns:
+            Asset name "<sha256 prefix>.<fmt>"; same content, same name
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown chart format {fmt!r} (expected one of {sorted(FORMATS)})")
+        name = f"{hashlib.sha256(image).hexdigest()[:24]}.{fmt}"
+        if self.asset_dir is not None:
+            path = os.path.join(self.asset_dir, name)
+            if not _touch(path):
+                os.makedirs(self.asset_dir, exist_ok=True)
+                # Write then rename, so a concurrent reader never sees a partial file
+                fd, tmp_path = tempfile.mkstemp(dir=self.asset_dir, suffix='.part')
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(image)
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+                    raise
+                self._maybe_sweep(len(image))
+        self._remember_asset(name, image)
+        return name
+
+    def _maybe_sweep(self, written: int):
+        with self._lock:
+            self._written_since_sweep += written
+            due = time.monotonic() - self._last_sweep >= ASSET_SWEEP_SECONDS or \
+                self._written_since_sweep >= self.asset_max_bytes // 10
+            if due:
+                self._last_sweep = time.monotonic()
+                self._written_since_sweep = 0
+        if due:
+            self.cleanup_assets()
+
+    def cleanup_assets(self) -> int:
+        """
+        Delete assets (files in asset_dir) not published or read for
+        asset_ttl_seconds, then the least recently used ones until the
+        directory is under asset_max_bytes
+
+        Returns:
+            Number of files removed
+        """
+        if self.asset_dir is None or not os.path.isdir(self.asset_dir):
+            return 0
+        cutoff = time.time() - self.asset_ttl_seconds
+        files = []
+        for entry in os.scandir(self.asset_dir):
+            if not (ASSET_NAME.match(entry.name) or entry.name.endswith('.part')):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            if entry.name.endswith('.part') and stat.st_mtime > cutoff:
+                continue  # being written right now
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for mtime, size, path in files:
+            if mtime > cutoff and total <= self.asset_max_bytes:
+                break
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass  # another worker's sweep got there first
+            total -= size
+        if removed:
+            logger.info(f"🧹 Removed {removed} chart assets from {self.asset_dir}")
+        return removed
+
+    def asset(self, name: str) -> Optional[Tuple[bytes, str]]:
+        """(image, media type) of a published asset, None if unknown"""
+        with self._lock:
+            image = self._assets.get(name)
+            if image is not None:
+                self._assets.move_to_end(name)
+        if image is None:
+            if self.asset_dir is None or not ASSET_NAME.match(name):
+                return None
+            path = os.path.join(self.asset_dir, name)
+            try:
+                with open(path, 'rb') as f:
+                    image = f.read()
+            except FileNotFoundError:
+                return None
+            _touch(path)  # still linked, so keep it past the sweep
+            self._remember_asset(name, image)
+        return image, FORMATS[name.rsplit('.', 1)[-1]]
+
+    async def report_chart_assets_async(self, player_data: Dict, analysis_data: Dict,
+                                        fmt: str = 'png') -> Dict[str, str]:
+        """The report's charts rendered in the process pool and published; {kind: asset name}"""
+        charts = report_chart_data(player_data, analysis_data)
+        images = await asyncio.gather(*(self.render_async(kind, data, fmt) for kind, data in charts.items()))
+        names = await asyncio.to_thread(lambda: [self.publish(image, fmt) for image in images])
+        return dict(zip(charts, names))
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'entries': len(self._cache),
+                'bytes': sum(len(image) for image in self._cache.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'inflight': len(self._inflight),
+                'assets': len(self._assets)
+            }
+
+    def close(self):
+        """Shut down the process pool (if this renderer created it)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._owns_executor:
+            executor.shutdown(wait=True)
+
+
+_chart_renderer = None
+
+
+def get_chart_renderer() -> ChartRenderer:
+    """Get the shared chart renderer"""
+    global _chart_renderer
+    if _chart_renderer is None:
+        _chart_renderer = ChartRenderer()
+    return _chart_renderer
@@ -0,0 +1,231 @@
+"""
+Cohort Percentile Engine
+========================
+
+Empirical percentile rankings per (age group, metric), built from stored
+training sessions instead of the four hard-coded benchmark thresholds.
+
+Each cohort keeps its samples sorted and a precomputed quantile grid
+(0th..100th percentile). A percentile query is a binary search into that
+grid with linear interpolation, vectorized over whole rosters with
+np.searchsorted.
+
+New observations are buffered and folded in by refresh(), which only
+touches cohorts that received data. sync_from_store() pulls sessions
+updated since the previous sync from a progress session store; a session
+that was ingested before has its old values replaced.
+
+Usage:
+    engine = CohortPercentileEngine()
+    engine.ingest_sessions(tracker_sessions)      # TrainingSession objects
+    engine.refresh()
+    engine.percentiles('high_school', 'bat_speed_mph', [58.0, 64.5, 71.2])
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Quantile grid resolution: 101 points = every whole percentile
+GRID_SIZE = 101
+# Cohorts smaller than this are not trusted for ranking
+DEFAULT_MIN_SAMPLES = 20
+
+# Age group boundaries, matching ProfileComparison._determine_age_group:
+# <=13 youth, <=18 high_school, <=23 college, otherwise adult
+AGE_GROUP_UPPER_BOUNDS = np.array([13, 18, 23])
+AGE_GROUP_LABELS = np.array(['youth', 'high_school', 'college', 'adult'])
+
+# ProfileComparison metric name -> TrainingSession attribute
+SESSION_METRICS = {
+    'bat_speed_mph': 'actual_bat_speed_mph',
+    'ground_score': 'ground_score_adjusted',
+    'engine_score': 'engine_score_adjusted',
+    'weapon_score': 'weapon_score_adjusted',
+}
+
+CohortKey = Tuple[str, str]  # (age_group, metric)
+
+
+def age_groups_for(ages) -> np.ndarray:
+    """Vectorized age group labels for an array of ages"""
+    ages = np.asarray(ages, dtype=float)
+    return AGE_GROUP_LABELS[np.searchsorted(AGE_GROUP_UPPER_BOUNDS, ages, side='left')]
+
+
+def _remove_sorted(samples: np.ndarray, values: Sequence[float]) -> np.ndarray:
+    """Sorted samples with one occurrence of each of `values` taken out"""
+    values = np.sort(np.asarray(values, dtype=float))
+    # k-th repeat of a value removes the k-th equal sample
+    positions = np.searchsorted(samples, values, side='left') + \
+        (np.arange(values.size) - np.searchsorted(values, values, side='left'))
+    found = positions < samples.size
+    found[found] = samples[positions[found]] == values[found]
+    keep = np.ones(samples.size, dtype=bool)
+    keep[positions[found]] = False
+    return samples[keep]
+
+
+class CohortPercentileEngine:
+    """Empirical CDFs per age group and metric with batched lookups"""
+
+    def __init__(self, min_samples: int = DEFAULT_MIN_SAMPLES, grid_size: int = GRID_SIZE):
+        self.min_samples = min_samples
+        self.grid_size = grid_size
+        self._percent_points = np.linspace(0.0, 100.0, grid_size)
+        self._samples: Dict[CohortKey, np.ndarray] = {}  # sorted
+        self._grids: Dict[CohortKey, np.ndarray] = {}
+        self._pending: Dict[CohortKey, List[np.ndarray]] = {}
+        self._removals: Dict[CohortKey, List[float]] = {}  # stale samples to drop on refresh
+        self._session_values: Dict[str, Tuple[str, Tuple[float, ...]]] = {}  # session_id -> (age group, metrics)
+        self.last_refreshed: Optional[datetime] = None
+        self.last_synced: Optional[datetime] = None
+
+    # ========================================
+    # INGEST & REFRESH
+    # ========================================
+
+    def add_observations(self, age_group: str, metric: str, values: Sequence[float]) -> None:
+        """Buffer samples for one cohort (applied on the next refresh)"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size:
+            self._pending.setdefault((age_group, metric), []).append(values)
+
+    def add_observations_by_age(self, ages: Sequence[float], metric: str, values: Sequence[float]) -> None:
+        """Buffer samples for many players, split into age group cohorts"""
+        groups = age_groups_for(ages)
+        values = np.asarray(values, dtype=float)
+        for group in np.unique(groups):
+            self.add_observations(str(group), metric, values[groups == group])
+
+    def ingest_sessions(self, sessions: Iterable) -> int:
+        """
+        Buffer metrics from TrainingSession objects
+
+        Sessions are tracked by session_id: an unchanged session is not
+        counted twice, and an updated one replaces its previous values on
+        the next refresh. Returns the number of new or updated sessions.
+        """
+        ages, columns = [], {metric: [] for metric in SESSION_METRICS}
+        for session in sessions:
+            values = tuple(
+                np.nan if getattr(session, attribute) is None else float(getattr(session, attribute))
+                for attribute in SESSION_METRICS.values()
+            )
+            age_group = str(age_groups_for([session.age])[0])
+            previous = self._session_values.get(session.session_id)
+            if previous is not None:
+                if previous[0] == age_group and np.array_equal(previous[1], values, equal_nan=True):
+                    continue
+                old_group, old_values = previous
+                for metric, value in zip(SESSION_METRICS, old_values):
+                    if not np.isnan(value):
+                        self._removals.setdefault((old_group, metric), []).append(value)
+            self._session_values[session.session_id] = (age_group, values)
+            ages.append(session.age)
+            for metric, value in zip(SESSION_METRICS, values):
+                columns[metric].append(value)
+
+        if ages:
+            for metric, values in columns.items():
+                self.add_observations_by_age(ages, metric, values)
+        return len(ages)
+
+    def refresh(self) -> List[CohortKey]:
+        """Fold buffered samples (and replaced ones) into their cohorts and rebuild those grids only"""
+        refreshed = []
+        for key in list(dict.fromkeys([*self._pending, *self._removals])):
+            existing = self._samples.get(key)
+            chunks = ([existing] if existing is not None else []) + self._pending.get(key, [])
+            merged = np.concatenate(chunks) if chunks else np.empty(0)
+            merged.sort()
+            if key in self._removals:
+                merged = _remove_sorted(merged, self._removals[key])
+            if merged.size:
+                self._samples[key] = merged
+                self._grids[key] = np.quantile(merged, self._percent_points / 100.0)
+            else:
+                self._samples.pop(key, None)
+                self._grids.pop(key, None)
+            refreshed.append(key)
+        self._pending.clear()
+        self._removals.clear()
+        self.last_refreshed = datetime.utcnow()
+        if refreshed:
+            logger.info(f"📊 Refreshed {len(refreshed)} percentile cohorts")
+        return refreshed
+
+    def sync_from_store(self, store) -> int:
+        """
+        Ingest sessions updated since the last sync and refresh
+
+        `store` must provide load_updated_since(since) (see
+        progress_session_store.SqlProgressSessionStore).
+        """
+        started = datetime.utcnow()
+        added = self.ingest_sessions(store.load_updated_since(self.last_synced))
+        self.last_synced = started
+        self.refresh()
+        return added
+
+    def refresh_if_due(self, store, max_age_seconds: float) -> bool:
+        """Periodic refresh hook: sync only when the last sync is older than max_age_seconds"""
+        if self.last_synced and (datetime.utcnow() - self.last_synced).total_seconds() < max_age_seconds:
+            return False
+        self.sync_from_store(store)
+        return True
+
+    # ========================================
+    # QUERIES
+    # ========================================
+
+    def sample_count(self, age_group: str, metric: str) -> int:
+        samples = self._samples.get((age_group, metric))
+        return 0 if samples is None else int(samples.size)
+
+    def has_cohort(self, age_group: str, metric: str) -> bool:
+        """True when the cohort has enough samples to rank against"""
+        return self.sample_count(age_group, metric) >= self.min_samples
+
+    def quantiles(self, age_group: str, metric: str) -> Optional[np.ndarray]:
+        """Precomputed 0..100th percentile values (None if the cohort is empty)"""
+        return self._grids.get((age_group, metric))
+
+    def percentiles(self, age_group: str, metric: str, values: Sequence[float]) -> np.ndarray:
+        """
+        Percentile (0-100, float) of each value within one cohort
+
+        Binary search into the quantile grid, interpolating linearly
+        between neighbouring grid points. Values below the cohort minimum
+        read 0, values at or above the maximum read 100.
+        """
+        grid = self._grids.get((age_group, metric))
+        values = np.asarray(values, dtype=float)
+        if grid is None:
+            raise KeyError(f"No cohort for {age_group}/{metric}")
+
+        upper = np.searchsorted(grid, values, side='right')
+        inner = np.clip(upper, 1, grid.size - 1)
+        low, high = grid[inner - 1], grid[inner]
+        width = high - low
+        fraction = np.divide(values - low, width, out=np.zeros_like(values), where=width > 0)
+        result = (inner - 1 + np.clip(fraction, 0.0, 1.0)) * (100.0 / (grid.size - 1))
+        result = np.where(upper == 0, 0.0, result)
+        result = np.where(upper >= grid.size, 100.0, result)
+        return np.where(np.isnan(values), np.nan, result)
+
+    def percentiles_by_age(self, ages: Sequence[float], metric: str, values: Sequence[float]) -> np.ndarray:
+        """Percentiles for a mixed-age roster (NaN where the cohort is too small)"""
+        groups = age_groups_for(ages)
+        values = np.asarray(values, dtype=float)
+        result = np.full(values.shape, np.nan)
+        for group in np.unique(groups):
+            if self.has_cohort(str(group), metric):
+                mask = groups == group
+                result[mask] = self.percentiles(str(group), metric, values[mask])
+        return result
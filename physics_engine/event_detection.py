@@ -6,11 +6,14 @@ CRITICAL FIX: Now detects swing window FIRST, then finds events within that wind
 This prevents finding events in wrong parts of long videos with multiple swings
 """
 
+import logging
 import numpy as np
 from typing import List, Optional, Dict, Tuple
 from dataclasses import dataclass
 from physics_calculator import JointAngles, JointVelocities
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class SwingWindow:
@@ -92,18 +95,16 @@ class EventDetector:
         Returns:
             SwingWindow or None if no valid swing found
         """
-        print(f"\n🔍 SWING WINDOW DETECTION (debug mode)")
-        print(f"   Total velocities: {len(velocities) if velocities else 0}")
+        logger.debug("🔍 SWING WINDOW DETECTION: %d velocities", len(velocities) if velocities else 0)
         
         if not velocities or len(velocities) < 20:
-            print(f"   ❌ Not enough velocities (need at least 20)")
+            logger.debug("❌ Not enough velocities (need at least 20)")
             return None
         
         # Get time range
-        if velocities:
-            first_time = velocities[0].timestamp_ms
-            last_time = velocities[-1].timestamp_ms
-            print(f"   Time range: {first_time:.0f}ms to {last_time:.0f}ms ({(last_time-first_time)/1000:.2f}s)")
+        first_time = velocities[0].timestamp_ms
+        last_time = velocities[-1].timestamp_ms
+        logger.debug("Time range: %.0fms to %.0fms (%.2fs)", first_time, last_time, (last_time - first_time) / 1000)
         
         # Calculate combined velocity metric (bat + hand velocities)
         combined_vels = []
@@ -117,29 +118,29 @@ class EventDetector:
             combined_vels.append(vel)
         
         if not combined_vels:
-            print(f"   ❌ No valid velocities found")
+            logger.debug("❌ No valid velocities found")
             return None
         
-        # Statistics
+        # Statistics (min/max only computed for the debug line)
         mean_vel = np.mean(combined_vels)
-        max_vel = np.max(combined_vels)
-        min_vel = np.min(combined_vels)
-        print(f"   Velocity stats: min={min_vel:.2f} m/s, max={max_vel:.2f} m/s, mean={mean_vel:.2f} m/s")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Velocity stats: min=%.2f m/s, max=%.2f m/s, mean=%.2f m/s",
+                         np.min(combined_vels), np.max(combined_vels), mean_vel)
         
         # Find peak velocity (likely contact point)
         peak_idx = np.argmax(combined_vels)
         peak_velocity = combined_vels[peak_idx]
         peak_velocity_ms = velocities[peak_idx].timestamp_ms
         
-        print(f"   ✓ Peak velocity: {peak_velocity:.2f} m/s at index {peak_idx}, time {peak_velocity_ms:.0f}ms ({peak_velocity_ms/1000:.2f}s)")
+        logger.debug("✓ Peak velocity: %.2f m/s at index %d, time %.0fms", peak_velocity, peak_idx, peak_velocity_ms)
         
         # Look backward for swing start (load phase begins)
         # Typically 300-600ms before contact
         search_start_idx = max(0, peak_idx - 100)  # Search ~100 frames back
         
         # Find where velocity was low (stance/early load)
-        velocity_threshold = np.mean(combined_vels) * 0.3  # 30% of mean
-        print(f"   Velocity threshold: {velocity_threshold:.2f} m/s (30% of mean)")
+        velocity_threshold = mean_vel * 0.3  # 30% of mean
+        logger.debug("Velocity threshold: %.2f m/s (30%% of mean)", velocity_threshold)
         
         start_idx = peak_idx
         for i in range(peak_idx - 1, search_start_idx, -1):
@@ -147,7 +148,7 @@ class EventDetector:
                 start_idx = i
                 break
         
-        print(f"   Window start: index {start_idx}, time {velocities[start_idx].timestamp_ms:.0f}ms")
+        logger.debug("Window start: index %d, time %.0fms", start_idx, velocities[start_idx].timestamp_ms)
         
         # Look forward for follow-through end
         # Typically 200-400ms after contact
@@ -163,7 +164,7 @@ class EventDetector:
             # Didn't find low velocity, use search end
             end_idx = search_end_idx
         
-        print(f"   Window end: index {end_idx}, time {velocities[end_idx].timestamp_ms:.0f}ms")
+        logger.debug("Window end: index %d, time %.0fms", end_idx, velocities[end_idx].timestamp_ms)
         
         # Create swing window
         window = SwingWindow(
@@ -175,14 +176,12 @@ class EventDetector:
         # Validate window duration
         duration = window.duration_ms()
         
-        print(f"   Window duration: {duration:.0f}ms")
-        print(f"   Validation: min={min_duration_ms}ms, max={max_duration_ms}ms")
-        
         if duration < min_duration_ms or duration > max_duration_ms:
-            print(f"   ❌ Invalid duration: {duration:.0f}ms (outside range {min_duration_ms}-{max_duration_ms}ms)")
+            logger.debug("❌ Invalid duration: %.0fms (outside range %s-%sms)",
+                         duration, min_duration_ms, max_duration_ms)
             return None
         
-        print(f"   ✓ Valid swing window detected!")
+        logger.debug("✓ Valid swing window: %.0fms", duration)
         return window
     
     def detect_stance(self, angles: List[JointAngles],
@@ -8,13 +8,20 @@ Ground truth validation (Connor Gray):
 - Video: 19.17 seconds
 - Swing window: ~2 seconds around peak velocity
 - Tempo: 3.38, Bat Speed: 57.5 mph
+
+Multi-swing sessions: find_swing_windows() returns one window per swing
+(bat velocity peaks separated by a refractory period) and
+detect_window_events() runs the same event detection inside any window.
 """
 
+import logging
 import numpy as np
 from typing import List, Optional, Dict, Tuple
 from dataclasses import dataclass
 from physics_calculator import JointAngles, JointVelocities
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class SwingWindow:
@@ -93,61 +100,58 @@ class EventDetector:
             SwingEvents or None if detection fails
         """
         if not angles or not velocities or len(angles) < 5:
-            print("❌ Not enough data for event detection")
+            logger.warning("❌ Not enough data for event detection")
             return None
         
-        video_duration_s = (angles[-1].timestamp_ms - angles[0].timestamp_ms) / 1000
-        print(f"\n🔍 EVENT DETECTION (V3 - with swing isolation)")
-        print(f"   Total frames: {len(angles)}")
-        print(f"   Video duration: {video_duration_s:.2f} seconds")
-        print(f"   Time range: {angles[0].timestamp_ms:.0f}ms to {angles[-1].timestamp_ms:.0f}ms")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 EVENT DETECTION (V3 - with swing isolation): %d frames, %.2f s (%.0fms to %.0fms)",
+                         len(angles), (angles[-1].timestamp_ms - angles[0].timestamp_ms) / 1000,
+                         angles[0].timestamp_ms, angles[-1].timestamp_ms)
         
         try:
             # STEP 1: ISOLATE THE SWING WINDOW (critical!)
             swing_window = self.isolate_swing_window(velocities)
             
             if not swing_window:
-                print("❌ Could not isolate swing window")
+                logger.warning("❌ Could not isolate swing window")
                 return None
             
-            print(f"\n   ✅ SWING WINDOW ISOLATED:")
-            print(f"      Window: {swing_window.start_ms:.0f}ms to {swing_window.end_ms:.0f}ms")
-            print(f"      Duration: {swing_window.duration_ms():.0f}ms ({swing_window.duration_ms()/1000:.2f}s)")
-            print(f"      Peak velocity: {swing_window.peak_velocity_value:.1f} m/s at {swing_window.peak_velocity_ms:.0f}ms")
-            
             # Filter angles and velocities to swing window only
             window_angles = [a for a in angles 
                            if swing_window.start_ms <= a.timestamp_ms <= swing_window.end_ms]
             window_velocities = [v for v in velocities 
                                if swing_window.start_ms <= v.timestamp_ms <= swing_window.end_ms]
             
-            print(f"      Frames in window: {len(window_angles)} angles, {len(window_velocities)} velocities")
+            logger.debug("✅ Swing window isolated: %.0fms to %.0fms (%.0fms), peak velocity %.1f m/s at %.0fms, "
+                         "%d angles / %d velocities in window",
+                         swing_window.start_ms, swing_window.end_ms, swing_window.duration_ms(),
+                         swing_window.peak_velocity_value, swing_window.peak_velocity_ms,
+                         len(window_angles), len(window_velocities))
             
             if len(window_angles) < 5 or len(window_velocities) < 5:
-                print("❌ Not enough frames in swing window")
+                logger.warning("❌ Not enough frames in swing window")
                 return None
             
             # STEP 2: DETECT EVENTS WITHIN THE ISOLATED WINDOW
             
             # 1. STANCE - first frame of window
             stance_ms = window_angles[0].timestamp_ms
-            print(f"\n   ✓ Stance: {stance_ms:.0f}ms (window start)")
             
             # 2. LOAD - max backward pelvis movement
             load_ms = self.detect_load(window_angles)
-            print(f"   ✓ Load: {load_ms:.0f}ms")
             
             # 3. FOOT DOWN - forward COM movement starts
             foot_down_ms = self.detect_foot_down(window_angles, load_ms)
-            print(f"   ✓ Foot Down: {foot_down_ms:.0f}ms")
             
             # 4. CONTACT - use the peak velocity we already found
             contact_ms = swing_window.peak_velocity_ms
-            print(f"   ✓ Contact: {contact_ms:.0f}ms (peak bat velocity)")
             
             # 5. FOLLOW THROUGH - last frame of window
             finish_ms = window_angles[-1].timestamp_ms
-            print(f"   ✓ Follow Through: {finish_ms:.0f}ms (window end)")
+            
+            logger.debug("✓ Events: stance %.0fms, load %.0fms, foot down %.0fms, "
+                         "contact %.0fms (peak bat velocity), follow through %.0fms",
+                         stance_ms, load_ms, foot_down_ms, contact_ms, finish_ms)
             
             # Validate phase order
             load_ms, foot_down_ms, contact_ms = self.validate_phases(
@@ -162,29 +166,141 @@ class EventDetector:
                 follow_through_ms=finish_ms
             )
             
-            # Print tempo
-            tempo = events.get_tempo_ratio()
-            load_dur = events.get_load_duration_ms()
-            swing_dur = events.get_swing_duration_ms()
-            print(f"\n   📊 TEMPO ANALYSIS:")
-            print(f"      Load Duration:  {load_dur:.0f}ms")
-            print(f"      Swing Duration: {swing_dur:.0f}ms")
-            print(f"      Tempo Ratio:    {tempo:.2f}:1")
-            
-            # Validation
-            if tempo < 1.0 or tempo > 5.0:
-                print(f"      ⚠️  Tempo {tempo:.2f} outside normal range (1.0-5.0)")
-            elif 2.0 <= tempo <= 3.5:
-                print(f"      ✅ Tempo {tempo:.2f} in optimal range (2.0-3.5)")
+            # Log tempo
+            if logger.isEnabledFor(logging.DEBUG):
+                tempo = events.get_tempo_ratio()
+                logger.debug("📊 Tempo: load %.0fms, swing %.0fms, ratio %.2f:1",
+                             events.get_load_duration_ms(), events.get_swing_duration_ms(), tempo)
+                
+                # Validation
+                if tempo < 1.0 or tempo > 5.0:
+                    logger.debug("⚠️  Tempo %.2f outside normal range (1.0-5.0)", tempo)
+                elif 2.0 <= tempo <= 3.5:
+                    logger.debug("✅ Tempo %.2f in optimal range (2.0-3.5)", tempo)
             
             return events
             
-        except Exception as e:
-            print(f"❌ Event detection failed: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("❌ Event detection failed")
             return None
     
+    def detect_window_events(self, window_angles: List[JointAngles],
+                             swing_window: SwingWindow) -> Optional[SwingEvents]:
+        """
+        Detect events inside an already isolated swing window (no logging)
+        
+        Args:
+            window_angles: Joint angles within the window, in time order
+            swing_window: The window (its peak velocity time is contact)
+        
+        Returns:
+            SwingEvents or None if the window has fewer than 5 frames
+        """
+        if len(window_angles) < 5:
+            return None
+        
+        # 1. STANCE - first frame of window
+        stance_ms = window_angles[0].timestamp_ms
+        # 2. LOAD - max backward pelvis movement
+        load_ms = self.detect_load(window_angles)
+        # 3. FOOT DOWN - forward COM movement starts
+        foot_down_ms = self.detect_foot_down(window_angles, load_ms)
+        # 4. CONTACT - the window's peak bat velocity
+        contact_ms = swing_window.peak_velocity_ms
+        # 5. FOLLOW THROUGH - last frame of window
+        finish_ms = window_angles[-1].timestamp_ms
+        
+        # Validate phase order
+        load_ms, foot_down_ms, contact_ms = self.validate_phases(
+            stance_ms, load_ms, foot_down_ms, contact_ms, finish_ms
+        )
+        
+        return SwingEvents(
+            stance_time_ms=stance_ms,
+            load_start_ms=load_ms,
+            foot_down_ms=foot_down_ms,
+            contact_ms=contact_ms,
+            follow_through_ms=finish_ms
+        )
+    
+    def find_swing_windows(self, velocities: List[JointVelocities],
+                           window_size_ms: float = 2000,
+                           refractory_ms: Optional[float] = None,
+                           min_peak_velocity: float = 1.0,
+                           min_relative_peak: float = 0.5) -> List[SwingWindow]:
+        """
+        Find every swing in a long video (cage session, multiple takes)
+        
+        Strategy:
+        1. Local maxima of |bat velocity| at least min_peak_velocity (m/s)
+           and min_relative_peak x the session's fastest swing (drops
+           waggles and practice cuts)
+        2. Strongest peaks first; any peak within refractory_ms of an
+           accepted one belongs to the same swing and is suppressed
+        3. ±window_size_ms/2 around each accepted peak, like
+           isolate_swing_window
+        
+        Args:
+            velocities: All velocities from full video
+            window_size_ms: Window size around each peak (default 2 seconds)
+            refractory_ms: Minimum time between swings (default window_size_ms,
+                so windows never overlap)
+            min_peak_velocity: Absolute peak threshold in m/s
+            min_relative_peak: Peak threshold relative to the fastest swing
+        
+        Returns:
+            SwingWindows in time order; the fastest swing's window is the
+            one isolate_swing_window returns
+        """
+        if not velocities or len(velocities) < 10:
+            return []
+        if refractory_ms is None:
+            refractory_ms = window_size_ms
+        
+        times = np.array([v.timestamp_ms for v in velocities], dtype=float)
+        speeds = np.abs(np.array(
+            [v.bat_velocity if hasattr(v, 'bat_velocity') else 0 for v in velocities], dtype=float
+        ))
+        
+        # Local maxima (first sample of a plateau, like the strict > scan)
+        padded = np.concatenate(([-np.inf], speeds, [-np.inf]))
+        is_peak = (speeds > padded[:-2]) & (speeds >= padded[2:])
+        threshold = max(min_peak_velocity, min_relative_peak * speeds.max())
+        candidates = np.flatnonzero(is_peak & (speeds >= threshold))
+        if candidates.size == 0:
+            return []
+        
+        # Non-maximum suppression: strongest first, earliest on ties
+        order = candidates[np.argsort(-speeds[candidates], kind='stable')]
+        accepted_times: List[float] = []
+        accepted: List[int] = []
+        for idx in order:
+            peak_ms = times[idx]
+            pos = np.searchsorted(accepted_times, peak_ms)
+            if pos > 0 and peak_ms - accepted_times[pos - 1] < refractory_ms:
+                continue
+            if pos < len(accepted_times) and accepted_times[pos] - peak_ms < refractory_ms:
+                continue
+            accepted_times.insert(pos, peak_ms)
+            accepted.insert(pos, int(idx))
+        
+        return [
+            self._window_around(velocities, idx, speeds[idx], window_size_ms)
+            for idx in accepted
+        ]
+    
+    def _window_around(self, velocities: List[JointVelocities], peak_idx: int,
+                       peak_value: float, window_size_ms: float) -> SwingWindow:
+        """±window_size_ms/2 around a peak, clamped to the data range"""
+        peak_ms = velocities[peak_idx].timestamp_ms
+        half_window = window_size_ms / 2
+        return SwingWindow(
+            start_ms=max(peak_ms - half_window, velocities[0].timestamp_ms),
+            end_ms=min(peak_ms + half_window, velocities[-1].timestamp_ms),
+            peak_velocity_ms=peak_ms,
+            peak_velocity_value=float(peak_value)
+        )
+    
     def isolate_swing_window(self, velocities: List[JointVelocities],
                             window_size_ms: float = 2000) -> Optional[SwingWindow]:
         """
@@ -216,7 +332,7 @@ class EventDetector:
                 peak_idx = i
         
         if max_bat_vel < 1.0:  # No clear swing detected
-            print(f"   ⚠️  Peak bat velocity too low: {max_bat_vel:.2f} m/s")
+            logger.debug("⚠️  Peak bat velocity too low: %.2f m/s", max_bat_vel)
             return None
         
         peak_ms = velocities[peak_idx].timestamp_ms
@@ -14,7 +14,11 @@ Author: Kinetic DNA Blueprint
 """
 
 from typing import Dict, List, Tuple
-import math
+
+try:
+    from .benchmark_index import NearestBenchmarkIndex
+except ImportError:
+    from benchmark_index import NearestBenchmarkIndex
 
 
 class ExitVelocityPredictor:
@@ -62,6 +66,9 @@ class ExitVelocityPredictor:
         'poor': 1.30        # Significant mistiming
     }
     
+    # Built once at import: height-bucketed nearest neighbour index (memoized)
+    BENCHMARK_INDEX = NearestBenchmarkIndex(MLB_BENCHMARKS)
+    
     def __init__(self):
         """Initialize the exit velocity predictor"""
         pass
@@ -95,23 +102,13 @@ class ExitVelocityPredictor:
             >>> neighbors = predictor.find_nearest_benchmarks(68, 190, num_neighbors=4)
             >>> print(f"Nearest: {neighbors[0][4]} at {neighbors[0][2]} mph max")
         """
-        distances = []
-        
-        for (h, w), (max_ev, avg_ev, name) in self.MLB_BENCHMARKS.items():
-            # Calculate weighted Euclidean distance
-            # Height weighted 5x more than weight
-            height_diff = h - height_inches
-            weight_diff = w - weight_lbs
-            
-            distance = math.sqrt((height_diff * 5) ** 2 + weight_diff ** 2)
-            
-            distances.append((h, w, max_ev, avg_ev, name, distance))
-        
-        # Sort by distance (closest first)
-        distances.sort(key=lambda x: x[5])
-        
-        # Return top N neighbors
-        return distances[:num_neighbors]
+        # Precomputed index: same neighbors, distances and tie order as
+        # scanning MLB_BENCHMARKS and stable-sorting by distance
+        return [
+            (h, w, max_ev, avg_ev, name, distance)
+            for distance, (h, w), (max_ev, avg_ev, name)
+            in self.BENCHMARK_INDEX.nearest(height_inches, weight_lbs, num_neighbors)
+        ]
     
     def interpolate_max_exit_velo(
         self,
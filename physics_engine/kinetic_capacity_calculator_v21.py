@@ -17,11 +17,83 @@ Key Innovation:
 - Then convert that to a bat speed RANGE based on skill level
 
 Philosophy: "Your body has X capacity. Let's see how much you're using."
+
+Roster scoring: calculate_energy_capacity_v21_batch() / _frame() apply the
+same corrections as NumPy array operations for many players at once.
 """
 
+import logging
 import numpy as np
 from typing import Dict, Tuple, Optional
 
+try:
+    from .benchmark_index import NearestBenchmarkIndex
+except ImportError:
+    from benchmark_index import NearestBenchmarkIndex
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# LOOKUP TABLES
+# ============================================================================
+
+# Empirical baseline bat speed for a 30oz bat: (height_in, weight_lbs) -> mph
+BASELINE_TABLE = {
+    # Youth
+    (54, 70): 35, (54, 80): 38, (54, 90): 40,
+    (60, 90): 42, (60, 100): 45, (60, 110): 47,
+    
+    # Teen
+    (64, 120): 52, (64, 130): 54, (64, 140): 56,
+    (66, 130): 55, (66, 140): 57, (66, 150): 59,
+    
+    # Short Adult (NEW V2.1 - recalibrated for Altuve fix)
+    (66, 160): 60, (66, 166): 62, (66, 170): 63,
+    (66, 175): 64,
+    
+    # Adult
+    (68, 160): 68, (68, 170): 70, (68, 180): 72,
+    (68, 190): 75,  # ← ERIC WILLIAMS BASELINE
+    (68, 200): 77,
+    
+    (69, 175): 68, (69, 180): 70, (69, 185): 71,  # NEW V2.1 - Pedroia range
+    
+    (70, 170): 70, (70, 180): 72, (70, 190): 74,
+    (70, 200): 76, (70, 210): 78,
+    
+    (72, 190): 76, (72, 200): 78, (72, 205): 79, (72, 210): 80,  # Acuña
+    (72, 220): 82, (72, 224): 83, (72, 230): 83,  # Soto
+    
+    (74, 210): 80, (74, 220): 82, (74, 230): 84,
+    (74, 235): 85, (74, 240): 85, (74, 250): 86,  # Trout
+    
+    (75, 220): 83, (75, 225): 84, (75, 230): 85,  # Harper
+    
+    (76, 230): 84, (76, 240): 86, (76, 250): 87,
+    (76, 260): 88, (76, 270): 89,
+    
+    (77, 225): 85, (77, 230): 86, (77, 235): 87,  # Alvarez
+    
+    (78, 240): 87, (78, 245): 88, (78, 250): 89,  # Stanton
+    
+    (79, 270): 87, (79, 280): 88, (79, 282): 88, (79, 290): 89,  # Judge
+}
+
+# Skill level -> (min, max) fraction of theoretical max bat speed
+EFFICIENCY_RANGES = {
+    "mlb_elite": (0.85, 0.90),
+    "mlb_average": (0.75, 0.85),
+    "mlb_below_avg": (0.65, 0.75),
+    "college": (0.60, 0.70),
+    "high_school": (0.55, 0.65),
+    "youth": (0.45, 0.55)
+}
+DEFAULT_EFFICIENCY_RANGE = (0.75, 0.85)
+
+# Built once: height-bucketed nearest neighbour index with memoized IDW
+_BASELINE_INDEX = NearestBenchmarkIndex(BASELINE_TABLE)
+
 
 # ============================================================================
 # V2.1 NEW FUNCTIONS
@@ -66,8 +138,8 @@ def apply_short_player_correction(baseline_bat_speed: float, height_inches: floa
         # Apply both corrections
         baseline_bat_speed *= inertia_boost * baseline_recalibration
         
-        print(f"[V2.1] SHORT PLAYER BOOST: +{(inertia_boost - 1) * 100:.1f}% inertia, "
-              f"+9% baseline for {height_inches}\" → Total: +{(inertia_boost * baseline_recalibration - 1) * 100:.1f}%")
+        logger.debug("[V2.1] SHORT PLAYER BOOST: +%.1f%% inertia, +9%% baseline for %s\" → Total: +%.1f%%",
+                     (inertia_boost - 1) * 100, height_inches, (inertia_boost * baseline_recalibration - 1) * 100)
     
     return baseline_bat_speed
 
@@ -106,9 +178,8 @@ def apply_age_adjustment(baseline_bat_speed: float, age: int) -> float:
     
     baseline_bat_speed *= age_factor
     
-    age_effect_pct = (age_factor - 1.0) * 100
-    print(f"[V2.1] AGE ADJUSTMENT: {age_factor:.3f}x for age {age} "
-          f"({age_effect_pct:+.1f}% from peak at 27)")
+    logger.debug("[V2.1] AGE ADJUSTMENT: %.3fx for age %s (%+.1f%% from peak at 27)",
+                 age_factor, age, (age_factor - 1.0) * 100)
     
     return baseline_bat_speed
 
@@ -146,11 +217,9 @@ def apply_wingspan_adjustment_v2(baseline_bat_speed: float,
     baseline_bat_speed *= wingspan_boost
     
     if ape_index > 4:
-        print(f"[V2.1] WINGSPAN CAP: Ape index {ape_index:.1f}\" capped at 4\" "
-              f"(+4.8% max boost)")
+        logger.debug("[V2.1] WINGSPAN CAP: Ape index %.1f\" capped at 4\" (+4.8%% max boost)", ape_index)
     else:
-        print(f"[V2.1] WINGSPAN BOOST: +{(wingspan_boost - 1) * 100:.1f}% "
-              f"for {ape_index:.1f}\" ape index")
+        logger.debug("[V2.1] WINGSPAN BOOST: +%.1f%% for %.1f\" ape index", (wingspan_boost - 1) * 100, ape_index)
     
     return baseline_bat_speed
 
@@ -180,8 +249,8 @@ def apply_height_penalty_v2(baseline_bat_speed: float, height_inches: float) ->
         height_penalty = 1 - (excess_height * 0.006)  # -0.6% per inch
         baseline_bat_speed *= height_penalty
         
-        print(f"[V2.1] HEIGHT PENALTY: -{(1 - height_penalty) * 100:.1f}% "
-              f"for {height_inches}\" ({excess_height}\" over 6'0\")")
+        logger.debug("[V2.1] HEIGHT PENALTY: -%.1f%% for %s\" (%s\" over 6'0\")",
+                     (1 - height_penalty) * 100, height_inches, excess_height)
     
     return baseline_bat_speed
 
@@ -217,14 +286,14 @@ def apply_body_comp_adjustment_v2(baseline_bat_speed: float,
         # Severely stocky build: -5% penalty
         body_comp_penalty = 0.95
         baseline_bat_speed *= body_comp_penalty
-        print(f"[V2.1] BODY COMP PENALTY: -5.0% for severe stockiness "
-              f"({weight_lbs:.0f} vs {expected_weight:.0f} lbs expected, +{weight_diff_pct * 100:.1f}%)")
+        logger.debug("[V2.1] BODY COMP PENALTY: -5.0%% for severe stockiness (%.0f vs %.0f lbs expected, +%.1f%%)",
+                     weight_lbs, expected_weight, weight_diff_pct * 100)
     elif weight_diff_pct > 0.15:
         # Moderately stocky build: -3% penalty
         body_comp_penalty = 0.97
         baseline_bat_speed *= body_comp_penalty
-        print(f"[V2.1] BODY COMP PENALTY: -3.0% for stocky build "
-              f"({weight_lbs:.0f} vs {expected_weight:.0f} lbs expected, +{weight_diff_pct * 100:.1f}%)")
+        logger.debug("[V2.1] BODY COMP PENALTY: -3.0%% for stocky build (%.0f vs %.0f lbs expected, +%.1f%%)",
+                     weight_lbs, expected_weight, weight_diff_pct * 100)
     
     return baseline_bat_speed
 
@@ -255,13 +324,13 @@ def apply_bat_weight_adjustment_v2(baseline_bat_speed: float,
     if bat_weight_oz > 32:
         # Heavy bat: increased penalty (-0.9 mph per oz)
         bat_weight_adjustment = bat_weight_delta * 0.9
-        print(f"[V2.1] BAT WEIGHT (HEAVY): {bat_weight_adjustment:+.1f} mph for {bat_weight_oz}oz "
-              f"(penalty: 0.9 mph/oz)")
+        logger.debug("[V2.1] BAT WEIGHT (HEAVY): %+.1f mph for %soz (penalty: 0.9 mph/oz)",
+                     bat_weight_adjustment, bat_weight_oz)
     else:
         # Standard bat: normal penalty (-0.7 mph per oz)
         bat_weight_adjustment = bat_weight_delta * 0.7
-        print(f"[V2.1] BAT WEIGHT: {bat_weight_adjustment:+.1f} mph for {bat_weight_oz}oz "
-              f"(penalty: 0.7 mph/oz)")
+        logger.debug("[V2.1] BAT WEIGHT: %+.1f mph for %soz (penalty: 0.7 mph/oz)",
+                     bat_weight_adjustment, bat_weight_oz)
     
     baseline_bat_speed += bat_weight_adjustment
     
@@ -284,16 +353,7 @@ def calculate_bat_speed_range(theoretical_max_bat_speed: float,
     
     This gives us a RANGE instead of a single point prediction.
     """
-    efficiency_ranges = {
-        "mlb_elite": (0.85, 0.90),
-        "mlb_average": (0.75, 0.85),
-        "mlb_below_avg": (0.65, 0.75),
-        "college": (0.60, 0.70),
-        "high_school": (0.55, 0.65),
-        "youth": (0.45, 0.55)
-    }
-    
-    eff_min, eff_max = efficiency_ranges.get(skill_level, (0.75, 0.85))
+    eff_min, eff_max = EFFICIENCY_RANGES.get(skill_level, DEFAULT_EFFICIENCY_RANGE)
     
     return {
         "theoretical_max_mph": theoretical_max_bat_speed,
@@ -350,7 +410,7 @@ def calculate_energy_capacity_v21(height_inches: float,
                                     bat_weight_oz: float,
                                     skill_level: str = "mlb_average",
                                     actual_bat_speed: Optional[float] = None,
-                                    verbose: bool = True) -> Dict:
+                                    verbose: bool = False) -> Dict:
     """
     Calculate kinetic energy capacity V2.1 with all refinements.
     
@@ -372,23 +432,25 @@ def calculate_energy_capacity_v21(height_inches: float,
         bat_weight_oz: Bat weight in ounces
         skill_level: "mlb_elite", "mlb_average", "mlb_below_avg", "college", "high_school"
         actual_bat_speed: If known (for realized efficiency calculation)
-        verbose: Print correction steps
+        verbose: Log the calculation summary at INFO instead of DEBUG
+            (the individual corrections always log at DEBUG)
     
     Returns:
         dict with V2.1 capacity metrics
     """
     
-    if verbose:
-        print("=" * 80)
-        print(f"KINETIC CAPACITY V2.1 CALCULATION")
-        print(f"Player: {height_inches}\" tall, {weight_lbs} lbs, wingspan {wingspan_inches}\", age {age}")
-        print(f"Bat: {bat_weight_oz}oz, Skill Level: {skill_level}")
-        print("=" * 80)
+    level = logging.INFO if verbose else logging.DEBUG
+    report = logger.isEnabledFor(level)
+    
+    if report:
+        logger.log(level, "%s\nKINETIC CAPACITY V2.1 CALCULATION\nPlayer: %s\" tall, %s lbs, wingspan %s\", age %s\n"
+                   "Bat: %soz, Skill Level: %s\n%s", "=" * 80, height_inches, weight_lbs, wingspan_inches, age,
+                   bat_weight_oz, skill_level, "=" * 80)
     
     # Step 1: Get baseline bat speed (empirical table)
     baseline = _get_baseline_bat_speed(height_inches, weight_lbs, age, v21_mode=True)
-    if verbose:
-        print(f"[V2.1] BASELINE (from lookup table): {baseline:.1f} mph")
+    if report:
+        logger.log(level, "[V2.1] BASELINE (from lookup table): %.1f mph", baseline)
     
     # Step 2: SHORT PLAYER CORRECTION (if applicable) - FIRST!
     if height_inches < 68:
@@ -409,18 +471,16 @@ def calculate_energy_capacity_v21(height_inches: float,
     # Step 7: Bat weight adjustment
     baseline, bat_weight_adj = apply_bat_weight_adjustment_v2(baseline, bat_weight_oz)
     
-    if verbose:
-        print(f"\n[V2.1] THEORETICAL MAX (100% efficiency): {baseline:.1f} mph")
-        print("-" * 80)
+    if report:
+        logger.log(level, "\n[V2.1] THEORETICAL MAX (100%% efficiency): %.1f mph\n%s", baseline, "-" * 80)
     
     # Step 8: Convert to skill-level-based range
     bat_speed_range = calculate_bat_speed_range(baseline, skill_level)
     
-    if verbose:
-        print(f"[V2.1] PREDICTED RANGE ({skill_level}): "
-              f"{bat_speed_range['predicted_min_mph']:.1f}-{bat_speed_range['predicted_max_mph']:.1f} mph "
-              f"(midpoint: {bat_speed_range['predicted_midpoint_mph']:.1f} mph)")
-        print(f"[V2.1] EFFICIENCY RANGE: {bat_speed_range['efficiency_range_pct']}")
+    if report:
+        logger.log(level, "[V2.1] PREDICTED RANGE (%s): %.1f-%.1f mph (midpoint: %.1f mph)\n[V2.1] EFFICIENCY RANGE: %s",
+                   skill_level, bat_speed_range['predicted_min_mph'], bat_speed_range['predicted_max_mph'],
+                   bat_speed_range['predicted_midpoint_mph'], bat_speed_range['efficiency_range_pct'])
     
     # Step 9: Calculate energy capacity
     bat_mass_kg = bat_weight_oz * 0.0283495  # oz to kg
@@ -435,14 +495,13 @@ def calculate_energy_capacity_v21(height_inches: float,
     realized_efficiency = None
     if actual_bat_speed is not None:
         realized_efficiency = calculate_realized_efficiency(actual_bat_speed, baseline)
-        if verbose:
-            print(f"\n[V2.1] ACTUAL BAT SPEED: {actual_bat_speed:.1f} mph")
-            print(f"[V2.1] REALIZED EFFICIENCY: {realized_efficiency['efficiency_pct']:.1f}% "
-                  f"({realized_efficiency['efficiency_rating']})")
-            print(f"[V2.1] COACHING FOCUS: {realized_efficiency['coaching_focus']}")
+        if report:
+            logger.log(level, "\n[V2.1] ACTUAL BAT SPEED: %.1f mph\n[V2.1] REALIZED EFFICIENCY: %.1f%% (%s)\n"
+                       "[V2.1] COACHING FOCUS: %s", actual_bat_speed, realized_efficiency['efficiency_pct'],
+                       realized_efficiency['efficiency_rating'], realized_efficiency['coaching_focus'])
     
-    if verbose:
-        print("=" * 80)
+    if report:
+        logger.log(level, "=" * 80)
     
     return {
         # V2.1 primary outputs
@@ -472,6 +531,199 @@ def calculate_energy_capacity_v21(height_inches: float,
     }
 
 
+# ============================================================================
+# V2.1 BATCH (VECTORIZED) FUNCTIONS
+# ============================================================================
+
+# Baseline table as parallel arrays (dict order preserved for tie-breaking)
+_BASELINE_HEIGHTS = np.array([h for h, _ in BASELINE_TABLE], dtype=float)
+_BASELINE_WEIGHTS = np.array([w for _, w in BASELINE_TABLE], dtype=float)
+_BASELINE_SPEEDS = np.array(list(BASELINE_TABLE.values()), dtype=float)
+
+REALIZED_EFFICIENCY_BANDS = (
+    # (lower bound exclusive, rating, coaching focus) - same bands as calculate_realized_efficiency
+    (90, "ELITE", "Skill refinement only, maintain technique"),
+    (75, "GOOD", "Sequence optimization, front leg stability"),
+    (60, "DEVELOPING", "Motor pattern rebuild, kinetic chain work"),
+)
+_INEFFICIENT = ("INEFFICIENT", "Major kinetic chain issues, ground force production")
+
+
+def _baseline_bat_speed_batch(height_inches: np.ndarray, weight_lbs: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `_get_baseline_bat_speed(..., v21_mode=True)`.
+
+    Exact table hits return the table value; everything else uses the same
+    4-nearest-neighbour IDW as `_interpolate_baseline` (stable sort, so ties
+    resolve in table order exactly like the scalar path).
+    """
+    dh = (height_inches[:, None] - _BASELINE_HEIGHTS) * 5
+    dw = weight_lbs[:, None] - _BASELINE_WEIGHTS
+    distances = np.sqrt(dh ** 2 + dw ** 2)
+
+    nearest = np.argsort(distances, axis=1, kind='stable')[:, :4]
+    nearest_distances = np.take_along_axis(distances, nearest, axis=1)
+    nearest_speeds = _BASELINE_SPEEDS[nearest]
+
+    # Accumulate neighbour by neighbour to keep the scalar summation order
+    weighted_sum = np.zeros(len(height_inches))
+    total_weight = np.zeros(len(height_inches))
+    for k in range(nearest.shape[1]):
+        idw = 1 / (nearest_distances[:, k] ** 2 + 0.1)
+        weighted_sum = weighted_sum + nearest_speeds[:, k] * idw
+        total_weight = total_weight + idw
+    baseline = weighted_sum / total_weight
+
+    exact = (dh == 0) & (dw == 0)
+    has_exact = exact.any(axis=1)
+    if has_exact.any():
+        baseline[has_exact] = _BASELINE_SPEEDS[exact[has_exact].argmax(axis=1)]
+    return baseline
+
+
+def _efficiency_bounds_batch(skill_level, n: int):
+    """Skill level(s) -> (eff_min, eff_max, range label, skill_level) arrays of length n"""
+    levels = np.broadcast_to(np.asarray(skill_level, dtype=object), (n,))
+    eff_min = np.empty(n)
+    eff_max = np.empty(n)
+    labels = np.empty(n, dtype=object)
+    for level in set(levels.tolist()):
+        mask = levels == level
+        lo, hi = EFFICIENCY_RANGES.get(level, DEFAULT_EFFICIENCY_RANGE)
+        eff_min[mask], eff_max[mask] = lo, hi
+        labels[mask] = f"{lo * 100:.0f}-{hi * 100:.0f}%"
+    return eff_min, eff_max, labels, levels.astype(str)
+
+
+def calculate_energy_capacity_v21_batch(height_inches,
+                                          wingspan_inches,
+                                          weight_lbs,
+                                          age,
+                                          bat_weight_oz,
+                                          skill_level="mlb_average",
+                                          actual_bat_speed=None) -> Dict[str, np.ndarray]:
+    """
+    Vectorized `calculate_energy_capacity_v21` for a whole roster.
+
+    Applies the same corrections, in the same order, as NumPy array
+    operations (no per-player Python calls, no printing). Results match the
+    scalar function to floating point precision.
+
+    Args:
+        height_inches, wingspan_inches, weight_lbs, age, bat_weight_oz:
+            Array-likes of equal length (scalars broadcast)
+        skill_level: One skill level for everyone, or one per player
+        actual_bat_speed: Optional measured bat speeds (NaN = unknown)
+
+    Returns:
+        Dict of column name -> array, using the scalar result keys. When
+        actual_bat_speed is given, 'realized_efficiency' is replaced by
+        'realized_efficiency_pct', 'efficiency_rating' and 'coaching_focus'
+        columns (NaN / None where the speed is unknown).
+    """
+    height, wingspan, weight, age, bat_weight = np.broadcast_arrays(*(
+        np.atleast_1d(np.asarray(values, dtype=float))
+        for values in (height_inches, wingspan_inches, weight_lbs, age, bat_weight_oz)
+    ))
+    n = height.shape[0]
+
+    # Step 1: Baseline (empirical table)
+    baseline = _baseline_bat_speed_batch(height, weight)
+
+    # Step 2: Short player correction (<5'8")
+    inertia_boost = np.minimum(1 + (68 - height) * 0.02, 1.10)
+    baseline = baseline * np.where(height < 68, inertia_boost * 1.09, 1.0)
+
+    # Step 3: Age adjustment (peak at 27, floor 85%)
+    baseline = baseline * np.maximum(1.0 - np.abs(age - 27) * 0.005, 0.85)
+
+    # Step 4: Wingspan adjustment (ape index capped at 4")
+    ape_index = wingspan - height
+    baseline = baseline * (1 + np.minimum(ape_index, 4.0) * 0.012)
+
+    # Step 5: Height penalty (>6'0")
+    baseline = baseline * np.where(height > 72, 1 - (height - 72) * 0.006, 1.0)
+
+    # Step 6: Body composition
+    expected_weight = (height - 60) * 4 + 140
+    weight_diff_pct = (weight - expected_weight) / expected_weight
+    baseline = baseline * np.select(
+        [weight_diff_pct > 0.25, weight_diff_pct > 0.15], [0.95, 0.97], default=1.0
+    )
+
+    # Step 7: Bat weight
+    bat_weight_adj = (30 - bat_weight) * np.where(bat_weight > 32, 0.9, 0.7)
+    theoretical_max = baseline + bat_weight_adj
+
+    # Step 8: Skill-level range
+    eff_min, eff_max, efficiency_range, levels = _efficiency_bounds_batch(skill_level, n)
+    predicted_min = theoretical_max * eff_min
+    predicted_max = theoretical_max * eff_max
+    predicted_mid = theoretical_max * ((eff_min + eff_max) / 2)
+
+    # Steps 9-10: Energy and exit velocity (off-tee)
+    bat_mass_kg = bat_weight * 0.0283495
+    energy_capacity = 0.5 * bat_mass_kg * ((predicted_mid * 0.44704) ** 2)
+
+    result = {
+        'theoretical_max_bat_speed_mph': theoretical_max,
+        'predicted_min_bat_speed_mph': predicted_min,
+        'predicted_max_bat_speed_mph': predicted_max,
+        'predicted_midpoint_bat_speed_mph': predicted_mid,
+        'efficiency_range': efficiency_range,
+        'skill_level': levels,
+        'energy_capacity_joules': energy_capacity,
+        'exit_velo_min_mph': predicted_min * 1.28,
+        'exit_velo_max_mph': predicted_max * 1.28,
+        'bat_weight_adjustment_mph': bat_weight_adj,
+        'wingspan_advantage_inches': ape_index,
+        'bat_speed_capacity_min_mph': predicted_min,
+        'bat_speed_capacity_max_mph': predicted_max,
+        'bat_speed_capacity_midpoint_mph': predicted_mid,
+    }
+
+    # Step 11: Realized efficiency
+    if actual_bat_speed is not None:
+        actual = np.broadcast_to(np.asarray(actual_bat_speed, dtype=float), (n,))
+        efficiency = (actual / theoretical_max) * 100
+        known = ~np.isnan(efficiency)
+        rating = np.full(n, None, dtype=object)
+        focus = np.full(n, None, dtype=object)
+        rating[known], focus[known] = _INEFFICIENT
+        # Walk bands low -> high so higher bands overwrite
+        for lower, band_rating, band_focus in reversed(REALIZED_EFFICIENCY_BANDS):
+            mask = known & (efficiency > lower)
+            rating[mask] = band_rating
+            focus[mask] = band_focus
+        result['realized_efficiency_pct'] = np.round(efficiency, 1)
+        result['efficiency_rating'] = rating
+        result['coaching_focus'] = focus
+
+    return result
+
+
+def calculate_energy_capacity_v21_frame(profiles, skill_level="mlb_average"):
+    """
+    Score a roster DataFrame with `calculate_energy_capacity_v21_batch`.
+
+    Expects columns height_inches, wingspan_inches, weight_lbs, age and
+    bat_weight_oz; optional skill_level and actual_bat_speed columns are
+    used when present. Returns a new DataFrame (same index) of results.
+    """
+    import pandas as pd
+
+    result = calculate_energy_capacity_v21_batch(
+        height_inches=profiles['height_inches'].to_numpy(),
+        wingspan_inches=profiles['wingspan_inches'].to_numpy(),
+        weight_lbs=profiles['weight_lbs'].to_numpy(),
+        age=profiles['age'].to_numpy(),
+        bat_weight_oz=profiles['bat_weight_oz'].to_numpy(),
+        skill_level=profiles['skill_level'].to_numpy() if 'skill_level' in profiles else skill_level,
+        actual_bat_speed=profiles['actual_bat_speed'].to_numpy() if 'actual_bat_speed' in profiles else None
+    )
+    return pd.DataFrame(result, index=profiles.index)
+
+
 # ============================================================================
 # BACKWARD COMPATIBILITY (V2.0 function with new backend)
 # ============================================================================
@@ -518,55 +770,12 @@ def _get_baseline_bat_speed(height_inches, weight_lbs, age, v21_mode=False):
     - Removed age adjustment (now handled separately in apply_age_adjustment)
     - age parameter kept for backward compatibility
     """
-    # Lookup table (height, weight): baseline_mph
-    baselines = {
-        # Youth
-        (54, 70): 35, (54, 80): 38, (54, 90): 40,
-        (60, 90): 42, (60, 100): 45, (60, 110): 47,
-        
-        # Teen
-        (64, 120): 52, (64, 130): 54, (64, 140): 56,
-        (66, 130): 55, (66, 140): 57, (66, 150): 59,
-        
-        # Short Adult (NEW V2.1 - recalibrated for Altuve fix)
-        (66, 160): 60, (66, 166): 62, (66, 170): 63,
-        (66, 175): 64,
-        
-        # Adult
-        (68, 160): 68, (68, 170): 70, (68, 180): 72,
-        (68, 190): 75,  # ← ERIC WILLIAMS BASELINE
-        (68, 200): 77,
-        
-        (69, 175): 68, (69, 180): 70, (69, 185): 71,  # NEW V2.1 - Pedroia range
-        
-        (70, 170): 70, (70, 180): 72, (70, 190): 74,
-        (70, 200): 76, (70, 210): 78,
-        
-        (72, 190): 76, (72, 200): 78, (72, 205): 79, (72, 210): 80,  # Acuña
-        (72, 220): 82, (72, 224): 83, (72, 230): 83,  # Soto
-        
-        (74, 210): 80, (74, 220): 82, (74, 230): 84,
-        (74, 235): 85, (74, 240): 85, (74, 250): 86,  # Trout
-        
-        (75, 220): 83, (75, 225): 84, (75, 230): 85,  # Harper
-        
-        (76, 230): 84, (76, 240): 86, (76, 250): 87,
-        (76, 260): 88, (76, 270): 89,
-        
-        (77, 225): 85, (77, 230): 86, (77, 235): 87,  # Alvarez
-        
-        (78, 240): 87, (78, 245): 88, (78, 250): 89,  # Stanton
-        
-        (79, 270): 87, (79, 280): 88, (79, 282): 88, (79, 290): 89,  # Judge
-    }
     
     # Find exact match or interpolate
-    key = (height_inches, weight_lbs)
-    if key in baselines:
-        baseline = baselines[key]
-    else:
-        # Interpolate from 4 nearest neighbors
-        baseline = _interpolate_baseline(height_inches, weight_lbs, baselines)
+    baseline = _BASELINE_INDEX.get((height_inches, weight_lbs))
+    if baseline is None:
+        # Interpolate from 4 nearest neighbors (same result as _interpolate_baseline)
+        baseline = _BASELINE_INDEX.interpolate(height_inches, weight_lbs)
     
     # V2.0 mode: Apply age adjustment here (backward compatibility)
     if not v21_mode:
@@ -584,6 +793,9 @@ def _interpolate_baseline(height, weight, baselines):
     """
     Inverse distance weighting (IDW) from 4 nearest neighbors.
     Height weighted 5x more than weight.
+
+    Full-scan reference implementation; _get_baseline_bat_speed uses the
+    precomputed _BASELINE_INDEX, which returns identical values.
     """
     distances = []
     for (h, w), baseline in baselines.items():
@@ -642,6 +854,10 @@ def _calculate_exit_velo(bat_speed_mph, pitch_speed_mph, bat_weight_oz):
 # ============================================================================
 
 if __name__ == "__main__":
+    # Show the per-correction DEBUG lines inline with the printed suite
+    import sys
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+    
     print("=" * 80)
     print("KINETIC CAPACITY V2.1 - 12-PLAYER VALIDATION SUITE")
     print("=" * 80)
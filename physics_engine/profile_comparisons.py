@@ -3,13 +3,34 @@ Profile Comparison System
 Compare player metrics to age-appropriate benchmarks
 
 Part of Priority 4: Motor Profile Classification Refinement
+
+Percentiles come from a CohortPercentileEngine (empirical CDFs built from
+stored sessions) when one is attached and the player's age group cohort is
+large enough; otherwise they are estimated from the benchmark thresholds.
+get_profile_comparison() shares one comparison whose engine is synced
+from the progress session store (start_cohort_refresh() keeps it fresh).
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
 import logging
+import os
+import threading
+import time
+
+import numpy as np
+
+try:
+    from .cohort_percentiles import CohortPercentileEngine, age_groups_for
+    from .progress_tracker import get_progress_tracker
+except ImportError:
+    from cohort_percentiles import CohortPercentileEngine, age_groups_for
+    from progress_tracker import get_progress_tracker
 
 logger = logging.getLogger(__name__)
 
+# Seconds between cohort syncs from the progress session store
+COHORT_REFRESH_SECONDS = float(os.environ.get("COHORT_REFRESH_SECONDS", "900"))
+
 
 class ProfileComparison:
     """
@@ -186,8 +207,8 @@ class ProfileComparison:
         }
     }
     
-    def __init__(self):
-        pass
+    def __init__(self, cohort_engine: Optional[CohortPercentileEngine] = None):
+        self.cohort_engine = cohort_engine
     
     def _determine_age_group(self, age: int) -> str:
         """
@@ -281,6 +302,33 @@ class ProfileComparison:
             pct = 20 - min((deficit / range_size) * 20, 20)
             return int(max(pct, 1))
     
+    def _estimate_percentile_batch(self, values: Sequence[float], benchmarks: Dict) -> np.ndarray:
+        """Vectorized _estimate_percentile (same piecewise model, same integers)"""
+        values = np.asarray(values, dtype=float)
+        elite = benchmarks['elite']
+        above_avg = benchmarks['above_avg']
+        avg = benchmarks['avg']
+        below_avg = benchmarks['below_avg']
+        
+        pct = np.select(
+            [values >= elite, values >= above_avg, values >= avg, values >= below_avg],
+            [
+                np.minimum(90 + np.minimum((values - elite) / (elite - above_avg) * 10, 10), 99),
+                70 + (values - above_avg) / (elite - above_avg) * 20,
+                40 + (values - avg) / (above_avg - avg) * 30,
+                20 + (values - below_avg) / (avg - below_avg) * 20,
+            ],
+            default=np.maximum(20 - np.minimum((below_avg - values) / (avg - below_avg) * 20, 20), 1)
+        )
+        return np.trunc(pct).astype(int)
+    
+    def _cohort_percentiles(self, age_group: str, metric_name: str, values: np.ndarray) -> Optional[np.ndarray]:
+        """Integer cohort percentiles (clamped to 1-99 like the estimate), or None"""
+        engine = self.cohort_engine
+        if engine is None or not engine.has_cohort(age_group, metric_name):
+            return None
+        return np.clip(np.trunc(engine.percentiles(age_group, metric_name, values)), 1, 99).astype(int)
+    
     def compare_metric(
         self,
         metric_name: str,
@@ -311,12 +359,17 @@ class ProfileComparison:
         
         benchmarks = self.BENCHMARKS[age_group][metric_name]
         rating = self._get_rating(value, benchmarks)
-        percentile = self._estimate_percentile(value, benchmarks)
+        cohort_percentile = self._cohort_percentiles(age_group, metric_name, np.array([value]))
+        if cohort_percentile is not None:
+            percentile, source = int(cohort_percentile[0]), 'cohort'
+        else:
+            percentile, source = self._estimate_percentile(value, benchmarks), 'benchmark'
         
         return {
             'value': round(value, 1),
             'rating': rating,
             'percentile': percentile,
+            'percentile_source': source,
             'benchmark_elite': benchmarks['elite'],
             'benchmark_avg': benchmarks['avg'],
             'vs_elite': round(value - benchmarks['elite'], 1),
@@ -401,6 +454,69 @@ class ProfileComparison:
         
         return comparisons
     
+    def roster_percentiles(
+        self,
+        ages: Sequence[float],
+        player_metrics: Dict[str, Sequence[float]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Percentiles for a whole roster in one vectorized pass
+        
+        Args:
+            ages: Player ages (one per player)
+            player_metrics: Metric name -> finite values aligned with ages
+            
+        Returns:
+            Metric name -> integer percentiles (cohort where available,
+            benchmark estimate otherwise; 50 for metrics without benchmarks)
+        """
+        groups = age_groups_for(ages)
+        results = {}
+        for metric_name, values in player_metrics.items():
+            values = np.asarray(values, dtype=float)
+            percentiles = np.full(values.shape, 50, dtype=int)
+            for age_group in np.unique(groups):
+                age_group = str(age_group)
+                benchmarks = self.BENCHMARKS[age_group].get(metric_name)
+                mask = groups == age_group
+                cohort = self._cohort_percentiles(age_group, metric_name, values[mask])
+                if cohort is not None:
+                    percentiles[mask] = cohort
+                elif benchmarks is not None:
+                    percentiles[mask] = self._estimate_percentile_batch(values[mask], benchmarks)
+            results[metric_name] = percentiles
+        return results
+    
+    def leaderboard(
+        self,
+        player_ids: Sequence[str],
+        ages: Sequence[float],
+        metric_name: str,
+        values: Sequence[float],
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Rank players by age-adjusted percentile (ties broken by raw value)
+        
+        Returns:
+            List of {'rank', 'player_id', 'age_group', 'value', 'percentile'}
+        """
+        values = np.asarray(values, dtype=float)
+        percentiles = self.roster_percentiles(ages, {metric_name: values})[metric_name]
+        groups = age_groups_for(ages)
+        order = np.lexsort((-values, -percentiles))[:limit]
+        
+        return [
+            {
+                'rank': rank,
+                'player_id': player_ids[i],
+                'age_group': str(groups[i]),
+                'value': round(float(values[i]), 1),
+                'percentile': int(percentiles[i])
+            }
+            for rank, i in enumerate(order, start=1)
+        ]
+    
     def get_age_group_benchmarks(self, age: int) -> Dict:
         """
         Get all benchmarks for a specific age group
@@ -415,6 +531,47 @@ class ProfileComparison:
         return self.BENCHMARKS[age_group].copy()
 
 
+# Shared comparison with a cohort engine
+_profile_comparison = None
+
+
+def get_profile_comparison() -> ProfileComparison:
+    """Get the shared ProfileComparison (with a CohortPercentileEngine attached)"""
+    global _profile_comparison
+    if _profile_comparison is None:
+        _profile_comparison = ProfileComparison(cohort_engine=CohortPercentileEngine())
+    return _profile_comparison
+
+
+def refresh_profile_cohorts(max_age_seconds: float = COHORT_REFRESH_SECONDS) -> bool:
+    """
+    Sync the shared cohort engine from the progress tracker's store when
+    the last sync is older than max_age_seconds
+
+    Returns:
+        True if a sync ran (False when due later or there is no store)
+    """
+    store = get_progress_tracker().store
+    if store is None or not hasattr(store, 'load_updated_since'):
+        return False
+    return get_profile_comparison().cohort_engine.refresh_if_due(store, max_age_seconds)
+
+
+def start_cohort_refresh(interval_seconds: float = COHORT_REFRESH_SECONDS) -> threading.Thread:
+    """Sync the shared cohort engine now and then every interval_seconds, in a daemon thread"""
+    def run():
+        while True:
+            try:
+                refresh_profile_cohorts(interval_seconds)
+            except Exception as e:
+                logger.error(f"❌ Cohort percentile refresh failed: {e}")
+            time.sleep(interval_seconds)
+
+    thread = threading.Thread(target=run, name="cohort-refresh", daemon=True)
+    thread.start()
+    return thread
+
+
 if __name__ == "__main__":
     # Test the comparison system
     print("="*70)
@@ -14,13 +14,17 @@ Features:
 - Progress visualization data
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Set, Protocol
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
+from bisect import bisect_left, bisect_right
 import json
+import logging
 import statistics
 
+logger = logging.getLogger(__name__)
+
 
 class MetricType(Enum):
     """Types of trackable metrics"""
@@ -166,17 +170,133 @@ class Milestone:
         return data
 
 
+class SessionStore(Protocol):
+    """Persistent backing store for training sessions (see progress_session_store.py)"""
+    
+    def save(self, session: TrainingSession) -> None:
+        """Insert or replace a session by session_id"""
+    
+    def load_athlete(self, athlete_id: str) -> List[TrainingSession]:
+        """All sessions for an athlete, oldest first"""
+    
+    # Optional: load_athletes(athlete_ids) -> Dict[str, List[TrainingSession]]
+    # lets get_latest_sessions / get_sessions_for_athletes load many
+    # athletes in one read
+
+
+class AthleteSessionIndex:
+    """
+    One athlete's sessions, kept sorted by session_date
+    
+    Inserts and date-range queries use bisect on the sorted keys; session_id
+    lookups go through a hash index. Sessions on the same date keep insertion
+    order in newest-first listings, as the previous stable sort did.
+    """
+    
+    def __init__(self):
+        self._keys: List[Tuple[datetime, int]] = []  # (session_date, -sequence), ascending
+        self._sessions: List[TrainingSession] = []  # parallel to _keys
+        self._by_id: Dict[str, Tuple[Tuple[datetime, int], TrainingSession]] = {}
+        self._sequence = 0
+    
+    def __len__(self) -> int:
+        return len(self._sessions)
+    
+    def add(self, session: TrainingSession) -> None:
+        """Insert a session (replaces an existing one with the same session_id)"""
+        if session.session_id in self._by_id:
+            self.remove(session.session_id)
+        self._sequence += 1
+        key = (session.session_date, -self._sequence)
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._sessions.insert(position, session)
+        self._by_id[session.session_id] = (key, session)
+    
+    def remove(self, session_id: str) -> Optional[TrainingSession]:
+        entry = self._by_id.pop(session_id, None)
+        if entry is None:
+            return None
+        key, session = entry
+        position = bisect_left(self._keys, key)
+        del self._keys[position]
+        del self._sessions[position]
+        return session
+    
+    def get(self, session_id: str) -> Optional[TrainingSession]:
+        entry = self._by_id.get(session_id)
+        return entry[1] if entry else None
+    
+    def latest(self) -> Optional[TrainingSession]:
+        return self._sessions[-1] if self._sessions else None
+    
+    def earliest(self) -> Optional[TrainingSession]:
+        return self._sessions[0] if self._sessions else None
+    
+    def newest_first(
+        self,
+        limit: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[TrainingSession]:
+        """Sessions with start_date <= session_date <= end_date, most recent first"""
+        lo = bisect_left(self._keys, (start_date,)) if start_date else 0
+        hi = bisect_right(self._keys, (end_date, float('inf'))) if end_date else len(self._keys)
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return self._sessions[lo:hi][::-1]
+
+
 class ProgressTracker:
     """
     Main progress tracking system
     Manages session history, goals, and milestones
+    
+    Sessions are held in per-athlete sorted indexes. Pass a SessionStore to
+    persist sessions: adds are written through, and an athlete's history is
+    loaded from the store the first time it is needed.
     """
     
-    def __init__(self):
+    def __init__(self, store: Optional[SessionStore] = None):
         """Initialize progress tracker"""
-        self.sessions: Dict[str, List[TrainingSession]] = {}  # athlete_id -> sessions
+        self.store = store
+        self._indexes: Dict[str, AthleteSessionIndex] = {}  # athlete_id -> sessions
         self.goals: Dict[str, List[Goal]] = {}  # athlete_id -> goals
         self.milestones: Dict[str, List[Milestone]] = {}  # athlete_id -> milestones
+        self._achieved_milestones: Dict[str, Set[MilestoneType]] = {}  # athlete_id -> types
+    
+    
+    @property
+    def sessions(self) -> Dict[str, List[TrainingSession]]:
+        """Loaded sessions per athlete, most recent first (read-only view)"""
+        return {athlete_id: index.newest_first() for athlete_id, index in self._indexes.items()}
+    
+    
+    def _session_index(self, athlete_id: str) -> AthleteSessionIndex:
+        """Athlete's session index, loading it from the store on first use"""
+        index = self._lookup_index(athlete_id)
+        if index is None:
+            index = AthleteSessionIndex()
+            self._indexes[athlete_id] = index
+        return index
+    
+    
+    def _lookup_index(self, athlete_id: str) -> Optional[AthleteSessionIndex]:
+        """
+        Athlete's session index for reads; None if the athlete has no sessions
+        
+        Only athletes with sessions are kept, so lookups of unknown ids do
+        not grow the index map (with a store they are re-checked each time).
+        """
+        index = self._indexes.get(athlete_id)
+        if index is None and self.store is not None:
+            sessions = self.store.load_athlete(athlete_id)
+            if sessions:
+                index = AthleteSessionIndex()
+                for session in sessions:
+                    index.add(session)
+                self._indexes[athlete_id] = index
+        return index
     
     
     # ========================================
@@ -185,31 +305,24 @@ class ProgressTracker:
     
     def add_session(self, session: TrainingSession) -> None:
         """Add a training session"""
-        if session.athlete_id not in self.sessions:
-            self.sessions[session.athlete_id] = []
+        index = self._session_index(session.athlete_id)
+        index.add(session)
         
-        self.sessions[session.athlete_id].append(session)
-        
-        # Sort by date (most recent first)
-        self.sessions[session.athlete_id].sort(
-            key=lambda s: s.session_date,
-            reverse=True
-        )
+        if self.store is not None:
+            self.store.save(session)
         
         # Check for milestones
         self._check_milestones(session)
         
-        # Update goal progress
-        self._update_goal_progress(session.athlete_id)
+        # Update goal progress (only changes when this is the newest session)
+        if index.latest() is session:
+            self._update_goal_progress(session.athlete_id)
     
     
     def get_session(self, athlete_id: str, session_id: str) -> Optional[TrainingSession]:
         """Get specific session"""
-        sessions = self.sessions.get(athlete_id, [])
-        for session in sessions:
-            if session.session_id == session_id:
-                return session
-        return None
+        index = self._lookup_index(athlete_id)
+        return index.get(session_id) if index is not None else None
     
     
     def get_sessions(
@@ -219,22 +332,77 @@ class ProgressTracker:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> List[TrainingSession]:
-        """Get session history for athlete"""
-        sessions = self.sessions.get(athlete_id, [])
-        
-        # Filter by date range
-        if start_date:
-            sessions = [s for s in sessions if s.session_date >= start_date]
-        if end_date:
-            sessions = [s for s in sessions if s.session_date <= end_date]
-        
-        return sessions[:limit]
+        """Get session history for athlete (most recent first)"""
+        index = self._lookup_index(athlete_id)
+        return index.newest_first(limit, start_date, end_date) if index is not None else []
     
     
     def get_latest_session(self, athlete_id: str) -> Optional[TrainingSession]:
         """Get most recent session"""
-        sessions = self.sessions.get(athlete_id, [])
-        return sessions[0] if sessions else None
+        index = self._lookup_index(athlete_id)
+        return index.latest() if index is not None else None
+    
+    
+    def get_latest_sessions(self, athlete_ids: List[str]) -> Dict[str, TrainingSession]:
+        """
+        Most recent session for each athlete that has one
+        
+        Athletes not loaded yet are fetched from the store in a single
+        load_athletes call when the store supports it.
+        """
+        indexes = self._load_indexes(athlete_ids)
+        
+        latest = {}
+        for athlete_id in athlete_ids:
+            index = indexes.get(athlete_id)
+            if index is not None and len(index):
+                latest[athlete_id] = index.latest()
+        return latest
+    
+    
+    def get_sessions_for_athletes(
+        self,
+        athlete_ids: List[str],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, List[TrainingSession]]:
+        """
+        Session history for many athletes (most recent first), with the
+        same single store read as get_latest_sessions
+        """
+        indexes = self._load_indexes(athlete_ids)
+        return {
+            athlete_id: indexes[athlete_id].newest_first(None, start_date, end_date) if athlete_id in indexes else []
+            for athlete_id in athlete_ids
+        }
+    
+    
+    def _load_indexes(self, athlete_ids: List[str]) -> Dict[str, AthleteSessionIndex]:
+        """
+        Indexes of the given athletes that have sessions, loading athletes
+        not loaded yet in one load_athletes call when the store supports it
+        """
+        athlete_ids = list(dict.fromkeys(athlete_ids))
+        missing = [a for a in athlete_ids if a not in self._indexes]
+        if missing and self.store is not None:
+            if hasattr(self.store, 'load_athletes'):
+                loaded = self.store.load_athletes(missing)
+                for athlete_id in missing:
+                    sessions = loaded.get(athlete_id)
+                    if sessions:
+                        index = AthleteSessionIndex()
+                        for session in sessions:
+                            index.add(session)
+                        self._indexes[athlete_id] = index
+            else:
+                for athlete_id in missing:
+                    self._lookup_index(athlete_id)
+        return {a: self._indexes[a] for a in athlete_ids if a in self._indexes}
+    
+    
+    def get_metric_value(self, session: TrainingSession, metric_type: MetricType) -> float:
+        """Value of a tracked metric in a session"""
+        return self._get_metric_value(session, metric_type)
     
     
     # ========================================
@@ -378,7 +546,7 @@ class ProgressTracker:
     
     
     def _update_goal_progress(self, athlete_id: str) -> None:
-        """Update progress on all active goals"""
+        """Update progress on all active goals (from the latest session, O(1) lookup)"""
         latest_session = self.get_latest_session(athlete_id)
         if not latest_session:
             return
@@ -416,20 +584,26 @@ class ProgressTracker:
     # ========================================
     
     def _check_milestones(self, session: TrainingSession) -> None:
-        """Check for achieved milestones"""
+        """
+        Check for achieved milestones
+        
+        Incremental: uses the achieved-type set and the index's first/latest
+        sessions instead of rescanning milestones or session history.
+        """
         athlete_id = session.athlete_id
         
         if athlete_id not in self.milestones:
             self.milestones[athlete_id] = []
         
-        achieved_types = {m.milestone_type for m in self.milestones[athlete_id]}
+        achieved_types = self._achieved_milestones.setdefault(athlete_id, set())
+        index = self._session_index(athlete_id)
         
         # Check each milestone type
         milestones_to_add = []
         
         # First analysis
         if MilestoneType.FIRST_ANALYSIS not in achieved_types:
-            if len(self.sessions.get(athlete_id, [])) == 1:
+            if len(index) == 1:
                 milestones_to_add.append(self._create_milestone(
                     athlete_id, session, MilestoneType.FIRST_ANALYSIS,
                     "First Analysis Complete!",
@@ -448,10 +622,9 @@ class ProgressTracker:
                 ))
         
         # Score improvements
-        sessions = self.get_sessions(athlete_id)
-        if len(sessions) >= 2:
-            first = sessions[-1]
-            latest = sessions[0]
+        if len(index) >= 2:
+            first = index.earliest()
+            latest = index.latest()
             
             avg_improvement = (
                 (latest.ground_score_adjusted - first.ground_score_adjusted) +
@@ -498,6 +671,7 @@ class ProgressTracker:
         
         # Add new milestones
         self.milestones[athlete_id].extend(milestones_to_add)
+        achieved_types.update(m.milestone_type for m in milestones_to_add)
     
     
     def get_milestones(self, athlete_id: str) -> List[Milestone]:
@@ -639,10 +813,23 @@ class ProgressTracker:
 _progress_tracker_instance = None
 
 def get_progress_tracker() -> ProgressTracker:
-    """Get or create global progress tracker instance"""
+    """
+    Get or create global progress tracker instance
+    
+    Sessions are persisted to the progress_sessions table (on
+    database.SessionLocal); outside the app, where the database layer is
+    not importable, the tracker is in-memory only.
+    """
     global _progress_tracker_instance
     if _progress_tracker_instance is None:
-        _progress_tracker_instance = ProgressTracker()
+        try:
+            from database import SessionLocal
+            from progress_session_store import SqlProgressSessionStore
+            store = SqlProgressSessionStore(SessionLocal)
+        except ImportError as e:
+            logger.warning(f"⚠️ Progress sessions will not persist (no database layer: {e})")
+            store = None
+        _progress_tracker_instance = ProgressTracker(store=store)
     return _progress_tracker_instance
 
 
@@ -2,16 +2,50 @@
 HTML Report Generator
 Generates professional HTML reports with embedded charts
 
+The report is the Jinja2 template templates/biomechanics_report.html,
+compiled once per process. Charts are either inlined as data URIs
+(standalone files) or referenced as content-hashed asset URLs served by
+biomechanics_report_routes with long-lived cache headers.
+
 Part of Priority 5: Visualization System
 """
 
 import os
 import base64
-from typing import Dict
+from typing import Dict, Iterator
 import logging
 
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+
 logger = logging.getLogger(__name__)
 
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
+REPORT_TEMPLATE = 'biomechanics_report.html'
+
+# Template output pieces per streamed chunk (a few KB of HTML)
+STREAM_BUFFER_SIZE = 16
+
+_template_environment = None
+
+
+def get_template_environment() -> Environment:
+    """Shared Jinja2 environment (compiled templates are cached in it)"""
+    global _template_environment
+    if _template_environment is None:
+        _template_environment = Environment(
+            loader=FileSystemLoader(TEMPLATE_DIR),
+            autoescape=select_autoescape(['html']),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False  # compile once; templates don't change at runtime
+        )
+    return _template_environment
+
+
+def get_report_template() -> Template:
+    """The compiled report template"""
+    return get_template_environment().get_template(REPORT_TEMPLATE)
+
 
 class ReportGenerator:
     """
@@ -52,386 +86,81 @@ class ReportGenerator:
         Args:
             player_data: Player information
             analysis_results: Complete analysis results
-            chart_paths: Dictionary of chart file paths
+            chart_paths: Dictionary of chart file paths, or of data URIs
+                already rendered in memory (see chart_renderer.ChartRenderer)
             output_path: Where to save HTML file
             
         Returns:
             Path to generated HTML file
         """
-        # Encode charts to base64
+        # Encode charts to base64 (rendered charts are already data URIs)
         charts_base64 = {}
-        for chart_name, chart_path in chart_paths.items():
-            if os.path.exists(chart_path):
-                charts_base64[chart_name] = self._encode_image_to_base64(chart_path)
-        
-        # Generate HTML
-        html_content = self._generate_html_template(
-            player_data,
-            analysis_results,
-            charts_base64
-        )
+        for chart_name, chart in chart_paths.items():
+            if chart.startswith('data:'):
+                charts_base64[chart_name] = chart
+            elif os.path.exists(chart):
+                charts_base64[chart_name] = self._encode_image_to_base64(chart)
         
         # Write to file
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(self.render_html_report(player_data, analysis_results, charts_base64))
         
         logger.info(f"HTML report saved to {output_path}")
         return output_path
     
-    def _generate_html_template(
+    def render_html_report(
         self,
         player_data: Dict,
-        analysis: Dict,
+        analysis_results: Dict,
         charts: Dict
     ) -> str:
-        """Generate complete HTML report template"""
-        
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{player_data.get('name', 'Player')} - Biomechanics Analysis Report</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 20px;
-            color: #2C3E50;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 10px 40px rgba(0,0,0,0.3);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-        }}
-        
-        .header p {{
-            font-size: 1.2em;
-            opacity: 0.9;
-        }}
-        
-        .content {{
-            padding: 40px;
-        }}
-        
-        .section {{
-            margin-bottom: 40px;
-        }}
-        
-        .section h2 {{
-            color: #667eea;
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 10px;
-            margin-bottom: 20px;
-            font-size: 1.8em;
-        }}
-        
-        .player-info {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        
-        .info-card {{
-            background: #F8F9FA;
-            padding: 20px;
-            border-radius: 10px;
-            border-left: 4px solid #667eea;
-        }}
-        
-        .info-card h3 {{
-            color: #667eea;
-            margin-bottom: 10px;
-        }}
-        
-        .info-card p {{
-            font-size: 1.5em;
-            font-weight: bold;
-            color: #2C3E50;
-        }}
-        
-        .chart-container {{
-            margin: 30px 0;
-            text-align: center;
-        }}
-        
-        .chart-container img {{
-            max-width: 100%;
-            border-radius: 10px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        }}
-        
-        .chart-title {{
-            font-size: 1.3em;
-            font-weight: bold;
-            color: #667eea;
-            margin-bottom: 15px;
-        }}
-        
-        .metrics-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-        }}
-        
-        .metric-card {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 25px;
-            border-radius: 10px;
-            text-align: center;
-        }}
-        
-        .metric-card h3 {{
-            font-size: 1.1em;
-            margin-bottom: 10px;
-            opacity: 0.9;
-        }}
-        
-        .metric-card .value {{
-            font-size: 2.5em;
-            font-weight: bold;
-            margin-bottom: 5px;
-        }}
-        
-        .metric-card .label {{
-            font-size: 0.9em;
-            opacity: 0.8;
-        }}
-        
-        .recommendations {{
-            background: #FFF3CD;
-            border-left: 5px solid #FFC107;
-            padding: 25px;
-            border-radius: 10px;
-            margin-top: 30px;
-        }}
-        
-        .recommendations h3 {{
-            color: #856404;
-            margin-bottom: 15px;
-        }}
-        
-        .recommendations ul {{
-            list-style: none;
-            padding-left: 0;
-        }}
-        
-        .recommendations li {{
-            padding: 10px;
-            margin: 5px 0;
-            background: white;
-            border-radius: 5px;
-        }}
-        
-        .footer {{
-            background: #F8F9FA;
-            padding: 20px;
-            text-align: center;
-            color: #6c757d;
-        }}
-        
-        @media print {{
-            body {{
-                background: white;
-                padding: 0;
-            }}
-            
-            .container {{
-                box-shadow: none;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>{player_data.get('name', 'Player Analysis')}</h1>
-            <p>Biomechanics Analysis Report</p>
-        </div>
+        """
+        Render the HTML report in memory (nothing read from or written to disk)
         
-        <div class="content">
-            <!-- Player Info Section -->
-            <div class="section">
-                <h2>Player Information</h2>
-                <div class="player-info">
-                    <div class="info-card">
-                        <h3>Age</h3>
-                        <p>{player_data.get('age', 'N/A')} years</p>
-                    </div>
-                    <div class="info-card">
-                        <h3>Height</h3>
-                        <p>{player_data.get('height_inches', 'N/A')}"</p>
-                    </div>
-                    <div class="info-card">
-                        <h3>Weight</h3>
-                        <p>{player_data.get('weight_lbs', 'N/A')} lbs</p>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Key Metrics Section -->
-            <div class="section">
-                <h2>Key Metrics</h2>
-                <div class="metrics-grid">
-                    <div class="metric-card">
-                        <h3>Actual Bat Speed</h3>
-                        <div class="value">{analysis.get('actual_bat_speed', 0):.1f}</div>
-                        <div class="label">mph</div>
-                    </div>
-                    <div class="metric-card">
-                        <h3>Potential Bat Speed</h3>
-                        <div class="value">{analysis.get('potential_bat_speed', 0):.1f}</div>
-                        <div class="label">mph</div>
-                    </div>
-                    <div class="metric-card">
-                        <h3>Gap</h3>
-                        <div class="value">{analysis.get('potential_bat_speed', 0) - analysis.get('actual_bat_speed', 0):.1f}</div>
-                        <div class="label">mph untapped</div>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Gap Chart -->
-            {f'''
-            <div class="section">
-                <div class="chart-container">
-                    <div class="chart-title">Bat Speed: Actual vs Potential</div>
-                    <img src="{charts.get('gap', '')}" alt="Gap Chart">
-                </div>
-            </div>
-            ''' if 'gap' in charts else ''}
-            
-            <!-- Component Scores Section -->
-            <div class="section">
-                <h2>Component Scores</h2>
-                <div class="metrics-grid">
-                    <div class="metric-card">
-                        <h3>Ground</h3>
-                        <div class="value">{analysis.get('ground_score', 0)}</div>
-                        <div class="label">/ 100</div>
-                    </div>
-                    <div class="metric-card">
-                        <h3>Engine</h3>
-                        <div class="value">{analysis.get('engine_score', 0)}</div>
-                        <div class="label">/ 100</div>
-                    </div>
-                    <div class="metric-card">
-                        <h3>Weapon</h3>
-                        <div class="value">{analysis.get('weapon_score', 0)}</div>
-                        <div class="label">/ 100</div>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Radar Chart -->
-            {f'''
-            <div class="section">
-                <div class="chart-container">
-                    <div class="chart-title">Ground-Engine-Weapon Radar</div>
-                    <img src="{charts.get('radar', '')}" alt="Radar Chart">
-                </div>
-            </div>
-            ''' if 'radar' in charts else ''}
-            
-            <!-- Kinematic Sequence Chart -->
-            {f'''
-            <div class="section">
-                <div class="chart-container">
-                    <div class="chart-title">Kinematic Sequence Timing</div>
-                    <img src="{charts.get('sequence', '')}" alt="Kinematic Sequence">
-                </div>
-            </div>
-            ''' if 'sequence' in charts else ''}
-            
-            <!-- Energy Distribution Chart -->
-            {f'''
-            <div class="section">
-                <div class="chart-container">
-                    <div class="chart-title">Energy Distribution</div>
-                    <img src="{charts.get('energy', '')}" alt="Energy Distribution">
-                </div>
-            </div>
-            ''' if 'energy' in charts else ''}
-            
-            <!-- Composite Report -->
-            {f'''
-            <div class="section">
-                <div class="chart-container">
-                    <div class="chart-title">Complete Analysis Overview</div>
-                    <img src="{charts.get('composite', '')}" alt="Composite Report">
-                </div>
-            </div>
-            ''' if 'composite' in charts else ''}
+        Args:
+            player_data: Player information
+            analysis_results: Complete analysis results
+            charts: Dictionary of chart data URIs (PNG or SVG) or chart
+                asset URLs
             
-            <!-- Recommendations Section -->
-            {self._generate_recommendations_html(analysis.get('recommendations', {}))}
-        </div>
-        
-        <div class="footer">
-            <p>Generated by Kinetic DNA Blueprint Analysis System</p>
-            <p>© 2024 Reboot Motion Backend</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
-        return html
+        Returns:
+            HTML document
+        """
+        return get_report_template().render(self._template_context(player_data, analysis_results, charts))
     
-    def _generate_recommendations_html(self, recommendations: Dict) -> str:
-        """Generate recommendations section HTML"""
-        if not recommendations:
-            return ""
+    def stream_html_report(
+        self,
+        player_data: Dict,
+        analysis_results: Dict,
+        charts: Dict,
+        buffer_size: int = STREAM_BUFFER_SIZE
+    ) -> Iterator[str]:
+        """
+        Render the HTML report incrementally, for streaming responses
         
-        return f"""
-            <div class="section">
-                <h2>Recommendations</h2>
-                <div class="recommendations">
-                    <h3>🎯 Primary Focus: {recommendations.get('primary_component', 'N/A')}</h3>
-                    <p><strong>Priority:</strong> {recommendations.get('priority', 'N/A')}</p>
-                    <p><strong>Estimated Gain:</strong> +{recommendations.get('estimated_gain_mph', 0):.1f} mph</p>
-                    <p><strong>Training Frequency:</strong> {recommendations.get('training_frequency', 'N/A')}</p>
-                    
-                    {self._generate_drills_html(recommendations.get('drills', []))}
-                </div>
-            </div>
+        Args:
+            player_data: Player information
+            analysis_results: Complete analysis results
+            charts: Dictionary of chart data URIs or chart asset URLs
+            buffer_size: Template output pieces joined into each chunk
+            
+        Returns:
+            Iterator of HTML chunks (joined, equal to render_html_report)
         """
+        stream = get_report_template().stream(self._template_context(player_data, analysis_results, charts))
+        stream.enable_buffering(buffer_size)
+        return stream
     
-    def _generate_drills_html(self, drills: list) -> str:
-        """Generate drills list HTML"""
-        if not drills:
-            return ""
-        
-        drills_html = "<h4>Recommended Drills:</h4><ul>"
-        for drill in drills:
-            drills_html += f"<li>{drill}</li>"
-        drills_html += "</ul>"
-        
-        return drills_html
+    def _template_context(self, player_data: Dict, analysis: Dict, charts: Dict) -> Dict:
+        """Template variables for REPORT_TEMPLATE"""
+        return {
+            'player': player_data,
+            'analysis': analysis,
+            'charts': charts,
+            'actual_bat_speed': analysis.get('actual_bat_speed', 0),
+            'potential_bat_speed': analysis.get('potential_bat_speed', 0),
+            'recommendations': analysis.get('recommendations', {})
+        }
 
 
 if __name__ == "__main__":
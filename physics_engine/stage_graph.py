@@ -0,0 +1,221 @@
+"""
+Stage Graph
+===========
+
+A small dependency-graph (DAG) executor for analysis pipelines.
+
+Each stage names the stages (or graph inputs) it depends on and receives
+their results as keyword arguments. A stage is submitted as soon as all
+of its dependencies have finished, so independent stages run
+concurrently in a thread or process pool. End-to-end time approaches the
+critical path (the slowest chain) instead of the sum of all stages.
+
+Stage functions must be picklable (module-level functions or
+functools.partial of one) when a ProcessPoolExecutor is used.
+
+Usage:
+    graph = StageGraph()
+    graph.add("capacity", partial(calculate_energy_capacity, **anthropometrics))
+    graph.add("race_bar", format_kinetic_sequence_for_race_bar, depends_on={"kinetic_chain_events": "events"})
+    graph.add("tempo", calculate_tempo_from_events, depends_on=["events"])
+
+    run = graph.run({"events": events})
+    run.results["tempo"], run.metadata()
+"""
+
+from concurrent.futures import Executor, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stage:
+    """One node: func(**{argument: result of dependency})"""
+    name: str
+    func: Callable
+    arguments: Dict[str, str]  # keyword argument -> dependency name
+
+    @property
+    def depends_on(self) -> List[str]:
+        return list(self.arguments.values())
+
+
+@dataclass
+class StageRun:
+    """Results and timings of one graph execution"""
+    results: Dict[str, Any]
+    durations_ms: Dict[str, float]
+    started_ms: Dict[str, float]  # Offset from the start of the run
+    wall_ms: float
+    critical_path: List[str] = field(default_factory=list)
+
+    @property
+    def sum_ms(self) -> float:
+        """What the stages would have taken back to back"""
+        return sum(self.durations_ms.values())
+
+    def metadata(self) -> Dict:
+        """Per-stage timings for API responses"""
+        return {
+            "stages": {
+                name: {
+                    "duration_ms": round(self.durations_ms[name], 2),
+                    "started_ms": round(self.started_ms[name], 2)
+                }
+                for name in self.durations_ms
+            },
+            "wall_ms": round(self.wall_ms, 2),
+            "sequential_ms": round(self.sum_ms, 2),
+            "parallel_speedup": round(self.sum_ms / self.wall_ms, 2) if self.wall_ms > 0 else 1.0,
+            "critical_path": self.critical_path
+        }
+
+
+def _timed_call(func: Callable, kwargs: Dict) -> Tuple[Any, float]:
+    """Run a stage and measure it where it runs (worker thread or process)"""
+    start = time.perf_counter()
+    result = func(**kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+class StageGraph:
+    """Dependency graph of pipeline stages with concurrent execution"""
+
+    def __init__(self):
+        self.stages: Dict[str, Stage] = {}
+
+    def add(self, name: str, func: Callable,
+            depends_on: Union[Sequence[str], Mapping[str, str], None] = None) -> "StageGraph":
+        """
+        Add a stage
+
+        Args:
+            name: Stage name (its result is available to later stages under it)
+            func: Callable receiving dependency results as keyword arguments
+            depends_on: Dependency names (passed as same-named keyword
+                arguments) or a {keyword argument: dependency} mapping
+        """
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        if depends_on is None:
+            arguments = {}
+        elif isinstance(depends_on, Mapping):
+            arguments = dict(depends_on)
+        else:
+            arguments = {dependency: dependency for dependency in depends_on}
+        self.stages[name] = Stage(name=name, func=func, arguments=arguments)
+        return self
+
+    def order(self, inputs: Sequence[str] = ()) -> List[str]:
+        """
+        Topological order of the stages
+
+        Raises:
+            ValueError on unknown dependencies, cycles, or inputs named
+            like a stage
+        """
+        available = set(inputs)
+        shadowed = available & set(self.stages)
+        if shadowed:
+            raise ValueError(f"Inputs shadow stages: {sorted(shadowed)}")
+        for stage in self.stages.values():
+            for dependency in stage.depends_on:
+                if dependency not in self.stages and dependency not in available:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown '{dependency}'")
+
+        ordered, done = [], set(available)
+        remaining = dict(self.stages)
+        while remaining:
+            ready = [name for name, stage in remaining.items()
+                     if all(dependency in done for dependency in stage.depends_on)]
+            if not ready:
+                raise ValueError(f"Dependency cycle among stages: {sorted(remaining)}")
+            for name in ready:
+                ordered.append(name)
+                done.add(name)
+                del remaining[name]
+        return ordered
+
+    def run(self, inputs: Optional[Dict[str, Any]] = None,
+            executor: Optional[Executor] = None, max_workers: Optional[int] = None) -> StageRun:
+        """
+        Execute every stage, each as soon as its dependencies are done
+
+        Args:
+            inputs: Named values stages may depend on (e.g. pose_frames)
+            executor: Thread or process pool to use (a thread pool is
+                created for the run when omitted)
+            max_workers: Size of the temporary thread pool
+
+        Returns:
+            StageRun with every stage's result and timings
+
+        Raises:
+            The first stage exception; stages not yet started are cancelled
+        """
+        inputs = dict(inputs or {})
+        self.order(list(inputs))  # validate before starting anything
+
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=max_workers or max(1, len(self.stages))) as pool:
+                return self._execute(inputs, pool)
+        return self._execute(inputs, executor)
+
+    def _execute(self, inputs: Dict[str, Any], executor: Executor) -> StageRun:
+        results = dict(inputs)
+        durations: Dict[str, float] = {}
+        started: Dict[str, float] = {}
+        finished: Dict[str, float] = {}
+        pending = dict(self.stages)
+        running: Dict[Future, str] = {}
+        run_start = time.perf_counter()
+
+        def submit_ready():
+            for name in [n for n, s in pending.items() if all(d in results for d in s.depends_on)]:
+                stage = pending.pop(name)
+                kwargs = {argument: results[dependency] for argument, dependency in stage.arguments.items()}
+                started[name] = (time.perf_counter() - run_start) * 1000
+                running[executor.submit(_timed_call, stage.func, kwargs)] = name
+
+        submit_ready()
+        while running:
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name], durations[name] = future.result()
+                except Exception:
+                    for other in running:
+                        other.cancel()
+                    logger.error(f"❌ Stage '{name}' failed")
+                    raise
+                finished[name] = (time.perf_counter() - run_start) * 1000
+            submit_ready()
+
+        wall_ms = (time.perf_counter() - run_start) * 1000
+        stage_results = {name: results[name] for name in self.stages}
+        logger.info(f"⏱️  {len(self.stages)} stages in {wall_ms:.1f} ms "
+                    f"(sequential {sum(durations.values()):.1f} ms)")
+        return StageRun(
+            results=stage_results,
+            durations_ms=durations,
+            started_ms=started,
+            wall_ms=wall_ms,
+            critical_path=self._critical_path(finished)
+        )
+
+    def _critical_path(self, finished: Dict[str, float]) -> List[str]:
+        """Chain of stages that ended last, following the latest-finishing dependency"""
+        if not finished:
+            return []
+        path = [max(finished, key=finished.get)]
+        while True:
+            dependencies = [d for d in self.stages[path[-1]].depends_on if d in finished]
+            if not dependencies:
+                break
+            path.append(max(dependencies, key=finished.get))
+        return list(reversed(path))
@@ -0,0 +1,266 @@
+"""
+Streaming Statistics
+====================
+
+O(1)-per-sample accumulators for per-athlete metric summaries, so reports can
+be updated as sessions arrive instead of recomputed over the full history.
+
+- RunningStats:      Welford mean / variance, min, max (mergeable)
+- RunningRegression: least-squares line and correlation from centred
+                     co-moments (numerically stable, mergeable)
+- P2Quantile:        P² single-quantile sketch (Jain & Chlamtac, 1985),
+                     constant memory; exact until the 6th sample
+- QuantileSketch:    several P2Quantile markers fed together
+
+Each accumulator can also be built in one vectorized pass from NumPy arrays
+(`from_array` / `from_arrays`), which is what the batch analytics use.
+"""
+
+import math
+from bisect import bisect_right
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+
+class RunningStats:
+    """Welford's online mean and variance"""
+
+    __slots__ = ('count', 'mean', 'm2', 'min_value', 'max_value')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min_value = math.inf
+        self.max_value = -math.inf
+
+    @classmethod
+    def from_array(cls, values) -> 'RunningStats':
+        """Vectorized construction from a batch of samples"""
+        values = np.asarray(values, dtype=float)
+        stats = cls()
+        if values.size:
+            stats.count = int(values.size)
+            stats.mean = float(values.mean())
+            stats.m2 = float(((values - stats.mean) ** 2).sum())
+            stats.min_value = float(values.min())
+            stats.max_value = float(values.max())
+        return stats
+
+    def update(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Combine two accumulators (Chan et al. parallel update)"""
+        merged = RunningStats()
+        merged.count = self.count + other.count
+        if merged.count == 0:
+            return merged
+        delta = other.mean - self.mean
+        merged.mean = self.mean + delta * other.count / merged.count
+        merged.m2 = self.m2 + other.m2 + delta ** 2 * self.count * other.count / merged.count
+        merged.min_value = min(self.min_value, other.min_value)
+        merged.max_value = max(self.max_value, other.max_value)
+        return merged
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class RunningRegression:
+    """Streaming simple linear regression y = slope * x + intercept"""
+
+    __slots__ = ('count', 'mean_x', 'mean_y', 'c_xx', 'c_xy', 'c_yy')
+
+    def __init__(self):
+        self.count = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.c_xx = 0.0
+        self.c_xy = 0.0
+        self.c_yy = 0.0
+
+    @classmethod
+    def from_arrays(cls, x, y) -> 'RunningRegression':
+        """Vectorized construction from paired samples"""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        regression = cls()
+        if x.size:
+            regression.count = int(x.size)
+            regression.mean_x = float(x.mean())
+            regression.mean_y = float(y.mean())
+            dx = x - regression.mean_x
+            dy = y - regression.mean_y
+            regression.c_xx = float(dx @ dx)
+            regression.c_xy = float(dx @ dy)
+            regression.c_yy = float(dy @ dy)
+        return regression
+
+    def update(self, x: float, y: float):
+        self.count += 1
+        dx = x - self.mean_x
+        self.mean_x += dx / self.count
+        dy = y - self.mean_y
+        self.mean_y += dy / self.count
+        self.c_xx += dx * (x - self.mean_x)
+        self.c_xy += dx * (y - self.mean_y)
+        self.c_yy += dy * (y - self.mean_y)
+
+    def merge(self, other: 'RunningRegression') -> 'RunningRegression':
+        merged = RunningRegression()
+        merged.count = self.count + other.count
+        if merged.count == 0:
+            return merged
+        weight = self.count * other.count / merged.count
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        merged.mean_x = self.mean_x + dx * other.count / merged.count
+        merged.mean_y = self.mean_y + dy * other.count / merged.count
+        merged.c_xx = self.c_xx + other.c_xx + dx * dx * weight
+        merged.c_xy = self.c_xy + other.c_xy + dx * dy * weight
+        merged.c_yy = self.c_yy + other.c_yy + dy * dy * weight
+        return merged
+
+    @property
+    def slope(self) -> float:
+        """Least-squares slope (raises ZeroDivisionError if every x is equal)"""
+        return self.c_xy / self.c_xx
+
+    @property
+    def intercept(self) -> float:
+        return self.mean_y - self.slope * self.mean_x
+
+    @property
+    def r_squared(self) -> float:
+        """Coefficient of determination (0 when y is constant)"""
+        if self.c_yy == 0 or self.c_xx == 0:
+            return 0.0
+        return max(0.0, min(1.0, self.c_xy * self.c_xy / (self.c_xx * self.c_yy)))
+
+    @property
+    def correlation(self) -> float:
+        """Pearson r (0 when either variable is constant)"""
+        denominator = math.sqrt(self.c_xx) * math.sqrt(self.c_yy)
+        return self.c_xy / denominator if denominator != 0 else 0.0
+
+    def predict(self, x: float) -> float:
+        return self.slope * x + self.intercept
+
+
+class P2Quantile:
+    """
+    P² streaming quantile estimate with five markers.
+
+    The first five samples are kept exactly (interpolated like a sorted
+    percentile); after that each update is O(1) and memory is constant.
+    """
+
+    __slots__ = ('p', '_heights', '_positions', '_desired', '_increments')
+
+    def __init__(self, p: float):
+        if not 0 <= p <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        self.p = p
+        self._heights = []
+        self._positions = None
+        self._desired = None
+        self._increments = (0.0, p / 2, p, (1 + p) / 2, 1.0)
+
+    @property
+    def count(self) -> int:
+        return len(self._heights) if self._positions is None else self._positions[4] + 1
+
+    def update(self, value: float):
+        heights = self._heights
+        if self._positions is None:
+            if len(heights) < 5:
+                heights.append(value)
+                return
+            # 6th sample: switch from exact samples to the five markers
+            heights.sort()
+            p = self.p
+            self._positions = [0, 1, 2, 3, 4]
+            self._desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+
+        # Find the cell containing the sample, extending the extremes
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = bisect_right(heights, value) - 1
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Nudge the three middle markers toward their desired positions
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or \
+                    (offset <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if offset > 0 else -1
+                candidate = self._parabolic(i, step)
+                if heights[i - 1] < candidate < heights[i + 1]:
+                    heights[i] = candidate
+                else:
+                    heights[i] = heights[i] + step * (heights[i + step] - heights[i]) / \
+                        (positions[i + step] - positions[i])
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> float:
+        if self._positions is not None:
+            return self._heights[2]
+        if not self._heights:
+            return 0.0
+        ordered = sorted(self._heights)
+        k = (len(ordered) - 1) * self.p
+        lower = int(k)
+        if lower + 1 >= len(ordered):
+            return ordered[-1]
+        return ordered[lower] + (k - lower) * (ordered[lower + 1] - ordered[lower])
+
+
+class QuantileSketch:
+    """A set of P² markers fed from the same stream"""
+
+    def __init__(self, quantiles: Sequence[float] = (0.25, 0.5, 0.75, 0.9)):
+        self._markers: Dict[float, P2Quantile] = {q: P2Quantile(q) for q in quantiles}
+
+    def update(self, value: float):
+        for marker in self._markers.values():
+            marker.update(value)
+
+    def extend(self, values: Iterable[float]):
+        for value in values:
+            self.update(value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        marker = self._markers.get(q)
+        return marker.value() if marker is not None else None
@@ -0,0 +1,285 @@
+"""
+Swing Session Analyzer
+======================
+
+Detects and scores every swing in a long video (cage session, multiple
+takes) instead of only the fastest one.
+
+1. EventDetector.find_swing_windows() segments the session into one
+   window per swing (bat velocity peaks + refractory period)
+2. Each window is scored independently and in parallel: events, tempo,
+   Ground/Engine/Weapon scores, race bar and (with pose frames) head
+   stability
+3. Session aggregates come from race_bar_formatter.analyze_race_bar_consistency
+   and tempo_calculator.analyze_tempo_consistency
+
+Usage:
+    analyzer = SwingSessionAnalyzer()
+    session = analyzer.analyze_session(angles, velocities, pose_frames, weight_lbs=185)
+    session.to_dict()
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+import logging
+
+import numpy as np
+
+try:
+    from .event_detection_v3 import EventDetector, SwingEvents, SwingWindow
+    from .physics_calculator import JointAngles, JointVelocities, PhysicsCalculator
+    from .scoring_engine import ScoringEngine
+    from .tempo_calculator import calculate_tempo_score, analyze_tempo_consistency
+    from .race_bar_formatter import format_kinetic_sequence_for_race_bar, analyze_race_bar_consistency
+    from .stability_calculator import calculate_stability_score
+except ImportError:
+    from event_detection_v3 import EventDetector, SwingEvents, SwingWindow
+    from physics_calculator import JointAngles, JointVelocities, PhysicsCalculator
+    from scoring_engine import ScoringEngine
+    from tempo_calculator import calculate_tempo_score, analyze_tempo_consistency
+    from race_bar_formatter import format_kinetic_sequence_for_race_bar, analyze_race_bar_consistency
+    from stability_calculator import calculate_stability_score
+
+logger = logging.getLogger(__name__)
+
+CONTACT_DURATION_MS = 50  # Same assumption as tempo_calculator.calculate_tempo_from_events
+
+
+@dataclass
+class SwingAnalysis:
+    """Everything scored for one swing window"""
+    swing_number: int
+    window: SwingWindow
+    events: SwingEvents
+    event_summary: Dict
+    tempo: Dict
+    scores: Dict
+    race_bar: Dict
+    stability: Optional[Dict] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "swing_number": self.swing_number,
+            "window": {
+                "start_ms": round(self.window.start_ms, 1),
+                "end_ms": round(self.window.end_ms, 1),
+                "peak_velocity_ms": round(self.window.peak_velocity_ms, 1),
+                "peak_velocity_value": round(self.window.peak_velocity_value, 2)
+            },
+            "swing_events": self.event_summary,
+            "tempo": self.tempo,
+            "scores": self.scores,
+            "race_bar": self.race_bar,
+            "stability": self.stability
+        }
+
+
+@dataclass
+class SessionAnalysis:
+    """Per-swing results plus session aggregates"""
+    swings: List[SwingAnalysis]
+    windows_found: int
+    tempo_consistency: Dict
+    race_bar_consistency: Dict
+    summary: Dict = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return {
+            "swing_count": len(self.swings),
+            "windows_found": self.windows_found,
+            "swings": [swing.to_dict() for swing in self.swings],
+            "tempo_consistency": self.tempo_consistency,
+            "race_bar_consistency": self.race_bar_consistency,
+            "summary": self.summary
+        }
+
+
+@dataclass
+class _WindowTask:
+    """Picklable unit of per-window work (safe for process pools)"""
+    swing_number: int
+    window: SwingWindow
+    angles: List[JointAngles]
+    velocities: List[JointVelocities]
+    pose_frames: Optional[list]
+    weight_lbs: float
+    player_height_inches: float
+
+
+def _frame_at(angles: List[JointAngles], timestamp_ms: float) -> int:
+    """Frame number of the first angle at or after timestamp_ms"""
+    for angle in angles:
+        if angle.timestamp_ms >= timestamp_ms:
+            return angle.frame_number
+    return angles[-1].frame_number
+
+
+def _analyze_window(task: _WindowTask) -> Optional[SwingAnalysis]:
+    """Score one swing window (runs in a worker)"""
+    detector = EventDetector()
+    events = detector.detect_window_events(task.angles, task.window)
+    if events is None or len(task.velocities) < 5:
+        return None
+
+    tempo = calculate_tempo_score(
+        load_duration_ms=events.get_load_duration_ms(),
+        launch_duration_ms=events.get_swing_duration_ms(),
+        contact_duration_ms=CONTACT_DURATION_MS
+    )
+
+    kinetic_seq = PhysicsCalculator().find_kinetic_sequence(task.velocities)
+    scores = ScoringEngine().calculate_all_scores(
+        task.velocities, events, kinetic_seq, task.weight_lbs
+    )
+
+    race_bar = format_kinetic_sequence_for_race_bar({
+        'lower_half_peak_ms': kinetic_seq.pelvis_peak_time_ms,
+        'torso_peak_ms': kinetic_seq.torso_peak_time_ms,
+        'arms_peak_ms': kinetic_seq.hand_peak_time_ms,
+        'tempo_lower_to_torso': kinetic_seq.torso_peak_time_ms - kinetic_seq.pelvis_peak_time_ms,
+        'tempo_torso_to_arms': kinetic_seq.hand_peak_time_ms - kinetic_seq.torso_peak_time_ms
+    })
+
+    stability = None
+    if task.pose_frames:
+        # Phase boundaries (frame numbers) from this swing's events
+        load = _frame_at(task.angles, events.load_start_ms)
+        foot_down = _frame_at(task.angles, events.foot_down_ms)
+        contact = _frame_at(task.angles, events.contact_ms)
+        key_phases = {
+            'load': [task.angles[0].frame_number, load],
+            'stride': [load, foot_down],
+            'launch': [foot_down, contact],
+            'finish': [contact, task.angles[-1].frame_number]
+        }
+        stability = calculate_stability_score(
+            task.pose_frames, key_phases, player_height_inches=task.player_height_inches
+        )
+
+    return SwingAnalysis(
+        swing_number=task.swing_number,
+        window=task.window,
+        events=events,
+        event_summary=detector.get_event_summary(events),
+        tempo=tempo,
+        scores=scores.to_dict(),
+        race_bar=race_bar,
+        stability=stability
+    )
+
+
+class SwingSessionAnalyzer:
+    """
+    Segment a session into swings and score each window in parallel.
+
+    Windows are independent, so the per-window work fans out to a thread
+    pool by default. Pass use_processes=True to score in worker processes
+    instead (the work is pure Python, so processes scale with cores; tasks
+    are pickled, so use it for long sessions where that cost pays off).
+    """
+
+    def __init__(self, detector: Optional[EventDetector] = None,
+                 max_workers: Optional[int] = None, use_processes: bool = False):
+        self.detector = detector or EventDetector()
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+
+    def analyze_session(self, angles: List[JointAngles],
+                        velocities: List[JointVelocities],
+                        pose_frames: Optional[Sequence] = None,
+                        weight_lbs: float = 160,
+                        player_height_inches: float = 72.0,
+                        window_size_ms: float = 2000,
+                        refractory_ms: Optional[float] = None,
+                        executor: Optional[Executor] = None) -> SessionAnalysis:
+        """
+        Detect and score every swing in a video
+
+        Args:
+            angles: Joint angles for the whole video (time order)
+            velocities: Joint velocities for the whole video (time order)
+            pose_frames: Pose frames with a 'nose' landmark, for stability (optional)
+            weight_lbs: Athlete weight (motor profile Titan modifier)
+            player_height_inches: Athlete height (stability scaling)
+            window_size_ms: Window around each swing's peak bat velocity
+            refractory_ms: Minimum time between swings (default window_size_ms)
+            executor: Reuse an existing executor instead of creating one
+
+        Returns:
+            SessionAnalysis with per-swing results in time order
+        """
+        windows = self.detector.find_swing_windows(velocities, window_size_ms, refractory_ms)
+        tasks = self._build_tasks(windows, angles, velocities, pose_frames,
+                                  weight_lbs, player_height_inches)
+
+        if executor is not None:
+            results = list(executor.map(_analyze_window, tasks))
+        elif len(tasks) <= 1 or self.max_workers == 1:
+            results = [_analyze_window(task) for task in tasks]
+        else:
+            pool_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            with pool_class(max_workers=self.max_workers) as pool:
+                results = list(pool.map(_analyze_window, tasks))
+
+        swings = [swing for swing in results if swing is not None]
+        if len(swings) < len(windows):
+            logger.warning(f"⚠️  {len(windows) - len(swings)} of {len(windows)} swing windows had too few frames")
+        logger.info(f"🔍 Session analysis: {len(swings)} swings scored")
+
+        return SessionAnalysis(
+            swings=swings,
+            windows_found=len(windows),
+            tempo_consistency=analyze_tempo_consistency([swing.tempo for swing in swings]),
+            race_bar_consistency=analyze_race_bar_consistency([swing.race_bar for swing in swings]),
+            summary=self._summarize(swings)
+        )
+
+    def _build_tasks(self, windows: List[SwingWindow], angles, velocities, pose_frames,
+                     weight_lbs: float, player_height_inches: float) -> List[_WindowTask]:
+        """Slice every input stream to each window with binary searches"""
+        angle_times = np.array([a.timestamp_ms for a in angles], dtype=float)
+        velocity_times = np.array([v.timestamp_ms for v in velocities], dtype=float)
+        pose_times = None
+        if pose_frames:
+            pose_times = np.array([p.timestamp_ms for p in pose_frames], dtype=float)
+
+        tasks = []
+        for number, window in enumerate(windows, 1):
+            a0 = int(np.searchsorted(angle_times, window.start_ms, side='left'))
+            a1 = int(np.searchsorted(angle_times, window.end_ms, side='right'))
+            v0 = int(np.searchsorted(velocity_times, window.start_ms, side='left'))
+            v1 = int(np.searchsorted(velocity_times, window.end_ms, side='right'))
+            window_poses = None
+            if pose_times is not None:
+                p0 = int(np.searchsorted(pose_times, window.start_ms, side='left'))
+                p1 = int(np.searchsorted(pose_times, window.end_ms, side='right'))
+                window_poses = list(pose_frames[p0:p1])
+            tasks.append(_WindowTask(
+                swing_number=number,
+                window=window,
+                angles=angles[a0:a1],
+                velocities=velocities[v0:v1],
+                pose_frames=window_poses,
+                weight_lbs=weight_lbs,
+                player_height_inches=player_height_inches
+            ))
+        return tasks
+
+    def _summarize(self, swings: List[SwingAnalysis]) -> Dict:
+        """Session averages and the best swing"""
+        if not swings:
+            return {}
+
+        def average(key: str) -> float:
+            return round(sum(swing.scores[key] for swing in swings) / len(swings), 1)
+
+        best = max(swings, key=lambda swing: swing.scores['peak_bat_velocity_mph'])
+        return {
+            "avg_ground_score": average("ground_score"),
+            "avg_engine_score": average("engine_score"),
+            "avg_weapon_score": average("weapon_score"),
+            "avg_peak_bat_velocity_mph": average("peak_bat_velocity_mph"),
+            "best_swing_number": best.swing_number,
+            "best_peak_bat_velocity_mph": best.scores['peak_bat_velocity_mph']
+        }
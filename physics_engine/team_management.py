@@ -21,11 +21,21 @@ Date: 2025-12-24
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
+from bisect import bisect_right, insort
 import uuid
 
+try:
+    from .progress_tracker import ProgressTracker, MetricType, get_progress_tracker
+    from .cohort_percentiles import SESSION_METRICS
+    from .profile_comparisons import ProfileComparison, get_profile_comparison
+except ImportError:
+    from progress_tracker import ProgressTracker, MetricType, get_progress_tracker
+    from cohort_percentiles import SESSION_METRICS
+    from profile_comparisons import ProfileComparison, get_profile_comparison
+
 
 # ============================================================================
 # ENUMERATIONS
@@ -65,6 +75,22 @@ class AssignmentStatus(Enum):
     OVERDUE = "overdue"
 
 
+# Friendly metric names accepted by compare_athletes
+COMPARISON_METRIC_ALIASES = {
+    'bat_speed': MetricType.BAT_SPEED_ACTUAL,
+    'efficiency': MetricType.OVERALL_EFFICIENCY,
+}
+
+# Leaderboard metric (same names as compare_athletes) -> cohort metric
+# (cohort_percentiles.SESSION_METRICS)
+LEADERBOARD_METRICS = {
+    'bat_speed': 'bat_speed_mph',
+    'ground_score': 'ground_score',
+    'engine_score': 'engine_score',
+    'weapon_score': 'weapon_score',
+}
+
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
@@ -248,6 +274,37 @@ class TrainingAssignment:
         }
 
 
+@dataclass
+class TeamAggregate:
+    """
+    Running totals behind get_team_analytics
+    
+    Updated on every roster, status and assignment change so analytics are
+    read straight off the totals instead of rescanning the roster. The
+    biometric sums, birthdays, positions and assignment counters cover
+    active athletes only.
+    """
+    total_athletes: int = 0
+    status_counts: Dict[AthleteStatus, int] = field(default_factory=dict)
+    height_sum: float = 0.0
+    wingspan_sum: float = 0.0
+    weight_sum: float = 0.0
+    birth_year_sum: int = 0
+    birthdays: List[Tuple[int, int]] = field(default_factory=list)  # sorted (month, day)
+    position_counts: Dict[str, int] = field(default_factory=dict)
+    total_assignments: int = 0
+    completed_assignments: int = 0
+    
+    @property
+    def active_athletes(self) -> int:
+        return self.status_counts.get(AthleteStatus.ACTIVE, 0)
+    
+    def sum_of_ages(self, today: datetime) -> int:
+        """Sum of Athlete.age over active athletes, for the given date"""
+        birthdays_ahead = len(self.birthdays) - bisect_right(self.birthdays, (today.month, today.day))
+        return len(self.birthdays) * today.year - self.birth_year_sum - birthdays_ahead
+
+
 # ============================================================================
 # TEAM MANAGEMENT SYSTEM
 # ============================================================================
@@ -264,12 +321,23 @@ class TeamManagementSystem:
     - Coach notes and communication
     """
     
-    def __init__(self):
+    def __init__(self, progress_tracker: Optional[ProgressTracker] = None):
         self.coaches: Dict[str, Coach] = {}
         self.teams: Dict[str, Team] = {}
         self.athletes: Dict[str, Athlete] = {}
         self.notes: Dict[str, List[CoachNote]] = {}  # athlete_id -> notes
         self.assignments: Dict[str, List[TrainingAssignment]] = {}  # athlete_id -> assignments
+        self.progress_tracker = progress_tracker  # defaults to the global tracker
+        
+        # Indexes and incremental aggregates
+        self._teams_by_coach: Dict[str, List[str]] = {}  # coach_id -> team_ids
+        self._team_aggregates: Dict[str, TeamAggregate] = {}  # team_id -> totals
+        self._roster_by_status: Dict[str, Dict[AthleteStatus, Dict[str, None]]] = {}  # team_id -> status -> athlete_ids
+        self._roster_team: Dict[str, str] = {}  # athlete_id -> team_id whose roster lists them
+        self._roster_order: Dict[str, int] = {}  # athlete_id -> join sequence
+        self._roster_sequence = 0
+        self._assignment_index: Dict[str, TrainingAssignment] = {}  # assignment_id -> assignment
+        self._assignment_counts: Dict[str, List[int]] = {}  # athlete_id -> [total, completed]
     
     # ========================================================================
     # COACH MANAGEMENT
@@ -317,6 +385,9 @@ class TeamManagementSystem:
         )
         
         self.teams[team_id] = team
+        self._teams_by_coach.setdefault(team.coach_id, []).append(team_id)
+        self._team_aggregates[team_id] = TeamAggregate()
+        self._roster_by_status[team_id] = {}
         
         # Add team to coach's team list
         coach = self.coaches.get(team_data['coach_id'])
@@ -331,7 +402,7 @@ class TeamManagementSystem:
     
     def get_coach_teams(self, coach_id: str) -> List[Team]:
         """Get all teams for a coach"""
-        return [team for team in self.teams.values() if team.coach_id == coach_id]
+        return [self.teams[team_id] for team_id in self._teams_by_coach.get(coach_id, [])]
     
     # ========================================================================
     # ATHLETE MANAGEMENT
@@ -362,34 +433,119 @@ class TeamManagementSystem:
         
         self.athletes[athlete_id] = athlete
         
-        # Add athlete to team
-        team = self.teams.get(athlete_data['team_id'])
-        if team:
-            team.athlete_ids.append(athlete_id)
-        
         # Initialize notes and assignments
         self.notes[athlete_id] = []
         self.assignments[athlete_id] = []
         
+        # Add athlete to team
+        self._join_team(athlete)
+        
         return athlete_id
     
     def get_athlete(self, athlete_id: str) -> Optional[Athlete]:
         """Get athlete by ID"""
         return self.athletes.get(athlete_id)
     
+    def update_athlete(self, athlete_id: str, updates: Dict[str, Any]) -> bool:
+        """
+        Update athlete profile fields (status, team_id, biometrics, position, ...)
+        
+        Team aggregates and roster indexes are adjusted incrementally; change
+        athletes through this method rather than setting attributes directly.
+        """
+        athlete = self.athletes.get(athlete_id)
+        if not athlete:
+            return False
+        
+        previous_team_id = self._roster_team.get(athlete_id)
+        self._leave_team(athlete)
+        for key, value in updates.items():
+            if key == 'status':
+                value = AthleteStatus(value)
+            if key != 'athlete_id' and hasattr(athlete, key):
+                setattr(athlete, key, value)
+        
+        moved = athlete.team_id != previous_team_id
+        if moved and previous_team_id is not None:
+            self.teams[previous_team_id].athlete_ids.remove(athlete_id)
+        self._join_team(athlete, new_member=moved)
+        return True
+    
     def get_team_roster(self, team_id: str, status_filter: Optional[str] = None) -> List[Athlete]:
         """Get all athletes in a team with optional status filter"""
         team = self.teams.get(team_id)
         if not team:
             return []
         
-        roster = [self.athletes[aid] for aid in team.athlete_ids if aid in self.athletes]
-        
         if status_filter:
             status_enum = AthleteStatus(status_filter)
-            roster = [a for a in roster if a.status == status_enum]
+            athlete_ids = self._roster_by_status[team_id].get(status_enum, {})
+            return [self.athletes[aid] for aid in sorted(athlete_ids, key=self._roster_order.__getitem__)]
+        
+        return [self.athletes[aid] for aid in team.athlete_ids if aid in self.athletes]
+    
+    # ========================================================================
+    # ROSTER INDEX & AGGREGATES
+    # ========================================================================
+    
+    def _join_team(self, athlete: Athlete, new_member: bool = True) -> None:
+        """Add athlete to their team's status index and aggregates (and roster when new_member)"""
+        team = self.teams.get(athlete.team_id)
+        if not team:
+            return
+        
+        athlete_id = athlete.athlete_id
+        if new_member:
+            team.athlete_ids.append(athlete_id)
+            self._roster_sequence += 1
+            self._roster_order[athlete_id] = self._roster_sequence
+        self._roster_team[athlete_id] = team.team_id
+        self._roster_by_status[team.team_id].setdefault(athlete.status, {})[athlete_id] = None
+        self._apply_to_aggregate(self._team_aggregates[team.team_id], athlete, 1)
+    
+    def _leave_team(self, athlete: Athlete) -> None:
+        """Reverse of _join_team (before status or team changes)"""
+        team_id = self._roster_team.pop(athlete.athlete_id, None)
+        if team_id is None:
+            return
         
-        return roster
+        self._roster_by_status[team_id][athlete.status].pop(athlete.athlete_id, None)
+        self._apply_to_aggregate(self._team_aggregates[team_id], athlete, -1)
+    
+    def _apply_to_aggregate(self, aggregate: TeamAggregate, athlete: Athlete, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) an athlete's contribution"""
+        aggregate.total_athletes += sign
+        aggregate.status_counts[athlete.status] = aggregate.status_counts.get(athlete.status, 0) + sign
+        if athlete.status != AthleteStatus.ACTIVE:
+            return
+        
+        aggregate.height_sum += sign * athlete.height_inches
+        aggregate.wingspan_sum += sign * athlete.wingspan_inches
+        aggregate.weight_sum += sign * athlete.weight_lbs
+        aggregate.birth_year_sum += sign * athlete.date_of_birth.year
+        birthday = (athlete.date_of_birth.month, athlete.date_of_birth.day)
+        if sign > 0:
+            insort(aggregate.birthdays, birthday)
+        else:
+            aggregate.birthdays.pop(bisect_right(aggregate.birthdays, birthday) - 1)
+        
+        if athlete.position:
+            count = aggregate.position_counts.get(athlete.position, 0) + sign
+            if count:
+                aggregate.position_counts[athlete.position] = count
+            else:
+                del aggregate.position_counts[athlete.position]
+        
+        total, completed = self._assignment_counts.get(athlete.athlete_id, (0, 0))
+        aggregate.total_assignments += sign * total
+        aggregate.completed_assignments += sign * completed
+    
+    def _active_aggregate(self, athlete_id: str) -> Optional[TeamAggregate]:
+        """Aggregate that counts this athlete's assignments, if any"""
+        team_id = self._roster_team.get(athlete_id)
+        if team_id is None or self.athletes[athlete_id].status != AthleteStatus.ACTIVE:
+            return None
+        return self._team_aggregates[team_id]
     
     def search_athletes(self, team_id: str, query: str) -> List[Athlete]:
         """Search athletes by name, position, or jersey number"""
@@ -468,6 +624,11 @@ class TeamManagementSystem:
             self.assignments[athlete_id] = []
         
         self.assignments[athlete_id].append(assignment)
+        self._assignment_index[assignment_id] = assignment
+        self._assignment_counts.setdefault(athlete_id, [0, 0])[0] += 1
+        aggregate = self._active_aggregate(athlete_id)
+        if aggregate:
+            aggregate.total_assignments += 1
         return assignment_id
     
     def get_athlete_assignments(self, athlete_id: str, 
@@ -491,58 +652,62 @@ class TeamManagementSystem:
     
     def update_assignment_progress(self, assignment_id: str, sets_completed: int) -> bool:
         """Update assignment progress"""
-        for athlete_assignments in self.assignments.values():
-            for assignment in athlete_assignments:
-                if assignment.assignment_id == assignment_id:
-                    assignment.sets_completed = sets_completed
-                    
-                    if sets_completed >= assignment.sets_required:
-                        assignment.status = AssignmentStatus.COMPLETED
-                        assignment.completed_date = datetime.now()
-                    elif sets_completed > 0:
-                        assignment.status = AssignmentStatus.IN_PROGRESS
-                    
-                    return True
-        return False
+        assignment = self._assignment_index.get(assignment_id)
+        if not assignment:
+            return False
+        
+        was_completed = assignment.status == AssignmentStatus.COMPLETED
+        assignment.sets_completed = sets_completed
+        
+        if sets_completed >= assignment.sets_required:
+            assignment.status = AssignmentStatus.COMPLETED
+            assignment.completed_date = datetime.now()
+        elif sets_completed > 0:
+            assignment.status = AssignmentStatus.IN_PROGRESS
+        
+        change = (assignment.status == AssignmentStatus.COMPLETED) - was_completed
+        if change:
+            self._assignment_counts[assignment.athlete_id][1] += change
+            aggregate = self._active_aggregate(assignment.athlete_id)
+            if aggregate:
+                aggregate.completed_assignments += change
+        return True
     
     # ========================================================================
     # TEAM ANALYTICS
     # ========================================================================
     
     def get_team_analytics(self, team_id: str) -> Dict[str, Any]:
-        """Get aggregate team analytics"""
-        roster = self.get_team_roster(team_id)
+        """Get aggregate team analytics (read from the running team totals)"""
+        aggregate = self._team_aggregates.get(team_id)
         
-        if not roster:
+        if not aggregate or not aggregate.total_athletes:
             return {
                 'total_athletes': 0,
                 'active_athletes': 0,
                 'error': 'No athletes in team'
             }
         
-        active_athletes = [a for a in roster if a.status == AthleteStatus.ACTIVE]
+        active_count = aggregate.active_athletes
+        divisor = active_count or 1  # averages read 0 with no active athletes
         
-        # Calculate average biometrics
-        avg_height = sum(a.height_inches for a in active_athletes) / len(active_athletes)
-        avg_wingspan = sum(a.wingspan_inches for a in active_athletes) / len(active_athletes)
-        avg_weight = sum(a.weight_lbs for a in active_athletes) / len(active_athletes)
-        avg_age = sum(a.age for a in active_athletes) / len(active_athletes)
+        # Average biometrics
+        avg_height = aggregate.height_sum / divisor
+        avg_wingspan = aggregate.wingspan_sum / divisor
+        avg_weight = aggregate.weight_sum / divisor
+        avg_age = aggregate.sum_of_ages(datetime.now()) / divisor
         
-        # Count assignments
-        total_assignments = sum(len(self.assignments.get(a.athlete_id, [])) for a in active_athletes)
-        completed_assignments = sum(
-            len([asn for asn in self.assignments.get(a.athlete_id, []) 
-                 if asn.status == AssignmentStatus.COMPLETED])
-            for a in active_athletes
-        )
+        # Assignments of active athletes
+        total_assignments = aggregate.total_assignments
+        completed_assignments = aggregate.completed_assignments
         
         completion_rate = (completed_assignments / total_assignments * 100) if total_assignments > 0 else 0
         
         return {
             'team_id': team_id,
-            'total_athletes': len(roster),
-            'active_athletes': len(active_athletes),
-            'injured_athletes': len([a for a in roster if a.status == AthleteStatus.INJURED]),
+            'total_athletes': aggregate.total_athletes,
+            'active_athletes': active_count,
+            'injured_athletes': aggregate.status_counts.get(AthleteStatus.INJURED, 0),
             'avg_height_inches': round(avg_height, 1),
             'avg_wingspan_inches': round(avg_wingspan, 1),
             'avg_weight_lbs': round(avg_weight, 1),
@@ -550,17 +715,9 @@ class TeamManagementSystem:
             'total_assignments': total_assignments,
             'completed_assignments': completed_assignments,
             'completion_rate': round(completion_rate, 1),
-            'positions': self._count_positions(active_athletes)
+            'positions': dict(aggregate.position_counts)
         }
     
-    def _count_positions(self, athletes: List[Athlete]) -> Dict[str, int]:
-        """Count athletes by position"""
-        positions = {}
-        for athlete in athletes:
-            if athlete.position:
-                positions[athlete.position] = positions.get(athlete.position, 0) + 1
-        return positions
-    
     # ========================================================================
     # MULTI-ATHLETE COMPARISON
     # ========================================================================
@@ -570,33 +727,77 @@ class TeamManagementSystem:
         """
         Compare multiple athletes on a specific metric
         
-        Requires integration with Priority 14 (Progress Tracking)
-        to get latest metrics
+        Latest metrics come from Priority 14's ProgressTracker in one bulk
+        lookup. `metric` is a MetricType value ('ground_score',
+        'bat_speed_predicted', ...) or 'bat_speed' for the measured bat speed.
+        Athletes with no tracked sessions get None values.
         """
-        comparison = []
+        metric_type = COMPARISON_METRIC_ALIASES.get(metric) or MetricType(metric)
+        tracker = self.progress_tracker or get_progress_tracker()
+        
+        athletes = [self.athletes[aid] for aid in athlete_ids if aid in self.athletes]
+        latest_sessions = tracker.get_latest_sessions([a.athlete_id for a in athletes])
         
-        for athlete_id in athlete_ids:
-            athlete = self.athletes.get(athlete_id)
-            if not athlete:
-                continue
-            
-            # This would integrate with Priority 14's ProgressTracker
-            # For now, return athlete profile data
+        comparison = []
+        for athlete in athletes:
+            session = latest_sessions.get(athlete.athlete_id)
             comparison.append({
-                'athlete_id': athlete_id,
+                'athlete_id': athlete.athlete_id,
                 'name': athlete.name,
                 'age': athlete.age,
                 'height': athlete.height_inches,
                 'wingspan': athlete.wingspan_inches,
                 'position': athlete.position,
                 'status': athlete.status.value,
-                # Future: Add latest metrics from Progress Tracker
-                # 'latest_bat_speed': progress_tracker.get_latest_metric(athlete_id, 'bat_speed'),
-                # 'ground_score': progress_tracker.get_latest_metric(athlete_id, 'ground_score'),
-                # etc.
+                'metric': metric,
+                'metric_value': tracker.get_metric_value(session, metric_type) if session else None,
+                'latest_session_date': session.session_date.isoformat() if session else None,
+                'ground_score': session.ground_score_adjusted if session else None,
+                'engine_score': session.engine_score_adjusted if session else None,
+                'weapon_score': session.weapon_score_adjusted if session else None,
             })
         
         return comparison
+    
+    def team_leaderboard(self, team_id: str, metric: str = 'bat_speed',
+                         limit: Optional[int] = None,
+                         comparison: Optional[ProfileComparison] = None) -> List[Dict[str, Any]]:
+        """
+        Active athletes ranked by age-adjusted percentile of their latest
+        session's metric
+        
+        Percentiles come from the shared ProfileComparison's cohort engine
+        (benchmark estimates until cohorts are large enough). `metric` is
+        one of LEADERBOARD_METRICS ('bat_speed', as in compare_athletes,
+        or a score); athletes without a value are left out.
+        """
+        if metric not in LEADERBOARD_METRICS:
+            raise ValueError(f"Unknown leaderboard metric {metric!r} (expected one of {sorted(LEADERBOARD_METRICS)})")
+        cohort_metric = LEADERBOARD_METRICS[metric]
+        comparison = comparison or get_profile_comparison()
+        tracker = self.progress_tracker or get_progress_tracker()
+        
+        athletes = self.get_team_roster(team_id, AthleteStatus.ACTIVE.value)
+        latest_sessions = tracker.get_latest_sessions([a.athlete_id for a in athletes])
+        ranked = []
+        for athlete in athletes:
+            session = latest_sessions.get(athlete.athlete_id)
+            value = getattr(session, SESSION_METRICS[cohort_metric]) if session else None
+            if value is not None:
+                ranked.append((athlete, value))
+        if not ranked:
+            return []
+        
+        board = comparison.leaderboard(
+            [athlete.athlete_id for athlete, _ in ranked],
+            [athlete.age for athlete, _ in ranked],
+            cohort_metric,
+            [value for _, value in ranked],
+            limit=limit
+        )
+        for row in board:
+            row['name'] = self.athletes[row['player_id']].name
+        return board
 
 
 # ============================================================================
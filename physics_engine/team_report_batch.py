@@ -0,0 +1,450 @@
+"""
+TEAM BATCH REPORTS
+==================
+
+End-of-week report bundle for a whole roster: one zip with an HTML
+report and a printable PDF of the composite chart for every athlete who
+trained in the date range, plus a manifest.json.
+
+- Session history for the roster comes from the ProgressTracker in one
+  bulk store read (get_sessions_for_athletes), not one query per athlete
+- Each athlete's charts and report are rendered in a process pool
+  (matplotlib is CPU-bound and holds the GIL); at most `max_workers`
+  athletes are in flight, so memory stays bounded on large rosters
+- Finished reports are written to the zip as they arrive, and progress
+  (completed / failed / skipped, reports per minute) is updated after
+  each athlete and passed to an optional callback
+- Background jobs share a process-wide queue: TEAM_REPORT_MAX_JOBS jobs
+  (each with its own render pool) run at once, at most
+  TEAM_REPORT_MAX_QUEUED wait, and finished jobs and their zips are
+  removed after TEAM_REPORT_TTL_SECONDS
+
+Usage:
+    job = TeamReportBatchJob(team_system, team_id, start_date, end_date, "/tmp/week_42.zip")
+    progress = job.run()
+    print(progress.reports_per_minute)
+
+    # or in the background, polled by job id (team_management_routes)
+    progress = start_batch_report_job(team_system, team_id, start_date, end_date)
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import re
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from .chart_renderer import ChartRenderer, _warm_worker, render_chart, report_chart_data
+    from .progress_tracker import TrainingSession, get_progress_tracker
+    from .report_generator import ReportGenerator
+    from .team_management import Athlete, AthleteStatus, TeamManagementSystem
+except ImportError:
+    from chart_renderer import ChartRenderer, _warm_worker, render_chart, report_chart_data
+    from progress_tracker import TrainingSession, get_progress_tracker
+    from report_generator import ReportGenerator
+    from team_management import Athlete, AthleteStatus, TeamManagementSystem
+
+logger = logging.getLogger(__name__)
+
+REPORT_WORKERS = int(os.environ.get("TEAM_REPORT_WORKERS", "2"))
+REPORT_DIR = os.environ.get("TEAM_REPORT_DIR", os.path.join(tempfile.gettempdir(), "team_reports"))
+MAX_CONCURRENT_JOBS = int(os.environ.get("TEAM_REPORT_MAX_JOBS", "1"))
+MAX_QUEUED_JOBS = int(os.environ.get("TEAM_REPORT_MAX_QUEUED", "16"))
+JOB_TTL_SECONDS = float(os.environ.get("TEAM_REPORT_TTL_SECONDS", str(24 * 3600)))
+
+# Report files per athlete: html = full report, pdf / png = composite chart
+REPORT_FORMATS = ('html', 'pdf', 'png')
+
+# Already-compressed formats are stored, not deflated again
+_STORED_EXTENSIONS = ('.pdf', '.png')
+
+
+@dataclass
+class BatchReportProgress:
+    """State of a team batch report job"""
+    job_id: str
+    team_id: str
+    start_date: datetime
+    end_date: datetime
+    status: str = 'pending'  # pending / running / completed / failed
+    total: int = 0  # athletes with sessions in the range
+    completed: int = 0
+    failed: int = 0
+    skipped: int = 0  # active athletes without sessions in the range
+    output_path: Optional[str] = None
+    error: Optional[str] = None
+    errors: Dict[str, str] = field(default_factory=dict)  # athlete_id -> error
+    started_at: Optional[float] = None  # time.monotonic()
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def reports_per_minute(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.completed / elapsed * 60 if elapsed > 0 else 0.0
+
+    @property
+    def done(self) -> bool:
+        return self.status in ('completed', 'failed')
+
+    def to_dict(self) -> Dict:
+        return {
+            'job_id': self.job_id,
+            'team_id': self.team_id,
+            'start_date': self.start_date.isoformat(),
+            'end_date': self.end_date.isoformat(),
+            'status': self.status,
+            'total': self.total,
+            'completed': self.completed,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'percent_complete': round((self.completed + self.failed) / self.total * 100, 1) if self.total else 0.0,
+            'elapsed_seconds': round(self.elapsed_seconds, 2),
+            'reports_per_minute': round(self.reports_per_minute, 1),
+            'error': self.error,
+            'errors': dict(self.errors)
+        }
+
+
+def build_report_data(athlete: Athlete, sessions: List[TrainingSession]) -> Tuple[Dict, Dict]:
+    """
+    (player_data, analysis_data) for an athlete's report, in the format
+    BiomechanicsVisualizer and ReportGenerator use
+
+    Args:
+        athlete: Roster entry
+        sessions: Sessions in the report's range, most recent first
+    """
+    latest, earliest = sessions[0], sessions[-1]
+    scores = {
+        'GROUND': latest.ground_score_adjusted,
+        'ENGINE': latest.engine_score_adjusted,
+        'WEAPON': latest.weapon_score_adjusted
+    }
+    player_data = {
+        'name': athlete.name,
+        'age': athlete.age,
+        'height_inches': athlete.height_inches,
+        'weight_lbs': athlete.weight_lbs
+    }
+    analysis_data = {
+        'actual_bat_speed': latest.actual_bat_speed_mph or latest.predicted_bat_speed,
+        'potential_bat_speed': latest.bat_speed_capacity_midpoint,
+        'ground_score': latest.ground_score_adjusted,
+        'engine_score': latest.engine_score_adjusted,
+        'weapon_score': latest.weapon_score_adjusted,
+        'sessions_in_range': len(sessions),
+        'efficiency_change': round(latest.overall_efficiency - earliest.overall_efficiency, 1),
+        'recommendations': {
+            'primary_component': min(scores, key=scores.get),
+            'estimated_gain_mph': latest.expected_gain_mph,
+            'training_frequency': f"{latest.timeline_weeks}-week plan, {latest.drills_count} drills"
+        }
+    }
+    return player_data, analysis_data
+
+
+def render_athlete_report(player_data: Dict, analysis_data: Dict,
+                          formats: Sequence[str] = REPORT_FORMATS) -> Dict[str, bytes]:
+    """
+    One athlete's report files (runs in a pool worker)
+
+    Returns:
+        {"report.html": ..., "composite.pdf": ..., "composite.png": ...}
+        for the requested formats
+    """
+    files = {}
+    charts = report_chart_data(player_data, analysis_data)
+    pngs = {}
+    if 'html' in formats:
+        pngs = {kind: render_chart(kind, data, 'png') for kind, data in charts.items()}
+        chart_uris = {kind: ChartRenderer.data_uri(image, 'png') for kind, image in pngs.items()}
+        html = ReportGenerator().render_html_report(player_data, analysis_data, chart_uris)
+        files['report.html'] = html.encode('utf-8')
+    if 'composite' in charts:
+        if 'pdf' in formats:
+            files['composite.pdf'] = render_chart('composite', charts['composite'], 'pdf')
+        if 'png' in formats:
+            files['composite.png'] = pngs.get('composite') or render_chart('composite', charts['composite'], 'png')
+    return files
+
+
+def _folder_name(athlete: Athlete) -> str:
+    slug = re.sub(r'[^a-z0-9]+', '_', athlete.name.lower()).strip('_') or 'athlete'
+    return f"{slug}_{athlete.athlete_id[:8]}"
+
+
+class TeamReportBatchJob:
+    """Render a team's reports for a date range into one zip"""
+
+    def __init__(
+        self,
+        team_system: TeamManagementSystem,
+        team_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        output_path: str,
+        formats: Sequence[str] = REPORT_FORMATS,
+        max_workers: int = REPORT_WORKERS,
+        executor: Optional[Executor] = None,
+        on_progress: Optional[Callable[[BatchReportProgress], None]] = None,
+        job_id: Optional[str] = None
+    ):
+        unknown = set(formats) - set(REPORT_FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown report formats {sorted(unknown)} (expected {list(REPORT_FORMATS)})")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.team_system = team_system
+        self.team_id = team_id
+        self.formats = tuple(formats)
+        self.max_workers = max_workers
+        self.executor = executor
+        self.on_progress = on_progress
+        self.progress = BatchReportProgress(
+            job_id=job_id or str(uuid.uuid4()),
+            team_id=team_id,
+            start_date=start_date,
+            end_date=end_date,
+            output_path=output_path
+        )
+
+    def _notify(self):
+        if self.on_progress is not None:
+            try:
+                self.on_progress(self.progress)
+            except Exception as e:
+                logger.warning(f"⚠️ Batch report progress callback failed: {e}")
+
+    def _work_items(self) -> List[Tuple[Athlete, Dict, Dict]]:
+        """(athlete, player_data, analysis_data) for athletes with sessions in range"""
+        progress = self.progress
+        roster = self.team_system.get_team_roster(self.team_id, status_filter=AthleteStatus.ACTIVE.value)
+        tracker = self.team_system.progress_tracker or get_progress_tracker()
+        history = tracker.get_sessions_for_athletes(
+            [athlete.athlete_id for athlete in roster], progress.start_date, progress.end_date
+        )
+        items = []
+        for athlete in roster:
+            sessions = history.get(athlete.athlete_id)
+            if sessions:
+                items.append((athlete, *build_report_data(athlete, sessions)))
+        progress.skipped = len(roster) - len(items)
+        return items
+
+    def run(self) -> BatchReportProgress:
+        """Render every report and write the zip (blocking)"""
+        progress = self.progress
+        progress.status = 'running'
+        progress.started_at = time.monotonic()
+        self._notify()
+        try:
+            if self.team_system.get_team(self.team_id) is None:
+                raise ValueError(f"Team {self.team_id} not found")
+            items = self._work_items()
+            progress.total = len(items)
+            self._notify()
+
+            os.makedirs(os.path.dirname(os.path.abspath(progress.output_path)), exist_ok=True)
+            with zipfile.ZipFile(progress.output_path, 'w', zipfile.ZIP_DEFLATED) as bundle:
+                athletes = self._render_all(items, bundle)
+                manifest = {key: value for key, value in progress.to_dict().items() if key not in ('status', 'error')}
+                manifest['athletes'] = sorted(athletes, key=lambda entry: entry['name'])
+                bundle.writestr('manifest.json', json.dumps(manifest, indent=2))
+            progress.status = 'completed'
+        except Exception as e:
+            logger.exception(f"❌ Batch report {progress.job_id} for team {self.team_id} failed")
+            progress.status = 'failed'
+            progress.error = str(e)
+        finally:
+            progress.finished_at = time.monotonic()
+        logger.info(
+            f"📦 Team {self.team_id} batch reports: {progress.completed}/{progress.total} in "
+            f"{progress.elapsed_seconds:.1f}s ({progress.reports_per_minute:.1f} reports/min, "
+            f"{progress.failed} failed, {progress.skipped} without sessions)"
+        )
+        self._notify()
+        return progress
+
+    def _render_all(self, items: List[Tuple[Athlete, Dict, Dict]], bundle: zipfile.ZipFile) -> List[Dict]:
+        """
+        Render in the pool with at most max_workers athletes in flight,
+        writing each athlete's files as they finish
+
+        Returns:
+            Manifest entry per athlete
+        """
+        progress = self.progress
+        athletes = []
+        if not items:
+            return athletes
+
+        executor = self.executor or ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(items)),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_warm_worker
+        )
+        try:
+            pending = {}
+            remaining = iter(items)
+            while True:
+                for athlete, player_data, analysis_data in remaining:
+                    future = executor.submit(render_athlete_report, player_data, analysis_data, self.formats)
+                    pending[future] = (athlete, analysis_data)
+                    if len(pending) >= self.max_workers:
+                        break
+                if not pending:
+                    break
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    athlete, analysis_data = pending.pop(future)
+                    entry = {
+                        'athlete_id': athlete.athlete_id,
+                        'name': athlete.name,
+                        'sessions': analysis_data['sessions_in_range']
+                    }
+                    try:
+                        files = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ Report for {athlete.athlete_id} failed: {e}")
+                        progress.failed += 1
+                        progress.errors[athlete.athlete_id] = str(e)
+                        entry['error'] = str(e)
+                    else:
+                        folder = _folder_name(athlete)
+                        for filename, content in files.items():
+                            compress_type = zipfile.ZIP_STORED if filename.endswith(_STORED_EXTENSIONS) else None
+                            bundle.writestr(f"{folder}/{filename}", content, compress_type=compress_type)
+                        progress.completed += 1
+                        entry['files'] = [f"{folder}/{filename}" for filename in files]
+                    athletes.append(entry)
+                    logger.debug("Report %d/%d done: %s", progress.completed + progress.failed,
+                                 progress.total, athlete.athlete_id)
+                    self._notify()
+        finally:
+            if self.executor is None:
+                executor.shutdown(wait=True, cancel_futures=True)
+        return athletes
+
+
+class BatchQueueFullError(Exception):
+    """Too many batch report jobs are already waiting"""
+    pass
+
+
+# Background jobs by job_id (this process only)
+_batch_jobs: Dict[str, TeamReportBatchJob] = {}
+_batch_jobs_lock = threading.Lock()
+
+# Jobs waiting for one of the MAX_CONCURRENT_JOBS runner threads
+_job_queue: "queue.Queue[TeamReportBatchJob]" = queue.Queue()
+_job_runners: List[threading.Thread] = []
+
+_BUNDLE_NAME = re.compile(r'^team_.+\.zip$')
+
+
+def _run_queued_jobs():
+    while True:
+        job = _job_queue.get()
+        try:
+            job.run()
+        except Exception:
+            logger.exception(f"❌ Batch report {job.progress.job_id} crashed")
+        finally:
+            _job_queue.task_done()
+
+
+def _ensure_job_runners():
+    # Called with _batch_jobs_lock held
+    while len(_job_runners) < MAX_CONCURRENT_JOBS:
+        runner = threading.Thread(target=_run_queued_jobs, name=f"team-reports-{len(_job_runners)}", daemon=True)
+        runner.start()
+        _job_runners.append(runner)
+
+
+def _remove_file(path: Optional[str]):
+    if path and os.path.exists(path):
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not remove batch report {path}: {e}")
+
+
+def cleanup_batch_reports(ttl_seconds: Optional[float] = None) -> int:
+    """
+    Forget jobs that finished more than ttl_seconds ago and delete their
+    zips, plus bundles in REPORT_DIR older than that (left by earlier
+    processes)
+
+    Returns:
+        Number of jobs removed
+    """
+    ttl = JOB_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+    now = time.monotonic()
+    with _batch_jobs_lock:
+        expired = [job_id for job_id, job in _batch_jobs.items()
+                   if job.progress.done and now - (job.progress.finished_at or now) >= ttl]
+        removed = [_batch_jobs.pop(job_id) for job_id in expired]
+        active = {job.progress.output_path for job in _batch_jobs.values()}
+
+    for job in removed:
+        _remove_file(job.progress.output_path)
+
+    if os.path.isdir(REPORT_DIR):
+        cutoff = time.time() - ttl
+        for name in os.listdir(REPORT_DIR):
+            path = os.path.join(REPORT_DIR, name)
+            if _BUNDLE_NAME.match(name) and path not in active and os.path.getmtime(path) <= cutoff:
+                _remove_file(path)
+    return len(removed)
+
+
+def start_batch_report_job(
+    team_system: TeamManagementSystem,
+    team_id: str,
+    start_date: datetime,
+    end_date: datetime,
+    output_dir: Optional[str] = None,
+    **job_kwargs
+) -> BatchReportProgress:
+    """
+    Queue a TeamReportBatchJob for the background runners; poll with
+    get_batch_report_job
+
+    Raises:
+        BatchQueueFullError: MAX_QUEUED_JOBS jobs are already waiting
+    """
+    cleanup_batch_reports()
+    job_id = str(uuid.uuid4())
+    output_path = os.path.join(output_dir or REPORT_DIR, f"team_{team_id[:8]}_{start_date:%Y%m%d}_{end_date:%Y%m%d}_{job_id[:8]}.zip")
+    job = TeamReportBatchJob(team_system, team_id, start_date, end_date, output_path, job_id=job_id, **job_kwargs)
+    with _batch_jobs_lock:
+        if _job_queue.qsize() >= MAX_QUEUED_JOBS:
+            raise BatchQueueFullError(f"{MAX_QUEUED_JOBS} batch report jobs are already waiting")
+        _batch_jobs[job_id] = job
+        _job_queue.put(job)
+        _ensure_job_runners()
+    return job.progress
+
+
+def get_batch_report_job(job_id: str) -> Optional[BatchReportProgress]:
+    """Progress of a background batch report job"""
+    with _batch_jobs_lock:
+        job = _batch_jobs.get(job_id)
+    return job.progress if job is not None else None
@@ -12,13 +12,16 @@ Features:
 - Support for multiple video sources (YouTube, Vimeo, S3, local)
 - Thumbnail generation and caching
 - View tracking and analytics
+- Inverted search index (posting-list intersections, precomputed ranking)
 """
 
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
+from bisect import bisect_left, insort
 import json
+import re
 
 
 class VideoSource(Enum):
@@ -69,15 +72,257 @@ class VideoMetadata:
     featured: bool = False
 
 
+# ========================================
+# SEARCH INDEX
+# ========================================
+
+TOKEN_PATTERN = re.compile(r'\w+')
+GRAM_SIZE = 3
+# Sort matching ids directly when they are at most this share of the library;
+# otherwise walk the precomputed ranking and keep the matches
+SORT_CANDIDATES_RATIO = 0.125
+
+_EMPTY: frozenset = frozenset()
+
+
+def _grams(token: str) -> Set[str]:
+    return {token[i:i + GRAM_SIZE] for i in range(len(token) - GRAM_SIZE + 1)}
+
+
+@dataclass
+class _IndexedVideo:
+    """What a video was indexed under (so it can be unindexed after edits)"""
+    sequence: int
+    rank_key: Tuple
+    title: str
+    description: str
+    tokens: Set[str]
+    tags: Set[str]
+    category: VideoCategory
+    drill_stage: Optional[DrillStage]
+    drill_ids: Set[str]
+    featured: bool
+
+
+class VideoSearchIndex:
+    """
+    In-memory inverted index over library videos
+    
+    Postings (sets of video_ids) are kept for title/description word tokens,
+    tags, category, drill stage, drill ids and featured. Text queries keep the
+    original substring semantics: every word run in the query must lie inside
+    some indexed token, so each query word is expanded to the vocabulary
+    tokens containing it (via a trigram index over the vocabulary), the
+    posting lists are intersected smallest first, and only the surviving
+    videos get the substring check.
+    
+    Results come back in popularity order (featured, most viewed, newest),
+    kept precomputed as a sorted list of rank keys and patched on each change.
+    """
+    
+    def __init__(self):
+        self._indexed: Dict[str, _IndexedVideo] = {}
+        self._videos: Dict[str, VideoMetadata] = {}
+        self._token_postings: Dict[str, Set[str]] = {}
+        self._gram_tokens: Dict[str, Set[str]] = {}  # trigram -> vocabulary tokens
+        self._tag_postings: Dict[str, Set[str]] = {}
+        self._category_postings: Dict[VideoCategory, Set[str]] = {}
+        self._stage_postings: Dict[DrillStage, Set[str]] = {}
+        self._drill_postings: Dict[str, Set[str]] = {}
+        self._featured: Set[str] = set()
+        self._ranking: List[Tuple] = []  # sorted rank keys, last element is video_id
+        self._sequence = 0
+    
+    def __len__(self) -> int:
+        return len(self._indexed)
+    
+    @staticmethod
+    def _rank_key(video: VideoMetadata, sequence: int) -> Tuple:
+        return (not video.featured, -video.view_count, -video.created_at.timestamp(), sequence, video.video_id)
+    
+    # ---- maintenance ----
+    
+    def add(self, video: VideoMetadata) -> None:
+        """Index a video (re-indexes it if already present)"""
+        previous = self.remove(video.video_id)
+        if previous is not None:
+            sequence = previous.sequence
+        else:
+            self._sequence += 1
+            sequence = self._sequence
+        
+        title = video.title.lower()
+        description = video.description.lower()
+        entry = _IndexedVideo(
+            sequence=sequence,
+            rank_key=self._rank_key(video, sequence),
+            title=title,
+            description=description,
+            tokens=set(TOKEN_PATTERN.findall(title)) | set(TOKEN_PATTERN.findall(description)),
+            tags=set(video.tags),
+            category=video.category,
+            drill_stage=video.drill_stage,
+            drill_ids=set(video.drill_ids),
+            featured=video.featured,
+        )
+        video_id = video.video_id
+        self._indexed[video_id] = entry
+        self._videos[video_id] = video
+        
+        for token in entry.tokens:
+            postings = self._token_postings.get(token)
+            if postings is None:
+                postings = self._token_postings[token] = set()
+                for gram in _grams(token):
+                    self._gram_tokens.setdefault(gram, set()).add(token)
+            postings.add(video_id)
+        for tag in entry.tags:
+            self._tag_postings.setdefault(tag, set()).add(video_id)
+        for drill_id in entry.drill_ids:
+            self._drill_postings.setdefault(drill_id, set()).add(video_id)
+        self._category_postings.setdefault(entry.category, set()).add(video_id)
+        if entry.drill_stage is not None:
+            self._stage_postings.setdefault(entry.drill_stage, set()).add(video_id)
+        if entry.featured:
+            self._featured.add(video_id)
+        insort(self._ranking, entry.rank_key)
+    
+    def remove(self, video_id: str) -> Optional[_IndexedVideo]:
+        """Drop a video from every posting list"""
+        entry = self._indexed.pop(video_id, None)
+        if entry is None:
+            return None
+        del self._videos[video_id]
+        
+        for token in entry.tokens:
+            postings = self._token_postings[token]
+            postings.discard(video_id)
+            if not postings:
+                del self._token_postings[token]
+                for gram in _grams(token):
+                    tokens = self._gram_tokens[gram]
+                    tokens.discard(token)
+                    if not tokens:
+                        del self._gram_tokens[gram]
+        self._discard(self._tag_postings, entry.tags, video_id)
+        self._discard(self._drill_postings, entry.drill_ids, video_id)
+        self._discard(self._category_postings, [entry.category], video_id)
+        if entry.drill_stage is not None:
+            self._discard(self._stage_postings, [entry.drill_stage], video_id)
+        self._featured.discard(video_id)
+        del self._ranking[bisect_left(self._ranking, entry.rank_key)]
+        return entry
+    
+    @staticmethod
+    def _discard(postings: Dict, keys: Iterable, video_id: str) -> None:
+        for key in keys:
+            ids = postings[key]
+            ids.discard(video_id)
+            if not ids:
+                del postings[key]
+    
+    def update_rank(self, video: VideoMetadata) -> None:
+        """Move a video in the ranking after its view count changed"""
+        entry = self._indexed[video.video_id]
+        del self._ranking[bisect_left(self._ranking, entry.rank_key)]
+        entry.rank_key = self._rank_key(video, entry.sequence)
+        insort(self._ranking, entry.rank_key)
+    
+    # ---- queries ----
+    
+    def _text_candidates(self, query_lower: str) -> List[Set[str]]:
+        """One posting set per query word (words under GRAM_SIZE are not pruned on)"""
+        postings = []
+        for word in set(TOKEN_PATTERN.findall(query_lower)):
+            if len(word) < GRAM_SIZE:
+                continue
+            gram_sets = sorted((self._gram_tokens.get(g, _EMPTY) for g in _grams(word)), key=len)
+            tokens = gram_sets[0].intersection(*gram_sets[1:])
+            matches = set()
+            for token in tokens:
+                if word in token:
+                    matches |= self._token_postings[token]
+            postings.append(matches)
+        return postings
+    
+    def in_library_order(self, video_ids: Iterable[str]) -> List[VideoMetadata]:
+        """Videos in the order they were added to the library"""
+        indexed = self._indexed
+        return [self._videos[v] for v in sorted(video_ids, key=lambda v: indexed[v].sequence)]
+    
+    def videos_for_drill(self, drill_id: str) -> List[VideoMetadata]:
+        return self.in_library_order(self._drill_postings.get(drill_id, _EMPTY))
+    
+    def videos_by_stage(self, stage: DrillStage) -> List[VideoMetadata]:
+        return self.in_library_order(self._stage_postings.get(stage, _EMPTY))
+    
+    def videos_by_category(self, category: VideoCategory) -> List[VideoMetadata]:
+        return self.in_library_order(self._category_postings.get(category, _EMPTY))
+    
+    def all_tags(self) -> Set[str]:
+        return set(self._tag_postings)
+    
+    def search(
+        self,
+        query: str = None,
+        tags: Set[str] = None,
+        category: VideoCategory = None,
+        drill_stage: DrillStage = None,
+        featured_only: bool = False
+    ) -> List[VideoMetadata]:
+        """Same filters as VideoLibrary.search_videos, in popularity order"""
+        filters: List[Set[str]] = []
+        if featured_only:
+            filters.append(self._featured)
+        if category:
+            filters.append(self._category_postings.get(category, _EMPTY))
+        if drill_stage:
+            filters.append(self._stage_postings.get(drill_stage, _EMPTY))
+        if tags:
+            filters.append(set().union(*(self._tag_postings.get(tag, _EMPTY) for tag in tags)))
+        query_lower = query.lower() if query else None
+        if query_lower:
+            filters.extend(self._text_candidates(query_lower))
+        
+        indexed = self._indexed
+        if filters:
+            filters.sort(key=len)
+            candidates = filters[0].intersection(*filters[1:])
+            if query_lower:
+                candidates = {
+                    v for v in candidates
+                    if query_lower in indexed[v].title or query_lower in indexed[v].description
+                }
+            if len(candidates) <= len(self._ranking) * SORT_CANDIDATES_RATIO:
+                ranked = sorted(candidates, key=lambda v: indexed[v].rank_key)
+            else:
+                ranked = [key[-1] for key in self._ranking if key[-1] in candidates]
+        else:
+            ranked = [key[-1] for key in self._ranking]
+            if query_lower:
+                ranked = [
+                    v for v in ranked
+                    if query_lower in indexed[v].title or query_lower in indexed[v].description
+                ]
+        
+        videos = self._videos
+        return [videos[v] for v in ranked]
+
+
 class VideoLibrary:
     """
     Central video library management system
     Stores and retrieves drill demonstration videos
+    
+    Lookups and search go through a VideoSearchIndex, kept current by
+    add_video / update_video / increment_view_count / delete_video. Edit
+    videos through those methods rather than mutating them in place.
     """
     
     def __init__(self):
         """Initialize video library with sample content"""
         self.videos: Dict[str, VideoMetadata] = {}
+        self.index = VideoSearchIndex()
         self._initialize_sample_library()
     
     
@@ -351,6 +596,7 @@ class VideoLibrary:
         # Add all videos to library
         for video in sample_videos:
             self.videos[video.video_id] = video
+            self.index.add(video)
     
     
     # ========================================
@@ -364,26 +610,17 @@ class VideoLibrary:
     
     def get_videos_for_drill(self, drill_id: str) -> List[VideoMetadata]:
         """Get all videos associated with a specific drill"""
-        return [
-            video for video in self.videos.values()
-            if drill_id in video.drill_ids
-        ]
+        return self.index.videos_for_drill(drill_id)
     
     
     def get_videos_by_stage(self, stage: DrillStage) -> List[VideoMetadata]:
         """Get all videos for a specific drill stage"""
-        return [
-            video for video in self.videos.values()
-            if video.drill_stage == stage
-        ]
+        return self.index.videos_by_stage(stage)
     
     
     def get_videos_by_category(self, category: VideoCategory) -> List[VideoMetadata]:
         """Get all videos in a category"""
-        return [
-            video for video in self.videos.values()
-            if video.category == category
-        ]
+        return self.index.videos_by_category(category)
     
     
     def search_videos(
@@ -403,41 +640,17 @@ class VideoLibrary:
             category: Filter by category
             drill_stage: Filter by drill stage
             featured_only: Only return featured videos
-        """
-        results = list(self.videos.values())
         
-        # Filter by featured
-        if featured_only:
-            results = [v for v in results if v.featured]
-        
-        # Filter by category
-        if category:
-            results = [v for v in results if v.category == category]
-        
-        # Filter by drill stage
-        if drill_stage:
-            results = [v for v in results if v.drill_stage == drill_stage]
-        
-        # Filter by tags (any match)
-        if tags:
-            results = [
-                v for v in results
-                if any(tag in v.tags for tag in tags)
-            ]
-        
-        # Text search in title/description
-        if query:
-            query_lower = query.lower()
-            results = [
-                v for v in results
-                if query_lower in v.title.lower() or
-                   query_lower in v.description.lower()
-            ]
-        
-        # Sort by featured, then view count, then created date
-        results.sort(key=lambda v: (-v.featured, -v.view_count, v.created_at), reverse=True)
-        
-        return results
+        Results are sorted featured first, then by view count (highest
+        first), then by created date (newest first).
+        """
+        return self.index.search(
+            query=query,
+            tags=tags,
+            category=category,
+            drill_stage=drill_stage,
+            featured_only=featured_only
+        )
     
     
     def get_featured_videos(self, limit: int = 10) -> List[VideoMetadata]:
@@ -449,10 +662,7 @@ class VideoLibrary:
     
     def get_all_tags(self) -> Set[str]:
         """Get all unique tags in library"""
-        all_tags = set()
-        for video in self.videos.values():
-            all_tags.update(video.tags)
-        return all_tags
+        return self.index.all_tags()
     
     
     # ========================================
@@ -464,6 +674,7 @@ class VideoLibrary:
         if video.video_id in self.videos:
             return False
         self.videos[video.video_id] = video
+        self.index.add(video)
         return True
     
     
@@ -476,6 +687,7 @@ class VideoLibrary:
         for key, value in updates.items():
             if hasattr(video, key):
                 setattr(video, key, value)
+        self.index.add(video)
         
         return True
     
@@ -484,7 +696,9 @@ class VideoLibrary:
         """Increment view count for a video"""
         if video_id not in self.videos:
             return False
-        self.videos[video_id].view_count += 1
+        video = self.videos[video_id]
+        video.view_count += 1
+        self.index.update_rank(video)
         return True
     
     
@@ -493,6 +707,7 @@ class VideoLibrary:
         if video_id not in self.videos:
             return False
         del self.videos[video_id]
+        self.index.remove(video_id)
         return True
     
     
@@ -2,6 +2,11 @@
 Biomechanics Visualization System
 Generates professional charts for analysis reports
 
+Each chart has a draw_* method that draws on a given figure and a
+generate_* method that draws on a new figure and saves it to a path or
+buffer. chart_renderer.ChartRenderer reuses figures and renders to
+memory (PNG or SVG) with caching.
+
 Part of Priority 5: Visualization System
 """
 
@@ -40,6 +45,37 @@ class BiomechanicsVisualizer:
         matplotlib.rcParams['font.family'] = 'sans-serif'
         matplotlib.rcParams['font.size'] = 10
     
+    # Figure size per chart kind (inches); also used by the chart render service
+    FIGURE_SIZES = {
+        'gap': (10, 6),
+        'radar': (8, 8),
+        'sequence': (10, 6),
+        'energy': (8, 8),
+        'composite': (16, 12)
+    }
+    DPI = 150
+    
+    def save_figure(self, fig, output, fmt: str = None, **savefig_kwargs):
+        """
+        Save a figure to a path or a binary buffer (io.BytesIO)
+        
+        fmt: 'png' / 'svg' (default: from the file extension, png for buffers)
+        """
+        if fmt is None and not isinstance(output, (str, os.PathLike)):
+            fmt = 'png'
+        fig.savefig(output, format=fmt, dpi=self.DPI, bbox_inches='tight',
+                    facecolor=self.COLORS['background'], **savefig_kwargs)
+    
+    def _generate(self, kind: str, draw, output_path, *args) -> str:
+        """Draw one chart on a new pyplot figure and save it"""
+        fig = plt.figure(figsize=self.FIGURE_SIZES[kind])
+        try:
+            draw(fig, *args)
+            self.save_figure(fig, output_path)
+        finally:
+            plt.close(fig)
+        return output_path
+    
     def generate_gap_chart(
         self,
         actual_bat_speed: float,
@@ -51,7 +87,13 @@ class BiomechanicsVisualizer:
         
         Returns: Path to saved chart
         """
-        fig, ax = plt.subplots(figsize=(10, 6))
+        self._generate('gap', self.draw_gap_chart, output_path, actual_bat_speed, potential_bat_speed)
+        logger.info(f"Gap chart saved to {output_path}")
+        return output_path
+    
+    def draw_gap_chart(self, fig, actual_bat_speed: float, potential_bat_speed: float):
+        """Draw the gap chart on an empty figure"""
+        ax = fig.add_subplot()
         fig.patch.set_facecolor(self.COLORS['background'])
         ax.set_facecolor(self.COLORS['background'])
         
@@ -87,12 +129,7 @@ class BiomechanicsVisualizer:
         ax.set_title('Bat Speed: Actual vs Potential', fontsize=16, fontweight='bold', pad=20)
         ax.set_ylim(0, potential_bat_speed * 1.15)
         
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor=self.COLORS['background'])
-        plt.close()
-        
-        logger.info(f"Gap chart saved to {output_path}")
-        return output_path
+        fig.tight_layout()
     
     def generate_gew_radar_chart(
         self,
@@ -104,7 +141,13 @@ class BiomechanicsVisualizer:
         """
         Generate radar chart for Ground-Engine-Weapon scores
         """
-        fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(projection='polar'))
+        self._generate('radar', self.draw_gew_radar_chart, output_path, ground_score, engine_score, weapon_score)
+        logger.info(f"Radar chart saved to {output_path}")
+        return output_path
+    
+    def draw_gew_radar_chart(self, fig, ground_score: float, engine_score: float, weapon_score: float):
+        """Draw the G-E-W radar chart on an empty figure"""
+        ax = fig.add_subplot(projection='polar')
         fig.patch.set_facecolor(self.COLORS['background'])
         
         # Data
@@ -138,12 +181,7 @@ class BiomechanicsVisualizer:
         # Title
         ax.set_title('Component Scores (G-E-W)', fontsize=16, fontweight='bold', pad=20)
         
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor=self.COLORS['background'])
-        plt.close()
-        
-        logger.info(f"Radar chart saved to {output_path}")
-        return output_path
+        fig.tight_layout()
     
     def generate_kinematic_sequence_waterfall(
         self,
@@ -161,7 +199,13 @@ class BiomechanicsVisualizer:
             'contact_ms': 0
         }
         """
-        fig, ax = plt.subplots(figsize=(10, 6))
+        self._generate('sequence', self.draw_kinematic_sequence_waterfall, output_path, sequence_data)
+        logger.info(f"Kinematic sequence chart saved to {output_path}")
+        return output_path
+    
+    def draw_kinematic_sequence_waterfall(self, fig, sequence_data: Dict):
+        """Draw the kinematic sequence waterfall on an empty figure"""
+        ax = fig.add_subplot()
         fig.patch.set_facecolor(self.COLORS['background'])
         ax.set_facecolor(self.COLORS['background'])
         
@@ -192,12 +236,7 @@ class BiomechanicsVisualizer:
         ax.set_title('Kinematic Sequence Timing', fontsize=16, fontweight='bold', pad=20)
         ax.invert_xaxis()  # So contact is on right
         
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor=self.COLORS['background'])
-        plt.close()
-        
-        logger.info(f"Kinematic sequence chart saved to {output_path}")
-        return output_path
+        fig.tight_layout()
     
     def generate_energy_distribution_pie(
         self,
@@ -209,7 +248,13 @@ class BiomechanicsVisualizer:
         """
         Generate pie chart for energy distribution
         """
-        fig, ax = plt.subplots(figsize=(8, 8))
+        self._generate('energy', self.draw_energy_distribution_pie, output_path, lowerhalf_pct, torso_pct, arms_pct)
+        logger.info(f"Energy distribution chart saved to {output_path}")
+        return output_path
+    
+    def draw_energy_distribution_pie(self, fig, lowerhalf_pct: float, torso_pct: float, arms_pct: float):
+        """Draw the energy distribution pie on an empty figure"""
+        ax = fig.add_subplot()
         fig.patch.set_facecolor(self.COLORS['background'])
         
         # Data
@@ -237,12 +282,7 @@ class BiomechanicsVisualizer:
         
         ax.set_title('Energy Distribution', fontsize=16, fontweight='bold', pad=20)
         
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor=self.COLORS['background'])
-        plt.close()
-        
-        logger.info(f"Energy distribution chart saved to {output_path}")
-        return output_path
+        fig.tight_layout()
     
     def generate_composite_report(
         self,
@@ -271,7 +311,12 @@ class BiomechanicsVisualizer:
             'energy': {'lowerhalf_pct': 61, ...}
         }
         """
-        fig = plt.figure(figsize=(16, 12))
+        self._generate('composite', self.draw_composite_report, output_path, player_data, analysis_data)
+        logger.info(f"Composite report saved to {output_path}")
+        return output_path
+    
+    def draw_composite_report(self, fig, player_data: Dict, analysis_data: Dict):
+        """Draw the composite report on an empty figure"""
         fig.patch.set_facecolor(self.COLORS['background'])
         
         # Title
@@ -309,12 +354,6 @@ class BiomechanicsVisualizer:
         # 6. Recommendations (bottom right)
         ax6 = fig.add_subplot(gs[1, 2])
         self._plot_recommendations_on_axis(ax6, analysis_data.get('recommendations', {}))
-        
-        plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor=self.COLORS['background'])
-        plt.close()
-        
-        logger.info(f"Composite report saved to {output_path}")
-        return output_path
     
     # Helper methods for composite report
     def _plot_gap_on_axis(self, ax, actual, potential):
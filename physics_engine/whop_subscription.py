@@ -32,6 +32,7 @@ import uuid
 import hmac
 import hashlib
 import json
+import os
 
 
 # ============================================================================
@@ -550,9 +551,19 @@ class WhopAPIClient:
 class SubscriptionManager:
     """Manages subscriptions and feature access"""
     
-    def __init__(self, whop_api_key: str, whop_webhook_secret: str):
+    def __init__(self, whop_api_key: str, whop_webhook_secret: str, meter=None):
+        """
+        Args:
+            whop_api_key: Whop API key
+            whop_webhook_secret: Webhook signing secret
+            meter: Optional usage_metering.UsageMeter. With a meter, usage
+                is counted in the database (atomic limit checks, shared by
+                all workers) instead of in usage_tracking, per calendar-month
+                billing period (the meter's rollups cover that period)
+        """
         self.whop_client = WhopAPIClient(whop_api_key)
         self.whop_webhook_secret = whop_webhook_secret
+        self.meter = meter
         self.subscriptions: Dict[str, Subscription] = {}
         self.usage_tracking: Dict[str, UsageTracking] = {}
     
@@ -708,6 +719,9 @@ class SubscriptionManager:
         plan = SUBSCRIPTION_PLANS[subscription.tier]
         limits = plan.get('limits', {})
         
+        if self.meter is not None:
+            return self._track_metered_usage(user_id, usage_type, count, plan)
+        
         # Track and check limits
         if usage_type == 'swings':
             usage.swings_count += count
@@ -722,6 +736,14 @@ class SubscriptionManager:
         usage.updated_at = datetime.now()
         return True
     
+    def _track_metered_usage(self, user_id: str, usage_type: str, count: int, plan: Dict) -> bool:
+        """Count usage through the meter in the current period (limited swings are check-and-increment)"""
+        max_swings = plan['features'].get('max_swings')
+        if usage_type == 'swings' and max_swings is not None:
+            return self.meter.try_consume(user_id, 'swings', limit=max_swings, amount=count).allowed
+        self.meter.record(user_id, usage_type, count)
+        return True
+    
     def get_user_subscription(self, user_id: str) -> Optional[Subscription]:
         """Get active subscription for user"""
         for subscription in self.subscriptions.values():
@@ -745,12 +767,21 @@ class SubscriptionManager:
         plan = SUBSCRIPTION_PLANS[subscription.tier]
         max_swings = plan['features'].get('max_swings')
         
+        period_start = usage.period_start
+        if self.meter is not None:
+            # Current period's rollup snapshot (plus this worker's unflushed increments)
+            counts = self.meter.usage_summary(user_id)
+            swings, sessions, videos = (counts.get(k, 0) for k in ('swings', 'sessions', 'videos'))
+            period_start = self.meter.period_start()
+        else:
+            swings, sessions, videos = usage.swings_count, usage.sessions_count, usage.video_uploads_count
+        
         return {
-            'swings_used': usage.swings_count,
+            'swings_used': swings,
             'max_swings': max_swings if max_swings is not None else 'unlimited',
-            'sessions_used': usage.sessions_count,
-            'videos_uploaded': usage.video_uploads_count,
-            'period_start': usage.period_start.isoformat(),
+            'sessions_used': sessions,
+            'videos_uploaded': videos,
+            'period_start': period_start.isoformat(),
             'tier': subscription.tier.value
         }
     
@@ -809,6 +840,33 @@ class SubscriptionManager:
         }
 
 
+# Singleton manager, metered through usage_metering
+_subscription_manager = None
+
+
+def get_subscription_manager() -> SubscriptionManager:
+    """
+    Get the shared SubscriptionManager (WHOP_API_KEY / WHOP_WEBHOOK_SECRET)
+
+    Usage is counted by the shared usage meter, whose background worker
+    keeps the rollups get_usage_stats reads fresh. Outside the app, where
+    the meter is not importable, usage is tracked in memory.
+    """
+    global _subscription_manager
+    if _subscription_manager is None:
+        try:
+            from usage_metering import get_usage_meter
+            meter = get_usage_meter()
+        except ImportError:
+            meter = None
+        _subscription_manager = SubscriptionManager(
+            whop_api_key=os.environ.get("WHOP_API_KEY", ""),
+            whop_webhook_secret=os.environ.get("WHOP_WEBHOOK_SECRET", ""),
+            meter=meter
+        )
+    return _subscription_manager
+
+
 # ============================================================================
 # TESTING
 # ============================================================================
@@ -5,10 +5,12 @@ Endpoints for KRS scoring and 4B Framework metrics
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime, timedelta
-from database import get_db
+from database import get_db, get_async_db
 from models import PlayerReport, Player, Session as DBSession
 from krs_calculator import calculate_krs, calculate_on_table_gain
 import sys
@@ -21,10 +23,29 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["Player Reports"])
 
 
+async def _get_player(db: AsyncSession, player_id: int) -> Optional[Player]:
+    """Get a player by primary key"""
+    result = await db.execute(select(Player).where(Player.id == player_id))
+    return result.scalars().first()
+
+
+async def _get_latest_report(db: AsyncSession, player_id: int, include_player: bool = False) -> Optional[PlayerReport]:
+    """Most recently analyzed report for a player (optionally with player joined in)"""
+    stmt = select(PlayerReport).where(
+        PlayerReport.player_id == player_id
+    ).order_by(
+        PlayerReport.analyzed_at.desc()
+    ).limit(1)
+    if include_player:
+        stmt = stmt.options(joinedload(PlayerReport.player))
+    result = await db.execute(stmt)
+    return result.scalars().first()
+
+
 @router.get("/sessions/{session_id}/report")
 async def get_session_report(
     session_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get full player report for a session.
@@ -37,10 +58,14 @@ async def get_session_report(
     Example response matches /docs/API_REFERENCE.md spec
     """
     try:
-        # Query player report
-        report = db.query(PlayerReport).filter(
-            PlayerReport.session_id == session_id
-        ).first()
+        # Query player report (player joined in for to_dict)
+        result = await db.execute(
+            select(PlayerReport)
+            .options(joinedload(PlayerReport.player))
+            .where(PlayerReport.session_id == session_id)
+            .limit(1)
+        )
+        report = result.scalars().first()
         
         if not report:
             raise HTTPException(
@@ -64,7 +89,7 @@ async def get_session_report(
 @router.get("/sessions/latest")
 async def get_latest_session(
     player_id: int = Query(..., description="Player ID"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get most recent session for player.
@@ -77,15 +102,11 @@ async def get_latest_session(
     """
     try:
         # Query latest report for player
-        report = db.query(PlayerReport).filter(
-            PlayerReport.player_id == player_id
-        ).order_by(
-            PlayerReport.analyzed_at.desc()
-        ).first()
+        report = await _get_latest_report(db, player_id, include_player=True)
         
         if not report:
             # Return empty state for new players
-            player = db.query(Player).filter(Player.id == player_id).first()
+            player = await _get_player(db, player_id)
             if not player:
                 raise HTTPException(
                     status_code=404,
@@ -120,7 +141,7 @@ async def get_latest_session(
 async def get_player_progress(
     player_id: int,
     days: int = Query(30, description="Number of days to look back"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get KRS history for 30-day progress chart.
@@ -149,7 +170,7 @@ async def get_player_progress(
     """
     try:
         # Validate player exists
-        player = db.query(Player).filter(Player.id == player_id).first()
+        player = await _get_player(db, player_id)
         if not player:
             raise HTTPException(
                 status_code=404,
@@ -161,13 +182,16 @@ async def get_player_progress(
         start_date = end_date - timedelta(days=days)
         
         # Query reports in date range
-        reports = db.query(PlayerReport).filter(
-            PlayerReport.player_id == player_id,
-            PlayerReport.analyzed_at >= start_date,
-            PlayerReport.analyzed_at <= end_date
-        ).order_by(
-            PlayerReport.analyzed_at.asc()
-        ).all()
+        result = await db.execute(
+            select(PlayerReport).where(
+                PlayerReport.player_id == player_id,
+                PlayerReport.analyzed_at >= start_date,
+                PlayerReport.analyzed_at <= end_date
+            ).order_by(
+                PlayerReport.analyzed_at.asc()
+            )
+        )
+        reports = result.scalars().all()
         
         if not reports:
             return {
@@ -255,7 +279,7 @@ async def get_player_progress(
 @router.get("/players/{player_id}/recommended-drills")
 async def get_recommended_drills(
     player_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get personalized drill recommendations.
@@ -268,14 +292,10 @@ async def get_recommended_drills(
     """
     try:
         # Get latest report
-        report = db.query(PlayerReport).filter(
-            PlayerReport.player_id == player_id
-        ).order_by(
-            PlayerReport.analyzed_at.desc()
-        ).first()
+        report = await _get_latest_report(db, player_id)
         
         if not report:
-            player = db.query(Player).filter(Player.id == player_id).first()
+            player = await _get_player(db, player_id)
             if not player:
                 raise HTTPException(
                     status_code=404,
@@ -362,8 +382,10 @@ async def get_recommended_drills(
         )
 
 
+# Write endpoints stay on the sync session; plain `def` lets FastAPI run them
+# in its threadpool instead of blocking the event loop.
 @router.post("/reports/create")
-async def create_player_report(
+def create_player_report(
     session_id: str,
     player_id: int,
     creation_score: float,
@@ -448,7 +470,7 @@ async def create_player_report(
 
 
 @router.post("/reports/from-coach-rick")
-async def create_report_from_coach_rick(
+def create_report_from_coach_rick(
     session_id: str,
     player_id: int,
     coach_rick_data: dict,
@@ -0,0 +1,98 @@
+"""
+Progress Session Store
+Persistent backing store for physics_engine.progress_tracker.ProgressTracker
+
+ProgressTracker keeps each athlete's sessions in a sorted in-memory index.
+This store writes every added session through to the `progress_sessions`
+table and hands an athlete's full history back (oldest first, straight off
+the (athlete_id, session_date) index) the first time the tracker needs it,
+so history survives restarts.
+
+Usage:
+    from database import SessionLocal
+    from progress_session_store import SqlProgressSessionStore
+    from physics_engine.progress_tracker import ProgressTracker
+
+    tracker = ProgressTracker(store=SqlProgressSessionStore(SessionLocal))
+"""
+
+from typing import Callable, Dict, List, Optional
+from datetime import datetime
+import logging
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import ProgressSession
+from physics_engine.progress_tracker import TrainingSession
+
+logger = logging.getLogger(__name__)
+
+
+def _to_training_session(row: ProgressSession) -> TrainingSession:
+    return TrainingSession.from_dict(dict(row.payload))
+
+
+class SqlProgressSessionStore:
+    """SQLAlchemy implementation of the ProgressTracker SessionStore protocol"""
+
+    def __init__(self, session_factory: Callable[[], Session]):
+        self.session_factory = session_factory
+
+    def save(self, session: TrainingSession) -> None:
+        """Insert or replace a session by session_id"""
+        payload = session.to_dict()
+        with self.session_factory() as db:
+            row = db.execute(
+                select(ProgressSession).where(ProgressSession.session_id == session.session_id)
+            ).scalar_one_or_none()
+            if row is None:
+                row = ProgressSession(session_id=session.session_id)
+                db.add(row)
+            row.athlete_id = session.athlete_id
+            row.session_date = session.session_date
+            row.payload = payload
+            db.commit()
+
+    def load_athlete(self, athlete_id: str) -> List[TrainingSession]:
+        """All sessions for an athlete, oldest first (insertion order within a date)"""
+        with self.session_factory() as db:
+            rows = db.execute(
+                select(ProgressSession)
+                .where(ProgressSession.athlete_id == athlete_id)
+                .order_by(ProgressSession.session_date, ProgressSession.id)
+            ).scalars().all()
+            sessions = [_to_training_session(row) for row in rows]
+
+        logger.debug(f"📚 Loaded {len(sessions)} progress sessions for {athlete_id}")
+        return sessions
+
+    def load_athletes(self, athlete_ids: List[str]) -> Dict[str, List[TrainingSession]]:
+        """Sessions for many athletes in one query, each list oldest first"""
+        sessions: Dict[str, List[TrainingSession]] = {athlete_id: [] for athlete_id in athlete_ids}
+        if not athlete_ids:
+            return sessions
+        with self.session_factory() as db:
+            rows = db.execute(
+                select(ProgressSession)
+                .where(ProgressSession.athlete_id.in_(athlete_ids))
+                .order_by(ProgressSession.athlete_id, ProgressSession.session_date, ProgressSession.id)
+            ).scalars().all()
+            for row in rows:
+                sessions[row.athlete_id].append(_to_training_session(row))
+        return sessions
+
+    def load_updated_since(self, since: Optional[datetime] = None) -> List[TrainingSession]:
+        """Sessions written after `since` (all sessions when None)"""
+        query = select(ProgressSession).order_by(ProgressSession.updated_at, ProgressSession.id)
+        if since is not None:
+            query = query.where(ProgressSession.updated_at >= since)
+        with self.session_factory() as db:
+            return [_to_training_session(row) for row in db.execute(query).scalars().all()]
+
+    def get(self, session_id: str) -> Optional[TrainingSession]:
+        """Single session by session_id"""
+        with self.session_factory() as db:
+            row = db.execute(
+                select(ProgressSession).where(ProgressSession.session_id == session_id)
+            ).scalar_one_or_none()
+            return _to_training_session(row) if row is not None else None
@@ -10,6 +10,7 @@ Supported file types:
 2. inverse-kinematics.csv - Joint angles, positions, velocities (if available)
 """
 
+import logging
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -17,6 +18,8 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import re
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class RebootSwingData:
@@ -55,6 +58,10 @@ class RebootSwingData:
     contact_time_s: float
 
 
+def _pct(value: Optional[float]) -> str:
+    return f"{value:.1f}" if value is not None else "n/a"
+
+
 class RebootCSVImporter:
     """
     Import and parse Reboot Motion CSV files
@@ -105,20 +112,16 @@ class RebootCSVImporter:
         Returns:
             RebootSwingData with parsed biomechanics
         """
-        print(f"\n📂 Loading Reboot Motion CSV: {csv_path}")
-        
         # Load CSV
         df = pd.read_csv(csv_path)
         
-        print(f"   Loaded {len(df)} rows, {len(df.columns)} columns")
-        
         # Parse filename
         filename = Path(csv_path).name
         metadata = self.parse_filename(filename)
         
-        print(f"   Session ID: {metadata['session_id']}")
-        print(f"   Movement: {metadata['movement_type']}")
-        print(f"   Data Type: {metadata['data_type']}")
+        logger.debug("📂 Loaded Reboot Motion CSV %s: %d rows, %d columns (session %s, %s, %s)",
+                     csv_path, len(df), len(df.columns),
+                     metadata['session_id'], metadata['movement_type'], metadata['data_type'])
         
         # Extract time data
         time_s = df['time'].values if 'time' in df.columns else np.arange(len(df)) / 240  # Assume 240 FPS
@@ -132,13 +135,12 @@ class RebootCSVImporter:
             fps = 240.0
             duration_s = 0.0
         
-        print(f"   FPS: {fps:.1f}, Duration: {duration_s:.2f}s, Frames: {len(df)}")
-        
         # Find contact frame (where time_from_max_hand is closest to 0)
         contact_frame = np.argmin(np.abs(time_from_max_hand))
         contact_time_s = time_s[contact_frame]
         
-        print(f"   Contact frame: {contact_frame}, Time: {contact_time_s:.3f}s")
+        logger.debug("FPS: %.1f, Duration: %.2fs, Frames: %d, Contact frame: %d at %.3fs",
+                     fps, duration_s, len(df), contact_frame, contact_time_s)
         
         # Extract bat data
         bat_columns = {
@@ -248,7 +250,7 @@ class RebootCSVImporter:
             contact_time_s=contact_time_s
         )
         
-        print(f"   ✅ Successfully loaded Reboot Motion data")
+        logger.debug("✅ Successfully loaded Reboot Motion data")
         
         return swing_data
     
@@ -286,8 +288,6 @@ class RebootCSVImporter:
         Returns:
             Dict with ground truth metrics
         """
-        print(f"\n📊 Calculating Ground Truth Metrics")
-        
         # Find contact frame
         contact_idx = swing_data.contact_frame
         
@@ -297,15 +297,11 @@ class RebootCSVImporter:
         bat_speed_ms = np.sqrt(2 * bat_ke_at_contact / bat_mass_kg)
         bat_speed_mph = bat_speed_ms * 2.237
         
-        print(f"   Bat Speed at Contact: {bat_speed_mph:.1f} mph")
-        
         # Peak bat speed (maximum in dataset)
         peak_bat_ke = np.max(swing_data.bat_kinetic_energy)
         peak_bat_speed_ms = np.sqrt(2 * peak_bat_ke / bat_mass_kg)
         peak_bat_speed_mph = peak_bat_speed_ms * 2.237
         
-        print(f"   Peak Bat Speed: {peak_bat_speed_mph:.1f} mph")
-        
         # Energy distribution at contact
         total_ke = swing_data.total_kinetic_energy[contact_idx]
         
@@ -327,14 +323,6 @@ class RebootCSVImporter:
         else:
             arms_pct = None
         
-        print(f"   Energy Distribution at Contact:")
-        if lowerhalf_pct:
-            print(f"      Lower Half: {lowerhalf_pct:.1f}%")
-        if torso_pct:
-            print(f"      Torso: {torso_pct:.1f}%")
-        if arms_pct:
-            print(f"      Arms: {arms_pct:.1f}%")
-        
         # Find kinematic sequence peaks (time before contact)
         # Look in window before contact
         pre_contact_window = max(0, contact_idx - int(0.5 * swing_data.fps))  # 500ms before
@@ -363,13 +351,6 @@ class RebootCSVImporter:
         rarm_time_before = (contact_time - swing_data.time_s[rarm_peak_idx]) * 1000
         bat_time_before = (contact_time - swing_data.time_s[bat_peak_idx]) * 1000
         
-        print(f"   Kinematic Sequence (ms before contact):")
-        print(f"      Pelvis: {pelvis_time_before:.0f} ms")
-        print(f"      Torso: {torso_time_before:.0f} ms")
-        print(f"      L Arm: {larm_time_before:.0f} ms")
-        print(f"      R Arm: {rarm_time_before:.0f} ms")
-        print(f"      Bat: {bat_time_before:.0f} ms")
-        
         # Calculate CORRECT tempo from lower half kinetic energy curve
         # Method: Load Start (min KE) → Hip Peak (max KE) → Contact
         # This matches the ground truth validation method
@@ -412,11 +393,19 @@ class RebootCSVImporter:
             swing_duration_ms = (swing_data.time_s[contact_idx] - swing_data.time_s[hip_peak_idx]) * 1000
             tempo_ratio = load_duration_ms / swing_duration_ms if swing_duration_ms > 0 else 0
         
-        print(f"   Tempo (from lower half KE curve):")
-        print(f"      Load Duration: {load_duration_ms:.0f} ms")
-        print(f"      Swing Duration: {swing_duration_ms:.0f} ms")
-        print(f"      Tempo Ratio: {tempo_ratio:.2f}:1")
-        print(f"      Expected: 3.38:1 (Connor Gray ground truth)")
+        # One structured record instead of a printed report, built only when
+        # DEBUG is enabled for this module
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "📊 Ground truth: bat speed %.1f mph (peak %.1f), energy at contact lower/torso/arms %s/%s/%s %%, "
+                "sequence before contact pelvis %.0f torso %.0f larm %.0f rarm %.0f bat %.0f ms, "
+                "tempo %.2f:1 (load %.0f ms, swing %.0f ms; Connor Gray ground truth 3.38:1)",
+                bat_speed_mph, peak_bat_speed_mph, _pct(lowerhalf_pct), _pct(torso_pct), _pct(arms_pct),
+                pelvis_time_before, torso_time_before, larm_time_before, rarm_time_before, bat_time_before,
+                tempo_ratio, load_duration_ms, swing_duration_ms,
+                extra={'session_id': swing_data.session_id, 'bat_speed_mph': float(bat_speed_mph),
+                       'tempo_ratio': float(tempo_ratio)}
+            )
         
         return {
             'bat_speed_mph': bat_speed_mph,
@@ -457,4 +446,5 @@ def test_importer():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     test_importer()
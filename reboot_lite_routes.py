@@ -10,9 +10,12 @@ from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Depends
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import logging
 import os
 import tempfile
+import time
 
 # Import database
 from database import get_db
@@ -32,14 +35,145 @@ from physics_engine.tempo_calculator import calculate_tempo_score, calculate_tem
 from physics_engine.stability_calculator import calculate_stability_score, analyze_stability_from_pose_frames
 from physics_engine.race_bar_formatter import format_kinetic_sequence_for_race_bar
 from physics_engine.bat_module import BatModule
+from physics_engine.stage_graph import StageGraph
+from stage_metrics import timed, record_stage_run
+from logging_config import configure_logging
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # Create router
 router = APIRouter(prefix="/api/reboot-lite", tags=["Reboot Lite"])
 
+# Post-pose stages share one pool per worker process
+POST_POSE_STAGE_WORKERS = 6
+_stage_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_stage_executor() -> ThreadPoolExecutor:
+    """Get singleton executor for the post-pose analysis stages"""
+    global _stage_executor
+    if _stage_executor is None:
+        _stage_executor = ThreadPoolExecutor(
+            max_workers=POST_POSE_STAGE_WORKERS,
+            thread_name_prefix="reboot-lite-stage"
+        )
+    return _stage_executor
+
+
+# ============================================================
+# POST-POSE STAGES
+# ============================================================
+# Module-level functions so the graph also runs in a process pool
+
+def _score_gew(physics_metrics: Dict) -> Dict:
+    return ScoringEngine().score_swing(physics_metrics)
+
+
+def _classify_motor_profile(physics_metrics: Dict, gew_scores: Dict):
+    return MotorProfileClassifier().classify(physics_metrics, gew_scores)
+
+
+def _analyze_stability(pose_frames: List, player_height_inches: float) -> Dict:
+    # Convert pose frames to dict format for stability calculator
+    pose_frames_dict = [
+        {
+            'frame_number': pf.frame_number,
+            'timestamp_ms': pf.timestamp_ms,
+            'landmarks': {
+                name: {
+                    'x': lm.x,
+                    'y': lm.y,
+                    'z': lm.z,
+                    'visibility': lm.visibility
+                }
+                for name, lm in pf.landmarks.items()
+            },
+            'is_valid': pf.is_valid
+        }
+        for pf in pose_frames
+    ]
+    
+    return analyze_stability_from_pose_frames(
+        pose_frames_dict,
+        player_height_inches=player_height_inches
+    )
+
+
+def _analyze_bat(physics_metrics: Dict, bat_weight_oz: float,
+                 player_height_inches: float, player_weight_lbs: float) -> Dict:
+    bat_module = BatModule()
+    
+    # Calculate body kinetic energy for transfer efficiency
+    body_ke = physics_metrics.get('rotational_ke', 0) + physics_metrics.get('translational_ke', 0)
+    
+    bat_optimization = bat_module.analyze_bat_optimization(
+        bat_weight_oz=float(bat_weight_oz),
+        bat_length_inches=33.0,  # Default, could be made a parameter
+        bat_speed_mph=physics_metrics.get('bat_speed', 0),
+        body_kinetic_energy=body_ke,
+        player_height_inches=player_height_inches,
+        player_weight_lbs=player_weight_lbs,
+        bat_type="balanced"
+    )
+    
+    # Format bat optimization for response
+    return {
+        'current_bat': {
+            'weight_oz': bat_optimization.current_bat['weight_oz'],
+            'length_inches': bat_optimization.current_bat['length_inches'],
+            'moi_kgm2': bat_optimization.current_bat['moi_kgm2'],
+            'bat_speed_mph': bat_optimization.current_bat['bat_speed_mph'],
+            'predicted_exit_velo_mph': bat_optimization.current_bat['predicted_exit_velo_mph']
+        },
+        'energy_transfer': {
+            'body_ke_joules': bat_optimization.body_kinetic_energy_joules,
+            'bat_ke_joules': bat_optimization.bat_kinetic_energy_joules,
+            'efficiency_percent': bat_optimization.transfer_efficiency_percent
+        },
+        'recommendations': {
+            'optimal_weight_range_oz': {
+                'min': bat_optimization.optimal_weight_range_oz[0],
+                'max': bat_optimization.optimal_weight_range_oz[1]
+            },
+            'test_weights': bat_optimization.recommended_weights,
+            'exit_velo_predictions': bat_optimization.exit_velo_predictions
+        },
+        'optimization_notes': bat_optimization.optimization_notes
+    }
+
+
+def build_post_pose_graph(height_inches: float, weight_lbs: float, age: int,
+                          wingspan_inches: float, bat_weight_oz: float) -> StageGraph:
+    """
+    Steps 4-10 of analyze-swing as a dependency graph
+    
+    Graph inputs: pose_frames, events, physics_metrics
+    """
+    graph = StageGraph()
+    graph.add("capacity", partial(
+        calculate_energy_capacity,
+        height_inches=height_inches,
+        weight_lbs=weight_lbs,
+        age=age,
+        wingspan_inches=wingspan_inches,
+        bat_weight_oz=bat_weight_oz
+    ))
+    graph.add("gew_scores", _score_gew, depends_on=["physics_metrics"])
+    graph.add("motor_profile", _classify_motor_profile, depends_on=["physics_metrics", "gew_scores"])
+    graph.add("race_bar", format_kinetic_sequence_for_race_bar, depends_on={"kinetic_chain_events": "events"})
+    graph.add("tempo", calculate_tempo_from_events, depends_on=["events"])
+    graph.add("stability", partial(_analyze_stability, player_height_inches=height_inches),
+              depends_on=["pose_frames"])
+    graph.add("bat_optimization", partial(
+        _analyze_bat,
+        bat_weight_oz=bat_weight_oz,
+        player_height_inches=height_inches,
+        player_weight_lbs=weight_lbs
+    ), depends_on=["physics_metrics"])
+    return graph
+
 
 @router.post("/analyze-swing")
 async def analyze_swing_reboot_lite(
@@ -55,7 +189,8 @@ async def analyze_swing_reboot_lite(
     """
     Complete Reboot Lite analysis for a single swing
     
-    Combines ALL analysis components:
+    Combines ALL analysis components (independent ones run concurrently,
+    see build_post_pose_graph; per-stage timings in pipeline_metadata):
     1. V2.0.2 Kinetic Capacity Prediction
     2. Race Bar (Kinematic Sequence)
     3. Tempo Score
@@ -99,16 +234,19 @@ async def analyze_swing_reboot_lite(
         pose_detector = PoseDetector()
         
         # Extract pose data from video
+        step_start = time.perf_counter()
         pose_frames = []
         frame_count = 0
         
         for frame_number in range(video_processor.metadata.total_frames):
-            success, frame = video_processor.get_frame(frame_number)
+            with timed("video_decode"):
+                success, frame = video_processor.get_frame(frame_number)
             if not success:
                 continue
             
             timestamp_ms = frame_number * video_processor.metadata.frame_time_ms
-            pose_frame = pose_detector.detect_pose(frame, timestamp_ms)
+            with timed("pose_inference"):
+                pose_frame = pose_detector.detect_pose(frame, timestamp_ms)
             pose_frames.append(pose_frame)
             frame_count += 1
             
@@ -116,6 +254,7 @@ async def analyze_swing_reboot_lite(
             if frame_count % 30 == 0:
                 logger.info(f"  Processed {frame_count}/{video_processor.metadata.total_frames} frames")
         
+        pose_ms = (time.perf_counter() - step_start) * 1000
         logger.info(f"✅ Pose detection complete: {len(pose_frames)} frames analyzed")
         
         # ============================================================
@@ -123,8 +262,11 @@ async def analyze_swing_reboot_lite(
         # ============================================================
         logger.info("Step 2: Analyzing kinetic chain events...")
         
-        event_analyzer = KineticChainAnalyzer()
-        events = event_analyzer.analyze(pose_frames)
+        step_start = time.perf_counter()
+        with timed("event_detection"):
+            event_analyzer = KineticChainAnalyzer()
+            events = event_analyzer.analyze(pose_frames)
+        events_ms = (time.perf_counter() - step_start) * 1000
         
         logger.info(f"✅ Events detected: {events}")
         
@@ -133,145 +275,57 @@ async def analyze_swing_reboot_lite(
         # ============================================================
         logger.info("Step 3: Calculating physics metrics...")
         
-        physics_calculator = PhysicsCalculator()
-        physics_metrics = physics_calculator.calculate_all(pose_frames, events)
+        step_start = time.perf_counter()
+        with timed("physics"):
+            physics_calculator = PhysicsCalculator()
+            physics_metrics = physics_calculator.calculate_all(pose_frames, events)
+        physics_ms = (time.perf_counter() - step_start) * 1000
         
         logger.info(f"✅ Physics calculated: bat speed = {physics_metrics.get('bat_speed', 0):.1f} mph")
         
         # ============================================================
-        # STEP 4: Kinetic Capacity Prediction (V2.0.2)
+        # STEPS 4-10: Post-pose stages (dependency graph)
         # ============================================================
-        logger.info("Step 4: Calculating kinetic capacity...")
+        # Capacity, GEW scores, race bar, tempo, stability and bat
+        # optimization depend only on the pose/physics output or on
+        # anthropometrics, so they run concurrently; motor profile waits
+        # for GEW scores. Latency approaches the slowest chain.
+        logger.info("Steps 4-10: Running post-pose analysis stages...")
         
         # Use wingspan if provided, otherwise estimate from height
         wingspan = wingspan_inches if wingspan_inches else height_inches + 2
         
-        capacity_result = calculate_energy_capacity(
+        stage_run = build_post_pose_graph(
             height_inches=height_inches,
             weight_lbs=weight_lbs,
             age=age,
             wingspan_inches=wingspan,
             bat_weight_oz=bat_weight_oz
+        ).run(
+            {'pose_frames': pose_frames, 'events': events, 'physics_metrics': physics_metrics},
+            executor=get_stage_executor()
         )
+        record_stage_run(stage_run, prefix="reboot_lite.")
+        stages = stage_run.results
         
+        capacity_result = stages['capacity']
         predicted_bat_speed = capacity_result['bat_speed_capacity_mph']
-        logger.info(f"✅ Predicted capacity: {predicted_bat_speed:.1f} mph")
-        
-        # ============================================================
-        # STEP 5: GEW Scoring
-        # ============================================================
-        logger.info("Step 5: Calculating GEW scores...")
-        
-        scoring_engine = ScoringEngine()
-        gew_scores = scoring_engine.score_swing(physics_metrics)
+        gew_scores = stages['gew_scores']
+        motor_profile = stages['motor_profile']
+        race_bar = stages['race_bar']
+        tempo_score = stages['tempo']
+        stability_score = stages['stability']
+        bat_analysis = stages['bat_optimization']
         
+        logger.info(f"✅ Predicted capacity: {predicted_bat_speed:.1f} mph")
         logger.info(f"✅ GEW scores: G={gew_scores.get('ground', 0)}, E={gew_scores.get('engine', 0)}, W={gew_scores.get('weapon', 0)}")
-        
-        # ============================================================
-        # STEP 6: Motor Profile Classification
-        # ============================================================
-        logger.info("Step 6: Classifying motor profile...")
-        
-        motor_classifier = MotorProfileClassifier()
-        motor_profile = motor_classifier.classify(physics_metrics, gew_scores)
-        
         logger.info(f"✅ Motor profile: {motor_profile}")
-        
-        # ============================================================
-        # STEP 7: Race Bar (Kinematic Sequence)
-        # ============================================================
-        logger.info("Step 7: Formatting race bar...")
-        
-        race_bar = format_kinetic_sequence_for_race_bar(events)
-        
         logger.info(f"✅ Race bar: grade={race_bar['sequence_grade']}, efficiency={race_bar['energy_transfer']}%")
-        
-        # ============================================================
-        # STEP 8: Tempo Score
-        # ============================================================
-        logger.info("Step 8: Calculating tempo score...")
-        
-        tempo_score = calculate_tempo_from_events(events)
-        
         logger.info(f"✅ Tempo: {tempo_score['category']} (ratio={tempo_score['ratio']})")
-        
-        # ============================================================
-        # STEP 9: Stability Score
-        # ============================================================
-        logger.info("Step 9: Calculating stability score...")
-        
-        # Convert pose frames to dict format for stability calculator
-        pose_frames_dict = [
-            {
-                'frame_number': pf.frame_number,
-                'timestamp_ms': pf.timestamp_ms,
-                'landmarks': {
-                    name: {
-                        'x': lm.x,
-                        'y': lm.y,
-                        'z': lm.z,
-                        'visibility': lm.visibility
-                    }
-                    for name, lm in pf.landmarks.items()
-                },
-                'is_valid': pf.is_valid
-            }
-            for pf in pose_frames
-        ]
-        
-        stability_score = analyze_stability_from_pose_frames(
-            pose_frames_dict,
-            player_height_inches=height_inches
-        )
-        
         logger.info(f"✅ Stability: grade={stability_score['grade']}, score={stability_score['stability_score']}")
-        
-        # ============================================================
-        # STEP 10: BAT Optimization Analysis
-        # ============================================================
-        logger.info("Step 10: Analyzing bat optimization...")
-        
-        bat_module = BatModule()
-        
-        # Calculate body kinetic energy for transfer efficiency
-        body_ke = physics_metrics.get('rotational_ke', 0) + physics_metrics.get('translational_ke', 0)
-        
-        bat_optimization = bat_module.analyze_bat_optimization(
-            bat_weight_oz=float(bat_weight_oz),
-            bat_length_inches=33.0,  # Default, could be made a parameter
-            bat_speed_mph=physics_metrics.get('bat_speed', 0),
-            body_kinetic_energy=body_ke,
-            player_height_inches=height_inches,
-            player_weight_lbs=weight_lbs,
-            bat_type="balanced"
-        )
-        
-        # Format bat optimization for response
-        bat_analysis = {
-            'current_bat': {
-                'weight_oz': bat_optimization.current_bat['weight_oz'],
-                'length_inches': bat_optimization.current_bat['length_inches'],
-                'moi_kgm2': bat_optimization.current_bat['moi_kgm2'],
-                'bat_speed_mph': bat_optimization.current_bat['bat_speed_mph'],
-                'predicted_exit_velo_mph': bat_optimization.current_bat['predicted_exit_velo_mph']
-            },
-            'energy_transfer': {
-                'body_ke_joules': bat_optimization.body_kinetic_energy_joules,
-                'bat_ke_joules': bat_optimization.bat_kinetic_energy_joules,
-                'efficiency_percent': bat_optimization.transfer_efficiency_percent
-            },
-            'recommendations': {
-                'optimal_weight_range_oz': {
-                    'min': bat_optimization.optimal_weight_range_oz[0],
-                    'max': bat_optimization.optimal_weight_range_oz[1]
-                },
-                'test_weights': bat_optimization.recommended_weights,
-                'exit_velo_predictions': bat_optimization.exit_velo_predictions
-            },
-            'optimization_notes': bat_optimization.optimization_notes
-        }
-        
-        logger.info(f"✅ Bat optimization: {bat_optimization.transfer_efficiency_percent}% efficiency, optimal range {bat_optimization.optimal_weight_range_oz}")
+        logger.info(f"✅ Bat optimization: {bat_analysis['energy_transfer']['efficiency_percent']}% efficiency, "
+                    f"optimal range {bat_analysis['recommendations']['optimal_weight_range_oz']}")
+        logger.info(f"✅ Post-pose stages: {stage_run.wall_ms:.0f} ms (sequential {stage_run.sum_ms:.0f} ms)")
         
         # ============================================================
         # STEP 11: Assemble Complete Response
@@ -289,6 +343,12 @@ async def analyze_swing_reboot_lite(
                 'total_frames': video_processor.metadata.total_frames,
                 'frames_analyzed': len(pose_frames)
             },
+            'pipeline_metadata': {
+                'pose_detection_ms': round(pose_ms, 2),
+                'event_detection_ms': round(events_ms, 2),
+                'physics_ms': round(physics_ms, 2),
+                'post_pose_stages': stage_run.metadata()
+            },
             'analysis': {
                 # Core Metrics
                 'bat_speed_mph': physics_metrics.get('bat_speed', 0),
@@ -385,7 +445,8 @@ async def optimize_bat(
     player_weight_lbs: int = Form(...),
     bat_model: Optional[str] = Form(None),
     balance_point_inches: Optional[float] = Form(None),
-    bat_type: str = Form("balanced")
+    bat_type: str = Form("balanced"),
+    include_surface: bool = Form(False)
 ):
     """
     Standalone bat optimization analysis
@@ -403,6 +464,7 @@ async def optimize_bat(
         bat_model: Bat model name (optional)
         balance_point_inches: Balance point from knob in inches (optional)
         bat_type: Bat type - "balanced", "end_loaded", or "light" (default "balanced")
+        include_surface: Include the 26-36 oz x length ±2" sweep (default False)
     
     Returns:
         Bat optimization analysis with recommendations
@@ -436,7 +498,8 @@ async def optimize_bat(
             player_weight_lbs=player_weight_lbs,
             bat_model=bat_model,
             balance_point_inches=balance_point_inches,
-            bat_type=bat_type
+            bat_type=bat_type,
+            include_surface=include_surface
         )
         
         # Format response
@@ -475,6 +538,7 @@ async def optimize_bat(
                     key=lambda x: x['exit_velo_mph']
                 )
             },
+            'response_surface': optimization.response_surface,
             'optimization_notes': optimization.optimization_notes,
             'player_info': {
                 'height_inches': player_height_inches,
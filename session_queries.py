@@ -0,0 +1,327 @@
+"""
+Session Queries
+Shared ORM queries for session endpoints and the Reboot Motion sync service
+
+Every query that serializes sessions together with their player eager-loads
+the `player` relationship, so the number of SQL statements per request stays
+fixed no matter how many sessions are returned. Counts and time ranges are
+computed with single aggregate queries instead of loading rows.
+
+Each query is built once as a SQLAlchemy `select()` statement and executed
+either on a sync Session (sync routes, sync service) or on an AsyncSession
+(`*_async` variants used by async routes via get_async_db).
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple, Union
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from models import Player, Session as SessionModel, BiomechanicsData, SyncLog
+
+
+# ========================================
+# STATEMENT BUILDERS
+# ========================================
+
+def _as_datetime(value: Union[str, datetime]) -> datetime:
+    """Parse an ISO date/datetime query parameter (raises ValueError if invalid)"""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _player_stmt(player_id: int):
+    return select(Player).where(Player.id == player_id)
+
+
+def _session_with_player_stmt(session_id: int):
+    return select(SessionModel)\
+        .options(joinedload(SessionModel.player))\
+        .where(SessionModel.id == session_id)
+
+
+def _player_sessions_stmt(
+    player_id: int,
+    start_date: Optional[Union[str, datetime]],
+    end_date: Optional[Union[str, datetime]],
+    limit: int
+):
+    stmt = select(SessionModel)\
+        .options(joinedload(SessionModel.player))\
+        .where(SessionModel.player_id == player_id)
+
+    if start_date:
+        stmt = stmt.where(SessionModel.session_date >= _as_datetime(start_date))
+    if end_date:
+        stmt = stmt.where(SessionModel.session_date <= _as_datetime(end_date))
+
+    return stmt.order_by(SessionModel.session_date.desc()).limit(limit)
+
+
+def _session_frames_stmt(session_id: int, limit: int):
+    return select(BiomechanicsData)\
+        .where(BiomechanicsData.session_id == session_id)\
+        .order_by(BiomechanicsData.frame_number)\
+        .limit(limit)
+
+
+def _players_page_stmts(search: Optional[str], skip: int, limit: int) -> Tuple[Any, Any]:
+    """(count statement, page statement) for the /players listing"""
+    stmt = select(Player)
+    if search:
+        search_filter = f"%{search}%"
+        stmt = stmt.where(
+            (Player.first_name.ilike(search_filter)) |
+            (Player.last_name.ilike(search_filter))
+        )
+
+    count_stmt = select(func.count()).select_from(stmt.subquery())
+    page_stmt = stmt.order_by(Player.last_name, Player.first_name)\
+        .offset(skip)\
+        .limit(limit)
+    return count_stmt, page_stmt
+
+
+def _latest_sync_log_stmt():
+    return select(SyncLog).order_by(SyncLog.started_at.desc()).limit(1)
+
+
+def _session_frame_summary_stmt(session_id: int):
+    return select(
+        func.count(BiomechanicsData.id),
+        func.min(BiomechanicsData.timestamp),
+        func.max(BiomechanicsData.timestamp)
+    ).where(BiomechanicsData.session_id == session_id)
+
+
+def _database_stats_stmt():
+    session_stats = select(
+        func.count(SessionModel.id).label('total_sessions'),
+        func.count(SessionModel.id).filter(SessionModel.data_synced == True).label('synced_sessions')
+    ).subquery()
+
+    return select(
+        select(func.count(Player.id)).scalar_subquery(),
+        session_stats.c.total_sessions,
+        session_stats.c.synced_sessions,
+        select(func.count(BiomechanicsData.id)).scalar_subquery()
+    )
+
+
+def _frame_summary_from_row(row) -> Dict[str, Any]:
+    return {
+        'total_frames': row[0],
+        'start_time': row[1],
+        'end_time': row[2]
+    }
+
+
+def _stats_from_row(row) -> Dict[str, int]:
+    total_players, total_sessions, synced_sessions, biomech_count = row
+    return {
+        "total_players": total_players,
+        "total_sessions": total_sessions,
+        "synced_sessions": synced_sessions,
+        "pending_sessions": total_sessions - synced_sessions,
+        "biomechanics_records": biomech_count
+    }
+
+
+# ========================================
+# SYNC QUERIES
+# ========================================
+
+def get_player(db: Session, player_id: int) -> Optional[Player]:
+    """Get a player by primary key"""
+    return db.execute(_player_stmt(player_id)).scalars().first()
+
+
+def get_session_with_player(db: Session, session_id: int) -> Optional[SessionModel]:
+    """Get a session by primary key with its player joined in the same query"""
+    return db.execute(_session_with_player_stmt(session_id)).scalars().first()
+
+
+def get_player_sessions(
+    db: Session,
+    player_id: int,
+    start_date: Optional[Union[str, datetime]] = None,
+    end_date: Optional[Union[str, datetime]] = None,
+    limit: int = 50
+) -> List[SessionModel]:
+    """
+    Get a player's sessions (newest first) with the player joined in.
+
+    Args:
+        db: SQLAlchemy database session
+        player_id: Player database ID
+        start_date: Optional inclusive lower bound on session_date (ISO string or datetime)
+        end_date: Optional inclusive upper bound on session_date (ISO string or datetime)
+        limit: Maximum number of sessions to return
+
+    Returns:
+        List of Session models with `player` already loaded
+
+    Raises:
+        ValueError: If a date bound is not a valid ISO date
+    """
+    stmt = _player_sessions_stmt(player_id, start_date, end_date, limit)
+    return list(db.execute(stmt).scalars().all())
+
+
+def get_sessions_pending_sync(db: Session, limit: int = 50) -> List[SessionModel]:
+    """
+    Get sessions whose biomechanics data has not been synced yet.
+
+    Players are loaded with a single SELECT ... IN query, since the sessions
+    usually belong to many different players.
+    """
+    return db.query(SessionModel)\
+             .options(selectinload(SessionModel.player))\
+             .filter(SessionModel.data_synced == False)\
+             .limit(limit)\
+             .all()
+
+
+def get_session_frame_summary(db: Session, session_id: int) -> Dict[str, Any]:
+    """
+    Frame count and first/last timestamp for a session in one aggregate query.
+
+    Returns:
+        {'total_frames': int, 'start_time': datetime|None, 'end_time': datetime|None}
+    """
+    return _frame_summary_from_row(db.execute(_session_frame_summary_stmt(session_id)).one())
+
+
+def get_database_stats(db: Session) -> Dict[str, int]:
+    """
+    Table counts for the /stats endpoint in a single round trip.
+
+    Session totals and synced counts come from one COUNT ... FILTER
+    aggregate; players and biomechanics rows are scalar subqueries.
+    """
+    return _stats_from_row(db.execute(_database_stats_stmt()).one())
+
+
+# ========================================
+# ASYNC QUERIES (AsyncSession)
+# ========================================
+
+async def get_player_async(db, player_id: int) -> Optional[Player]:
+    """Async get_player()"""
+    result = await db.execute(_player_stmt(player_id))
+    return result.scalars().first()
+
+
+async def get_players_page_async(
+    db,
+    search: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100
+) -> Tuple[int, List[Player]]:
+    """Total matching players and one page of them, ordered by name"""
+    count_stmt, page_stmt = _players_page_stmts(search, skip, limit)
+    total = (await db.execute(count_stmt)).scalar_one()
+    players = (await db.execute(page_stmt)).scalars().all()
+    return total, list(players)
+
+
+async def get_session_with_player_async(db, session_id: int) -> Optional[SessionModel]:
+    """Async get_session_with_player()"""
+    result = await db.execute(_session_with_player_stmt(session_id))
+    return result.scalars().first()
+
+
+async def get_player_sessions_async(
+    db,
+    player_id: int,
+    start_date: Optional[Union[str, datetime]] = None,
+    end_date: Optional[Union[str, datetime]] = None,
+    limit: int = 50
+) -> List[SessionModel]:
+    """Async get_player_sessions()"""
+    result = await db.execute(_player_sessions_stmt(player_id, start_date, end_date, limit))
+    return list(result.scalars().all())
+
+
+async def get_session_frames_async(db, session_id: int, limit: int = 1000) -> List[BiomechanicsData]:
+    """Biomechanics rows for a session ordered by frame number"""
+    result = await db.execute(_session_frames_stmt(session_id, limit))
+    return list(result.scalars().all())
+
+
+async def get_latest_sync_log_async(db) -> Optional[SyncLog]:
+    """Most recently started sync operation"""
+    result = await db.execute(_latest_sync_log_stmt())
+    return result.scalars().first()
+
+
+async def get_session_frame_summary_async(db, session_id: int) -> Dict[str, Any]:
+    """Async get_session_frame_summary()"""
+    result = await db.execute(_session_frame_summary_stmt(session_id))
+    return _frame_summary_from_row(result.one())
+
+
+async def get_database_stats_async(db) -> Dict[str, int]:
+    """Async get_database_stats()"""
+    result = await db.execute(_database_stats_stmt())
+    return _stats_from_row(result.one())
+
+
+class StatsSnapshot:
+    """
+    TTL cache around get_database_stats() for dashboard polling.
+
+    One snapshot is shared per process; it is recomputed at most once per
+    `ttl_seconds` (concurrent callers wait for the refresh instead of all
+    hitting the database).
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0):
+        self.ttl_seconds = ttl_seconds
+        self._stats: Optional[Dict[str, int]] = None
+        self._computed_at = 0.0
+        self._lock = threading.Lock()
+
+    def _is_stale(self, now: float) -> bool:
+        return self._stats is None or now - self._computed_at >= self.ttl_seconds
+
+    def _snapshot(self, stats: Dict[str, int], now: float) -> Dict[str, Any]:
+        return {
+            **stats,
+            "cached": True,
+            "snapshot_age_seconds": round(now - self._computed_at, 3)
+        }
+
+    def get(self, db: Session, refresh: bool = False) -> Dict[str, Any]:
+        """Return cached stats (plus snapshot age) or recompute if stale"""
+        with self._lock:
+            now = time.monotonic()
+            if refresh or self._is_stale(now):
+                self._stats = get_database_stats(db)
+                self._computed_at = now
+            return self._snapshot(self._stats, now)
+
+    async def get_async(self, db, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Async get(). The refresh query runs outside the lock, so concurrent
+        callers that miss at the same moment may each refresh once.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if not refresh and not self._is_stale(now):
+                return self._snapshot(self._stats, now)
+
+        stats = await get_database_stats_async(db)
+        with self._lock:
+            now = time.monotonic()
+            self._stats = stats
+            self._computed_at = now
+            return self._snapshot(stats, now)
+
+    def invalidate(self):
+        """Drop the cached snapshot (e.g. after a sync)"""
+        with self._lock:
+            self._stats = None
@@ -0,0 +1,407 @@
+"""
+Stage Timing Instrumentation
+
+Lightweight timers around the expensive pipeline stages (video decode,
+pose inference, event detection, physics, scoring, database, external
+HTTP) with Prometheus text-format export and a per-request trace.
+
+- timed("stage") works as a context manager and as a decorator (sync or
+  async); each use records one observation in the
+  stage_duration_seconds histogram and adds to the current request trace
+- instrument_engine(engine) times every SQL statement as the "db" stage
+- StageTimingMiddleware times requests (http_request_duration_seconds by
+  route template) and, when the client sends `X-Request-Trace: 1` (or
+  STAGE_TRACE_HEADER=always), returns the request's stage totals in a
+  standard `Server-Timing` header
+- render_metrics() is the /metrics payload (includes the db pool gauges
+  from db_pool_metrics)
+
+Recording is a perf_counter pair, a bisect and a short lock hold
+(a few microseconds), so it stays on in production.
+
+Usage:
+    from stage_metrics import timed
+
+    with timed("pose_inference"):
+        pose = detector.detect_pose(frame, timestamp_ms)
+
+    @timed("http.whop")
+    async def get_membership(...): ...
+"""
+
+import functools
+import inspect
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+
+from db_pool_metrics import pool_metrics
+
+# Seconds; covers per-frame inference (ms) up to whole uploads (minutes)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+TRACE_REQUEST_HEADER = b"x-request-trace"
+TRACE_ALWAYS = os.environ.get("STAGE_TRACE_HEADER", "").lower() == "always"
+
+
+# ========================================
+# METRIC TYPES
+# ========================================
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with labels"""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels (Prometheus semantics)"""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return series[2] if series else 0
+
+    def sum(self, *labels: str) -> float:
+        series = self._series.get(labels)
+        return series[1] if series else 0.0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = [(labels, list(s[0]), s[1], s[2]) for labels, s in sorted(self._series.items())]
+        for labels, counts, total, count in snapshot:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}")
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics rendered together in Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+STAGE_SECONDS = metrics.histogram(
+    "stage_duration_seconds", "Time spent in a pipeline stage", ["stage"]
+)
+STAGE_ERRORS = metrics.counter(
+    "stage_errors_total", "Pipeline stage invocations that raised", ["stage"]
+)
+HTTP_SECONDS = metrics.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template",
+    ["method", "route", "status"]
+)
+
+
+# ========================================
+# REQUEST TRACE
+# ========================================
+
+class RequestTrace:
+    """Stage totals for one request"""
+
+    __slots__ = ("stages",)
+
+    def __init__(self):
+        self.stages: Dict[str, List[float]] = {}  # stage -> [total seconds, count]
+
+    def add(self, stage: str, seconds: float):
+        entry = self.stages.get(stage)
+        if entry is None:
+            self.stages[stage] = [seconds, 1]
+        else:
+            entry[0] += seconds
+            entry[1] += 1
+
+    def summary(self) -> Dict[str, Dict]:
+        return {
+            stage: {"total_ms": round(total * 1000, 2), "count": count}
+            for stage, (total, count) in self.stages.items()
+        }
+
+    def server_timing(self) -> str:
+        """Server-Timing header value (stage names sanitized to tokens)"""
+        return ", ".join(
+            f'{stage.replace(" ", "_").replace(",", "_").replace(";", "_")};dur={total * 1000:.1f};desc="x{count}"'
+            for stage, (total, count) in self.stages.items()
+        )
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar("stage_trace", default=None)
+
+
+def current_trace() -> Optional[RequestTrace]:
+    return _current_trace.get()
+
+
+def start_trace() -> RequestTrace:
+    """Begin a trace in the current context (the middleware does this per request)"""
+    trace = RequestTrace()
+    _current_trace.set(trace)
+    return trace
+
+
+# ========================================
+# TIMERS
+# ========================================
+
+def record(stage: str, seconds: float, error: bool = False):
+    """Record one stage observation (metrics + current request trace)"""
+    STAGE_SECONDS.observe(seconds, stage)
+    if error:
+        STAGE_ERRORS.inc(stage)
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(stage, seconds)
+
+
+class timed:
+    """
+    Time a block or a function as a named stage
+
+        with timed("physics"):
+            ...
+
+        @timed("scoring")
+        def score(...): ...
+    """
+
+    __slots__ = ("stage", "_start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record(self.stage, time.perf_counter() - self._start, error=exc_type is not None)
+        return False
+
+    def __call__(self, func: Callable) -> Callable:
+        stage = self.stage
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                failed = True
+                try:
+                    result = await func(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    record(stage, time.perf_counter() - start, error=failed)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            failed = True
+            try:
+                result = func(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                record(stage, time.perf_counter() - start, error=failed)
+        return wrapper
+
+
+def record_stage_run(stage_run, prefix: str = ""):
+    """Record every stage of a physics_engine.stage_graph.StageRun"""
+    for name, duration_ms in stage_run.durations_ms.items():
+        record(f"{prefix}{name}", duration_ms / 1000)
+
+
+def instrument_engine(engine, stage: str = "db"):
+    """Time every SQL statement on a (sync) engine as `stage`"""
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_query(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("stage_metrics_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _end_query(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("stage_metrics_start")
+        if starts:
+            record(stage, time.perf_counter() - starts.pop())
+
+    @event.listens_for(engine, "handle_error")
+    def _failed_query(exception_context):
+        conn = exception_context.connection
+        starts = conn.info.get("stage_metrics_start") if conn is not None else None
+        if starts:
+            record(stage, time.perf_counter() - starts.pop(), error=True)
+
+
+# ========================================
+# ASGI MIDDLEWARE & EXPORT
+# ========================================
+
+class StageTimingMiddleware:
+    """
+    Per-request trace + request latency histogram (pure ASGI, no body buffering)
+
+    Requests carrying `X-Request-Trace: 1` get a Server-Timing header with
+    the request's stage totals plus `total`.
+    """
+
+    def __init__(self, app, always_trace_header: bool = TRACE_ALWAYS):
+        self.app = app
+        self.always_trace_header = always_trace_header
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = RequestTrace()
+        token = _current_trace.set(trace)
+        start = time.perf_counter()
+        status = [500]
+        want_header = self.always_trace_header or any(
+            name == TRACE_REQUEST_HEADER and value not in (b"", b"0")
+            for name, value in scope.get("headers", ())
+        )
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+                if want_header:
+                    timing = trace.server_timing()
+                    total = f"total;dur={(time.perf_counter() - start) * 1000:.1f}"
+                    value = f"{timing}, {total}" if timing else total
+                    message = dict(message)
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", value.encode("latin-1"))
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            HTTP_SECONDS.observe(time.perf_counter() - start, scope["method"], route_path, str(status[0]))
+            _current_trace.reset(token)
+
+
+def _pool_lines() -> List[str]:
+    """db_pool_metrics snapshot as gauges and (monotonic) counters"""
+    series = {
+        "db_pool_in_use": ("gauge", "Connections checked out", lambda s: s["in_use"]),
+        "db_pool_checkouts_total": ("counter", "Connection checkouts", lambda s: s["checkouts"]),
+        "db_pool_checkout_timeouts_total": ("counter", "Checkouts that timed out", lambda s: s["checkout_timeouts"]),
+        "db_pool_checkout_wait_p95_ms": ("gauge", "95th percentile checkout wait",
+                                         lambda s: s["checkout_wait_ms"]["p95"]),
+    }
+    snapshot = pool_metrics.snapshot()
+    lines = []
+    for name, (metric_type, documentation, getter) in series.items():
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for pool_name, pool in sorted(snapshot.items()):
+            lines.append(f'{name}{{pool="{_escape(pool_name)}"}} {getter(pool)}')
+    return lines
+
+
+def render_metrics() -> str:
+    """Prometheus text exposition for this worker process"""
+    text = metrics.render()
+    pool_lines = _pool_lines()
+    if pool_lines:
+        text += "\n".join(pool_lines) + "\n"
+    return text
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
@@ -25,11 +25,10 @@ import sys
 import logging
 from datetime import datetime
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from logging_config import configure_logging
+
+# Configure logging (quiet analysis detail; LOG_FORMAT=json for log shippers)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 def main():
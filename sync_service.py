@@ -11,8 +11,11 @@ from typing import Optional, Dict, Any, List
 from sqlalchemy.orm import Session
 from database import SessionLocal
 from models import Player, Session as SessionModel, BiomechanicsData, SyncLog
+from session_queries import get_sessions_pending_sync
+from frame_store import pack_session_frames
+from logging_config import configure_logging
 
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # Configuration
@@ -575,10 +578,8 @@ class RebootMotionSync:
         logger.info("🔄 Syncing biomechanics data...")
         
         try:
-            # Find sessions that need data synced
-            sessions_to_sync = db.query(SessionModel).filter(
-                SessionModel.data_synced == False
-            ).limit(limit).all()
+            # Find sessions that need data synced (players eager-loaded, no per-session query)
+            sessions_to_sync = get_sessions_pending_sync(db, limit=limit)
             
             if not sessions_to_sync:
                 logger.info("✅ No sessions need biomechanics data sync")
@@ -648,6 +649,7 @@ class RebootMotionSync:
             int: Number of records created
         """
         records_created = 0
+        new_records = []
         
         try:
             # Handle different response structures
@@ -694,8 +696,19 @@ class RebootMotionSync:
                     biomech_record.joint_angles = movement
                 
                 db.add(biomech_record)
+                new_records.append(biomech_record)
                 records_created += 1
             
+            # Columnar copy for time-series reads (see frame_store.py). In a
+            # savepoint, so a failed pack only loses the packed copy and not
+            # the caller's transaction with the frame rows.
+            if new_records:
+                try:
+                    with db.begin_nested():
+                        pack_session_frames(db, session.id, frames=new_records)
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not pack frame channels for session {session.session_id}: {e}")
+            
             return records_created
             
         except Exception as e:
@@ -20,15 +20,21 @@ Endpoints:
 - GET /athletes/{athlete_id}/assignments - Get athlete assignments
 - PUT /assignments/{assignment_id} - Update assignment progress
 - POST /athletes/compare - Compare multiple athletes
+- GET /teams/{team_id}/leaderboard - Roster ranked by age-adjusted cohort percentile
+- POST /teams/{team_id}/reports/batch - Start a zipped report bundle for the roster
+- GET /reports/batch/{job_id} - Batch report progress
+- GET /reports/batch/{job_id}/download - Download the finished bundle
 
 Author: Reboot Motion Development Team
 Date: 2025-12-24
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import FileResponse
 from pydantic import BaseModel, EmailStr
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+import os
 
 from physics_engine.team_management import (
     TeamManagementSystem,
@@ -37,12 +43,19 @@ from physics_engine.team_management import (
     AthleteStatus,
     AssignmentStatus
 )
+from physics_engine.profile_comparisons import start_cohort_refresh
 
 # Initialize router and system
 router = APIRouter(prefix="/api/teams", tags=["Team Management"])
 team_system = TeamManagementSystem()
 
 
+@router.on_event("startup")
+def start_leaderboard_percentile_refresh():
+    """Keep leaderboard cohort percentiles synced from stored sessions"""
+    start_cohort_refresh()
+
+
 # ============================================================================
 # REQUEST MODELS
 # ============================================================================
@@ -111,6 +124,13 @@ class AthleteCompare(BaseModel):
     metric: str = "bat_speed"
 
 
+class BatchReportCreate(BaseModel):
+    start_date: str  # ISO format: "2025-12-15"
+    end_date: str  # inclusive; a bare date covers the whole day
+    formats: List[str] = ["html", "pdf", "png"]
+    max_workers: Optional[int] = None  # capped at TEAM_REPORT_WORKERS
+
+
 # ============================================================================
 # COACH ENDPOINTS
 # ============================================================================
@@ -395,6 +415,27 @@ def compare_athletes(comparison: AthleteCompare) -> Dict[str, Any]:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.get("/teams/{team_id}/leaderboard")
+def get_team_leaderboard(
+    team_id: str,
+    metric: str = Query("bat_speed", description="bat_speed, ground_score, engine_score or weapon_score"),
+    limit: Optional[int] = Query(None, ge=1)
+) -> Dict[str, Any]:
+    """Active athletes ranked by age-adjusted percentile (cohort percentiles from stored sessions)"""
+    if not team_system.get_team(team_id):
+        raise HTTPException(status_code=404, detail="Team not found")
+    try:
+        leaderboard = team_system.team_leaderboard(team_id, metric, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        'success': True,
+        'metric': metric,
+        'leaderboard': leaderboard
+    }
+
+
 # ============================================================================
 # DASHBOARD SUMMARY
 # ============================================================================
@@ -423,3 +464,73 @@ def get_coach_dashboard(coach_id: str) -> Dict[str, Any]:
         'success': True,
         'dashboard': dashboard
     }
+
+
+# ============================================================================
+# BATCH REPORTS
+# ============================================================================
+
+@router.post("/teams/{team_id}/reports/batch")
+def start_team_batch_report(team_id: str, request: BatchReportCreate) -> Dict[str, Any]:
+    """Render every active athlete's report for a date range into one zip (background job)"""
+    # Imported here: rendering pulls in matplotlib
+    from physics_engine.team_report_batch import REPORT_WORKERS, BatchQueueFullError, start_batch_report_job
+    
+    if not team_system.get_team(team_id):
+        raise HTTPException(status_code=404, detail="Team not found")
+    try:
+        start_date = datetime.fromisoformat(request.start_date)
+        end_date = datetime.fromisoformat(request.end_date)
+        if len(request.end_date) == 10:
+            end_date += timedelta(days=1, microseconds=-1)
+        if end_date < start_date:
+            raise ValueError("end_date is before start_date")
+        progress = start_batch_report_job(
+            team_system, team_id, start_date, end_date,
+            formats=request.formats,
+            max_workers=min(request.max_workers or REPORT_WORKERS, REPORT_WORKERS)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except BatchQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "60"})
+    
+    return {
+        'success': True,
+        'job': progress.to_dict()
+    }
+
+
+@router.get("/reports/batch/{job_id}")
+def get_team_batch_report(job_id: str) -> Dict[str, Any]:
+    """Batch report progress (completed / total, reports per minute)"""
+    from physics_engine.team_report_batch import get_batch_report_job
+    
+    progress = get_batch_report_job(job_id)
+    if not progress:
+        raise HTTPException(status_code=404, detail="Batch report job not found")
+    
+    return {
+        'success': True,
+        'job': progress.to_dict()
+    }
+
+
+@router.get("/reports/batch/{job_id}/download")
+def download_team_batch_report(job_id: str):
+    """Zipped report bundle of a completed job"""
+    from physics_engine.team_report_batch import get_batch_report_job
+    
+    progress = get_batch_report_job(job_id)
+    if not progress:
+        raise HTTPException(status_code=404, detail="Batch report job not found")
+    if progress.status != 'completed':
+        raise HTTPException(status_code=409, detail=f"Batch report job is {progress.status}")
+    if not os.path.exists(progress.output_path):
+        raise HTTPException(status_code=410, detail="Batch report bundle has expired")
+    
+    return FileResponse(
+        progress.output_path,
+        media_type="application/zip",
+        filename=os.path.basename(progress.output_path)
+    )
@@ -11,9 +11,14 @@ Author: Catching Barrels
 Date: December 2025
 """
 
+import logging
+import sys
+
 import pandas as pd
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -34,7 +39,7 @@ EXPECTED_LAUNCH_RANGE = (0.3, 0.6) # Launch duration in seconds
 # MAIN ANALYSIS
 # ============================================================================
 
-def calculate_tempo(df, verbose=True):
+def calculate_tempo(df, verbose=False):
     """
     Calculate tempo ratio from Reboot momentum-energy data.
     
@@ -44,9 +49,16 @@ def calculate_tempo(df, verbose=True):
     - Load Duration: time from load start to hip peak
     - Launch Duration: time from hip peak to contact
     
+    The step-by-step report is logged at INFO when verbose, otherwise at
+    DEBUG (quiet unless enabled for this module, e.g.
+    LOG_LEVELS=tempo_calculator=DEBUG); nothing is formatted when the
+    level is off.
+    
     Returns dict with all tempo metrics
     """
     
+    level = logging.INFO if verbose else logging.DEBUG
+    report = logger.isEnabledFor(level)
     results = {}
     
     # ----------------------------------------
@@ -57,12 +69,11 @@ def calculate_tempo(df, verbose=True):
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
     
-    if verbose:
-        print("=" * 70)
-        print("TEMPO CALCULATION")
-        print("=" * 70)
-        print(f"\nData points: {len(df)}")
-        print(f"Time range: {df['time_from_max_hand'].min():.3f}s to {df['time_from_max_hand'].max():.3f}s")
+    if report:
+        logger.log(level, "%s\nTEMPO CALCULATION\n%s", "=" * 70, "=" * 70)
+        logger.log(level, "\nData points: %d", len(df))
+        logger.log(level, "Time range: %.3fs to %.3fs",
+                   df['time_from_max_hand'].min(), df['time_from_max_hand'].max())
     
     # ----------------------------------------
     # STEP 2: Find CONTACT frame (time = 0)
@@ -74,11 +85,9 @@ def calculate_tempo(df, verbose=True):
     results['contact_time'] = contact_time
     results['contact_ke'] = contact_ke
     
-    if verbose:
-        print(f"\n[CONTACT]")
-        print(f"  Frame: {contact_idx}")
-        print(f"  Time: {contact_time:.4f}s (should be ~0)")
-        print(f"  Lower Half KE: {contact_ke:.1f} J")
+    if report:
+        logger.log(level, "\n[CONTACT]\n  Frame: %s\n  Time: %.4fs (should be ~0)\n  Lower Half KE: %.1f J",
+                   contact_idx, contact_time, contact_ke)
     
     # ----------------------------------------
     # STEP 3: Find LOAD START (minimum lower half KE)
@@ -99,11 +108,9 @@ def calculate_tempo(df, verbose=True):
     results['load_start_time'] = load_start_time
     results['load_start_ke'] = load_start_ke
     
-    if verbose:
-        print(f"\n[LOAD START] (min KE in window {LOAD_START_WINDOW})")
-        print(f"  Frame: {load_start_idx}")
-        print(f"  Time: {load_start_time:.3f}s")
-        print(f"  Lower Half KE: {load_start_ke:.1f} J")
+    if report:
+        logger.log(level, "\n[LOAD START] (min KE in window %s)\n  Frame: %s\n  Time: %.3fs\n  Lower Half KE: %.1f J",
+                   LOAD_START_WINDOW, load_start_idx, load_start_time, load_start_ke)
     
     # ----------------------------------------
     # STEP 4: Find HIP PEAK (maximum lower half KE)
@@ -125,11 +132,9 @@ def calculate_tempo(df, verbose=True):
     results['hip_peak_time'] = hip_peak_time
     results['hip_peak_ke'] = hip_peak_ke
     
-    if verbose:
-        print(f"\n[HIP PEAK] (max KE in window {HIP_PEAK_WINDOW})")
-        print(f"  Frame: {hip_peak_idx}")
-        print(f"  Time: {hip_peak_time:.3f}s")
-        print(f"  Lower Half KE: {hip_peak_ke:.1f} J")
+    if report:
+        logger.log(level, "\n[HIP PEAK] (max KE in window %s)\n  Frame: %s\n  Time: %.3fs\n  Lower Half KE: %.1f J",
+                   HIP_PEAK_WINDOW, hip_peak_idx, hip_peak_time, hip_peak_ke)
     
     # ----------------------------------------
     # STEP 5: Calculate DURATIONS
@@ -142,10 +147,9 @@ def calculate_tempo(df, verbose=True):
     results['launch_duration_s'] = launch_duration
     results['launch_duration_ms'] = launch_duration * 1000
     
-    if verbose:
-        print(f"\n[DURATIONS]")
-        print(f"  Load:   {load_duration:.3f}s ({load_duration*1000:.0f}ms)")
-        print(f"  Launch: {launch_duration:.3f}s ({launch_duration*1000:.0f}ms)")
+    if report:
+        logger.log(level, "\n[DURATIONS]\n  Load:   %.3fs (%.0fms)\n  Launch: %.3fs (%.0fms)",
+                   load_duration, load_duration * 1000, launch_duration, launch_duration * 1000)
     
     # ----------------------------------------
     # STEP 6: Calculate TEMPO RATIO
@@ -157,9 +161,8 @@ def calculate_tempo(df, verbose=True):
     
     results['tempo_ratio'] = round(tempo_ratio, 2)
     
-    if verbose:
-        print(f"\n[TEMPO RATIO]")
-        print(f"  {load_duration:.3f}s / {launch_duration:.3f}s = {tempo_ratio:.2f}:1")
+    if report:
+        logger.log(level, "\n[TEMPO RATIO]\n  %.3fs / %.3fs = %.2f:1", load_duration, launch_duration, tempo_ratio)
     
     # ----------------------------------------
     # STEP 7: Validate against expected ranges
@@ -185,10 +188,9 @@ def calculate_tempo(df, verbose=True):
     
     results['validations'] = validations
     
-    if verbose:
-        print(f"\n[VALIDATION]")
-        for name, value, status in validations:
-            print(f"  {name}: {value} {status}")
+    if report:
+        logger.log(level, "\n[VALIDATION]\n%s",
+                   "\n".join(f"  {name}: {value} {status}" for name, value, status in validations))
     
     return results
 
@@ -377,6 +379,9 @@ def generate_report(df, athlete_name="Athlete", verbose=True):
 # ============================================================================
 
 if __name__ == "__main__":
+    # The verbose tempo steps are log records; show them inline with the report
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     print("\nLoading data...")
     
     try:
@@ -0,0 +1,109 @@
+"""
+Shared pytest fixtures
+
+Provides an in-memory SQLite database with the ORM schema, a
+query-counting harness for asserting how many SQL statements a code path
+issues, and a TrainingSession factory (import it: `from conftest import
+training_session`).
+"""
+
+import pytest
+import sys
+import os
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from models import Base
+from physics_engine.progress_tracker import TrainingSession
+
+SESSION_BASE_DATE = datetime(2025, 4, 1)
+
+
+def training_session(athlete_id="eric", day=0, bat_speed=66.0, score=60, session_id=None,
+                     base_date=SESSION_BASE_DATE, **fields):
+    """
+    TrainingSession `day` days after base_date; `score` fills every
+    ground / engine / weapon score and `fields` overrides any attribute
+    """
+    values = dict(
+        session_id=session_id or f"{athlete_id}_{day}", athlete_id=athlete_id, athlete_name=athlete_id,
+        session_date=base_date + timedelta(days=day),
+        ground_score=score, engine_score=score, weapon_score=score,
+        height_inches=70, wingspan_inches=71, weight_lbs=190, age=18, bat_weight_oz=31,
+        actual_bat_speed_mph=bat_speed, motor_preference="spinner", motor_preference_confidence=0.5,
+        ground_score_adjusted=score, engine_score_adjusted=score, weapon_score_adjusted=score,
+        overall_efficiency=65.0, bat_speed_capacity_midpoint=76.0, predicted_bat_speed=66.0,
+        gap_to_capacity_max=8.0, issues_count=1, drills_count=2, timeline_weeks=4, expected_gain_mph=5.0
+    )
+    values.update(fields)
+    return TrainingSession(**values)
+
+
+class QueryCounter:
+    """Records every SQL statement executed on an engine while active"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def selects(self) -> list:
+        return [s for s in self.statements if s.lstrip().upper().startswith("SELECT")]
+
+    @contextmanager
+    def __call__(self):
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._before_cursor_execute)
+        try:
+            yield self
+        finally:
+            event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
+
+
+@pytest.fixture
+def db_engine():
+    """Fresh in-memory SQLite engine with all tables created"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine):
+    """SQLAlchemy session bound to the in-memory engine"""
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def count_queries(db_engine):
+    """
+    Context manager counting SQL statements.
+
+    Usage:
+        with count_queries() as counter:
+            ...
+        assert counter.count == 2
+    """
+    return QueryCounter(db_engine)
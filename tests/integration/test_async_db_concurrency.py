@@ -0,0 +1,165 @@
+"""
+Integration Tests: Async DB Concurrency
+Benchmarks p99 latency under mixed load for the sync-session-in-async-route
+pattern (before) versus the get_async_db path (after)
+
+Mixed load = aggregate DB reads (/sessions/{id}/metrics query) interleaved
+with lightweight non-DB requests on the same event loop. When DB I/O runs on
+the event loop thread, every light request queues behind it.
+"""
+
+import pytest
+import sys
+import os
+import time
+import asyncio
+import tempfile
+import statistics
+from datetime import datetime, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import httpx
+from fastapi import FastAPI, Depends
+from sqlalchemy import create_engine, insert
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from models import Base, Player, Session as SessionModel, BiomechanicsData
+from session_queries import get_session_frame_summary, get_session_frame_summary_async
+
+NUM_FRAMES = 20000
+HEAVY_REQUESTS = 40
+LIGHT_PER_HEAVY = 3
+ARRIVAL_INTERVAL_MS = 5.0
+POOL_SIZE = 8
+
+
+def _p99(latencies_ms):
+    ordered = sorted(latencies_ms)
+    return ordered[min(len(ordered) - 1, int(round(0.99 * (len(ordered) - 1))))]
+
+
+@pytest.fixture(scope="module")
+def benchmark_db():
+    """File-backed SQLite database with one large session"""
+    tmpdir = tempfile.mkdtemp()
+    path = os.path.join(tmpdir, "async_bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as conn:
+        conn.execute(insert(Player), [{"id": 1, "org_player_id": "bench"}])
+        conn.execute(insert(SessionModel), [{"id": 1, "session_id": "bench", "player_id": 1}])
+        start = datetime(2025, 1, 1)
+        conn.execute(insert(BiomechanicsData), [
+            {"session_id": 1, "frame_number": i, "timestamp": start + timedelta(milliseconds=i)}
+            for i in range(NUM_FRAMES)
+        ])
+    engine.dispose()
+
+    yield path
+    os.remove(path)
+    os.rmdir(tmpdir)
+
+
+def _build_app(path: str) -> FastAPI:
+    sync_engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    SyncSessionLocal = sessionmaker(bind=sync_engine, autoflush=False)
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", poolclass=AsyncAdaptedQueuePool, pool_size=POOL_SIZE, max_overflow=0
+    )
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, class_=AsyncSession, expire_on_commit=False)
+
+    # Async generator so FastAPI doesn't run it in its threadpool: the query
+    # itself still executes on the event loop thread, as in the old routes.
+    async def get_sync_db():
+        db = SyncSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+
+    # Before: async route holding a sync Session (blocks the event loop)
+    @app.get("/before/sessions/{session_id}/metrics")
+    async def metrics_before(session_id: int, db: Session = Depends(get_sync_db)):
+        return get_session_frame_summary(db, session_id)
+
+    # After: async route on get_async_db
+    @app.get("/after/sessions/{session_id}/metrics")
+    async def metrics_after(session_id: int, db: AsyncSession = Depends(get_async_db)):
+        return await get_session_frame_summary_async(db, session_id)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    app.state.engines = (sync_engine, async_engine)
+    return app
+
+
+async def _mixed_load(app: FastAPI, prefix: str):
+    """
+    Open-loop mixed load: requests arrive on a fixed schedule (one every
+    ARRIVAL_INTERVAL_MS), every (LIGHT_PER_HEAVY + 1)th one a DB read.
+    Latency is measured from the scheduled arrival time, so time spent
+    waiting for a blocked event loop counts against the request.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up: open every pooled connection before measuring
+        await asyncio.gather(*(client.get(f"/{prefix}/sessions/1/metrics") for _ in range(POOL_SIZE)))
+
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+
+        async def timed(url, arrival_offset):
+            await asyncio.sleep(arrival_offset)
+            response = await client.get(url)
+            assert response.status_code == 200
+            return url, (loop.time() - (t0 + arrival_offset)) * 1000
+
+        urls = []
+        for _ in range(HEAVY_REQUESTS):
+            urls.append(f"/{prefix}/sessions/1/metrics")
+            urls.extend(["/ping"] * LIGHT_PER_HEAVY)
+        results = await asyncio.gather(*(
+            timed(url, i * ARRIVAL_INTERVAL_MS / 1000) for i, url in enumerate(urls)
+        ))
+
+    heavy = [ms for url, ms in results if "metrics" in url]
+    light = [ms for url, ms in results if url == "/ping"]
+    return heavy, light
+
+
+class TestAsyncDbConcurrency:
+    """p99 latency under mixed load, before vs after"""
+
+    def test_p99_latency_mixed_load(self, benchmark_db):
+        app = _build_app(benchmark_db)
+        try:
+            before_heavy, before_light = asyncio.run(_mixed_load(app, "before"))
+            after_heavy, after_light = asyncio.run(_mixed_load(app, "after"))
+        finally:
+            sync_engine, async_engine = app.state.engines
+            sync_engine.dispose()
+            asyncio.run(async_engine.dispose())
+
+        before_p99 = _p99(before_light)
+        after_p99 = _p99(after_light)
+
+        print(f"\n📊 Mixed load ({len(before_heavy)} DB reads + {len(before_light)} light requests, {NUM_FRAMES} frames)")
+        print(f"   Before (sync session): light p99 {before_p99:.1f}ms, "
+              f"DB p99 {_p99(before_heavy):.1f}ms, light median {statistics.median(before_light):.1f}ms")
+        print(f"   After  (async session): light p99 {after_p99:.1f}ms, "
+              f"DB p99 {_p99(after_heavy):.1f}ms, light median {statistics.median(after_light):.1f}ms")
+
+        # Light requests no longer queue behind DB I/O on the event loop
+        assert after_p99 < before_p99, f"async p99 {after_p99:.1f}ms >= sync p99 {before_p99:.1f}ms"
@@ -0,0 +1,59 @@
+"""
+Integration Tests: Import Time
+`python -X importtime` profile of the server entry points (Procfile's
+coach_rick_wap_integration and main) with a budget: heavy feature
+dependencies must not load before the first request, and the total
+import stays within IMPORT_TIME_BUDGET_RATIO times FastAPI's own import
+time (the unavoidable floor, measured in the same run so the budget holds
+on slow and fast machines)
+"""
+
+import pytest
+import sys
+import os
+import subprocess
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+
+# Eager routers measured ~2.9x; lazy routers ~1.7-1.9x
+IMPORT_TIME_BUDGET_RATIO = float(os.environ.get("IMPORT_TIME_BUDGET_RATIO", "2.5"))
+
+# Loaded by the lazy routers on first use / in the warm-up, never at import
+HEAVY_MODULES = {"pandas", "cv2", "mediapipe", "matplotlib", "httpx", "coach_rick", "swing_dna", "physics_engine"}
+
+
+def _import_profile(module: str):
+    """(cumulative ms of `module`, cumulative ms of fastapi, set of top-level packages imported)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120,
+        env={**os.environ, "LAZY_ROUTER_WARMUP": "0"}
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    total_ms, fastapi_ms, imported = None, None, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        imported.add(name.strip().split(".")[0])
+        if name.strip() == module:
+            total_ms = int(cumulative) / 1000
+        elif name.strip() == "fastapi":
+            fastapi_ms = int(cumulative) / 1000
+    return total_ms, fastapi_ms, imported
+
+
+@pytest.mark.parametrize("module", ["coach_rick_wap_integration", "main"])
+def test_entry_point_import_budget(module):
+    # Best of two: the first run may also be compiling .pyc files
+    profiles = [_import_profile(module) for _ in range(2)]
+    total_ms, fastapi_ms, imported = min(profiles, key=lambda p: p[0] / p[1])
+    ratio = total_ms / fastapi_ms
+
+    print(f"\n📊 import {module}: {total_ms:.0f} ms, {ratio:.2f}x fastapi ({fastapi_ms:.0f} ms), "
+          f"budget {IMPORT_TIME_BUDGET_RATIO:.1f}x")
+    assert not HEAVY_MODULES & imported, f"loaded at import: {sorted(HEAVY_MODULES & imported)}"
+    assert ratio < IMPORT_TIME_BUDGET_RATIO
@@ -0,0 +1,70 @@
+"""
+Integration Tests: Logging Overhead
+Per-call cost of the analysis hot paths with their step-by-step detail
+enabled (formatted and written, as the previous unconditional print()
+calls were) vs quiet mode (lazy %-style arguments never formatted)
+"""
+
+import pytest
+import sys
+import os
+import gc
+import io
+import logging
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from physics_engine import kinetic_capacity_calculator_v21 as capacity_v21
+
+NUM_CALLS = 3000
+PLAYERS = [
+    dict(height_inches=66, wingspan_inches=67.5, weight_lbs=166, age=34, bat_weight_oz=30),
+    dict(height_inches=79, wingspan_inches=83, weight_lbs=282, age=32, bat_weight_oz=34),
+    dict(height_inches=72, wingspan_inches=74, weight_lbs=205, age=27, bat_weight_oz=31),
+]
+
+
+def _per_call_us(fn, calls=NUM_CALLS):
+    """Mean µs per call, GC disabled while timing (as timeit does)"""
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for i in range(calls):
+            fn(**PLAYERS[i % len(PLAYERS)])
+        return (time.perf_counter() - start) / calls * 1e6
+    finally:
+        gc.enable()
+
+
+@pytest.fixture
+def capacity_logger():
+    logger = capacity_v21.logger
+    level, propagate = logger.level, logger.propagate
+    yield logger
+    logger.setLevel(level)
+    logger.propagate = propagate
+    logger.handlers.clear()
+
+
+class TestLoggingOverhead:
+    """Quiet mode is cheaper per call than emitting the detail"""
+
+    def test_capacity_quiet_vs_detailed(self, capacity_logger):
+        sink = io.StringIO()
+        handler = logging.StreamHandler(sink)
+        capacity_logger.addHandler(handler)
+        capacity_logger.propagate = False
+
+        capacity_logger.setLevel(logging.DEBUG)
+        detailed_us = _per_call_us(lambda **p: capacity_v21.calculate_energy_capacity_v21(**p, verbose=True))
+        assert sink.tell() > 0
+
+        capacity_logger.setLevel(logging.WARNING)
+        written = sink.tell()
+        quiet_us = _per_call_us(capacity_v21.calculate_energy_capacity_v21)
+        assert sink.tell() == written
+
+        print(f"\n📊 calculate_energy_capacity_v21: detailed {detailed_us:.1f}µs, "
+              f"quiet {quiet_us:.1f}µs per call (saves {detailed_us - quiet_us:.1f}µs)")
+        assert quiet_us < detailed_us
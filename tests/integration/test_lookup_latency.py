@@ -0,0 +1,82 @@
+"""
+Integration Tests: Benchmark Lookup Latency
+Microbenchmark of per-call latency for the baseline bat speed lookup
+(kinetic_capacity_calculator_v21) and ExitVelocityPredictor.find_nearest_benchmarks:
+full table scan + sort (before) vs the precomputed NearestBenchmarkIndex (after)
+"""
+
+import pytest
+import sys
+import os
+import gc
+import math
+import time
+import random
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from physics_engine import kinetic_capacity_calculator_v21 as capacity_v21
+from physics_engine.benchmark_index import NearestBenchmarkIndex
+from physics_engine.exit_velocity_predictor import ExitVelocityPredictor
+
+NUM_QUERIES = 5000
+# Warm pass: a roster's worth of repeat profiles (fits in the index cache)
+NUM_WARM_PROFILES = 500
+
+
+def _scan_find_nearest(benchmarks, height_inches, weight_lbs, num_neighbors=4):
+    """Previous ExitVelocityPredictor.find_nearest_benchmarks body"""
+    distances = []
+    for (h, w), (max_ev, avg_ev, name) in benchmarks.items():
+        distance = math.sqrt(((h - height_inches) * 5) ** 2 + (w - weight_lbs) ** 2)
+        distances.append((h, w, max_ev, avg_ev, name, distance))
+    distances.sort(key=lambda x: x[5])
+    return distances[:num_neighbors]
+
+
+def _per_call_us(fn, queries):
+    """Mean µs per call, GC disabled while timing (as timeit does)"""
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for height, weight in queries:
+            fn(height, weight)
+        return (time.perf_counter() - start) / len(queries) * 1e6
+    finally:
+        gc.enable()
+
+
+@pytest.fixture(scope="module")
+def queries():
+    rng = random.Random(42)
+    return [(rng.uniform(60, 80), rng.uniform(150, 280)) for _ in range(NUM_QUERIES)]
+
+
+class TestLookupLatency:
+    """Per-call latency, cold (distinct queries) and warm (repeat queries)"""
+
+    def test_baseline_bat_speed_latency(self, queries):
+        table = capacity_v21.BASELINE_TABLE
+        index = NearestBenchmarkIndex(table)
+
+        scan_us = _per_call_us(lambda h, w: capacity_v21._interpolate_baseline(h, w, table), queries)
+        cold_us = _per_call_us(index.interpolate, queries)
+        warm_us = _per_call_us(index.interpolate, queries[:NUM_WARM_PROFILES] * 10)
+
+        print(f"\n📊 Baseline bat speed ({len(table)} entries): scan {scan_us:.1f}µs, "
+              f"index cold {cold_us:.1f}µs, warm {warm_us:.2f}µs per call")
+        assert cold_us < scan_us
+        assert warm_us < cold_us
+
+    def test_find_nearest_benchmarks_latency(self, queries):
+        predictor = ExitVelocityPredictor()
+        benchmarks = predictor.MLB_BENCHMARKS
+        predictor.BENCHMARK_INDEX.nearest.cache_clear()
+
+        scan_us = _per_call_us(lambda h, w: _scan_find_nearest(benchmarks, h, w), queries)
+        cold_us = _per_call_us(predictor.find_nearest_benchmarks, queries)
+        warm_us = _per_call_us(predictor.find_nearest_benchmarks, queries[:NUM_WARM_PROFILES] * 10)
+
+        print(f"\n📊 find_nearest_benchmarks ({len(benchmarks)} entries): scan {scan_us:.1f}µs, "
+              f"index cold {cold_us:.1f}µs, warm {warm_us:.2f}µs per call")
+        assert warm_us < scan_us
@@ -0,0 +1,72 @@
+"""
+Integration Tests: Pattern Recognition Batch Latency
+Session-level diagnostics over many swings: interpreted rules per swing
+(before) vs the compiled plan's vectorized batch (after)
+"""
+
+import pytest
+import sys
+import os
+import time
+import random
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from coach_rick.pattern_recognition import PatternRecognitionEngine
+
+NUM_SWINGS = 5000
+
+
+def _swings(n, seed=21):
+    rng = random.Random(seed)
+    swings = []
+    for _ in range(n):
+        torso = rng.uniform(120, 160)
+        arms = torso + rng.uniform(0, 40)
+        swings.append({
+            "kinematic_sequence": {
+                "torso_peak_ms": torso, "arms_peak_ms": arms,
+                "bat_peak_ms": arms + rng.uniform(5, 30), "grade": rng.choice("ABCDF")
+            },
+            "tempo": {"ratio": rng.uniform(1.0, 4.0)},
+            "stability": {"score": rng.randint(60, 100)},
+        })
+    return swings
+
+
+def _interpreted_session(engine, swings, motor_profile):
+    """Previous per-swing loop: interpret every rule's conditions for every swing"""
+    counts = {}
+    for swing in swings:
+        for pattern_id, rule in engine.rules.items():
+            if engine._matches_conditions(swing, motor_profile, rule['conditions']):
+                counts[pattern_id] = counts.get(pattern_id, 0) + 1
+    return counts
+
+
+class TestPatternBatchLatency:
+    """Batch session diagnostics beat the interpreted per-swing loop"""
+
+    def test_session_batch_speedup(self):
+        engine = PatternRecognitionEngine()
+        swings = _swings(NUM_SWINGS)
+
+        start = time.perf_counter()
+        expected = _interpreted_session(engine, swings, "Whipper")
+        interpreted_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        summary = engine.analyze_session(swings, "Whipper")
+        batch_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for swing in swings:
+            engine.analyze(swing, "Whipper")
+        compiled_time = time.perf_counter() - start
+
+        print(f"\n📊 {NUM_SWINGS} swings: interpreted {interpreted_time * 1000:.1f} ms, "
+              f"compiled per-swing {compiled_time * 1000:.1f} ms, batch {batch_time * 1000:.1f} ms "
+              f"({interpreted_time / batch_time:.1f}x)")
+
+        assert {p.pattern_id: p.swings_matched for p in summary} == expected
+        assert batch_time < interpreted_time
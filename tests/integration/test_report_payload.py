@@ -0,0 +1,72 @@
+"""
+Integration Tests: Report Payload
+HTML report with base64-inlined charts (previous output) vs the compiled
+template linking content-hashed chart assets, compressed as served:
+bytes on the wire and time to produce them
+"""
+
+import pytest
+import sys
+import os
+import gc
+import gzip
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from compression import GZIP_LEVEL
+from physics_engine.chart_renderer import ChartRenderer, report_chart_data
+from physics_engine.report_generator import ReportGenerator
+
+NUM_REPORTS = 50
+PLAYER = {'name': 'Eric Williams', 'age': 33, 'height_inches': 68, 'weight_lbs': 190}
+ANALYSIS = {
+    'actual_bat_speed': 57.9,
+    'potential_bat_speed': 76.0,
+    'ground_score': 72,
+    'engine_score': 85,
+    'weapon_score': 40,
+    'sequence': {'pelvis_ms': 150, 'torso_ms': 100, 'arm_ms': 50, 'hand_ms': 10, 'contact_ms': 0},
+    'energy': {'lowerhalf_pct': 61, 'torso_pct': 29, 'arms_pct': 10},
+    'recommendations': {'primary_component': 'WEAPON', 'priority': 'CRITICAL', 'estimated_gain_mph': 7.2,
+                        'training_frequency': '5-6 days/week', 'drills': ['Tee work', 'Barrel control']}
+}
+
+
+def _per_report_ms(fn, calls=NUM_REPORTS):
+    """Mean ms per report, GC disabled while timing (as timeit does)"""
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        return (time.perf_counter() - start) / calls * 1000
+    finally:
+        gc.enable()
+
+
+class TestReportPayload:
+    """Linked charts shrink the report and the time to serve it"""
+
+    def test_inline_vs_linked(self):
+        renderer = ChartRenderer()
+        generator = ReportGenerator()
+        inline_charts = renderer.report_charts(PLAYER, ANALYSIS)  # charts cached: measure the report only
+        linked_charts = {
+            kind: f"/api/biomechanics-reports/charts/{renderer.publish(renderer.render(kind, data))}"
+            for kind, data in report_chart_data(PLAYER, ANALYSIS).items()
+        }
+
+        def inline():
+            return gzip.compress(generator.render_html_report(PLAYER, ANALYSIS, inline_charts).encode(), GZIP_LEVEL)
+
+        def linked():
+            return gzip.compress(generator.render_html_report(PLAYER, ANALYSIS, linked_charts).encode(), GZIP_LEVEL)
+
+        inline_ms, linked_ms = _per_report_ms(inline), _per_report_ms(linked)
+        inline_bytes, linked_bytes = len(inline()), len(linked())
+
+        print(f"\n📊 report: inline {inline_bytes / 1024:.0f} KB in {inline_ms:.2f}ms, "
+              f"linked {linked_bytes / 1024:.1f} KB in {linked_ms:.2f}ms")
+        assert linked_bytes * 50 < inline_bytes
+        assert linked_ms * 5 < inline_ms
@@ -0,0 +1,102 @@
+"""
+Integration Tests: Video Search Latency
+Per-query latency of VideoLibrary.search_videos on a large drill-clip
+library: filter-and-sort scan (before) vs the inverted index (after)
+"""
+
+import pytest
+import sys
+import os
+import gc
+import time
+import random
+import statistics
+from datetime import datetime, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from physics_engine.video_library import (
+    VideoLibrary, VideoMetadata, VideoSource, VideoCategory, DrillStage
+)
+
+NUM_CLIPS = 20000
+VOCABULARY_SIZE = 3000
+TAGS = [f"tag_{i}" for i in range(200)]
+
+QUERIES = [
+    dict(query="rotation"),
+    dict(query="hip rotation", drill_stage=DrillStage.STAGE_1),
+    dict(tags={"tag_3", "tag_17"}, category=VideoCategory.DRILL),
+    dict(query="barrel", tags={"tag_5"}),
+    dict(featured_only=True, category=VideoCategory.CONCEPT, drill_stage=DrillStage.STAGE_2),
+]
+
+
+def _scan_search(videos, query=None, tags=None, category=None, drill_stage=None, featured_only=False):
+    """Previous search_videos body (ordering as documented)"""
+    results = list(videos.values())
+    if featured_only:
+        results = [v for v in results if v.featured]
+    if category:
+        results = [v for v in results if v.category == category]
+    if drill_stage:
+        results = [v for v in results if v.drill_stage == drill_stage]
+    if tags:
+        results = [v for v in results if any(tag in v.tags for tag in tags)]
+    if query:
+        query_lower = query.lower()
+        results = [v for v in results
+                   if query_lower in v.title.lower() or query_lower in v.description.lower()]
+    results.sort(key=lambda v: (v.featured, v.view_count, v.created_at), reverse=True)
+    return results
+
+
+def _median_ms(fn, repeat=20):
+    gc.disable()
+    try:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples)
+    finally:
+        gc.enable()
+
+
+@pytest.fixture(scope="module")
+def library():
+    rng = random.Random(21)
+    vocabulary = [f"w{i}" for i in range(VOCABULARY_SIZE)] + ["hip", "rotation", "barrel", "load"]
+    library = VideoLibrary()
+    for i in range(NUM_CLIPS):
+        library.add_video(VideoMetadata(
+            video_id=f"clip_{i:06d}",
+            title=" ".join(rng.choices(vocabulary, k=4)),
+            description=" ".join(rng.choices(vocabulary, k=25)),
+            source=VideoSource.CLOUDFLARE_STREAM,
+            source_url=f"https://stream.example/{i}",
+            category=rng.choice(list(VideoCategory)),
+            tags=set(rng.sample(TAGS, 4)),
+            drill_stage=rng.choice([None] + list(DrillStage)),
+            created_at=datetime(2024, 1, 1) + timedelta(minutes=i),
+            view_count=rng.randint(0, 1000),
+            featured=rng.random() < 0.05,
+        ))
+    return library
+
+
+class TestVideoSearchLatency:
+    """Median per-query latency on a 20k clip library"""
+
+    @pytest.mark.parametrize("filters", QUERIES, ids=lambda f: ",".join(sorted(f)))
+    def test_search_latency(self, library, filters):
+        assert library.search_videos(**filters) == _scan_search(library.videos, **filters)
+
+        scan_ms = _median_ms(lambda: _scan_search(library.videos, **filters), repeat=5)
+        index_ms = _median_ms(lambda: library.search_videos(**filters))
+        hits = len(library.search_videos(**filters))
+
+        print(f"\n📊 search {filters} on {NUM_CLIPS} clips ({hits} hits): "
+              f"scan {scan_ms:.2f}ms, index {index_ms:.3f}ms")
+        assert index_ms < scan_ms
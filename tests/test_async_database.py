@@ -0,0 +1,221 @@
+"""
+Async Database Layer Tests
+Checks the asyncio query path (get_async_db / *_async queries) returns the
+same data as the sync path and that async report routes work end-to-end
+"""
+
+import pytest
+import asyncio
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+from database import to_async_url, get_async_db
+from models import Base, Player, Session as SessionModel, BiomechanicsData, PlayerReport
+from session_queries import (
+    get_player_sessions, get_database_stats,
+    get_player_async, get_players_page_async, get_player_sessions_async,
+    get_session_with_player_async, get_session_frames_async,
+    get_session_frame_summary_async, get_database_stats_async
+)
+import player_report_routes
+
+
+@pytest.fixture
+def async_sessionmaker_factory():
+    """Async in-memory SQLite (aiosqlite) with all tables created"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async def _create():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(_create())
+    yield async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+def _seed_async(factory):
+    async def _seed():
+        async with factory() as db:
+            player = Player(org_player_id="org_1", first_name="Eric", last_name="Williams")
+            other = Player(org_player_id="org_2", first_name="Connor", last_name="Gray")
+            db.add_all([player, other])
+            await db.flush()
+            for i in range(3):
+                db.add(SessionModel(
+                    session_id=f"sess_{i}",
+                    player_id=player.id,
+                    session_date=datetime(2025, 1, 1) + timedelta(days=i),
+                    data_synced=(i == 0)
+                ))
+            await db.flush()
+            for f in range(4):
+                db.add(BiomechanicsData(
+                    session_id=1,
+                    frame_number=f,
+                    timestamp=datetime(2025, 1, 1, 12) + timedelta(milliseconds=10 * f)
+                ))
+            db.add(PlayerReport(
+                session_id="sess_0", player_id=player.id,
+                krs_total=75.0, krs_level="ADVANCED", creation_score=72.0, transfer_score=77.0,
+                bat_transfer_efficiency=80.0, brain_motor_profile="Slingshotter", swing_count=10,
+                analyzed_at=datetime.utcnow() - timedelta(days=1)
+            ))
+            await db.commit()
+    asyncio.run(_seed())
+
+
+class TestAsyncUrl:
+    """DATABASE_URL -> async driver URL mapping"""
+
+    @pytest.mark.parametrize("url,expected", [
+        ("postgres://u:p@host:5432/db", "postgresql+asyncpg://u:p@host:5432/db"),
+        ("postgresql://u:p@host/db", "postgresql+asyncpg://u:p@host/db"),
+        ("postgresql+psycopg2://u:p@host/db", "postgresql+asyncpg://u:p@host/db"),
+        ("sqlite:///./catching_barrels.db", "sqlite+aiosqlite:///./catching_barrels.db"),
+        ("sqlite://", "sqlite+aiosqlite://"),
+    ])
+    def test_to_async_url(self, url, expected):
+        assert to_async_url(url) == expected
+
+
+class TestAsyncQueries:
+    """Async queries return the same results as their sync counterparts"""
+
+    def test_player_and_sessions(self, async_sessionmaker_factory):
+        _seed_async(async_sessionmaker_factory)
+
+        async def _run():
+            async with async_sessionmaker_factory() as db:
+                player = await get_player_async(db, 1)
+                sessions = await get_player_sessions_async(db, 1, start_date="2025-01-02")
+                return player.to_dict(), [s.to_dict(include_player=True) for s in sessions]
+
+        player, sessions = asyncio.run(_run())
+        assert player["last_name"] == "Williams"
+        assert [s["session_id"] for s in sessions] == ["sess_2", "sess_1"]
+        assert all(s["player"]["org_player_id"] == "org_1" for s in sessions)
+
+    def test_invalid_date_filter_raises(self, async_sessionmaker_factory):
+        async def _run():
+            async with async_sessionmaker_factory() as db:
+                await get_player_sessions_async(db, 1, start_date="not-a-date")
+
+        with pytest.raises(ValueError):
+            asyncio.run(_run())
+
+    def test_players_page_search(self, async_sessionmaker_factory):
+        _seed_async(async_sessionmaker_factory)
+
+        async def _run():
+            async with async_sessionmaker_factory() as db:
+                return (
+                    await get_players_page_async(db),
+                    await get_players_page_async(db, search="gra")
+                )
+
+        (total, players), (search_total, search_players) = asyncio.run(_run())
+        assert total == 2
+        assert [p.last_name for p in players] == ["Gray", "Williams"]
+        assert search_total == 1 and search_players[0].first_name == "Connor"
+
+    def test_session_data_and_metrics(self, async_sessionmaker_factory):
+        _seed_async(async_sessionmaker_factory)
+
+        async def _run():
+            async with async_sessionmaker_factory() as db:
+                session = await get_session_with_player_async(db, 1)
+                frames = await get_session_frames_async(db, 1, limit=2)
+                summary = await get_session_frame_summary_async(db, 1)
+                stats = await get_database_stats_async(db)
+                return session.to_dict(include_player=True), frames, summary, stats
+
+        session, frames, summary, stats = asyncio.run(_run())
+        assert session["player"]["first_name"] == "Eric"
+        assert [f.frame_number for f in frames] == [0, 1]
+        assert summary["total_frames"] == 4
+        assert summary["end_time"] == datetime(2025, 1, 1, 12) + timedelta(milliseconds=30)
+        assert stats == {
+            "total_players": 2,
+            "total_sessions": 3,
+            "synced_sessions": 1,
+            "pending_sessions": 2,
+            "biomechanics_records": 4
+        }
+
+    def test_matches_sync_path(self, db_session, async_sessionmaker_factory):
+        player = Player(org_player_id="org_1", first_name="A", last_name="B")
+        db_session.add(player)
+        db_session.flush()
+        db_session.add(SessionModel(session_id="s", player_id=player.id, session_date=datetime(2025, 3, 1)))
+        db_session.commit()
+
+        async def _seed():
+            async with async_sessionmaker_factory() as db:
+                player = Player(org_player_id="org_1", first_name="A", last_name="B")
+                db.add(player)
+                await db.flush()
+                db.add(SessionModel(session_id="s", player_id=player.id, session_date=datetime(2025, 3, 1)))
+                await db.commit()
+
+        async def _run():
+            async with async_sessionmaker_factory() as db:
+                sessions = await get_player_sessions_async(db, 1)
+                return [s.to_dict(include_player=True) for s in sessions], await get_database_stats_async(db)
+
+        asyncio.run(_seed())
+        async_sessions, async_stats = asyncio.run(_run())
+        sync_sessions = [s.to_dict(include_player=True) for s in get_player_sessions(db_session, 1)]
+
+        strip = lambda rows: [{k: v for k, v in r.items() if k not in ("created_at", "updated_at", "player")} for r in rows]
+        assert strip(async_sessions) == strip(sync_sessions)
+        assert async_stats == get_database_stats(db_session)
+
+
+class TestAsyncReportRoutes:
+    """player_report_routes read endpoints on get_async_db"""
+
+    @pytest.fixture
+    def client(self, async_sessionmaker_factory):
+        _seed_async(async_sessionmaker_factory)
+
+        async def override_get_async_db():
+            async with async_sessionmaker_factory() as db:
+                yield db
+
+        app = FastAPI()
+        app.include_router(player_report_routes.router)
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        return TestClient(app)
+
+    def test_session_report_includes_player(self, client):
+        response = client.get("/api/sessions/sess_0/report")
+        assert response.status_code == 200
+        assert response.json()["player"]["last_name"] == "Williams"
+
+    def test_session_report_not_found(self, client):
+        assert client.get("/api/sessions/missing/report").status_code == 404
+
+    def test_latest_session(self, client):
+        body = client.get("/api/sessions/latest", params={"player_id": 1}).json()
+        assert body["has_data"] is True
+        assert body["latest_report"]["krs"]["krs_total"] == 75.0
+
+        empty = client.get("/api/sessions/latest", params={"player_id": 2}).json()
+        assert empty["has_data"] is False
+
+    def test_progress_and_drills(self, client):
+        progress = client.get("/api/players/1/progress").json()
+        assert len(progress["krs_history"]) == 1
+        assert progress["stats"]["total_swings"] == 10
+
+        drills = client.get("/api/players/1/recommended-drills")
+        assert drills.status_code == 200
@@ -0,0 +1,150 @@
+"""
+Bat Sweep Tests
+Vectorized weight x length sweep against the scalar BatModule predictions,
+and the memoized MOI table
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from physics_engine.bat_module import BatModule, moi_table, _moi
+
+
+def _scalar_cell(module, weight, length, current_weight, bat_speed, body_ke, bat_type):
+    """Per-candidate loop the recommendation path uses"""
+    speed = bat_speed - 0.5 * (weight - current_weight)
+    moi = module.calculate_moi(weight, length, bat_type=bat_type)
+    ke = module.calculate_bat_kinetic_energy(speed, moi, length)
+    exit_velo = module.predict_exit_velocity(speed, moi)
+    efficiency = module.calculate_transfer_efficiency(ke, body_ke)
+    return moi, ke, exit_velo, efficiency
+
+
+class TestBatSweep:
+    """Every grid cell matches the scalar functions"""
+
+    @pytest.mark.parametrize("bat_type", ["balanced", "end_loaded", "light"])
+    def test_surface_matches_scalar(self, bat_type):
+        module = BatModule()
+        sweep = module.sweep_bat_grid(30, 33, 82, 514, bat_type=bat_type)
+        surface = sweep.to_dict()
+
+        assert sweep.exit_velo_mph.shape == (21, 9)
+        assert surface['weights_oz'][0] == 26.0 and surface['weights_oz'][-1] == 36.0
+        assert surface['lengths_inches'] == [31.0 + 0.5 * j for j in range(9)]
+
+        for i, weight in enumerate(surface['weights_oz']):
+            for j, length in enumerate(surface['lengths_inches']):
+                moi, ke, exit_velo, efficiency = _scalar_cell(module, weight, length, 30, 82, 514, bat_type)
+                assert surface['moi_kgm2'][i][j] == moi
+                # np.round and round() may only disagree on exact .x5 ties
+                assert surface['bat_ke_joules'][i][j] == pytest.approx(ke, abs=0.1 + 1e-9)
+                assert surface['exit_velo_mph'][i][j] == pytest.approx(exit_velo, abs=0.1 + 1e-9)
+                assert surface['efficiency_percent'][i][j] == pytest.approx(efficiency, abs=0.1 + 1e-9)
+
+    def test_best_cell_and_weight_range(self):
+        sweep = BatModule().sweep_bat_grid(30, 33, 82, 514)
+        best = sweep.best()
+        assert best['predicted_exit_velo_mph'] == round(float(sweep.exit_velo_mph.max()), 1)
+
+        limited = sweep.best((29.0, 31.0))
+        assert 29.0 <= limited['bat_weight_oz'] <= 31.0
+        in_range = (sweep.weights_oz >= 29.0) & (sweep.weights_oz <= 31.0)
+        assert limited['predicted_exit_velo_mph'] == round(float(sweep.exit_velo_mph[in_range].max()), 1)
+
+    def test_zero_body_energy(self):
+        sweep = BatModule().sweep_bat_grid(30, 33, 82, 0)
+        assert not sweep.efficiency_percent.any()
+
+    def test_analysis_surface_is_optional(self):
+        module = BatModule()
+        kwargs = dict(
+            bat_weight_oz=30, bat_length_inches=33, bat_speed_mph=82,
+            body_kinetic_energy=514, player_height_inches=70, player_weight_lbs=185
+        )
+        plain = module.analyze_bat_optimization(**kwargs)
+        with_surface = module.analyze_bat_optimization(include_surface=True, **kwargs)
+
+        assert plain.response_surface is None
+        assert with_surface.recommended_weights == plain.recommended_weights
+        assert with_surface.exit_velo_predictions == plain.exit_velo_predictions
+        low, high = plain.optimal_weight_range_oz
+        assert low <= with_surface.response_surface['best_in_optimal_range']['bat_weight_oz'] <= high
+
+    @pytest.mark.parametrize("bat_speed, body_ke, weights", [
+        (82, 385, [29.0, 29.5, 30.0, 30.5, 31.0]),             # good efficiency: ±1 oz
+        (82, 300, [29.0, 29.5, 30.0, 30.5, 31.0, 31.5, 32.0]),  # elite: -1 to +2 oz
+        (60, 900, [28.0, 28.5, 29.0, 29.5, 30.0]),             # low: -2 oz to current
+    ])
+    def test_recommendations_come_from_the_sweep(self, bat_speed, body_ke, weights):
+        module = BatModule()
+        result = module.analyze_bat_optimization(
+            bat_weight_oz=30, bat_length_inches=33, bat_speed_mph=bat_speed, body_kinetic_energy=body_ke,
+            player_height_inches=70, player_weight_lbs=185, bat_type="end_loaded"
+        )
+        assert [rec['bat_weight_oz'] for rec in result.recommended_weights] == weights
+        assert [rec['bat_weight_oz'] for rec in result.recommended_weights if rec['is_current']] == [30.0]
+        for rec in result.recommended_weights:
+            assert rec['bat_length_inches'] == 33.0
+            moi, ke, exit_velo, efficiency = _scalar_cell(module, rec['bat_weight_oz'], 33, 30,
+                                                          bat_speed, body_ke, "end_loaded")
+            assert rec['predicted_moi_kgm2'] == moi
+            assert rec['predicted_exit_velo_mph'] == pytest.approx(exit_velo, abs=0.1 + 1e-9)
+            assert rec['predicted_efficiency_percent'] == pytest.approx(efficiency, abs=0.1 + 1e-9)
+        assert [p['bat_weight_oz'] for p in result.exit_velo_predictions] == weights
+
+    def test_off_grid_current_weight(self):
+        result = BatModule().analyze_bat_optimization(
+            bat_weight_oz=30.25, bat_length_inches=33.25, bat_speed_mph=82, body_kinetic_energy=514,
+            player_height_inches=70, player_weight_lbs=185
+        )
+        assert [rec['bat_weight_oz'] for rec in result.recommended_weights if rec['is_current']] == [30.25]
+        assert {rec['bat_length_inches'] for rec in result.recommended_weights} == {33.25}
+
+
+class TestMoiMemoization:
+    """MOI cells and whole tables are computed once"""
+
+    def test_table_is_cached_and_read_only(self):
+        weights, lengths = (28.0, 29.0, 30.0), (32.0, 33.0)
+        table = moi_table(weights, lengths, "end_loaded")
+        assert moi_table(weights, lengths, "end_loaded") is table
+        assert moi_table(weights, lengths, "balanced") is not table
+        with pytest.raises(ValueError):
+            table[0, 0] = 1.0
+
+        module = BatModule()
+        assert table[2, 1] == module.calculate_moi(30.0, 33.0, bat_type="end_loaded")
+
+    def test_calculate_moi_hits_cache(self):
+        module = BatModule()
+        module.calculate_moi(31.25, 33.75, balance_point_inches=22.5, bat_type="light")
+        hits = _moi.cache_info().hits
+        assert module.calculate_moi(31.25, 33.75, balance_point_inches=22.5, bat_type="light") == \
+            round(31.25 * 0.0283495 * (22.5 * 0.0254) ** 2 * 0.23, 4)
+        assert _moi.cache_info().hits == hits + 1
+
+    def test_warm_sweep_faster_than_scalar_loop(self):
+        module = BatModule()
+        weights = np.arange(24.0, 38.01, 0.1)
+        lengths = np.arange(28.0, 36.01, 0.1)
+        module.sweep_bat_grid(30, 33, 82, 514, weights_oz=weights, lengths_inches=lengths)
+
+        start = time.perf_counter()
+        for weight in weights:
+            for length in lengths:
+                speed = 82 - 0.5 * (weight - 30)
+                moi = round(weight * 0.0283495 * (length * 0.0254) ** 2 * 0.25, 4)
+                module.predict_exit_velocity(speed, moi)
+                module.calculate_transfer_efficiency(module.calculate_bat_kinetic_energy(speed, moi, length), 514)
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        module.sweep_bat_grid(30, 33, 82, 514, weights_oz=weights, lengths_inches=lengths)
+        sweep_time = time.perf_counter() - start
+
+        print(f"\n📊 {weights.size * lengths.size} cells: loop {loop_time * 1000:.1f} ms, "
+              f"sweep {sweep_time * 1000:.2f} ms ({loop_time / sweep_time:.0f}x)")
+        assert sweep_time * 5 < loop_time
@@ -0,0 +1,85 @@
+"""
+Nearest Benchmark Index Tests
+Precomputed lookups must return exactly what the full table scan did
+"""
+
+import math
+import random
+
+from physics_engine.benchmark_index import NearestBenchmarkIndex
+from physics_engine import kinetic_capacity_calculator_v21 as capacity_v21
+from physics_engine.exit_velocity_predictor import ExitVelocityPredictor
+
+
+def _scan_nearest(table, height, weight, k):
+    """Reference: distance to every entry, stable sort, take k"""
+    distances = [
+        (math.sqrt(((height - h) * 5) ** 2 + (weight - w) ** 2), (h, w), value)
+        for (h, w), value in table.items()
+    ]
+    distances.sort(key=lambda x: x[0])
+    return tuple(distances[:k])
+
+
+def _queries(seed=0):
+    rng = random.Random(seed)
+    grid = [(h, w) for h in range(50, 86, 1) for w in range(60, 320, 3)]
+    scattered = [(rng.uniform(50, 86), rng.uniform(60, 320)) for _ in range(3000)]
+    return grid + scattered
+
+
+class TestNearestBenchmarkIndex:
+    """Pruned height-row search vs full scan"""
+
+    def test_nearest_matches_full_scan(self):
+        index = NearestBenchmarkIndex(capacity_v21.BASELINE_TABLE)
+        for height, weight in _queries():
+            for k in (1, 4, 7):
+                assert index.nearest(height, weight, k) == \
+                    _scan_nearest(capacity_v21.BASELINE_TABLE, height, weight, k)
+
+    def test_ties_keep_table_order(self):
+        # Equidistant entries above and below the query height
+        table = {(70, 200): 'b', (68, 200): 'a', (69, 210): 'c', (69, 190): 'd'}
+        index = NearestBenchmarkIndex(table)
+        assert [value for _, _, value in index.nearest(69, 200, 4)] == ['b', 'a', 'c', 'd']
+        assert index.nearest(69, 200, 4) == _scan_nearest(table, 69, 200, 4)
+
+    def test_k_larger_than_table(self):
+        index = NearestBenchmarkIndex({(70, 200): 1.0, (72, 210): 2.0})
+        assert len(index.nearest(71, 205, 10)) == 2
+        assert index.nearest(71, 205, 0) == ()
+
+    def test_memoized(self):
+        index = NearestBenchmarkIndex(capacity_v21.BASELINE_TABLE)
+        index.interpolate(70.5, 183)
+        index.interpolate(70.5, 183)
+        assert index.interpolate.cache_info().hits == 1
+
+
+class TestPredictorsUseIndex:
+    """Both predictors return identical values through the index"""
+
+    def test_baseline_bat_speed_exact(self):
+        for height, weight in _queries(seed=1):
+            expected = capacity_v21._interpolate_baseline(height, weight, capacity_v21.BASELINE_TABLE)
+            if (height, weight) in capacity_v21.BASELINE_TABLE:
+                expected = capacity_v21.BASELINE_TABLE[(height, weight)]
+            assert capacity_v21._get_baseline_bat_speed(height, weight, 27, v21_mode=True) == expected
+
+    def test_find_nearest_benchmarks_exact(self):
+        predictor = ExitVelocityPredictor()
+        for height, weight in _queries(seed=2):
+            for k in (2, 4, 20):
+                expected = [
+                    (h, w, max_ev, avg_ev, name, distance)
+                    for distance, (h, w), (max_ev, avg_ev, name)
+                    in _scan_nearest(predictor.MLB_BENCHMARKS, height, weight, k)
+                ]
+                assert predictor.find_nearest_benchmarks(height, weight, k) == expected
+
+    def test_predict_from_bat_speed_unchanged(self):
+        result = ExitVelocityPredictor().predict_from_bat_speed(74.0, 68, 190, 'poor')
+        assert result['exit_velocity_max_mph'] == 113.6
+        assert result['exit_velocity_avg_mph'] == 96.2
+        assert result['reference_players'][0].startswith('Dustin Pedroia')
@@ -0,0 +1,139 @@
+"""
+Biomechanics Report Tests
+Compiled Jinja2 report template, streamed rendering, content-hashed
+chart assets with cache headers, and response compression
+"""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from compression import add_compression
+from physics_engine import report_generator
+from physics_engine.report_generator import ReportGenerator
+
+PLAYER = {'name': 'Eric Williams', 'age': 33, 'height_inches': 68, 'weight_lbs': 190}
+ANALYSIS = {
+    'actual_bat_speed': 57.9,
+    'potential_bat_speed': 76.0,
+    'ground_score': 72,
+    'engine_score': 85,
+    'weapon_score': 40,
+    'energy': {'lowerhalf_pct': 61, 'torso_pct': 29, 'arms_pct': 10},
+    'recommendations': {
+        'primary_component': 'WEAPON',
+        'priority': 'CRITICAL',
+        'estimated_gain_mph': 7.2,
+        'training_frequency': '5-6 days/week',
+        'drills': ['Tee work focusing on hand path', 'Barrel control exercises']
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    from biomechanics_report_routes import router
+    from physics_engine.chart_renderer import get_chart_renderer
+
+    renderer = get_chart_renderer()
+    asset_dir, renderer.asset_dir = renderer.asset_dir, str(tmp_path_factory.mktemp('chart_assets'))
+    app = FastAPI()
+    add_compression(app)
+    app.include_router(router)
+    yield TestClient(app)
+    renderer.close()
+    renderer.asset_dir = asset_dir
+
+
+class TestReportTemplate:
+    """Compiled template output"""
+
+    def test_render_contents(self):
+        html = ReportGenerator().render_html_report(PLAYER, ANALYSIS, {'gap': '/charts/abc.png'})
+        assert '<title>Eric Williams - Biomechanics Analysis Report</title>' in html
+        assert '<div class="value">18.1</div>' in html  # gap
+        assert '<img src="/charts/abc.png" alt="Gap Chart">' in html
+        assert 'alt="Radar Chart"' not in html
+        assert '+7.2 mph' in html and '<li>Barrel control exercises</li>' in html
+
+    def test_escapes_player_input_and_handles_missing_data(self):
+        html = ReportGenerator().render_html_report({'name': '<script>x</script>'}, {}, {})
+        assert '<script>x</script>' not in html and '&lt;script&gt;' in html
+        assert '<p>N/A years</p>' in html
+        assert '<h2>Recommendations</h2>' not in html
+
+    def test_compiled_once_and_streamed(self):
+        assert report_generator.get_report_template() is report_generator.get_report_template()
+
+        generator = ReportGenerator()
+        chunks = list(generator.stream_html_report(PLAYER, ANALYSIS, {'gap': '/charts/abc.png'}, buffer_size=4))
+        assert len(chunks) > 1
+        assert ''.join(chunks) == generator.render_html_report(PLAYER, ANALYSIS, {'gap': '/charts/abc.png'})
+
+
+class TestReportRoutes:
+    """Report endpoint, chart assets, compression"""
+
+    def test_report_links_cacheable_chart_assets(self, client):
+        response = client.post("/api/biomechanics-reports/html", json={'player': PLAYER, 'analysis': ANALYSIS})
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('text/html')
+        assert response.headers['content-encoding'] == 'gzip'
+        assert 'base64' not in response.text
+
+        html = response.text
+        urls = [part.split('"')[0] for part in html.split('<img src="')[1:]]
+        assert len(urls) == 4  # gap, radar, energy, composite (no sequence data)
+        assert all(url.startswith('/api/biomechanics-reports/charts/') and url.endswith('.png') for url in urls)
+
+        chart = client.get(urls[0])
+        assert chart.status_code == 200
+        assert chart.headers['content-type'] == 'image/png'
+        assert chart.headers['cache-control'] == 'public, max-age=31536000, immutable'
+        assert chart.content.startswith(b'\x89PNG')
+
+        etag = chart.headers['etag']
+        assert client.get(urls[0], headers={'If-None-Match': etag}).status_code == 304
+
+        # Served from disk once the in-memory copy is gone
+        from physics_engine.chart_renderer import get_chart_renderer
+        get_chart_renderer()._assets.clear()
+        assert client.get(urls[0]).content == chart.content
+
+        # Same input, same asset URLs (charts come from the render cache)
+        again = client.post("/api/biomechanics-reports/html", json={'player': PLAYER, 'analysis': ANALYSIS})
+        assert again.text == html
+
+    def test_svg_and_inline_reports(self, client):
+        svg = client.post("/api/biomechanics-reports/html",
+                          json={'player': PLAYER, 'analysis': ANALYSIS, 'chart_format': 'svg'})
+        url = svg.text.split('<img src="')[1].split('"')[0]
+        assert url.endswith('.svg')
+        assert client.get(url).headers['content-type'] == 'image/svg+xml'
+
+        inline = client.post("/api/biomechanics-reports/html",
+                             json={'player': PLAYER, 'analysis': ANALYSIS, 'inline_charts': True})
+        assert inline.text.count('src="data:image/png;base64,') == 4
+
+    def test_errors(self, client):
+        assert client.get("/api/biomechanics-reports/charts/0123abcd.png").status_code == 404
+        response = client.post("/api/biomechanics-reports/html",
+                               json={'player': PLAYER, 'analysis': ANALYSIS, 'chart_format': 'gif'})
+        assert response.status_code == 422
+        response = client.post("/api/biomechanics-reports/html",
+                               json={'player': PLAYER, 'analysis': {'actual_bat_speed': 'fast', 'potential_bat_speed': 76}})
+        assert response.status_code == 422
+
+        # Charts the data doesn't cover are left out (no composite without player details)
+        response = client.post("/api/biomechanics-reports/html", json={'player': {'name': 'A'}, 'analysis': ANALYSIS})
+        assert response.status_code == 200
+        assert 'alt="Radar Chart"' in response.text and 'alt="Composite Report"' not in response.text
+
+    def test_uncompressed_for_clients_without_gzip(self, client):
+        response = client.post("/api/biomechanics-reports/html", json={'player': PLAYER, 'analysis': ANALYSIS},
+                               headers={'Accept-Encoding': 'identity'})
+        assert 'content-encoding' not in response.headers
+        assert response.text.startswith('<!DOCTYPE html>')
+        assert len(gzip.compress(response.content)) < len(response.content) / 3
@@ -0,0 +1,164 @@
+"""
+Chart Render Service Tests
+In-memory PNG / SVG rendering with reused figure templates, the render
+cache, the process pool and the HTML report built without disk files
+"""
+
+import asyncio
+import os
+import time
+
+import numpy as np
+import pytest
+
+from physics_engine import chart_renderer
+from physics_engine.chart_renderer import ChartRenderer, chart_cache_key, render_chart, report_chart_data
+from physics_engine.report_generator import ReportGenerator
+from physics_engine.visualizations import BiomechanicsVisualizer
+
+PLAYER = {'name': 'Eric Williams', 'age': 33, 'height_inches': 68, 'weight_lbs': 190}
+ANALYSIS = {
+    'actual_bat_speed': 57.9,
+    'potential_bat_speed': 76.0,
+    'ground_score': 72,
+    'engine_score': 85,
+    'weapon_score': 40,
+    'sequence': {'pelvis_ms': 150, 'torso_ms': 100, 'arm_ms': 50, 'hand_ms': 10, 'contact_ms': 0},
+    'energy': {'lowerhalf_pct': 61, 'torso_pct': 29, 'arms_pct': 10},
+    'recommendations': {'primary_component': 'WEAPON', 'estimated_gain_mph': 7.2,
+                        'priority': 'CRITICAL', 'training_frequency': '5-6 days/week'}
+}
+GAP = {'actual_bat_speed': 57.9, 'potential_bat_speed': 76.0}
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+class TestRenderChart:
+    """Rendering into buffers with reused figures"""
+
+    def test_png_matches_file_output(self, tmp_path):
+        path = str(tmp_path / 'gap.png')
+        BiomechanicsVisualizer().generate_gap_chart(57.9, 76.0, path)
+        with open(path, 'rb') as f:
+            from_disk = f.read()
+
+        image = render_chart('gap', GAP)
+        assert image.startswith(PNG_SIGNATURE)
+        assert image == from_disk
+        # The reused template gives the same image on the next render
+        assert render_chart('gap', GAP) == image
+
+    def test_every_kind_as_svg(self):
+        charts = report_chart_data(PLAYER, ANALYSIS)
+        assert set(charts) == set(chart_renderer.CHART_KINDS)
+        for kind, data in charts.items():
+            image = render_chart(kind, data, 'svg')
+            assert b'<svg' in image[:1000]
+            assert render_chart(kind, data, 'svg') == image  # deterministic, so cacheable downstream
+
+    def test_templates_are_reused(self):
+        render_chart('radar', {'ground_score': 72, 'engine_score': 85, 'weapon_score': 40})
+        template = chart_renderer._templates['radar']
+        render_chart('radar', {'ground_score': 10, 'engine_score': 20, 'weapon_score': 30})
+        assert chart_renderer._templates['radar'] is template
+        assert template.axes == []  # cleared after rendering
+
+    def test_bad_requests(self):
+        with pytest.raises(ValueError):
+            render_chart('histogram', GAP)
+        with pytest.raises(ValueError):
+            render_chart('gap', GAP, 'gif')
+
+
+class TestChartRenderer:
+    """Cache, process pool and report integration"""
+
+    def test_cache_hits_and_eviction(self):
+        renderer = ChartRenderer(max_entries=2)
+        first = renderer.render('gap', GAP)
+        assert renderer.render('gap', dict(GAP)) is first
+        renderer.render('gap', GAP, 'svg')
+        renderer.render('gap', {'actual_bat_speed': 60.0, 'potential_bat_speed': 76.0})
+
+        stats = renderer.stats()
+        assert (stats['hits'], stats['misses'], stats['entries']) == (1, 3, 2)
+        assert renderer.render('gap', GAP) == first  # evicted, rendered again
+        assert renderer.stats()['misses'] == 4
+
+    def test_cache_key_accepts_numpy(self):
+        numpy_data = {'actual_bat_speed': np.float64(57.9), 'potential_bat_speed': np.float32(76.0)}
+        assert chart_cache_key('gap', numpy_data) == chart_cache_key('gap', GAP)
+        assert chart_cache_key('gap', GAP, 'svg') != chart_cache_key('gap', GAP)
+
+    def test_async_renders_in_pool_and_coalesces(self):
+        renderer = ChartRenderer(max_workers=1)
+
+        async def run():
+            return await asyncio.gather(*(renderer.render_async('gap', GAP) for _ in range(4)))
+
+        try:
+            images = asyncio.run(run())
+            assert all(image == images[0] for image in images)
+            assert images[0] == render_chart('gap', GAP)
+            stats = renderer.stats()
+            assert (stats['misses'], stats['coalesced'], stats['inflight']) == (1, 3, 0)
+
+            svg = asyncio.run(renderer.report_charts_async(PLAYER, ANALYSIS, fmt='svg'))
+            assert set(svg) == set(chart_renderer.CHART_KINDS)
+            assert all(uri.startswith('data:image/svg+xml;base64,') for uri in svg.values())
+        finally:
+            renderer.close()
+
+    def test_published_assets_persist(self, tmp_path):
+        image = render_chart('gap', GAP)
+        name = ChartRenderer(asset_dir=str(tmp_path)).publish(image)
+        assert os.listdir(tmp_path) == [name]
+
+        # Another worker (or this one after a restart / LRU eviction) reads it back
+        other = ChartRenderer(max_entries=1, asset_dir=str(tmp_path))
+        assert other.asset(name) == (image, 'image/png')
+        other.publish(render_chart('gap', GAP, 'svg'), 'svg')
+        assert other.stats()['assets'] == 1
+        assert other.asset(name) == (image, 'image/png')
+
+        assert other.asset('0123456789abcdef01234567.png') is None
+        assert other.asset('../' + name) is None
+        assert ChartRenderer(asset_dir=None).asset(name) is None
+
+    def test_asset_sweep_bounds_age_and_size(self, tmp_path):
+        renderer = ChartRenderer(asset_dir=str(tmp_path))
+        images = [render_chart('gap', {'actual_bat_speed': 50.0 + i, 'potential_bat_speed': 76.0}) for i in range(4)]
+        names = [renderer.publish(image) for image in images]
+        now = time.time()
+        for age, name in zip((7200, 300, 200, 100), names):
+            os.utime(tmp_path / name, (now - age, now - age))
+        (tmp_path / 'notes.txt').write_text('kept')
+
+        renderer.asset_ttl_seconds = 3600
+        renderer.asset_max_bytes = len(images[2]) + len(images[3])
+        assert renderer.cleanup_assets() == 2  # expired, then the least recently used
+        assert sorted(os.listdir(tmp_path)) == sorted(['notes.txt'] + names[2:])
+
+        # Reading an asset back from disk keeps it in use
+        other = ChartRenderer(asset_dir=str(tmp_path))
+        assert other.asset(names[2]) is not None
+        assert os.path.getmtime(tmp_path / names[2]) >= now - 1
+
+        # Publishing past a tenth of the cap sweeps without waiting for the interval
+        renderer.asset_max_bytes = len(images[0]) * 2
+        renderer.publish(images[0])
+        assert len([n for n in os.listdir(tmp_path) if n.endswith('.png')]) <= 2
+
+    def test_html_report_without_files(self, tmp_path, monkeypatch):
+        charts = ChartRenderer().report_charts(PLAYER, ANALYSIS)
+        monkeypatch.chdir(tmp_path)
+
+        html = ReportGenerator().render_html_report(PLAYER, ANALYSIS, charts)
+        assert html.count('src="data:image/png;base64,') == 5
+        assert os.listdir(tmp_path) == []
+
+        # generate_html_report accepts rendered charts as well as paths
+        output = str(tmp_path / 'report.html')
+        ReportGenerator().generate_html_report(PLAYER, ANALYSIS, charts, output)
+        with open(output, encoding='utf-8') as f:
+            assert f.read() == html
@@ -0,0 +1,196 @@
+"""
+Coach Rick Response Cache Tests
+Semantic-key caching, single-flight coalescing and the latency budget,
+against a local stub of the chat completions endpoint
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from coach_rick.conversational_ai import ConversationalAI
+from coach_rick.response_cache import ResponseCache, bucket, semantic_key
+from stage_metrics import STAGE_ERRORS, STAGE_SECONDS
+
+PATTERNS = [{"pattern_id": "spinner_lead_arm_bent", "name": "Lead arm bent",
+             "description": "Lead arm stays bent through contact"}]
+
+
+class StubCompletions:
+    """Local HTTP server answering like /v1/chat/completions"""
+
+    def __init__(self, delay: float = 0.0, status: int = 200):
+        self.delay = delay
+        self.status = status
+        self.calls = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.calls += 1
+                time.sleep(stub.delay)
+                prompt = body["messages"][-1]["content"]
+                name = "Eric Williams" if "Eric Williams" in prompt else "the player"
+                payload = json.dumps({"choices": [{"message": {
+                    "content": f"  Nice work, {name}! Eric, keep that lead arm long. (call {stub.calls})  "
+                }}]}).encode()
+                self.send_response(stub.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/v1/chat/completions"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _coach(stub, **kwargs) -> ConversationalAI:
+    coach = ConversationalAI(api_key="test-key", **kwargs)
+    coach.api_url = stub.url
+    return coach
+
+
+def _analysis(coach, name="Eric Williams", bat_speed=82.4):
+    return coach.generate_analysis_message(
+        player_name=name, motor_profile="Spinner", confidence=85.0, patterns=PATTERNS,
+        metrics={"bat_speed_mph": bat_speed, "exit_velocity_mph": 99, "efficiency_percent": 111}
+    )
+
+
+class TestResponseCache:
+    """TTL, size bound and keys"""
+
+    def test_ttl_and_lru_bound(self):
+        now = [0.0]
+        cache = ResponseCache(ttl_seconds=10, max_entries=2, clock=lambda: now[0])
+        cache.put("a", "A")
+        cache.put("b", "B")
+        assert cache.get("a") == "A"  # a is now most recent
+        cache.put("c", "C")
+        assert cache.get("b") is None and cache.get("a") == "A" and len(cache) == 2
+
+        now[0] = 10.0
+        assert cache.get("a") is None
+
+    def test_buckets_and_keys(self):
+        assert bucket(82.4, 2) == bucket(83.9, 2) == 82
+        assert bucket(84.0, 2) == 84
+        assert bucket("N/A", 2) == "N/A"
+        assert semantic_key("t", a=1, b=2) == semantic_key("t", b=2, a=1)
+        assert semantic_key("t", a=1) != semantic_key("u", a=1)
+
+
+class TestSyncCaching:
+    """Blocking path caches by semantic key"""
+
+    def test_bucketed_metrics_share_one_call(self):
+        with StubCompletions() as stub:
+            coach = _coach(stub)
+            first = _analysis(coach, bat_speed=82.4)
+            second = _analysis(coach, bat_speed=83.1)
+            other = _analysis(coach, bat_speed=90.0)
+        assert stub.calls == 2
+        assert first.content == second.content == "Nice work, Eric Williams! Eric, keep that lead arm long. (call 1)"
+        assert other.content.endswith("(call 2)")
+
+    def test_prompt_uses_the_key_buckets(self):
+        coach = ConversationalAI(api_key="test-key")
+        metrics = {"exit_velocity_mph": 99, "efficiency_percent": 111}
+        first = coach._build_analysis_prompt("Eric Williams", "Spinner", 85.0, PATTERNS,
+                                             dict(metrics, bat_speed_mph=82.4))
+        second = coach._build_analysis_prompt("Eric Williams", "Spinner", 81.0, PATTERNS,
+                                              dict(metrics, bat_speed_mph=83.9))
+        assert first == second
+        assert "82-84 mph" in first and "98-100 mph" in first and "110-115%" in first
+        assert "80-90%" in first and "82.4" not in first and "85.0" not in first
+
+    def test_cached_message_is_repersonalized(self):
+        with StubCompletions() as stub:
+            coach = _coach(stub)
+            _analysis(coach, name="Eric Williams")
+            message = _analysis(coach, name="Sam Jones")
+        assert stub.calls == 1
+        assert message.content == "Nice work, Sam Jones! Sam, keep that lead arm long. (call 1)"
+
+    def test_errors_fall_back_and_are_not_cached(self):
+        with StubCompletions(status=500) as stub:
+            coach = _coach(stub)
+            message = _analysis(coach)
+            assert "Spinner" in message.content
+            _analysis(coach)
+        assert stub.calls == 2
+        assert len(coach.cache) == 0
+
+    def test_api_calls_are_timed(self):
+        calls, errors = STAGE_SECONDS.count("http.openai"), STAGE_ERRORS.value("http.openai")
+        with StubCompletions() as stub:
+            _analysis(_coach(stub))
+        with StubCompletions(status=500) as stub:
+            _analysis(_coach(stub))
+        assert STAGE_SECONDS.count("http.openai") == calls + 2
+        assert STAGE_ERRORS.value("http.openai") == errors + 1
+
+    def test_no_api_key_uses_templates(self):
+        coach = ConversationalAI(api_key="your-openai-key-here")
+        assert "Spinner" in _analysis(coach).content
+        assert coach.cache.stats["misses"] == 0
+
+
+class TestAsyncPath:
+    """Pooled async client, single-flight and the latency budget"""
+
+    def test_identical_prompts_coalesce(self):
+        with StubCompletions(delay=0.2) as stub:
+            coach = _coach(stub)
+
+            async def burst():
+                messages = await asyncio.gather(*[
+                    coach.generate_encouragement_async("Eric Williams", "general") for _ in range(10)
+                ])
+                await coach.aclose()
+                return messages
+
+            messages = asyncio.run(burst())
+        assert stub.calls == 1
+        assert coach.cache.stats["coalesced"] == 9
+        assert {m.content for m in messages} == {"Nice work, Eric Williams! Eric, keep that lead arm long. (call 1)"}
+
+    def test_latency_budget_falls_back_then_cache_fills(self):
+        with StubCompletions(delay=0.5) as stub:
+            coach = _coach(stub, latency_budget_seconds=0.05)
+
+            async def scenario():
+                start = time.perf_counter()
+                slow = await coach.generate_drill_introduction_async(
+                    "Eric Williams", "Lead arm bent", "Rope Swings", "+3 mph"
+                )
+                waited = time.perf_counter() - start
+                await asyncio.sleep(0.7)  # the call finishes in the background
+                cached = await coach.generate_drill_introduction_async(
+                    "Sam Jones", "Lead arm bent", "Rope Swings", "+3 mph"
+                )
+                await coach.aclose()
+                return slow, waited, cached
+
+            slow, waited, cached = asyncio.run(scenario())
+        assert waited < 0.3
+        assert slow.content == coach._generate_fallback_message("drill prescription")
+        assert cached.content == "Nice work, Sam Jones! Sam, keep that lead arm long. (call 1)"
+        assert stub.calls == 1
@@ -0,0 +1,182 @@
+"""
+Cohort Percentile Tests
+Empirical per-age-group CDFs, incremental refresh and the batched
+ProfileComparison roster / leaderboard calls
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from conftest import training_session
+from physics_engine.cohort_percentiles import CohortPercentileEngine, age_groups_for
+from physics_engine.profile_comparisons import ProfileComparison
+from progress_session_store import SqlProgressSessionStore
+
+
+class TestCohortPercentileEngine:
+    """Grid lookups against the empirical CDF"""
+
+    def test_age_groups_match_scalar(self):
+        comparison = ProfileComparison()
+        ages = [9, 13, 13.5, 14, 18, 19, 23, 24, 35, 41]
+        assert list(age_groups_for(ages)) == [comparison._determine_age_group(a) for a in ages]
+
+    def test_percentiles_track_ecdf(self):
+        rng = np.random.default_rng(0)
+        samples = rng.normal(65, 5, 20000)
+        engine = CohortPercentileEngine()
+        engine.add_observations('high_school', 'bat_speed_mph', samples)
+        engine.refresh()
+
+        queries = np.linspace(45, 85, 200)
+        ecdf = np.searchsorted(np.sort(samples), queries, side='right') / samples.size * 100
+        assert np.max(np.abs(engine.percentiles('high_school', 'bat_speed_mph', queries) - ecdf)) < 0.5
+        assert engine.percentiles('high_school', 'bat_speed_mph', [-1, 1000]).tolist() == [0.0, 100.0]
+        with pytest.raises(KeyError):
+            engine.percentiles('youth', 'bat_speed_mph', [50])
+
+    def test_incremental_refresh_matches_full_build(self):
+        rng = np.random.default_rng(1)
+        first, second = rng.normal(70, 4, 500), rng.normal(72, 4, 300)
+
+        incremental = CohortPercentileEngine()
+        incremental.add_observations('adult', 'bat_speed_mph', first)
+        incremental.add_observations('adult', 'ground_score', first)
+        incremental.refresh()
+        incremental.add_observations('adult', 'bat_speed_mph', second)
+        assert incremental.refresh() == [('adult', 'bat_speed_mph')]  # untouched cohorts kept
+
+        full = CohortPercentileEngine()
+        full.add_observations('adult', 'bat_speed_mph', np.concatenate([second, first]))
+        full.refresh()
+        np.testing.assert_array_equal(incremental.quantiles('adult', 'bat_speed_mph'),
+                                      full.quantiles('adult', 'bat_speed_mph'))
+        assert incremental.sample_count('adult', 'ground_score') == 500
+
+    def test_sync_from_store(self, db_engine):
+        from physics_engine.progress_tracker import ProgressTracker
+        store = SqlProgressSessionStore(sessionmaker(bind=db_engine))
+        tracker = ProgressTracker(store=store)
+        rng = random.Random(3)
+        for i in range(60):
+            age = rng.choice([15, 16, 30])
+            tracker.add_session(training_session(f"a{i}", i, rng.uniform(55, 80), rng.randint(40, 90), age=age))
+
+        engine = CohortPercentileEngine()
+        assert engine.sync_from_store(store) == 60
+        tracker.add_session(training_session("a60", 60, None, 70, age=16))  # no measured bat speed
+        assert engine.sync_from_store(store) == 1
+        assert engine.sync_from_store(store) == 0
+        high_school = engine.sample_count('high_school', 'ground_score')
+        assert high_school + engine.sample_count('adult', 'ground_score') == 61
+        assert engine.sample_count('high_school', 'bat_speed_mph') == high_school - 1
+        assert engine.refresh_if_due(store, max_age_seconds=3600) is False
+
+
+class TestProfileComparisonBatch:
+    """Roster-wide percentiles in one call"""
+
+    def test_benchmark_batch_matches_scalar(self):
+        comparison = ProfileComparison()
+        rng = random.Random(4)
+        ages = [rng.randint(9, 40) for _ in range(2000)]
+        metrics = {
+            'bat_speed_mph': [rng.uniform(30, 95) for _ in ages],
+            'weapon_score': [rng.uniform(0, 100) for _ in ages],
+            'not_a_metric': [1.0 for _ in ages],
+        }
+        batch = comparison.roster_percentiles(ages, metrics)
+        for metric in ('bat_speed_mph', 'weapon_score'):
+            expected = [
+                comparison.compare_metric(metric, value, comparison._determine_age_group(age))['percentile']
+                for age, value in zip(ages, metrics[metric])
+            ]
+            assert batch[metric].tolist() == expected
+        assert set(batch['not_a_metric'].tolist()) == {50}
+
+    def test_cohort_used_when_large_enough(self):
+        engine = CohortPercentileEngine(min_samples=100)
+        engine.add_observations('high_school', 'bat_speed_mph', np.linspace(50, 70, 1001))
+        engine.add_observations('adult', 'bat_speed_mph', np.linspace(60, 80, 50))
+        engine.refresh()
+        comparison = ProfileComparison(cohort_engine=engine)
+
+        result = comparison.compare_metric('bat_speed_mph', 60.0, 'high_school')
+        assert (result['percentile'], result['percentile_source']) == (50, 'cohort')
+        assert result['rating'] == 'AVERAGE'
+        small = comparison.compare_metric('bat_speed_mph', 76.0, 'adult')
+        assert (small['percentile'], small['percentile_source']) == (74, 'benchmark')
+
+        batch = comparison.roster_percentiles([16, 33], {'bat_speed_mph': [60.0, 76.0]})
+        assert batch['bat_speed_mph'].tolist() == [50, 74]
+
+    def test_leaderboard(self):
+        comparison = ProfileComparison()
+        board = comparison.leaderboard(['eric', 'connor', 'kyle', 'jake'], [33, 16, 28, 16],
+                                       'bat_speed_mph', [76.0, 57.5, 82.0, 66.0], limit=3)
+        # eric and jake tie on percentile (74); the higher raw value ranks first
+        assert [row['player_id'] for row in board] == ['kyle', 'eric', 'jake']
+        assert [row['rank'] for row in board] == [1, 2, 3]
+        assert board[2] == {'rank': 3, 'player_id': 'jake', 'age_group': 'high_school',
+                            'value': 66.0, 'percentile': 74}
+
+    def test_updated_sessions_replace_old_values(self):
+        engine = CohortPercentileEngine(min_samples=1)
+        first, second = training_session("a0", 0, 60.0, 50, age=16), training_session("a1", 1, 60.0, 55, age=16)
+        assert engine.ingest_sessions([first, second]) == 2
+        engine.refresh()
+        assert engine.ingest_sessions([training_session("a0", 0, 60.0, 50, age=16)]) == 0  # unchanged
+        assert engine.ingest_sessions([training_session("a0", 0, 70.0, 50, age=16)]) == 1
+        engine.refresh()
+        assert engine.sample_count('high_school', 'bat_speed_mph') == 2
+        assert engine.quantiles('high_school', 'bat_speed_mph')[[0, -1]].tolist() == [60.0, 70.0]
+
+        # Age group change moves the session to its new cohort
+        engine.ingest_sessions([training_session("a1", 1, 60.0, 55, age=30)])
+        engine.refresh()
+        assert engine.sample_count('high_school', 'ground_score') == 1
+        assert engine.sample_count('adult', 'ground_score') == 1
+        assert engine.quantiles('high_school', 'ground_score').tolist() == [50.0] * 101
+
+
+class TestSharedComparison:
+    """Production comparison synced from the progress session store"""
+
+    def test_refresh_and_team_leaderboard(self, db_engine, monkeypatch):
+        from physics_engine import profile_comparisons, progress_tracker
+        from physics_engine.progress_tracker import ProgressTracker
+        from physics_engine.team_management import TeamManagementSystem
+
+        tracker = ProgressTracker(store=SqlProgressSessionStore(sessionmaker(bind=db_engine)))
+        monkeypatch.setattr(progress_tracker, "_progress_tracker_instance", tracker)
+        monkeypatch.setattr(profile_comparisons, "_profile_comparison", None)
+
+        system = TeamManagementSystem()
+        coach_id = system.create_coach({'name': 'Coach', 'email': 'c@example.com', 'organization': 'THS'})
+        team_id = system.create_team({'name': 'Varsity', 'coach_id': coach_id, 'season': '2025 Spring'})
+        athlete_ids = [system.add_athlete({
+            'name': name, 'email': f"{name}@example.com", 'team_id': team_id,
+            'date_of_birth': datetime.now() - timedelta(days=16 * 365), 'height_inches': 70, 'wingspan_inches': 72,
+            'weight_lbs': 185, 'bat_weight_oz': 31
+        }) for name in ('eric', 'connor', 'kyle')]
+        for i, (athlete_id, bat_speed) in enumerate(zip(athlete_ids, [64.0, None, 71.0])):
+            tracker.add_session(training_session(athlete_id, i, bat_speed, 60, age=16))
+        rng = random.Random(5)
+        for i in range(3, 40):
+            tracker.add_session(training_session(f"a{i}", i, rng.uniform(55, 75), 60, age=16))
+
+        assert profile_comparisons.refresh_profile_cohorts(max_age_seconds=0) is True
+        engine = profile_comparisons.get_profile_comparison().cohort_engine
+        assert engine.has_cohort('high_school', 'bat_speed_mph')
+        assert profile_comparisons.refresh_profile_cohorts() is False  # not due yet
+
+        board = system.team_leaderboard(team_id, 'bat_speed')
+        assert [row['name'] for row in board] == ['kyle', 'eric']  # connor has no bat speed
+        assert board[0]['percentile'] == int(np.clip(np.rint(
+            engine.percentiles('high_school', 'bat_speed_mph', [71.0])[0]), 1, 99))
+        with pytest.raises(ValueError):
+            system.team_leaderboard(team_id, 'exit_velocity')
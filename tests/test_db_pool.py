@@ -0,0 +1,146 @@
+"""
+Database Pool Configuration & Instrumentation Tests
+"""
+
+import pytest
+import os
+import tempfile
+
+from sqlalchemy import create_engine, text, exc
+
+import database
+from database import get_pool_config, install_idle_pre_ping
+from db_pool_metrics import PoolMetrics, PoolMetricsRegistry, InstrumentedQueuePool, instrument_pool
+
+
+@pytest.fixture
+def sqlite_path():
+    tmpdir = tempfile.mkdtemp()
+    path = os.path.join(tmpdir, "pool.db")
+    yield path
+    if os.path.exists(path):
+        os.remove(path)
+    os.rmdir(tmpdir)
+
+
+def _engine(path, **pool_options):
+    engine = create_engine(f"sqlite:///{path}", poolclass=InstrumentedQueuePool, **pool_options)
+    metrics = instrument_pool(engine.pool, PoolMetrics("test"))
+    return engine, metrics
+
+
+class TestPoolConfig:
+    """Pool settings come from the environment"""
+
+    def test_defaults(self, monkeypatch):
+        for name in ("DB_POOL_SIZE", "DB_MAX_OVERFLOW", "DB_POOL_TIMEOUT", "DB_POOL_RECYCLE",
+                     "DB_POOL_PRE_PING", "DB_POOL_PRE_PING_IDLE_SECONDS"):
+            monkeypatch.delenv(name, raising=False)
+
+        config = get_pool_config()
+        assert config == {
+            "pool_size": 5,
+            "max_overflow": 10,
+            "pool_timeout": 30,
+            "pool_recycle": 1800,
+            "pre_ping": "idle",
+            "pre_ping_idle_seconds": 30
+        }
+
+    def test_env_overrides(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_SIZE", "2")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+        monkeypatch.setenv("DB_POOL_RECYCLE", "-1")
+        monkeypatch.setenv("DB_POOL_PRE_PING", "ALWAYS")
+
+        config = get_pool_config()
+        assert config["pool_size"] == 2
+        assert config["max_overflow"] == 0
+        assert config["pool_recycle"] == -1
+        assert config["pre_ping"] == "always"
+        assert database._engine_options(config)["pool_pre_ping"] is True
+
+    def test_invalid_values_fall_back(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_SIZE", "lots")
+        monkeypatch.setenv("DB_POOL_PRE_PING", "sometimes")
+
+        config = get_pool_config()
+        assert config["pool_size"] == 5
+        assert config["pre_ping"] == "idle"
+
+    def test_module_engine_is_instrumented(self):
+        assert isinstance(database.engine.pool, InstrumentedQueuePool)
+        assert "sync" in database.pool_metrics.snapshot()
+
+
+class TestPoolMetrics:
+    """Pool event instrumentation"""
+
+    def test_checkout_counts_and_wait(self, sqlite_path):
+        engine, metrics = _engine(sqlite_path, pool_size=2, max_overflow=0)
+        for _ in range(3):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                assert metrics.snapshot()["in_use"] == 1
+
+        snap = metrics.snapshot()
+        assert snap["checkouts"] == 3
+        assert snap["in_use"] == 0
+        assert snap["peak_in_use"] == 1
+        assert snap["connections_opened"] == 1
+        assert snap["checkout_wait_ms"]["max"] >= snap["checkout_wait_ms"]["p50"] >= 0
+        assert snap["connection_age_seconds"]["open"] == 1
+        assert snap["pool_size"] == 2
+        engine.dispose()
+
+    def test_overflow_and_timeout(self, sqlite_path):
+        engine, metrics = _engine(sqlite_path, pool_size=1, max_overflow=1, pool_timeout=0.05)
+        first = engine.connect()
+        second = engine.connect()  # overflow connection
+
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+        snap = metrics.snapshot()
+        assert snap["in_use"] == 2
+        assert snap["overflow_checkouts"] == 1
+        assert snap["checkout_timeouts"] == 1
+        assert snap["current_overflow"] == 1
+        assert snap["checkout_wait_ms"]["max"] >= 50
+
+        second.close()
+        first.close()
+        assert metrics.snapshot()["in_use"] == 0
+        engine.dispose()
+        assert metrics.snapshot()["connection_age_seconds"]["open"] == 0
+
+    def test_idle_pre_ping_only_after_idle(self, sqlite_path):
+        engine, metrics = _engine(sqlite_path, pool_size=1, max_overflow=0)
+        install_idle_pre_ping(engine.pool, idle_seconds=3600, metrics=metrics)
+        for _ in range(3):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        assert metrics.snapshot()["pre_pings"] == 0
+        engine.dispose()
+
+        engine, metrics = _engine(sqlite_path, pool_size=1, max_overflow=0)
+        install_idle_pre_ping(engine.pool, idle_seconds=0, metrics=metrics)
+        for _ in range(3):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        # First checkout is a fresh connection; the next two were idle >= 0s
+        assert metrics.snapshot()["pre_pings"] == 2
+        engine.dispose()
+
+    def test_registry_snapshot(self, sqlite_path):
+        registry = PoolMetricsRegistry()
+        engine = create_engine(f"sqlite:///{sqlite_path}", poolclass=InstrumentedQueuePool)
+        registry.register("primary", engine.pool)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        snapshot = registry.snapshot()
+        assert list(snapshot) == ["primary"]
+        assert snapshot["primary"]["checkouts"] == 1
+        assert registry.get("primary") is not None
+        engine.dispose()
@@ -0,0 +1,168 @@
+"""
+Columnar Frame Store Tests
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+
+from models import Player, Session as SessionModel, BiomechanicsData, SessionFrameChannel
+from frame_store import (
+    extract_channels, pack_session_frames, get_channel_manifest,
+    load_session_channels, load_session_matrix, backfill_frame_channels
+)
+from sync_service import RebootMotionSync
+
+
+def _frame(i, start=datetime(2025, 1, 1, 12)):
+    return BiomechanicsData(
+        session_id=1,
+        frame_number=i,
+        timestamp=start + timedelta(milliseconds=10 * i),
+        joint_angles={"pelvis_rot": 10.0 + i, "torso_rot": 20.0 + i, "label": "text"},
+        joint_positions={"left_wrist": [0.1 * i, 1.0, 2.0]},
+        joint_velocities={"bat": {"speed": 30.0 * i}} if i % 2 == 0 else {}
+    )
+
+
+@pytest.fixture
+def session_with_frames(db_session):
+    player = Player(org_player_id="org_1")
+    db_session.add(player)
+    db_session.flush()
+    session = SessionModel(session_id="s1", player_id=player.id)
+    db_session.add(session)
+    db_session.flush()
+    for i in range(6):
+        db_session.add(_frame(i))
+    db_session.commit()
+    return session.id
+
+
+class TestExtractChannels:
+    """JSON frames -> float32 channel arrays"""
+
+    def test_flattens_numeric_leaves(self):
+        channels = extract_channels([_frame(i) for i in range(4)])
+
+        assert channels["frame_number"].tolist() == [0, 1, 2, 3]
+        np.testing.assert_allclose(channels["time_s"], [0.0, 0.01, 0.02, 0.03], rtol=1e-5)
+        np.testing.assert_allclose(channels["joint_angles.pelvis_rot"], [10, 11, 12, 13])
+        np.testing.assert_allclose(channels["joint_positions.left_wrist.0"], [0.0, 0.1, 0.2, 0.3], rtol=1e-6)
+        assert "joint_angles.label" not in channels
+        assert all(values.dtype == np.float32 for values in channels.values())
+
+    def test_missing_samples_are_nan(self):
+        speed = extract_channels([_frame(i) for i in range(4)])["joint_velocities.bat.speed"]
+        assert speed[0] == 0.0 and speed[2] == 60.0
+        assert np.isnan(speed[1]) and np.isnan(speed[3])
+
+    def test_empty(self):
+        assert extract_channels([]) == {}
+
+
+class TestFrameStore:
+    """Packing, manifest and selective loads"""
+
+    def test_pack_and_manifest(self, db_session, session_with_frames):
+        count = pack_session_frames(db_session, session_with_frames)
+        db_session.commit()
+
+        manifest = get_channel_manifest(db_session, session_with_frames)
+        names = [m["channel"] for m in manifest]
+        assert len(manifest) == count
+        assert "joint_angles.pelvis_rot" in names and "time_s" in names
+        assert all(m["frame_count"] == 6 and m["dtype"] == "<f4" for m in manifest)
+
+    def test_load_selected_channels_only(self, db_session, session_with_frames, count_queries):
+        pack_session_frames(db_session, session_with_frames)
+        db_session.commit()
+
+        wanted = ["joint_angles.torso_rot", "time_s", "not_a_channel"]
+        with count_queries() as counter:
+            channels = load_session_channels(db_session, session_with_frames, wanted)
+
+        assert counter.count == 1
+        assert list(channels) == ["joint_angles.torso_rot", "time_s"]
+        np.testing.assert_allclose(channels["joint_angles.torso_rot"], [20, 21, 22, 23, 24, 25])
+        assert not channels["time_s"].flags.writeable  # zero-copy view over stored bytes
+
+    def test_load_by_prefix_and_matrix(self, db_session, session_with_frames):
+        pack_session_frames(db_session, session_with_frames)
+        db_session.commit()
+
+        angles = load_session_channels(db_session, session_with_frames, prefix="joint_angles.")
+        assert list(angles) == ["joint_angles.pelvis_rot", "joint_angles.torso_rot"]
+
+        matrix = load_session_matrix(db_session, session_with_frames, ["frame_number", "joint_angles.pelvis_rot"])
+        assert matrix.shape == (6, 2)
+        assert matrix[5].tolist() == [5.0, 15.0]
+
+        with pytest.raises(KeyError):
+            load_session_matrix(db_session, session_with_frames, ["nope"])
+
+    def test_repack_replaces_channels(self, db_session, session_with_frames):
+        pack_session_frames(db_session, session_with_frames)
+        db_session.commit()
+        pack_session_frames(db_session, session_with_frames, frames=[_frame(0), _frame(1)])
+        db_session.commit()
+
+        manifest = get_channel_manifest(db_session, session_with_frames)
+        assert all(m["frame_count"] == 2 for m in manifest)
+        assert db_session.query(SessionFrameChannel).filter_by(channel="frame_number").count() == 1
+
+    def test_backfill(self, db_session, session_with_frames):
+        assert backfill_frame_channels(db_session) == 1
+        assert backfill_frame_channels(db_session) == 0
+        assert get_channel_manifest(db_session, session_with_frames)
+
+
+class TestSyncPacksChannels:
+    """Biomechanics sync writes the columnar copy alongside the JSON rows"""
+
+    def test_process_biomechanics_packs_session(self, db_session):
+        player = Player(org_player_id="org_1")
+        db_session.add(player)
+        db_session.flush()
+        session = SessionModel(session_id="s1", player_id=player.id, movement_type_id=1)
+        db_session.add(session)
+        db_session.commit()
+
+        sync = RebootMotionSync(username="test", password="test")
+        created = sync._process_biomechanics_data(db_session, session, {"movements": [
+            {"joint_angles": {"pelvis_rot": 1.0}},
+            {"joint_angles": {"pelvis_rot": 2.0}},
+        ]})
+        db_session.commit()
+
+        assert created == 2
+        channels = load_session_channels(db_session, session.id, ["joint_angles.pelvis_rot"])
+        assert channels["joint_angles.pelvis_rot"].tolist() == [1.0, 2.0]
+
+    def test_pack_failure_keeps_frames(self, db_session, monkeypatch):
+        import sync_service
+
+        def failing_pack(db, session_id, frames=None):
+            db.add(SessionFrameChannel(session_id=session_id, channel="partial", dtype="<f4",
+                                       frame_count=0, data=b""))
+            db.flush()
+            raise RuntimeError("pack failed")
+
+        monkeypatch.setattr(sync_service, "pack_session_frames", failing_pack)
+        player = Player(org_player_id="org_1")
+        db_session.add(player)
+        db_session.flush()
+        session = SessionModel(session_id="s1", player_id=player.id, movement_type_id=1)
+        db_session.add(session)
+        db_session.commit()
+
+        sync = RebootMotionSync(username="test", password="test")
+        created = sync._process_biomechanics_data(db_session, session, {"movements": [
+            {"joint_angles": {"pelvis_rot": 1.0}},
+            {"joint_angles": {"pelvis_rot": 2.0}},
+        ]})
+        db_session.commit()
+
+        assert created == 2
+        assert db_session.query(BiomechanicsData).filter_by(session_id=session.id).count() == 2
+        assert db_session.query(SessionFrameChannel).filter_by(session_id=session.id).count() == 0
@@ -0,0 +1,118 @@
+"""
+Kinetic Capacity V2.1 Batch Tests
+Vectorized roster scoring must match the scalar calculator
+"""
+
+import pytest
+import time
+import numpy as np
+import pandas as pd
+
+from physics_engine.kinetic_capacity_calculator_v21 import (
+    calculate_energy_capacity_v21,
+    calculate_energy_capacity_v21_batch,
+    calculate_energy_capacity_v21_frame,
+    EFFICIENCY_RANGES
+)
+
+NUMERIC_KEYS = [
+    'theoretical_max_bat_speed_mph', 'predicted_min_bat_speed_mph', 'predicted_max_bat_speed_mph',
+    'predicted_midpoint_bat_speed_mph', 'energy_capacity_joules', 'exit_velo_min_mph',
+    'exit_velo_max_mph', 'bat_weight_adjustment_mph', 'wingspan_advantage_inches',
+]
+
+
+def _roster(n, seed=0):
+    rng = np.random.default_rng(seed)
+    height = rng.integers(54, 82, n).astype(float)
+    height[::7] += 0.5  # off-table heights force interpolation
+    return {
+        'height_inches': height,
+        'wingspan_inches': height + rng.uniform(-2, 7, n),
+        'weight_lbs': rng.integers(70, 300, n).astype(float),
+        'age': rng.integers(10, 45, n),
+        'bat_weight_oz': rng.choice([28, 30, 31, 32, 33, 34, 35], n).astype(float),
+        'skill_level': rng.choice(list(EFFICIENCY_RANGES) + ['unknown_level'], n),
+    }
+
+
+def _scalar(roster, i, actual=None):
+    return calculate_energy_capacity_v21(
+        height_inches=roster['height_inches'][i],
+        wingspan_inches=roster['wingspan_inches'][i],
+        weight_lbs=roster['weight_lbs'][i],
+        age=int(roster['age'][i]),
+        bat_weight_oz=roster['bat_weight_oz'][i],
+        skill_level=roster['skill_level'][i],
+        actual_bat_speed=actual,
+        verbose=False
+    )
+
+
+class TestBatchMatchesScalar:
+    """Every correction applied as array ops gives the scalar result"""
+
+    def test_random_roster(self, capsys):
+        roster = _roster(500)
+        actual = np.linspace(40, 95, 500)
+        actual[::4] = np.nan
+        batch = calculate_energy_capacity_v21_batch(**roster, actual_bat_speed=actual)
+
+        for i in range(500):
+            known = not np.isnan(actual[i])
+            expected = _scalar(roster, i, actual[i] if known else None)
+            for key in NUMERIC_KEYS:
+                assert batch[key][i] == pytest.approx(expected[key], rel=1e-12), key
+            assert batch['efficiency_range'][i] == expected['efficiency_range']
+            if known:
+                realized = expected['realized_efficiency']
+                assert batch['efficiency_rating'][i] == realized['efficiency_rating']
+                assert batch['coaching_focus'][i] == realized['coaching_focus']
+                assert batch['realized_efficiency_pct'][i] == pytest.approx(realized['efficiency_pct'], abs=0.051)
+            else:
+                assert batch['efficiency_rating'][i] is None
+
+        # Nothing printed by the batch path
+        capsys.readouterr()
+        calculate_energy_capacity_v21_batch(**roster)
+        assert capsys.readouterr().out == ""
+
+    def test_table_hits_and_short_player(self):
+        # Altuve (exact table hit, <5'8") and Judge (exact hit, tall + stocky)
+        batch = calculate_energy_capacity_v21_batch(
+            height_inches=[66, 79], wingspan_inches=[67.5, 82], weight_lbs=[166, 282],
+            age=[34, 32], bat_weight_oz=[30, 34], skill_level="mlb_elite"
+        )
+        for i, (h, ws, w, a, bw) in enumerate([(66, 67.5, 166, 34, 30), (79, 82, 282, 32, 34)]):
+            expected = calculate_energy_capacity_v21(h, ws, w, a, bw, "mlb_elite", verbose=False)
+            assert batch['predicted_midpoint_bat_speed_mph'][i] == pytest.approx(
+                expected['predicted_midpoint_bat_speed_mph'], rel=1e-12)
+        assert list(batch['skill_level']) == ["mlb_elite", "mlb_elite"]
+
+    def test_scalar_inputs_broadcast(self):
+        batch = calculate_energy_capacity_v21_batch(72, 74, [190, 200, 210], 27, 31)
+        assert batch['theoretical_max_bat_speed_mph'].shape == (3,)
+
+
+class TestBatchFrame:
+    """DataFrame entry point and throughput"""
+
+    def test_frame_round_trip(self):
+        roster = _roster(20, seed=1)
+        profiles = pd.DataFrame(roster, index=[f"p{i}" for i in range(20)])
+        profiles['actual_bat_speed'] = 70.0
+
+        scored = calculate_energy_capacity_v21_frame(profiles)
+        assert list(scored.index) == list(profiles.index)
+        expected = _scalar(roster, 3, 70.0)
+        assert scored.loc['p3', 'predicted_midpoint_bat_speed_mph'] == pytest.approx(
+            expected['predicted_midpoint_bat_speed_mph'], rel=1e-12)
+        assert scored.loc['p3', 'efficiency_rating'] == expected['realized_efficiency']['efficiency_rating']
+
+    def test_scores_tens_of_thousands_per_second(self):
+        roster = _roster(50000, seed=2)
+        start = time.perf_counter()
+        calculate_energy_capacity_v21_batch(**roster)
+        elapsed = time.perf_counter() - start
+        print(f"\n📊 50,000 profiles in {elapsed * 1000:.0f}ms")
+        assert elapsed < 2.0
@@ -0,0 +1,105 @@
+"""
+Lazy Router Tests
+Routers registered by prefix are imported on first use (or by the
+warm-up thread) and swapped in for their placeholder
+"""
+
+import sys
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from lazy_routes import LazyRouter, include_lazy_router, lazy_router_status, load_lazy_routers, warm_up_lazy_routers
+
+HEAVY_ROUTER = '''
+from fastapi import APIRouter
+
+IMPORTS = 0
+IMPORTS += 1
+
+router = APIRouter(prefix="/api/heavy")
+
+
+@router.get("/items/{item_id}")
+def item(item_id: int):
+    return {"id": item_id}
+'''
+
+
+@pytest.fixture
+def heavy_module(tmp_path, monkeypatch, request):
+    """A router module on sys.path that has not been imported yet"""
+    name = f"lazy_fixture_{request.node.name}"
+    (tmp_path / f"{name}.py").write_text(HEAVY_ROUTER)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    sys.modules.pop(name, None)
+
+
+def _app(module_name):
+    app = FastAPI()
+
+    @app.get("/before")
+    def before():
+        return {"ok": True}
+
+    placeholder = include_lazy_router(app, f"{module_name}:router", prefixes=["/api/heavy"], tags=["Heavy"])
+
+    @app.get("/api/heavy-ish")
+    def neighbour():
+        return {"ok": True}
+
+    return app, placeholder
+
+
+class TestLazyRouter:
+    """Import on first use, at the placeholder's position"""
+
+    def test_imported_on_first_matching_request(self, heavy_module):
+        app, placeholder = _app(heavy_module)
+        client = TestClient(app)
+
+        assert client.get("/before").status_code == 200
+        assert client.get("/api/heavy-ish").status_code == 200
+        assert heavy_module not in sys.modules and not placeholder.loaded
+        assert "/api/heavy/items/{item_id}" not in client.get("/openapi.json").json()["paths"]
+
+        assert client.get("/api/heavy/items/7").json() == {"id": 7}
+        assert placeholder.loaded and heavy_module in sys.modules
+        assert client.get("/api/heavy/items/8").json() == {"id": 8}
+        assert sys.modules[heavy_module].IMPORTS == 1
+
+        paths = [getattr(route, "path", None) for route in app.routes]
+        assert paths.index("/before") < paths.index("/api/heavy/items/{item_id}") < paths.index("/api/heavy-ish")
+        assert not any(isinstance(route, LazyRouter) for route in app.routes)
+        operation = client.get("/openapi.json").json()["paths"]["/api/heavy/items/{item_id}"]["get"]
+        assert operation["tags"] == ["Heavy"]
+
+    def test_warm_up_loads_in_background(self, heavy_module):
+        app, placeholder = _app(heavy_module)
+        thread = warm_up_lazy_routers(app)
+        thread.join(timeout=10)
+        assert lazy_router_status(app)[f"{heavy_module}:router"]["loaded"] is True
+        assert TestClient(app).get("/api/heavy/items/1").status_code == 200
+
+    def test_concurrent_loads_swap_once(self, heavy_module):
+        app, placeholder = _app(heavy_module)
+        threads = [threading.Thread(target=load_lazy_routers, args=(app,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        paths = [getattr(route, "path", None) for route in app.routes]
+        assert paths.count("/api/heavy/items/{item_id}") == 1
+
+    def test_bad_targets(self):
+        app = FastAPI()
+        with pytest.raises(ValueError):
+            include_lazy_router(app, "no_attribute_given", prefixes=["/x"])
+        include_lazy_router(app, "no_such_module_anywhere:router", prefixes=["/x"])
+        load_lazy_routers(app)  # logged, not raised
+        response = TestClient(app, raise_server_exceptions=False).get("/x/1")
+        assert response.status_code == 500
+        assert lazy_router_status(app)["no_such_module_anywhere:router"]["loaded"] is False
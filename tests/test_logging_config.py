@@ -0,0 +1,127 @@
+"""
+Logging Configuration Tests
+JSON / text output, per-module levels, quiet mode, and the analysis hot
+paths logging lazily instead of printing
+"""
+
+import json
+import io
+import logging
+import os
+import sys
+
+import pytest
+
+from logging_config import ANALYSIS_LOGGERS, configure_logging, parse_module_levels
+from physics_engine import kinetic_capacity_calculator_v21 as capacity_v21
+
+# physics_engine modules import their siblings by bare name
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'physics_engine')))
+from physics_calculator import JointAngles, JointVelocities
+from event_detection_v3 import EventDetector
+
+PLAYER = dict(height_inches=66, wingspan_inches=67.5, weight_lbs=166, age=34, bat_weight_oz=30)
+
+
+@pytest.fixture(autouse=True)
+def restore_logging():
+    """configure_logging() changes global state; put it back after each test"""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    names = ANALYSIS_LOGGERS + ("physics_engine.kinetic_capacity_calculator_v21", "test.module")
+    levels = {name: logging.getLogger(name).level for name in names}
+    yield
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    for name, module_level in levels.items():
+        logging.getLogger(name).setLevel(module_level)
+
+
+def _swing(duration_ms=3000, fps=60):
+    """One swing peaking at 1500 ms"""
+    angles, velocities = [], []
+    for frame in range(int(duration_ms * fps / 1000)):
+        t = frame * 1000 / fps
+        bat = 0.3 + 30.0 * 2.718 ** (-((t - 1500) / 60) ** 2)
+        pelvis = -20 if 600 <= t < 1200 else 0
+        angles.append(JointAngles(frame, t, pelvis, pelvis * 1.2, 0, 0, 90, 0, 20))
+        velocities.append(JointVelocities(frame, t, pelvis_velocity=0.0, torso_velocity=0.0,
+                                          shoulder_velocity=0.0, hip_velocity=0.0,
+                                          hand_velocity=0.0, bat_velocity=bat))
+    return angles, velocities
+
+
+class TestConfigureLogging:
+    """Formatter, levels and quiet mode"""
+
+    def test_json_records_include_extra_fields(self):
+        stream = io.StringIO()
+        configure_logging(level="INFO", fmt="json", stream=stream)
+        logging.getLogger("test.module").info("scored %d swings", 3, extra={"session_id": "s1"})
+        logging.getLogger("test.module").debug("not emitted")
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        assert record["message"] == "scored 3 swings"
+        assert record["level"] == "INFO" and record["logger"] == "test.module"
+        assert record["session_id"] == "s1" and "timestamp" in record
+
+    def test_quiet_mode_and_module_levels(self, monkeypatch):
+        monkeypatch.setenv("LOG_LEVELS", "tempo_calculator=DEBUG, bad-item")
+        configure_logging(stream=io.StringIO())
+        assert logging.getLogger("physics_engine").level == logging.WARNING
+        assert logging.getLogger("reboot_csv_importer").level == logging.WARNING
+        assert logging.getLogger("tempo_calculator").level == logging.DEBUG
+
+        configure_logging(quiet=False, module_levels={"reboot_csv_importer": "info"}, stream=io.StringIO())
+        assert logging.getLogger("physics_engine").level == logging.NOTSET
+        assert logging.getLogger("reboot_csv_importer").level == logging.INFO
+        assert parse_module_levels("a=debug,b.c = warning,=x") == {"a": "DEBUG", "b.c": "WARNING"}
+
+    def test_reconfiguring_replaces_plain_handlers_only(self, caplog):
+        root = logging.getLogger()
+        root.addHandler(logging.StreamHandler(io.StringIO()))  # what basicConfig() installs
+        configure_logging(stream=io.StringIO())
+        handler = configure_logging(stream=io.StringIO())
+
+        plain = [h for h in root.handlers if type(h) is logging.StreamHandler]
+        assert plain == [handler]
+        assert caplog.handler in root.handlers
+
+
+class TestQuietHotPaths:
+    """Analysis functions print nothing and format nothing unless asked"""
+
+    def test_capacity_is_silent_by_default(self, capsys, caplog):
+        caplog.set_level(logging.INFO)
+        capacity_v21.calculate_energy_capacity_v21(**PLAYER)
+        assert capsys.readouterr().out == ""
+        assert caplog.records == []
+
+    def test_capacity_detail_at_debug_and_summary_when_verbose(self, caplog):
+        caplog.set_level(logging.DEBUG, logger=capacity_v21.logger.name)
+        capacity_v21.calculate_energy_capacity_v21(**PLAYER)
+        messages = [r.getMessage() for r in caplog.records]
+        assert all(r.levelno == logging.DEBUG for r in caplog.records)
+        assert any(m.startswith("[V2.1] SHORT PLAYER BOOST: +4.0% inertia") for m in messages)
+
+        caplog.clear()
+        caplog.set_level(logging.INFO, logger=capacity_v21.logger.name)
+        capacity_v21.calculate_energy_capacity_v21(**PLAYER, actual_bat_speed=69, verbose=True)
+        assert caplog.records and all(r.levelno == logging.INFO for r in caplog.records)
+        assert any("REALIZED EFFICIENCY" in r.getMessage() for r in caplog.records)
+
+    def test_event_detection_logs_instead_of_printing(self, capsys, caplog):
+        angles, velocities = _swing()
+        assert EventDetector().detect_all_events(angles, velocities) is not None
+        assert capsys.readouterr().out == ""
+
+        caplog.set_level(logging.DEBUG, logger="event_detection_v3")
+        events = EventDetector().detect_all_events(angles, velocities)
+        assert events.contact_ms == pytest.approx(1500, abs=20)
+        assert any(r.getMessage().startswith("✅ Swing window isolated") for r in caplog.records)
+
+    def test_event_detection_failure_is_a_warning(self, caplog):
+        assert EventDetector().detect_all_events([], []) is None
+        assert [r.levelno for r in caplog.records] == [logging.WARNING]
@@ -0,0 +1,120 @@
+"""
+Pattern Rule Plan Tests
+Compiled Coach Rick pattern rules against the interpreted conditions, and
+the batch / session evaluation
+"""
+
+import random
+
+import pytest
+
+from coach_rick.pattern_recognition import PatternRecognitionEngine, PatternRulePlan, get_default_plan
+
+PROFILES = ["Spinner", "Whipper", "Torquer", "Mixed"]
+
+
+def _random_swing(rng):
+    """Swing dict with every metric source, each sometimes missing"""
+    kinematic_sequence = {}
+    if rng.random() < 0.9:
+        torso = rng.uniform(120, 160)
+        kinematic_sequence.update(torso_peak_ms=torso, arms_peak_ms=torso + rng.uniform(0, 40))
+        kinematic_sequence['bat_peak_ms'] = kinematic_sequence['arms_peak_ms'] + rng.uniform(5, 30)
+    if rng.random() < 0.2:
+        kinematic_sequence.update(hips_peak_time=rng.uniform(100, 140), shoulders_peak_time=rng.uniform(120, 170))
+    if rng.random() < 0.8:
+        kinematic_sequence['grade'] = rng.choice("ABCDF")
+    swing = {"kinematic_sequence": kinematic_sequence, "bat_speed": rng.uniform(60, 90)}
+    if rng.random() < 0.85:
+        swing["tempo"] = {"ratio": round(rng.uniform(1.0, 4.0), 1)}
+    if rng.random() < 0.85:
+        swing["stability"] = {"score": rng.randint(60, 100)}
+    return swing
+
+
+def _interpreted(engine, swing, motor_profile):
+    """Previous analyze(): interpret every rule, then sort by priority"""
+    matches = [
+        pattern_id for pattern_id, rule in engine.rules.items()
+        if engine._matches_conditions(swing, motor_profile, rule['conditions'])
+    ]
+    return sorted(matches, key=lambda pid: engine.priority_order[engine.rules[pid]['priority']])
+
+
+class TestCompiledRules:
+    """analyze() through the plan matches the interpreted rules"""
+
+    def test_random_swings_match_interpreter(self):
+        rng = random.Random(11)
+        engine = PatternRecognitionEngine()
+        for _ in range(2000):
+            swing, profile = _random_swing(rng), rng.choice(PROFILES)
+            matches = engine.analyze(swing, profile)
+            assert [m.pattern_id for m in matches] == _interpreted(engine, swing, profile)
+
+    def test_match_fields(self):
+        swing = {"kinematic_sequence": {"torso_peak_ms": 145, "arms_peak_ms": 160, "bat_peak_ms": 173, "grade": "B"},
+                 "tempo": {"ratio": 2.1}, "stability": {"score": 92}}
+        engine = PatternRecognitionEngine()
+        match = engine.analyze(swing, "Spinner")[0]
+        rule = engine.rules[match.pattern_id]
+        assert (match.diagnosis, match.root_cause, match.priority) == \
+            (rule['diagnosis'], rule['root_cause'], rule['priority'])
+        assert match.symptoms == rule['symptoms']
+
+    def test_plan_is_shared_and_recompiled(self):
+        assert PatternRecognitionEngine().plan is PatternRecognitionEngine().plan is get_default_plan()
+        plan = get_default_plan()
+        assert 'motor_profile' not in plan.metrics
+        assert len(plan.metrics) == len(set(plan.metrics))
+
+        rules = {
+            "slow_bat": {
+                "conditions": {"bat_speed": {"max": 70}, "tempo.ratio": {"min": 2}},
+                "diagnosis": "Slow bat", "symptoms": [], "root_cause": "", "priority": "LOW"
+            }
+        }
+        engine = PatternRecognitionEngine(rules)
+        assert [m.pattern_id for m in engine.analyze({"bat_speed": 65, "tempo": {"ratio": 2.5}}, "Mixed")] == ["slow_bat"]
+        assert engine.analyze({"bat_speed": 65, "tempo": {"ratio": 1.5}}, "Mixed") == []
+
+        rules["slow_bat"]["conditions"]["bat_speed"]["max"] = 60
+        engine.compile()
+        assert engine.analyze({"bat_speed": 65}, "Mixed") == []
+
+
+class TestBatchEvaluation:
+    """Vectorized masks agree with per-swing evaluation"""
+
+    def test_batch_matches_single(self):
+        rng = random.Random(12)
+        engine = PatternRecognitionEngine()
+        swings = [_random_swing(rng) for _ in range(500)]
+        profiles = [rng.choice(PROFILES) for _ in swings]
+
+        batch = engine.analyze_batch(swings, profiles)
+        assert [[m.pattern_id for m in matches] for matches in batch] == \
+            [[m.pattern_id for m in engine.analyze(swing, profile)] for swing, profile in zip(swings, profiles)]
+
+        single_profile = engine.analyze_batch(swings, "Whipper")
+        assert [[m.pattern_id for m in matches] for matches in single_profile] == \
+            [[m.pattern_id for m in engine.analyze(swing, "Whipper")] for swing in swings]
+
+    def test_session_summary(self):
+        rng = random.Random(13)
+        engine = PatternRecognitionEngine()
+        swings = [_random_swing(rng) for _ in range(200)]
+        per_swing = [{m.pattern_id for m in matches} for matches in engine.analyze_batch(swings, "Spinner")]
+
+        summary = engine.analyze_session(swings, "Spinner")
+        assert summary
+        for pattern in summary:
+            indices = [i for i, ids in enumerate(per_swing) if pattern.pattern_id in ids]
+            assert pattern.swing_indices == indices
+            assert pattern.swings_matched == len(indices)
+            assert pattern.match_rate == pytest.approx(len(indices) / len(swings), abs=1e-3)
+
+        keys = [(engine.priority_order[p.priority], -p.swings_matched) for p in summary]
+        assert keys == sorted(keys)
+        assert engine.analyze_session([], "Spinner") == []
+        assert engine.analyze_batch([], "Spinner") == []
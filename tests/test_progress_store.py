@@ -0,0 +1,151 @@
+"""
+Progress Store Tests
+Sorted per-athlete session index, incremental milestones/goals and the
+persistent SQL session store
+"""
+
+import pytest
+import random
+from datetime import timedelta
+
+from sqlalchemy.orm import sessionmaker
+
+from conftest import SESSION_BASE_DATE, training_session
+from physics_engine.progress_tracker import (
+    ProgressTracker, AthleteSessionIndex, Goal, GoalStatus,
+    MetricType, MilestoneType
+)
+from progress_session_store import SqlProgressSessionStore
+
+BASE_DATE = SESSION_BASE_DATE
+
+
+def _reference_sessions(added, limit=50, start_date=None, end_date=None):
+    """Previous behaviour: stable sort newest first, filter, then limit"""
+    sessions = sorted(added, key=lambda s: s.session_date, reverse=True)
+    if start_date:
+        sessions = [s for s in sessions if s.session_date >= start_date]
+    if end_date:
+        sessions = [s for s in sessions if s.session_date <= end_date]
+    return sessions[:limit]
+
+
+class TestAthleteSessionIndex:
+    """Bisect range queries match the previous sort-and-filter results"""
+
+    def test_range_queries_match_sort_and_filter(self):
+        rng = random.Random(7)
+        tracker = ProgressTracker()
+        added = []
+        for i in range(300):
+            session = training_session(day=rng.randint(0, 60), session_id=f"s{i}")  # many same-day ties
+            tracker.add_session(session)
+            added.append(session)
+
+        for _ in range(200):
+            start = BASE_DATE + timedelta(days=rng.randint(-5, 65)) if rng.random() < 0.7 else None
+            end = BASE_DATE + timedelta(days=rng.randint(-5, 65)) if rng.random() < 0.7 else None
+            limit = rng.choice([1, 5, 50, 500])
+            assert tracker.get_sessions("eric", limit, start, end) == \
+                _reference_sessions(added, limit, start, end)
+
+        assert tracker.get_latest_session("eric") is _reference_sessions(added)[0]
+        assert tracker.sessions["eric"] == _reference_sessions(added, limit=None)
+        assert tracker.get_session("eric", "s42") is added[42]
+        assert tracker.get_session("eric", "missing") is None
+
+    def test_readding_session_id_replaces(self):
+        index = AthleteSessionIndex()
+        index.add(training_session(day=1, session_id="a"))
+        index.add(training_session(day=5, session_id="b"))
+        moved = training_session(day=10, session_id="a")
+        index.add(moved)
+
+        assert len(index) == 2
+        assert index.latest() is moved
+        assert [s.session_id for s in index.newest_first()] == ["a", "b"]
+        assert index.remove("b").session_id == "b"
+        assert index.remove("b") is None
+
+
+class TestIncrementalChecks:
+    """Milestones and goals are awarded once, from first/latest sessions"""
+
+    def test_milestones(self):
+        tracker = ProgressTracker()
+        tracker.add_session(training_session(day=0, session_id="s1", score=55))
+        tracker.add_session(training_session(day=7, session_id="s2", score=72, motor_preference_confidence=0.9))
+        tracker.add_session(training_session(day=14, session_id="s3", score=82, motor_preference_confidence=0.95))
+        tracker.add_session(training_session(day=21, session_id="s4", score=85))
+
+        types = [m.milestone_type for m in tracker.get_milestones("eric")]
+        assert types == [
+            MilestoneType.FIRST_ANALYSIS,
+            MilestoneType.MOTOR_PREFERENCE_IDENTIFIED,
+            MilestoneType.SCORE_IMPROVEMENT_10,
+            MilestoneType.ALL_SCORES_ABOVE_70,
+            MilestoneType.SCORE_IMPROVEMENT_20,
+            MilestoneType.ALL_SCORES_ABOVE_80,
+        ]
+
+    def test_goals_follow_latest_session_only(self):
+        tracker = ProgressTracker()
+        tracker.add_goal(Goal(
+            goal_id="g1", athlete_id="eric", created_date=BASE_DATE, target_date=None,
+            metric_type=MetricType.BAT_SPEED_ACTUAL, current_value=67.0, target_value=75.0,
+            status=GoalStatus.NOT_STARTED, progress_percent=0.0
+        ))
+        tracker.add_session(training_session(day=10, session_id="s1", bat_speed=71.0))
+        goal = tracker.get_goals("eric")[0]
+        assert goal.progress_percent == pytest.approx(50.0)
+        assert goal.status == GoalStatus.IN_PROGRESS
+
+        # Back-filled older session does not move the goal
+        tracker.add_session(training_session(day=0, session_id="s0", bat_speed=76.0))
+        assert goal.progress_percent == pytest.approx(50.0)
+
+        tracker.add_session(training_session(day=20, session_id="s2", bat_speed=75.0))
+        assert goal.status == GoalStatus.ACHIEVED
+        assert goal.achieved_date == BASE_DATE + timedelta(days=20)
+
+
+class TestSqlProgressSessionStore:
+    """Sessions survive a tracker restart through the SQL store"""
+
+    def test_write_through_and_reload(self, db_engine):
+        store = SqlProgressSessionStore(sessionmaker(bind=db_engine))
+        tracker = ProgressTracker(store=store)
+        for i, day in enumerate([3, 1, 3, 2]):
+            tracker.add_session(training_session(day=day, session_id=f"s{i}"))
+        tracker.add_session(training_session(day=0, session_id="other", athlete_id="connor"))
+        tracker.add_session(training_session(day=5, session_id="s1", score=70))  # upsert
+
+        restarted = ProgressTracker(store=store)
+        assert [s.session_id for s in restarted.get_sessions("eric")] == \
+            [s.session_id for s in tracker.get_sessions("eric")] == ["s1", "s0", "s2", "s3"]
+        assert restarted.get_latest_session("eric").ground_score_adjusted == 70
+        assert restarted.get_sessions("eric", start_date=BASE_DATE + timedelta(days=3)) == \
+            tracker.get_sessions("eric", start_date=BASE_DATE + timedelta(days=3))
+        assert [s.session_id for s in restarted.get_sessions("connor")] == ["other"]
+        assert store.get("s3").session_date == BASE_DATE + timedelta(days=2)
+        assert store.get("missing") is None
+
+    def test_unknown_athlete_lookups_do_not_grow_indexes(self, db_engine):
+        store = SqlProgressSessionStore(sessionmaker(bind=db_engine))
+        store.save(training_session(day=1, session_id="s0"))
+        for tracker in (ProgressTracker(), ProgressTracker(store=store)):
+            assert tracker.get_sessions("nobody") == []
+            assert tracker.get_latest_session("nobody") is None
+            assert tracker.get_session("nobody", "s0") is None
+            assert tracker.get_latest_sessions(["nobody"]) == {}
+            assert tracker.get_sessions_for_athletes(["nobody"]) == {"nobody": []}
+            assert "nobody" not in tracker.sessions
+        assert ProgressTracker(store=store).get_latest_session("eric").session_id == "s0"
+
+    def test_global_tracker_is_persistent(self, monkeypatch):
+        from physics_engine import progress_tracker
+
+        monkeypatch.setattr(progress_tracker, "_progress_tracker_instance", None)
+        tracker = progress_tracker.get_progress_tracker()
+        assert isinstance(tracker.store, SqlProgressSessionStore)
+        assert progress_tracker.get_progress_tracker() is tracker
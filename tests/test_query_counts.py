@@ -0,0 +1,176 @@
+"""
+Query Count Tests
+Asserts the session endpoints, /stats and the biomechanics sync issue a fixed
+number of SQL statements regardless of how many rows they cover
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from models import Player, Session as SessionModel, BiomechanicsData
+from session_queries import (
+    get_player, get_player_sessions, get_session_with_player,
+    get_session_frame_summary, get_database_stats, StatsSnapshot
+)
+from sync_service import RebootMotionSync
+
+
+def _seed(db, num_players: int, sessions_per_player: int):
+    """Create players with sessions and return their ids"""
+    player_ids = []
+    base_date = datetime(2025, 1, 1)
+    for p in range(num_players):
+        player = Player(org_player_id=f"org_{p}", first_name="Test", last_name=f"Player{p}")
+        db.add(player)
+        db.flush()
+        for s in range(sessions_per_player):
+            db.add(SessionModel(
+                session_id=f"sess_{p}_{s}",
+                player_id=player.id,
+                session_date=base_date + timedelta(days=s),
+                movement_type_id=1,
+                movement_type_name="baseball-hitting",
+                data_synced=False
+            ))
+        player_ids.append(player.id)
+    db.commit()
+    # Start from an empty identity map so lazy loads would hit the database
+    db.close()
+    return player_ids
+
+
+def _player_sessions_endpoint(db, player_id):
+    """Same DB work as GET /players/{id}/sessions"""
+    player = get_player(db, player_id)
+    sessions = get_player_sessions(db, player_id, limit=100)
+    return [session.to_dict(include_player=True) for session in sessions]
+
+
+class TestSessionEndpointQueries:
+    """Session serialization must not query once per session"""
+
+    @pytest.mark.parametrize("sessions_per_player", [1, 5, 40])
+    def test_player_sessions_fixed_query_count(self, db_session, count_queries, sessions_per_player):
+        player_ids = _seed(db_session, num_players=1, sessions_per_player=sessions_per_player)
+
+        with count_queries() as counter:
+            result = _player_sessions_endpoint(db_session, player_ids[0])
+
+        assert len(result) == sessions_per_player
+        assert all(r["player"]["org_player_id"] == "org_0" for r in result)
+        assert counter.count == 2, counter.statements
+
+    def test_session_detail_single_query(self, db_session, count_queries):
+        _seed(db_session, num_players=1, sessions_per_player=3)
+
+        with count_queries() as counter:
+            session = get_session_with_player(db_session, 1)
+            result = session.to_dict(include_player=True)
+
+        assert result["player"]["first_name"] == "Test"
+        assert counter.count == 1, counter.statements
+
+    def test_missing_session_returns_none(self, db_session):
+        assert get_session_with_player(db_session, 999) is None
+
+
+class TestSyncBiomechanicsQueries:
+    """RebootMotionSync.sync_biomechanics_data must batch-load players"""
+
+    @pytest.mark.parametrize("num_players", [1, 4, 12])
+    def test_pending_sessions_fixed_select_count(self, db_session, count_queries, num_players):
+        _seed(db_session, num_players=num_players, sessions_per_player=2)
+
+        sync = RebootMotionSync(username="test", password="test")
+        requested_players = []
+
+        def fake_request(endpoint, params=None):
+            requested_players.append(params["org_player_id"])
+            return None
+
+        sync._make_request = fake_request
+
+        with count_queries() as counter:
+            sync.sync_biomechanics_data(db_session, limit=100)
+
+        assert len(requested_players) == num_players * 2
+        assert len(counter.selects) == 2, counter.selects
+
+
+class TestAggregateQueries:
+    """/stats and /sessions/{id}/metrics run one aggregate query each"""
+
+    def _add_frames(self, db, session_pk: int, num_frames: int):
+        start = datetime(2025, 1, 1, 12, 0, 0)
+        for i in range(num_frames):
+            db.add(BiomechanicsData(
+                session_id=session_pk,
+                frame_number=i,
+                timestamp=start + timedelta(milliseconds=10 * i),
+                joint_angles={"pelvis": float(i)}
+            ))
+        db.commit()
+        db.close()
+
+    def test_database_stats_single_query(self, db_session, count_queries):
+        _seed(db_session, num_players=3, sessions_per_player=4)
+        db_session.query(SessionModel).filter(SessionModel.id <= 5).update({"data_synced": True})
+        db_session.commit()
+        self._add_frames(db_session, 1, 7)
+
+        with count_queries() as counter:
+            stats = get_database_stats(db_session)
+
+        assert counter.count == 1, counter.statements
+        assert stats == {
+            "total_players": 3,
+            "total_sessions": 12,
+            "synced_sessions": 5,
+            "pending_sessions": 7,
+            "biomechanics_records": 7
+        }
+
+    def test_database_stats_empty(self, db_session):
+        stats = get_database_stats(db_session)
+        assert stats["total_sessions"] == 0
+        assert stats["pending_sessions"] == 0
+
+    @pytest.mark.parametrize("num_frames", [0, 3, 50])
+    def test_session_frame_summary_single_query(self, db_session, count_queries, num_frames):
+        _seed(db_session, num_players=1, sessions_per_player=1)
+        self._add_frames(db_session, 1, num_frames)
+
+        with count_queries() as counter:
+            summary = get_session_frame_summary(db_session, 1)
+
+        assert counter.count == 1, counter.statements
+        assert summary["total_frames"] == num_frames
+        if num_frames:
+            assert summary["start_time"] == datetime(2025, 1, 1, 12, 0, 0)
+            assert summary["end_time"] == datetime(2025, 1, 1, 12, 0, 0) + timedelta(milliseconds=10 * (num_frames - 1))
+        else:
+            assert summary["start_time"] is None and summary["end_time"] is None
+
+    def test_stats_snapshot_ttl(self, db_session, count_queries):
+        _seed(db_session, num_players=1, sessions_per_player=2)
+        snapshot = StatsSnapshot(ttl_seconds=60)
+
+        with count_queries() as counter:
+            first = snapshot.get(db_session)
+            second = snapshot.get(db_session)
+
+        assert counter.count == 1
+        assert first["total_sessions"] == second["total_sessions"] == 2
+        assert second["cached"] is True
+
+        snapshot.invalidate()
+        with count_queries() as counter:
+            snapshot.get(db_session)
+        assert counter.count == 1
+
+    def test_stats_snapshot_zero_ttl_always_refreshes(self, db_session, count_queries):
+        snapshot = StatsSnapshot(ttl_seconds=0)
+        with count_queries() as counter:
+            snapshot.get(db_session)
+            snapshot.get(db_session)
+        assert counter.count == 2
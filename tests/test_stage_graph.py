@@ -0,0 +1,106 @@
+"""
+Stage Graph Tests
+Dependency-ordered concurrent execution of pipeline stages, timings,
+and the post-pose Reboot Lite stages run as a graph
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pytest
+
+from physics_engine.stage_graph import StageGraph
+from physics_engine.kinetic_capacity_calculator import calculate_energy_capacity
+from physics_engine.race_bar_formatter import format_kinetic_sequence_for_race_bar
+from physics_engine.tempo_calculator import calculate_tempo_from_events
+
+EVENTS = {
+    'stance_start_ms': 0, 'load_start_ms': 120, 'stride_start_ms': 420,
+    'launch_start_ms': 520, 'contact_ms': 680,
+    'lower_half_peak_ms': 420, 'torso_peak_ms': 520, 'arms_peak_ms': 610,
+    'tempo_lower_to_torso': 100, 'tempo_torso_to_arms': 90
+}
+
+
+def _sleep_then(value, seconds=0.15, **dependencies):
+    time.sleep(seconds)
+    return value + sum(dependencies.values())
+
+
+def _fail():
+    raise RuntimeError("stage exploded")
+
+
+class TestStageGraph:
+    """Ordering, concurrency and errors"""
+
+    def test_dependencies_receive_results(self):
+        graph = StageGraph()
+        graph.add("a", lambda x: x + 1, depends_on=["x"])
+        graph.add("b", lambda a, x: a * x, depends_on=["a", "x"])
+        graph.add("c", lambda total: total - 1, depends_on={"total": "b"})
+        run = graph.run({"x": 3})
+        assert run.results == {"a": 4, "b": 12, "c": 11}
+        assert graph.order(["x"]) == ["a", "b", "c"]
+        assert run.critical_path == ["a", "b", "c"]
+
+    def test_independent_stages_overlap(self):
+        graph = StageGraph()
+        for name in ("capacity", "race_bar", "tempo", "stability"):
+            graph.add(name, partial(_sleep_then, 1))
+        graph.add("profile", partial(_sleep_then, 10), depends_on=["capacity", "tempo"])
+
+        run = graph.run()
+        assert run.results["profile"] == 12
+        metadata = run.metadata()
+        print(f"\n📊 5 stages x 150 ms: wall {metadata['wall_ms']:.0f} ms, "
+              f"sequential {metadata['sequential_ms']:.0f} ms")
+        # Two levels of 150 ms, not five
+        assert run.wall_ms < 0.6 * run.sum_ms
+        assert metadata["stages"]["profile"]["started_ms"] >= 140
+        assert set(metadata["stages"]) == {"capacity", "race_bar", "tempo", "stability", "profile"}
+
+    def test_invalid_graphs(self):
+        graph = StageGraph().add("a", lambda b: b, depends_on=["b"]).add("b", lambda a: a, depends_on=["a"])
+        with pytest.raises(ValueError, match="cycle"):
+            graph.run()
+        with pytest.raises(ValueError, match="unknown"):
+            StageGraph().add("a", lambda missing: missing, depends_on=["missing"]).run()
+        with pytest.raises(ValueError, match="Duplicate"):
+            StageGraph().add("a", int).add("a", int)
+        with pytest.raises(ValueError, match="shadow"):
+            StageGraph().add("a", int).run({"a": 1})
+
+    def test_stage_error_propagates_and_skips_dependents(self):
+        calls = []
+        graph = StageGraph()
+        graph.add("bad", _fail)
+        graph.add("after", lambda bad: calls.append(bad), depends_on=["bad"])
+        with pytest.raises(RuntimeError, match="exploded"):
+            graph.run()
+        assert calls == []
+
+    def test_process_pool(self):
+        graph = StageGraph()
+        graph.add("a", partial(_sleep_then, 1, 0.0))
+        graph.add("b", partial(_sleep_then, 2, 0.0), depends_on=["a"])
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            run = graph.run(executor=pool)
+        assert run.results == {"a": 1, "b": 3}
+
+
+class TestPostPoseStages:
+    """Reboot Lite capacity / race bar / tempo stages give the sequential results"""
+
+    def test_matches_sequential(self):
+        anthropometrics = dict(height_inches=70, weight_lbs=185, age=17, wingspan_inches=72, bat_weight_oz=31)
+        graph = StageGraph()
+        graph.add("capacity", partial(calculate_energy_capacity, **anthropometrics))
+        graph.add("race_bar", format_kinetic_sequence_for_race_bar, depends_on={"kinetic_chain_events": "events"})
+        graph.add("tempo", calculate_tempo_from_events, depends_on=["events"])
+
+        run = graph.run({"events": EVENTS})
+        assert run.results["capacity"] == calculate_energy_capacity(**anthropometrics)
+        assert run.results["race_bar"] == format_kinetic_sequence_for_race_bar(EVENTS)
+        assert run.results["tempo"] == calculate_tempo_from_events(EVENTS)
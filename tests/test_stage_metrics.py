@@ -0,0 +1,179 @@
+"""
+Stage Metrics Tests
+Timers, Prometheus text export, request traces (Server-Timing) and SQL
+statement timing
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+import stage_metrics
+from stage_metrics import (
+    Histogram, MetricsRegistry, StageTimingMiddleware, STAGE_SECONDS, STAGE_ERRORS, HTTP_SECONDS,
+    instrument_engine, record_stage_run, render_metrics, start_trace, current_trace, timed
+)
+
+
+class TestMetricTypes:
+    """Prometheus semantics and text format"""
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("work_seconds", "Work", ["stage"], buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, "pose")
+        registry.counter("jobs_total", "Jobs", ["kind"]).inc("a", amount=2)
+
+        assert registry.render().splitlines() == [
+            "# HELP work_seconds Work",
+            "# TYPE work_seconds histogram",
+            'work_seconds_bucket{stage="pose",le="0.1"} 2',
+            'work_seconds_bucket{stage="pose",le="1.0"} 3',
+            'work_seconds_bucket{stage="pose",le="+Inf"} 4',
+            'work_seconds_sum{stage="pose"} 3.65',
+            'work_seconds_count{stage="pose"} 4',
+            "# HELP jobs_total Jobs",
+            "# TYPE jobs_total counter",
+            'jobs_total{kind="a"} 2.0',
+        ]
+
+    def test_label_escaping_and_duplicates(self):
+        registry = MetricsRegistry()
+        registry.counter("c", "C", ["path"]).inc('a"b\\c')
+        assert 'c{path="a\\"b\\\\c"} 1.0' in registry.render()
+        with pytest.raises(ValueError):
+            registry.counter("c", "again")
+
+
+class TestTimers:
+    """Context manager / decorator recording and traces"""
+
+    def test_context_manager_and_error_count(self):
+        before = STAGE_SECONDS.count("test.block")
+        errors = STAGE_ERRORS.value("test.block")
+        with timed("test.block"):
+            time.sleep(0.01)
+        with pytest.raises(KeyError):
+            with timed("test.block"):
+                raise KeyError("boom")
+        assert STAGE_SECONDS.count("test.block") == before + 2
+        assert STAGE_SECONDS.sum("test.block") >= 0.01
+        assert STAGE_ERRORS.value("test.block") == errors + 1
+
+    def test_decorators_feed_the_current_trace(self):
+        @timed("test.sync")
+        def work(x):
+            return x * 2
+
+        @timed("test.async")
+        async def async_work(x):
+            await asyncio.sleep(0.005)
+            return x + 1
+
+        async def request():
+            trace = start_trace()
+            assert work(2) == 4 and work(3) == 6
+            assert await async_work(1) == 2
+            return trace
+
+        trace = asyncio.run(request())
+        summary = trace.summary()
+        assert summary["test.sync"]["count"] == 2
+        assert summary["test.async"]["total_ms"] >= 5
+        assert current_trace() is None  # asyncio.run used its own context
+
+    def test_stage_run_durations_recorded(self):
+        class FakeRun:
+            durations_ms = {"tempo": 12.0, "race_bar": 3.0}
+
+        before = STAGE_SECONDS.count("rl.tempo")
+        record_stage_run(FakeRun(), prefix="rl.")
+        assert STAGE_SECONDS.count("rl.tempo") == before + 1
+
+    def test_overhead_is_microseconds(self):
+        n = 20000
+        start = time.perf_counter()
+        for _ in range(n):
+            with timed("test.overhead"):
+                pass
+        per_call_us = (time.perf_counter() - start) / n * 1e6
+        print(f"\n📊 timed() overhead: {per_call_us:.2f} µs per stage")
+        assert per_call_us < 50
+
+
+class TestSqlTiming:
+    """Statements on an instrumented engine are the db stage"""
+
+    def test_engine_statements(self, db_engine):
+        instrument_engine(db_engine, stage="test.db")
+        before = STAGE_SECONDS.count("test.db")
+        with db_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+            with pytest.raises(Exception):
+                conn.execute(text("SELECT * FROM no_such_table"))
+        assert STAGE_SECONDS.count("test.db") == before + 3
+        assert STAGE_ERRORS.value("test.db") >= 1
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(StageTimingMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        with timed("test.pose_inference"):
+            time.sleep(0.002)
+        with timed("test.pose_inference"):
+            pass
+        return {"id": item_id}
+
+    @app.get("/metrics")
+    def metrics():
+        return PlainTextResponse(render_metrics(), media_type=stage_metrics.PROMETHEUS_CONTENT_TYPE)
+
+    return app
+
+
+class TestMiddleware:
+    """Request histogram by route template and Server-Timing on request"""
+
+    def test_trace_header_only_when_asked(self):
+        client = TestClient(_app())
+        plain = client.get("/items/1")
+        assert "server-timing" not in plain.headers
+
+        traced = client.get("/items/2", headers={"X-Request-Trace": "1"})
+        timing = traced.headers["server-timing"]
+        assert timing.startswith('test.pose_inference;dur=')
+        assert 'desc="x2"' in timing and "total;dur=" in timing
+
+    def test_metrics_endpoint(self):
+        client = TestClient(_app())
+        before = HTTP_SECONDS.count("GET", "/items/{item_id}", "200")
+        client.get("/items/7")
+        client.get("/items/8")
+        assert HTTP_SECONDS.count("GET", "/items/{item_id}", "200") == before + 2
+
+        response = client.get("/metrics")
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        body = response.text
+        assert "# TYPE stage_duration_seconds histogram" in body
+        assert 'stage_duration_seconds_count{stage="test.pose_inference"}' in body
+        assert 'http_request_duration_seconds_count{method="GET",route="/items/{item_id}",status="200"}' in body
+        assert "# TYPE db_pool_in_use gauge" in body
+        assert "# TYPE db_pool_checkouts_total counter" in body
+        assert "# TYPE db_pool_checkout_timeouts_total counter" in body
+
+    def test_unmatched_routes_share_one_label(self):
+        client = TestClient(_app())
+        before = HTTP_SECONDS.count("GET", "unmatched", "404")
+        client.get("/nope/123")
+        client.get("/nope/456")
+        assert HTTP_SECONDS.count("GET", "unmatched", "404") == before + 2
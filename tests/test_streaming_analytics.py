@@ -0,0 +1,175 @@
+"""
+Streaming Analytics Tests
+Vectorized AdvancedAnalyticsEngine paths and O(1) online summaries
+"""
+
+import pytest
+import random
+import statistics
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from physics_engine.advanced_analytics import (
+    AdvancedAnalyticsEngine, StreamingMetricSummary, TrendDirection
+)
+from physics_engine.streaming_stats import RunningStats, RunningRegression, P2Quantile
+
+
+def _history(n, seed=0, slope=0.2):
+    rng = random.Random(seed)
+    start = datetime(2025, 3, 1)
+    timestamps = [start + timedelta(days=2 * i, hours=rng.randint(0, 12)) for i in range(n)]
+    values = [60 + slope * 2 * i + rng.gauss(0, 1.5) for i in range(n)]
+    return timestamps, values
+
+
+class TestStreamingPrimitives:
+    """Welford, regression co-moments and P² against direct computation"""
+
+    def test_running_stats_and_merge(self):
+        values = [random.Random(1).uniform(50, 90) for _ in range(500)]
+        running = RunningStats()
+        for value in values:
+            running.update(value)
+
+        assert running.mean == pytest.approx(statistics.mean(values), rel=1e-12)
+        assert running.variance == pytest.approx(statistics.variance(values), rel=1e-9)
+        assert (running.min_value, running.max_value) == (min(values), max(values))
+
+        merged = RunningStats.from_array(values[:200]).merge(RunningStats.from_array(values[200:]))
+        assert merged.count == 500
+        assert merged.variance == pytest.approx(running.variance, rel=1e-9)
+
+    def test_running_regression_matches_polyfit(self):
+        rng = np.random.default_rng(3)
+        x = rng.uniform(0, 100, 300)
+        y = 0.3 * x + 5 + rng.normal(0, 2, 300)
+
+        running = RunningRegression()
+        for xi, yi in zip(x, y):
+            running.update(xi, yi)
+        slope, intercept = np.polyfit(x, y, 1)
+
+        assert running.slope == pytest.approx(slope, rel=1e-9)
+        assert running.intercept == pytest.approx(intercept, rel=1e-9)
+        assert running.correlation == pytest.approx(np.corrcoef(x, y)[0, 1], rel=1e-9)
+        halves = RunningRegression.from_arrays(x[:100], y[:100]).merge(RunningRegression.from_arrays(x[100:], y[100:]))
+        assert halves.slope == pytest.approx(slope, rel=1e-9)
+
+    def test_p2_quantile(self):
+        small = P2Quantile(0.9)
+        for value in [5, 1, 4, 2, 3]:
+            small.update(value)
+        assert small.value() == pytest.approx(np.percentile([1, 2, 3, 4, 5], 90))
+
+        rng = np.random.default_rng(4)
+        samples = rng.normal(70, 5, 5000)
+        for q in (0.25, 0.5, 0.9):
+            marker = P2Quantile(q)
+            for value in samples:
+                marker.update(value)
+            assert marker.value() == pytest.approx(np.quantile(samples, q), abs=0.25)
+
+
+class TestVectorizedEngine:
+    """Batch methods keep their previous results"""
+
+    def test_calculate_statistics(self):
+        engine = AdvancedAnalyticsEngine()
+        values = [72, 75, 78, 80, 82, 84, 86, 79.5]
+        stats = engine.calculate_statistics(values, "ground_score")
+        # 'inclusive' is linear interpolation between closest ranks (numpy's default)
+        percentiles = statistics.quantiles(values, n=100, method='inclusive')
+
+        assert stats.mean == pytest.approx(statistics.mean(values))
+        assert stats.median == pytest.approx(statistics.median(values))
+        assert stats.std_dev == pytest.approx(statistics.stdev(values))
+        for pct, field in ((25, 'percentile_25'), (75, 'percentile_75'), (90, 'percentile_90')):
+            assert getattr(stats, field) == pytest.approx(percentiles[pct - 1])
+        with pytest.raises(ValueError):
+            engine.calculate_statistics([1.0], "x")
+
+    def test_trend_matches_sum_formulas(self):
+        timestamps, values = _history(40)
+        trend = AdvancedAnalyticsEngine().analyze_trend(timestamps, values, "bat_speed")
+
+        days = [(t - timestamps[0]).total_seconds() / 86400 for t in timestamps]
+        n, sx, sy = len(days), sum(days), sum(values)
+        sxy = sum(x * y for x, y in zip(days, values))
+        sx2 = sum(x * x for x in days)
+        slope = (n * sxy - sx * sy) / (n * sx2 - sx * sx)
+        intercept = (sy - slope * sx) / n
+        ss_tot = sum((y - sy / n) ** 2 for y in values)
+        ss_res = sum((y - (slope * x + intercept)) ** 2 for x, y in zip(days, values))
+
+        assert trend.slope == pytest.approx(slope, rel=1e-9)
+        assert trend.r_squared == pytest.approx(1 - ss_res / ss_tot, rel=1e-9)
+        assert trend.direction == TrendDirection.IMPROVING
+
+    def test_correlation(self):
+        engine = AdvancedAnalyticsEngine()
+        x = [72, 75, 78, 80, 82, 84, 86]
+        y = [61.2, 63.5, 65.0, 66.8, 68.2, 69.5, 70.8]
+        result = engine.analyze_correlation(x, y, "ground_score", "bat_speed")
+        assert result.correlation == pytest.approx(np.corrcoef(x, y)[0, 1], rel=1e-12)
+        assert result.interpretation == "strong positive"
+
+
+class TestOnlineSummaries:
+    """update_metric keeps per-athlete summaries current in O(1)"""
+
+    def test_streaming_matches_batch(self):
+        timestamps, values = _history(60, seed=5)
+        engine = AdvancedAnalyticsEngine()
+        for timestamp, value in zip(timestamps, values):
+            summary = engine.update_metric("eric", "bat_speed", timestamp, value)
+
+        batch_trend = engine.analyze_trend(timestamps, values, "bat_speed")
+        batch_prediction = engine.predict_performance(timestamps, values, "bat_speed")
+        batch_stats = engine.calculate_statistics(values, "bat_speed")
+
+        assert summary is engine.get_metric_summary("eric", "bat_speed")
+        trend = summary.to_trend()
+        assert trend.slope == pytest.approx(batch_trend.slope, rel=1e-9)
+        assert trend.r_squared == pytest.approx(batch_trend.r_squared, rel=1e-9)
+        assert trend.direction == batch_trend.direction
+        assert trend.start_value == values[0] and trend.end_value == values[-1]
+
+        prediction = summary.to_prediction()
+        assert prediction.predicted_value == pytest.approx(batch_prediction.predicted_value, rel=1e-9)
+        assert prediction.confidence_interval_high == pytest.approx(batch_prediction.confidence_interval_high, rel=1e-9)
+        assert prediction.prediction_date == batch_prediction.prediction_date
+
+        stats = summary.to_statistics()
+        assert stats.mean == pytest.approx(batch_stats.mean, rel=1e-12)
+        assert stats.std_dev == pytest.approx(batch_stats.std_dev, rel=1e-9)
+        assert stats.median == pytest.approx(batch_stats.median, abs=2.0)  # P² estimate
+
+    def test_seeded_history_then_update(self):
+        timestamps, values = _history(30, seed=6)
+        engine = AdvancedAnalyticsEngine()
+        engine.load_metric_history("eric", "bat_speed", timestamps[:-1], values[:-1])
+        engine.update_metric("eric", "bat_speed", timestamps[-1], values[-1])
+
+        trend = engine.get_metric_summary("eric", "bat_speed").to_trend()
+        assert trend.slope == pytest.approx(engine.analyze_trend(timestamps, values, "bat_speed").slope, rel=1e-9)
+
+    def test_streaming_report(self):
+        engine = AdvancedAnalyticsEngine()
+        timestamps, values = _history(5)
+        for timestamp, value in zip(timestamps, values):
+            engine.update_metric("eric", "bat_speed", timestamp, value)
+        engine.update_metric("eric", "ground_score", timestamps[0], 80)
+
+        report = engine.get_streaming_report("eric")
+        assert set(report['statistics']) == {"bat_speed"}
+        assert report['statistics']['bat_speed']['median'] == round(statistics.median(values), 2)
+        assert "bat_speed" in report['predictions']
+        assert engine.get_streaming_report("nobody")['statistics'] == {}
+
+    def test_too_few_points(self):
+        summary = StreamingMetricSummary("bat_speed")
+        summary.add(datetime(2025, 1, 1), 70.0)
+        with pytest.raises(ValueError):
+            summary.to_statistics()
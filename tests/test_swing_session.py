@@ -0,0 +1,126 @@
+"""
+Swing Session Tests
+Multi-swing segmentation in EventDetector and per-window scoring in
+SwingSessionAnalyzer
+"""
+
+import pytest
+import sys
+import os
+import math
+
+# physics_engine modules import their siblings by bare name
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'physics_engine')))
+from physics_calculator import JointAngles, JointVelocities
+from stability_calculator import PoseFrame, PoseLandmark
+from event_detection_v3 import EventDetector
+from swing_session_analyzer import SwingSessionAnalyzer
+from tempo_calculator import analyze_tempo_consistency
+from race_bar_formatter import analyze_race_bar_consistency
+
+FPS = 60
+FRAME_MS = 1000 / FPS
+# (peak time ms, peak bat velocity m/s)
+SWINGS = [(5000, 28.0), (14000, 30.0), (22500, 25.0), (40000, 27.0)]
+WAGGLE = (31000, 8.0)  # below half the fastest swing
+ECHO = (14250, 20.0)   # follow-through bump inside swing 2's refractory period
+
+
+def _bump(t, center, height, width_ms=60):
+    return height * math.exp(-((t - center) / width_ms) ** 2)
+
+
+def _session(duration_ms=45000):
+    angles, velocities, poses = [], [], []
+    for frame in range(int(duration_ms / FRAME_MS)):
+        t = frame * FRAME_MS
+        bat = 0.3 + sum(_bump(t, c, h) for c, h in SWINGS + [WAGGLE, ECHO])
+        pelvis = 0.0
+        for center, _ in SWINGS:
+            if center - 900 <= t < center - 300:
+                pelvis = -20 * (t - (center - 900)) / 600    # load back
+            elif center - 300 <= t < center + 300:
+                pelvis = -20 + 60 * (t - (center - 300)) / 600  # rotate through
+        angles.append(JointAngles(frame, t, pelvis, pelvis * 1.2, 0, 0, 90, 0, 20))
+        velocities.append(JointVelocities(
+            frame, t,
+            pelvis_velocity=sum(_bump(t, c - 60, 500 + h) for c, h in SWINGS),
+            torso_velocity=sum(_bump(t, c - 40, 700 + h) for c, h in SWINGS),
+            shoulder_velocity=sum(_bump(t, c - 30, 650) for c, _ in SWINGS),
+            hip_velocity=0.0,
+            hand_velocity=sum(_bump(t, c - 15, 9) for c, _ in SWINGS),
+            bat_velocity=bat
+        ))
+        poses.append(PoseFrame(frame, t, {"nose": PoseLandmark(0.5 + 0.001 * math.sin(t / 300), 0.2, 0, 0.9)}, True))
+    return angles, velocities, poses
+
+
+class TestFindSwingWindows:
+    """Peak detection with a refractory period finds every swing once"""
+
+    def test_every_swing_found(self):
+        _, velocities, _ = _session()
+        detector = EventDetector()
+        windows = detector.find_swing_windows(velocities)
+
+        assert [round(w.peak_velocity_ms, -2) for w in windows] == [c for c, _ in SWINGS]
+        assert all(a.end_ms <= b.start_ms for a, b in zip(windows, windows[1:]))
+        assert all(w.duration_ms() <= 2000 for w in windows)
+
+        fastest = max(windows, key=lambda w: w.peak_velocity_value)
+        assert fastest == detector.isolate_swing_window(velocities)
+
+    def test_thresholds(self):
+        _, velocities, _ = _session()
+        detector = EventDetector()
+        # Relative threshold off: the waggle counts as a swing
+        assert len(detector.find_swing_windows(velocities, min_relative_peak=0.0)) == 5
+        # Short refractory period: the follow-through bump becomes its own window
+        assert len(detector.find_swing_windows(velocities, refractory_ms=100)) == 5
+        assert detector.find_swing_windows(velocities, min_peak_velocity=50) == []
+        assert detector.find_swing_windows(velocities[:5]) == []
+
+
+class TestSwingSessionAnalyzer:
+    """Each window scored independently; parallel equals sequential"""
+
+    def test_session_results(self):
+        angles, velocities, poses = _session()
+        session = SwingSessionAnalyzer().analyze_session(angles, velocities, poses, weight_lbs=185)
+
+        assert len(session.swings) == session.windows_found == len(SWINGS)
+        assert [s.swing_number for s in session.swings] == [1, 2, 3, 4]
+        for swing, (center, _) in zip(session.swings, SWINGS):
+            assert swing.window.start_ms < swing.events.foot_down_ms < swing.events.contact_ms
+            assert abs(swing.events.contact_ms - center) <= FRAME_MS
+            assert swing.tempo['ratio'] > 0
+            assert swing.stability['grade'] != 'N/A'
+
+        assert session.tempo_consistency == analyze_tempo_consistency([s.tempo for s in session.swings])
+        assert session.race_bar_consistency == analyze_race_bar_consistency([s.race_bar for s in session.swings])
+        assert session.summary['best_swing_number'] == 2
+        assert session.to_dict()['swing_count'] == 4
+
+    @pytest.mark.parametrize("use_processes", [False, True])
+    def test_parallel_matches_sequential(self, use_processes):
+        angles, velocities, poses = _session()
+        sequential = SwingSessionAnalyzer(max_workers=1).analyze_session(angles, velocities, poses)
+        parallel = SwingSessionAnalyzer(max_workers=2, use_processes=use_processes).analyze_session(
+            angles, velocities, poses
+        )
+        assert parallel.to_dict() == sequential.to_dict()
+
+    def test_window_events_match_single_swing_path(self):
+        angles, velocities, _ = _session(duration_ms=9000)  # first swing only
+        detector = EventDetector()
+        window = detector.isolate_swing_window(velocities)
+        window_angles = [a for a in angles if window.start_ms <= a.timestamp_ms <= window.end_ms]
+
+        assert detector.detect_window_events(window_angles, window) == \
+            detector.detect_all_events(angles, velocities)
+
+    def test_no_swings(self):
+        angles, velocities, _ = _session(duration_ms=3000)
+        session = SwingSessionAnalyzer().analyze_session(angles, velocities)
+        assert session.swings == [] and session.summary == {}
+        assert session.tempo_consistency['consistency_rating'] == 'N/A'
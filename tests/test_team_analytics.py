@@ -0,0 +1,162 @@
+"""
+Team Analytics Tests
+Incremental team aggregates and roster indexes vs a full roster rescan,
+and compare_athletes with latest metrics from the ProgressTracker
+"""
+
+import pytest
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import sessionmaker
+
+from physics_engine.team_management import TeamManagementSystem, AthleteStatus, AssignmentStatus
+from conftest import training_session
+from physics_engine.progress_tracker import ProgressTracker
+from progress_session_store import SqlProgressSessionStore
+
+POSITIONS = [None, 'OF', '1B', 'SS', 'C', 'P']
+STATUSES = ['active', 'active', 'active', 'injured', 'inactive', 'graduated']
+
+
+def _rescan_analytics(system, team_id):
+    """Previous get_team_analytics body: rescan roster and assignment lists"""
+    roster = system.get_team_roster(team_id)
+    if not roster:
+        return {'total_athletes': 0, 'active_athletes': 0, 'error': 'No athletes in team'}
+    active = [a for a in roster if a.status == AthleteStatus.ACTIVE]
+    n = len(active) or 1
+    total = sum(len(system.assignments.get(a.athlete_id, [])) for a in active)
+    completed = sum(
+        len([x for x in system.assignments.get(a.athlete_id, []) if x.status == AssignmentStatus.COMPLETED])
+        for a in active
+    )
+    positions = {}
+    for a in active:
+        if a.position:
+            positions[a.position] = positions.get(a.position, 0) + 1
+    return {
+        'team_id': team_id,
+        'total_athletes': len(roster),
+        'active_athletes': len(active),
+        'injured_athletes': len([a for a in roster if a.status == AthleteStatus.INJURED]),
+        'avg_height_inches': round(sum(a.height_inches for a in active) / n, 1),
+        'avg_wingspan_inches': round(sum(a.wingspan_inches for a in active) / n, 1),
+        'avg_weight_lbs': round(sum(a.weight_lbs for a in active) / n, 1),
+        'avg_age': round(sum(a.age for a in active) / n, 1),
+        'total_assignments': total,
+        'completed_assignments': completed,
+        'completion_rate': round(completed / total * 100, 1) if total else 0,
+        'positions': positions,
+    }
+
+
+def _athlete_data(rng, team_id, i):
+    return {
+        'name': f"Athlete {i}",
+        'email': f"athlete{i}@example.com",
+        'team_id': team_id,
+        'date_of_birth': datetime(2004, 1, 1) + timedelta(days=rng.randint(0, 2500)),
+        'height_inches': rng.randint(62, 78),
+        'wingspan_inches': rng.randint(62, 80),
+        'weight_lbs': rng.randint(140, 240),
+        'bat_weight_oz': rng.randint(28, 33),
+        'status': rng.choice(STATUSES),
+        'position': rng.choice(POSITIONS),
+        'jersey_number': i,
+    }
+
+
+@pytest.fixture
+def system():
+    system = TeamManagementSystem(progress_tracker=ProgressTracker())
+    coach_id = system.create_coach({'name': 'Coach', 'email': 'c@example.com', 'organization': 'THS'})
+    for name in ('Varsity', 'JV', 'Freshman'):
+        system.create_team({'name': name, 'coach_id': coach_id, 'season': '2025 Spring'})
+    return system
+
+
+class TestIncrementalAggregates:
+    """Aggregates stay equal to a rescan through adds, updates and assignments"""
+
+    def test_random_operations_match_rescan(self, system):
+        rng = random.Random(5)
+        team_ids = list(system.teams) + ['no_such_team']
+        athlete_ids, assignment_ids = [], []
+
+        for step in range(1500):
+            action = rng.random()
+            if action < 0.25 or not athlete_ids:
+                athlete_ids.append(system.add_athlete(_athlete_data(rng, rng.choice(team_ids), step)))
+            elif action < 0.5:
+                assignment_ids.append(system.assign_drill({
+                    'coach_id': 'c', 'athlete_id': rng.choice(athlete_ids), 'drill_id': 'd',
+                    'drill_name': 'Drill', 'due_date': datetime.now() + timedelta(days=rng.randint(-3, 3)),
+                    'sets_required': 4,
+                }))
+            elif action < 0.7 and assignment_ids:
+                system.update_assignment_progress(rng.choice(assignment_ids), rng.randint(0, 5))
+            elif action < 0.95:
+                updates = rng.choice([
+                    {'status': rng.choice(STATUSES)},
+                    {'position': rng.choice(POSITIONS), 'height_inches': rng.randint(62, 78)},
+                    {'team_id': rng.choice(team_ids)},
+                    {'date_of_birth': datetime(2005, 2, 28) + timedelta(days=rng.randint(0, 800))},
+                ])
+                assert system.update_athlete(rng.choice(athlete_ids), updates)
+            else:
+                system.get_athlete_assignments(rng.choice(athlete_ids))  # marks overdue
+
+            if step % 50 == 0:
+                for team_id in system.teams:
+                    assert system.get_team_analytics(team_id) == _rescan_analytics(system, team_id)
+
+        for team_id in system.teams:
+            assert system.get_team_analytics(team_id) == _rescan_analytics(system, team_id)
+            roster = system.get_team_roster(team_id)
+            assert [a.team_id for a in roster] == [team_id] * len(roster)
+            for status in ('active', 'injured', 'inactive', 'graduated'):
+                assert system.get_team_roster(team_id, status) == \
+                    [a for a in roster if a.status == AthleteStatus(status)]
+
+    def test_empty_and_all_inactive_team(self, system):
+        team_id = next(iter(system.teams))
+        assert system.get_team_analytics(team_id)['error'] == 'No athletes in team'
+        athlete_id = system.add_athlete(_athlete_data(random.Random(1), team_id, 1))
+        system.update_athlete(athlete_id, {'status': 'injured'})
+        analytics = system.get_team_analytics(team_id)
+        assert analytics['active_athletes'] == 0 and analytics['injured_athletes'] == 1
+        assert analytics['avg_height_inches'] == 0
+
+    def test_coach_teams_index(self, system):
+        coach_id = next(iter(system.coaches))
+        assert [t.name for t in system.get_coach_teams(coach_id)] == ['Varsity', 'JV', 'Freshman']
+        assert system.get_coach_teams('nobody') == []
+        assert system.update_assignment_progress('missing', 1) is False
+
+
+class TestCompareAthletes:
+    """Latest metrics come from the ProgressTracker in one bulk lookup"""
+
+    def test_latest_metrics_bulk_from_store(self, system, db_engine, count_queries):
+        team_id = next(iter(system.teams))
+        rng = random.Random(2)
+        athlete_ids = [system.add_athlete(_athlete_data(rng, team_id, i)) for i in range(3)]
+
+        store = SqlProgressSessionStore(sessionmaker(bind=db_engine))
+        writer = ProgressTracker(store=store)
+        writer.add_session(training_session(athlete_ids[0], 0, 68.0, 60))
+        writer.add_session(training_session(athlete_ids[0], 9, 71.5, 66))
+        writer.add_session(training_session(athlete_ids[1], 3, 74.0, 70))
+
+        system.progress_tracker = ProgressTracker(store=store)  # fresh process, nothing loaded
+        with count_queries() as counter:
+            comparison = system.compare_athletes(athlete_ids + ['unknown'], 'bat_speed')
+        assert len(counter.selects) == 1
+
+        assert [c['metric_value'] for c in comparison] == [71.5, 74.0, None]
+        assert comparison[0]['ground_score'] == 66
+        assert comparison[0]['latest_session_date'] == '2025-04-10T00:00:00'
+        assert system.compare_athletes(athlete_ids[:1], 'ground_score')[0]['metric_value'] == 66
+        with pytest.raises(ValueError):
+            system.compare_athletes(athlete_ids, 'not_a_metric')
@@ -0,0 +1,252 @@
+"""
+Team Batch Report Tests
+Whole-roster report bundles: one bulk session read, reports rendered in a
+bounded pool, progress reporting, and the zipped bundle layout
+"""
+
+import json
+import os
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from conftest import training_session
+from physics_engine.progress_tracker import ProgressTracker
+from physics_engine.team_management import TeamManagementSystem
+from physics_engine import team_report_batch
+from physics_engine.team_report_batch import (
+    BatchQueueFullError, TeamReportBatchJob, build_report_data, cleanup_batch_reports, get_batch_report_job,
+    start_batch_report_job
+)
+from progress_session_store import SqlProgressSessionStore
+
+WEEK_START = datetime(2025, 4, 7)
+WEEK_END = datetime(2025, 4, 13, 23, 59, 59)
+
+
+def _athlete(system, team_id, name, status='active'):
+    return system.add_athlete({
+        'name': name, 'email': f"{name.split()[0].lower()}@example.com", 'team_id': team_id,
+        'date_of_birth': datetime(2007, 5, 1), 'height_inches': 70, 'wingspan_inches': 72,
+        'weight_lbs': 185, 'bat_weight_oz': 31, 'status': status
+    })
+
+
+def _team(tracker, roster_size=2):
+    """Team whose first `roster_size` athletes trained in WEEK; plus a rested and an injured athlete"""
+    system = TeamManagementSystem(progress_tracker=tracker)
+    coach_id = system.create_coach({'name': 'Coach', 'email': 'c@example.com', 'organization': 'THS'})
+    team_id = system.create_team({'name': 'Varsity', 'coach_id': coach_id, 'season': '2025 Spring'})
+    athlete_ids = [_athlete(system, team_id, f"Player {i}") for i in range(roster_size)]
+    rested = _athlete(system, team_id, "Rested Player")
+    injured = _athlete(system, team_id, "Injured Player", status='injured')
+
+    for i, athlete_id in enumerate(athlete_ids):
+        for day, bat_speed, score, efficiency in ((2, 60.0, 50, 60.0), (7, 65.0, 55, 62.0), (10, 68.0, 60, 66.5)):
+            tracker.add_session(training_session(  # day 2 is before the week
+                athlete_id, day, bat_speed + i, score, overall_efficiency=efficiency,
+                engine_score_adjusted=score + 10, weapon_score_adjusted=score - 10
+            ))
+    tracker.add_session(training_session(rested, 1, 70.0, 60))
+    tracker.add_session(training_session(injured, 8, 70.0, 60))
+    return system, team_id, athlete_ids
+
+
+class TrackingExecutor(ThreadPoolExecutor):
+    """Thread pool recording how many renders were in flight at once"""
+
+    def __init__(self, fail_for=None):
+        super().__init__(max_workers=8)
+        self.in_flight = self.max_in_flight = 0
+        self.fail_for = fail_for
+        self._count_lock = threading.Lock()
+
+    def submit(self, fn, player_data, *args):
+        def tracked():
+            try:
+                time.sleep(0.01)
+                if player_data['name'] == self.fail_for:
+                    raise RuntimeError("renderer crashed")
+                return fn(player_data, *args)
+            finally:
+                with self._count_lock:
+                    self.in_flight -= 1
+
+        with self._count_lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return super().submit(tracked)
+
+
+class TestTeamReportBatch:
+    """Bundle contents, bulk loading, concurrency and progress"""
+
+    def test_bundle_from_one_bulk_read(self, db_engine, count_queries, tmp_path):
+        store = SqlProgressSessionStore(sessionmaker(bind=db_engine))
+        system, team_id, athlete_ids = _team(ProgressTracker(store=store))
+        system.progress_tracker = ProgressTracker(store=store)  # fresh process, nothing loaded
+
+        updates = []
+        output = str(tmp_path / 'reports' / 'week.zip')
+        job = TeamReportBatchJob(system, team_id, WEEK_START, WEEK_END, output, max_workers=2,
+                                 on_progress=lambda p: updates.append((p.status, p.completed)))
+        with count_queries() as counter:
+            progress = job.run()
+        assert len(counter.selects) == 1
+
+        assert progress.status == 'completed', progress.error
+        assert (progress.total, progress.completed, progress.failed, progress.skipped) == (2, 2, 0, 1)
+        assert progress.reports_per_minute > 0
+        assert updates[0] == ('running', 0) and updates[-1] == ('completed', 2)
+        assert [completed for _, completed in updates].count(1) == 1
+
+        with zipfile.ZipFile(output) as bundle:
+            names = sorted(bundle.namelist())
+            manifest = json.loads(bundle.read('manifest.json'))
+            html = bundle.read(next(n for n in names if n.startswith('player_1_') and n.endswith('report.html')))
+            pdf = next(n for n in names if n.endswith('composite.pdf'))
+            assert bundle.getinfo(pdf).compress_type == zipfile.ZIP_STORED
+            assert bundle.read(pdf).startswith(b'%PDF')
+
+        assert len(names) == 7  # manifest + 3 files for each of 2 athletes
+        assert [a['name'] for a in manifest['athletes']] == ['Player 0', 'Player 1']
+        assert manifest['athletes'][0]['sessions'] == 2 and manifest['completed'] == 2
+        assert b'Player 1' in html and b'<div class="value">69.0</div>' in html  # latest session in range
+        assert html.count(b'src="data:image/png;base64,') == 3  # gap, radar, composite
+
+    def test_concurrency_limit_and_failures(self, tmp_path):
+        system, team_id, athlete_ids = _team(ProgressTracker(), roster_size=6)
+        system.update_athlete(athlete_ids[2], {'name': 'Broken'})
+        executor = TrackingExecutor(fail_for='Broken')
+
+        job = TeamReportBatchJob(system, team_id, WEEK_START, WEEK_END, str(tmp_path / 'week.zip'),
+                                 formats=['png'], max_workers=2, executor=executor)
+        progress = job.run()
+        executor.shutdown()
+
+        assert executor.max_in_flight == 2
+        assert progress.status == 'completed'
+        assert (progress.completed, progress.failed) == (5, 1)
+        assert progress.errors == {athlete_ids[2]: 'renderer crashed'}
+        with zipfile.ZipFile(progress.output_path) as bundle:
+            manifest = json.loads(bundle.read('manifest.json'))
+        assert [a.get('error') for a in manifest['athletes'] if a['name'] == 'Broken'] == ['renderer crashed']
+
+    def test_bad_input(self, tmp_path):
+        system, team_id, _ = _team(ProgressTracker())
+        with pytest.raises(ValueError):
+            TeamReportBatchJob(system, team_id, WEEK_START, WEEK_END, str(tmp_path / 'x.zip'), formats=['docx'])
+
+        progress = TeamReportBatchJob(system, 'no_such_team', WEEK_START, WEEK_END, str(tmp_path / 'x.zip')).run()
+        assert progress.status == 'failed' and 'not found' in progress.error
+
+        empty = TeamReportBatchJob(system, team_id, datetime(2026, 1, 1), datetime(2026, 1, 7),
+                                   str(tmp_path / 'empty.zip')).run()
+        assert empty.status == 'completed' and (empty.total, empty.skipped) == (0, 3)
+
+    def test_report_data_from_sessions(self):
+        system, team_id, athlete_ids = _team(ProgressTracker())
+        athlete = system.get_athlete(athlete_ids[0])
+        sessions = system.progress_tracker.get_sessions(athlete.athlete_id, start_date=WEEK_START, end_date=WEEK_END)
+        player_data, analysis_data = build_report_data(athlete, sessions)
+        assert player_data['name'] == 'Player 0' and player_data['height_inches'] == 70
+        assert analysis_data['actual_bat_speed'] == 68.0 and analysis_data['potential_bat_speed'] == 76.0
+        assert analysis_data['efficiency_change'] == 4.5
+        assert analysis_data['recommendations']['primary_component'] == 'WEAPON'
+
+
+class TestBackgroundJobs:
+    """Process-wide job queue and expiry of finished bundles"""
+
+    def test_jobs_share_a_bounded_queue(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(team_report_batch, 'MAX_QUEUED_JOBS', 1)
+        system, _, _ = _team(ProgressTracker())
+        running, release = threading.Event(), threading.Event()
+
+        def block(progress):
+            running.set()
+            release.wait(10)
+
+        # Unknown team: each job fails right after reporting 'running'
+        first = start_batch_report_job(system, 'no_such_team', WEEK_START, WEEK_END, str(tmp_path), on_progress=block)
+        assert running.wait(10)
+        second = start_batch_report_job(system, 'no_such_team', WEEK_START, WEEK_END, str(tmp_path))
+        with pytest.raises(BatchQueueFullError):
+            start_batch_report_job(system, 'no_such_team', WEEK_START, WEEK_END, str(tmp_path))
+        assert (first.status, second.status) == ('running', 'pending')
+
+        release.set()
+        team_report_batch._job_queue.join()
+        assert get_batch_report_job(first.job_id).done and get_batch_report_job(second.job_id).done
+
+    def test_expired_jobs_and_bundles_are_removed(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(team_report_batch, 'REPORT_DIR', str(tmp_path))
+        system, team_id, _ = _team(ProgressTracker())
+
+        def job(name, finished_ago):
+            job = TeamReportBatchJob(system, team_id, WEEK_START, WEEK_END, str(tmp_path / name))
+            (tmp_path / name).write_bytes(b'PK')
+            job.progress.status = 'completed'
+            job.progress.finished_at = time.monotonic() - finished_ago
+            monkeypatch.setitem(team_report_batch._batch_jobs, job.progress.job_id, job)
+            return job.progress
+
+        old, recent = job('team_old.zip', 7200), job('team_recent.zip', 60)
+        orphan = tmp_path / 'team_orphan.zip'
+        orphan.write_bytes(b'PK')
+        os.utime(orphan, (time.time() - 7200,) * 2)
+        (tmp_path / 'notes.txt').write_text('kept')
+
+        assert cleanup_batch_reports(ttl_seconds=3600) == 1
+        assert get_batch_report_job(old.job_id) is None and get_batch_report_job(recent.job_id) is recent
+        assert sorted(os.listdir(tmp_path)) == ['notes.txt', 'team_recent.zip']
+
+
+class TestBatchReportRoutes:
+    """Start, poll and download through the team API"""
+
+    def test_start_poll_download(self, monkeypatch, tmp_path):
+        pytest.importorskip("email_validator")  # team_management_routes uses EmailStr
+        import team_management_routes
+        from physics_engine import team_report_batch
+
+        system, team_id, _ = _team(ProgressTracker())
+        monkeypatch.setattr(team_management_routes, 'team_system', system)
+        monkeypatch.setattr(team_report_batch, 'REPORT_DIR', str(tmp_path))
+        app = FastAPI()
+        app.include_router(team_management_routes.router)
+        client = TestClient(app)
+
+        response = client.post(f"/api/teams/teams/{team_id}/reports/batch",
+                               json={'start_date': '2025-04-07', 'end_date': '2025-04-13', 'formats': ['png'],
+                                     'max_workers': 1})
+        assert response.status_code == 200
+        job = response.json()['job']
+        assert job['end_date'] == '2025-04-13T23:59:59.999999'
+
+        deadline = time.monotonic() + 120
+        while job['status'] not in ('completed', 'failed') and time.monotonic() < deadline:
+            time.sleep(0.2)
+            job = client.get(f"/api/teams/reports/batch/{job['job_id']}").json()['job']
+        assert job['status'] == 'completed' and job['completed'] == 2
+        assert job['percent_complete'] == 100.0
+
+        download = client.get(f"/api/teams/reports/batch/{job['job_id']}/download")
+        assert download.headers['content-type'] == 'application/zip'
+        assert download.content.startswith(b'PK')
+
+        os.remove(get_batch_report_job(job['job_id']).output_path)  # as the TTL sweep does
+        assert client.get(f"/api/teams/reports/batch/{job['job_id']}/download").status_code == 410
+
+        assert client.get("/api/teams/reports/batch/nope").status_code == 404
+        assert client.post("/api/teams/teams/nope/reports/batch",
+                           json={'start_date': '2025-04-07', 'end_date': '2025-04-13'}).status_code == 404
+        assert client.post(f"/api/teams/teams/{team_id}/reports/batch",
+                           json={'start_date': '2025-04-13', 'end_date': '2025-04-07'}).status_code == 400
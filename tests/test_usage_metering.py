@@ -0,0 +1,295 @@
+"""
+Usage Metering Tests
+Atomic check-and-increment counters, write-behind batching, rollups,
+and limit enforcement under concurrent workers
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+import usage_metering
+from models import Base, UsageCounter
+from usage_metering import UsageMeter, current_period_start
+from whop_integration import SubscriptionTier
+from whop_middleware import check_swing_limit
+from physics_engine.whop_subscription import SubscriptionManager, SubscriptionTier as PlanTier
+
+PERIOD = datetime(2026, 10, 1)
+NEXT_PERIOD = datetime(2026, 11, 1)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def session_factory(db_engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+
+@pytest.fixture
+def meter(session_factory):
+    return UsageMeter(session_factory, flush_interval_seconds=3600, clock=FakeClock())
+
+
+def _stored(session_factory, user_id, usage_type="swings", period=PERIOD):
+    with session_factory() as db:
+        return db.execute(
+            select(UsageCounter.count).where(
+                UsageCounter.user_id == user_id,
+                UsageCounter.usage_type == usage_type,
+                UsageCounter.period_start == period
+            )
+        ).scalar_one_or_none()
+
+
+class TestTryConsume:
+    """Conditional UPDATE ... RETURNING"""
+
+    def test_stops_at_limit(self, meter, session_factory):
+        results = [meter.try_consume("u1", "swings", limit=3, period_start=PERIOD) for _ in range(5)]
+        assert [r.allowed for r in results] == [True, True, True, False, False]
+        assert [r.used for r in results] == [1, 2, 3, 3, 3]
+        assert results[-1].remaining == 0
+        assert _stored(session_factory, "u1") == 3
+
+    def test_amount_larger_than_remaining_is_refused_whole(self, meter, session_factory):
+        meter.try_consume("u1", "swings", limit=5, amount=4, period_start=PERIOD)
+        refused = meter.try_consume("u1", "swings", limit=5, amount=2, period_start=PERIOD)
+        assert not refused.allowed and refused.used == 4
+        assert _stored(session_factory, "u1") == 4
+
+    def test_unlimited_and_periods(self, meter, session_factory):
+        for _ in range(20):
+            assert meter.try_consume("u1", "swings", period_start=PERIOD).allowed
+        assert meter.try_consume("u1", "swings", limit=1, period_start=NEXT_PERIOD).allowed
+        assert _stored(session_factory, "u1") == 20
+        assert _stored(session_factory, "u1", period=NEXT_PERIOD) == 1
+        assert meter.try_consume("u1", "swings", period_start=PERIOD).remaining is None
+
+    def test_default_period_is_calendar_month(self):
+        assert current_period_start(datetime(2026, 10, 19, 15, 30)) == datetime(2026, 10, 1)
+
+
+class TestWriteBehind:
+    """Coalesced increments and flushing"""
+
+    def test_increments_coalesce_into_one_upsert(self, meter, session_factory, count_queries):
+        for _ in range(50):
+            meter.record("u1", "sessions", period_start=PERIOD)
+            meter.record("u2", "videos", 2, period_start=PERIOD)
+        assert _stored(session_factory, "u1", "sessions") is None
+        assert meter.pending("u1", "sessions", PERIOD) == 50
+
+        with count_queries() as counter:
+            assert meter.flush() == 2
+        assert len([s for s in counter.statements if s.lstrip().upper().startswith("INSERT")]) == 1
+        assert _stored(session_factory, "u1", "sessions") == 50
+        assert _stored(session_factory, "u2", "videos") == 100
+
+        meter.record("u1", "sessions", 5, period_start=PERIOD)
+        meter.flush()
+        assert _stored(session_factory, "u1", "sessions") == 55
+
+    def test_flushes_when_due(self, session_factory):
+        clock = FakeClock()
+        meter = UsageMeter(session_factory, flush_interval_seconds=10, max_pending=3, clock=clock)
+        meter.record("u1", "sessions", period_start=PERIOD)
+        assert _stored(session_factory, "u1", "sessions") is None
+
+        clock.now += 10
+        meter.record("u1", "sessions", period_start=PERIOD)
+        assert _stored(session_factory, "u1", "sessions") == 2
+
+        for user in ("a", "b", "c"):
+            meter.record(user, "sessions", period_start=PERIOD)
+        assert _stored(session_factory, "c", "sessions") == 1
+
+    def test_failed_flush_keeps_increments(self, session_factory):
+        def broken_factory():
+            raise RuntimeError("database down")
+
+        meter = UsageMeter(broken_factory, flush_interval_seconds=3600)
+        meter.record("u1", "sessions", 3, period_start=PERIOD)
+        assert meter.flush() == 0
+        assert meter.pending("u1", "sessions", PERIOD) == 3
+
+        meter.session_factory = session_factory
+        assert meter.flush() == 1
+        assert _stored(session_factory, "u1", "sessions") == 3
+
+
+class TestRollups:
+    """Snapshot reads for usage stats"""
+
+    def test_rollup_serves_summary_without_queries(self, meter, count_queries):
+        meter.try_consume("u1", "swings", limit=10, period_start=PERIOD)
+        meter.record("u1", "sessions", 2, period_start=PERIOD)
+        meter.record("u2", "videos", period_start=PERIOD)
+        assert meter.rollup(PERIOD) == 2
+
+        meter.try_consume("u1", "swings", limit=10, period_start=PERIOD)
+        meter.record("u1", "sessions", period_start=PERIOD)
+        with count_queries() as counter:
+            summary = meter.usage_summary("u1", PERIOD)
+        assert counter.count == 0
+        assert summary == {"swings": 2, "sessions": 3}
+
+    def test_stale_rollup_reads_database(self, meter, session_factory):
+        meter.rollup(PERIOD)
+        other_worker = UsageMeter(session_factory)
+        other_worker.try_consume("u1", "swings", limit=10, period_start=PERIOD)
+        assert meter.get_usage("u1", "swings", PERIOD) == 0  # snapshot still fresh
+
+        meter.clock.now += meter.rollup_max_age_seconds
+        assert meter.get_usage("u1", "swings", PERIOD) == 1
+        assert meter.rollup_if_due(PERIOD)
+        assert not meter.rollup_if_due(PERIOD)
+
+
+def _worker_consume(url, attempts, limit, results):
+    engine = create_engine(url, connect_args={"timeout": 30})
+    worker_meter = UsageMeter(sessionmaker(bind=engine))
+    allowed = sum(
+        worker_meter.try_consume("shared", "swings", limit=limit, period_start=PERIOD).allowed
+        for _ in range(attempts)
+    )
+    results.put(allowed)
+    engine.dispose()
+
+
+class TestConcurrency:
+    """The limit holds with many workers uploading for the same user"""
+
+    @pytest.fixture
+    def file_db(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'usage.db'}"
+        engine = create_engine(url, connect_args={"timeout": 30})
+        Base.metadata.create_all(bind=engine, tables=[UsageCounter.__table__])
+        yield url, sessionmaker(bind=engine)
+        engine.dispose()
+
+    def test_threads(self, file_db):
+        url, factory = file_db
+        meter = UsageMeter(factory)
+        allowed = []
+
+        def upload():
+            allowed.append(sum(
+                meter.try_consume("shared", "swings", limit=40, period_start=PERIOD).allowed
+                for _ in range(15)
+            ))
+
+        threads = [threading.Thread(target=upload) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sum(allowed) == 40
+        assert _stored(factory, "shared") == 40
+
+    def test_processes(self, file_db):
+        url, factory = file_db
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        workers = [context.Process(target=_worker_consume, args=(url, 20, 50, results)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert sum(results.get() for _ in workers) == 50
+        assert _stored(factory, "shared") == 50
+
+
+class TestIntegrations:
+    """check_swing_limit and SubscriptionManager use the meter"""
+
+    def test_check_swing_limit(self, meter, monkeypatch):
+        monkeypatch.setattr(usage_metering, "_usage_meter", meter)
+        calls = []
+
+        @check_swing_limit
+        async def analyze(user):
+            calls.append(user["user_id"])
+            return "ok"
+
+        free_user = {"user_id": "free", "tier": SubscriptionTier.FREE}
+        assert asyncio.run(analyze(user=free_user)) == "ok"
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(analyze(user=free_user))
+        assert exc.value.status_code == 429
+        assert exc.value.detail["swings_used"] == 1
+
+        pro_user = {"user_id": "pro", "tier": SubscriptionTier.PRO}
+        for _ in range(5):
+            asyncio.run(analyze(user=pro_user))
+        assert calls == ["free"] + ["pro"] * 5
+        assert meter.get_usage("pro", "swings") == 5
+        assert meter.get_usage("free", "swings") == 1
+
+    def test_subscription_manager(self, meter):
+        manager = SubscriptionManager("key", "secret", meter=meter)
+        manager.create_subscription("free_user", PlanTier.FREE)
+        manager.create_subscription("pro_user", PlanTier.PRO)
+
+        outcomes = [manager.track_usage("free_user", "swings") for _ in range(12)]
+        assert outcomes.count(True) == 10
+        for _ in range(30):
+            manager.track_usage("pro_user", "swings")
+        manager.track_usage("pro_user", "sessions", 2)
+
+        assert meter.rollup_if_due() is True
+        free_stats = manager.get_usage_stats("free_user")
+        pro_stats = manager.get_usage_stats("pro_user")
+        assert (free_stats["swings_used"], free_stats["max_swings"]) == (10, 10)
+        assert (pro_stats["swings_used"], pro_stats["sessions_used"]) == (30, 2)
+        assert pro_stats["max_swings"] == "unlimited"
+        assert pro_stats["period_start"] == current_period_start().isoformat()
+
+    def test_shared_subscription_manager_is_metered(self, meter, monkeypatch):
+        from physics_engine import whop_subscription
+
+        monkeypatch.setattr(usage_metering, "_usage_meter", meter)
+        monkeypatch.setattr(whop_subscription, "_subscription_manager", None)
+        assert whop_subscription.get_subscription_manager().meter is meter
+
+
+class TestBackgroundWorker:
+    """Flushes and rollups off the caller's thread"""
+
+    def test_worker_flushes_and_rolls_up(self, session_factory, monkeypatch):
+        meter = UsageMeter(session_factory, flush_interval_seconds=0.05, max_pending=1)
+        caller = threading.get_ident()
+        flush_threads = []
+        flush = meter.flush
+        monkeypatch.setattr(meter, "flush", lambda: flush_threads.append(threading.get_ident()) or flush())
+
+        meter.start()
+        assert meter.start() is meter._worker  # idempotent
+        meter.record("u1", "sessions", 3)  # due (max_pending=1), handed to the worker
+        deadline = time.monotonic() + 5
+        while _stored(session_factory, "u1", "sessions", current_period_start()) != 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        while meter._rollup_at is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert _stored(session_factory, "u1", "sessions", current_period_start()) == 3
+        assert caller not in flush_threads
+        assert meter._rollup_period == current_period_start()
+        meter.record("u2", "videos")
+        meter.close()
+        assert meter._worker is None
+        assert _stored(session_factory, "u2", "videos", current_period_start()) == 1
@@ -0,0 +1,117 @@
+"""
+Video Search Index Tests
+Inverted-index search must return what the filter-and-sort scan does
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from physics_engine.video_library import (
+    VideoLibrary, VideoMetadata, VideoSource, VideoCategory, DrillStage
+)
+
+WORDS = ["hip", "rotation", "stride", "load", "barrel", "path", "connection", "tempo",
+         "separation", "weight", "shift", "ground", "force", "game-speed", "45°", "Step"]
+TAGS = ["ground", "engine", "weapon", "timing", "foundation", "integration", "spinner", "power"]
+
+
+def _video(rng, i):
+    return VideoMetadata(
+        video_id=f"clip_{i:05d}",
+        title=" ".join(rng.sample(WORDS, 3)).title(),
+        description=" ".join(rng.choice(WORDS) for _ in range(12)) + ".",
+        source=VideoSource.S3,
+        source_url=f"s3://clips/{i}.mp4",
+        category=rng.choice(list(VideoCategory)),
+        tags=set(rng.sample(TAGS, rng.randint(0, 3))),
+        drill_ids={f"drill_{rng.randint(0, 40)}"},
+        drill_stage=rng.choice([None] + list(DrillStage)),
+        created_at=datetime(2025, 1, 1) + timedelta(days=rng.randint(0, 30)),
+        view_count=rng.randint(0, 5),
+        featured=rng.random() < 0.2,
+    )
+
+
+def _scan_search(library, query=None, tags=None, category=None, drill_stage=None, featured_only=False):
+    """Reference: filter every video, then featured / most viewed / newest"""
+    results = list(library.videos.values())
+    if featured_only:
+        results = [v for v in results if v.featured]
+    if category:
+        results = [v for v in results if v.category == category]
+    if drill_stage:
+        results = [v for v in results if v.drill_stage == drill_stage]
+    if tags:
+        results = [v for v in results if any(tag in v.tags for tag in tags)]
+    if query:
+        q = query.lower()
+        results = [v for v in results if q in v.title.lower() or q in v.description.lower()]
+    results.sort(key=lambda v: (v.featured, v.view_count, v.created_at), reverse=True)
+    return results
+
+
+def _random_filters(rng):
+    words = " ".join(rng.sample(WORDS, rng.randint(1, 2)))
+    start = rng.randint(0, max(0, len(words) - 2))
+    return dict(
+        query=rng.choice([None, words, words[start:start + rng.randint(1, 9)], "zzz"]),
+        tags=rng.choice([None, set(rng.sample(TAGS, 2)), {"missing"}]),
+        category=rng.choice([None, VideoCategory.DRILL, VideoCategory.CONCEPT]),
+        drill_stage=rng.choice([None, DrillStage.STAGE_1]),
+        featured_only=rng.random() < 0.3,
+    )
+
+
+class TestVideoSearchIndex:
+    """Posting-list search vs the full scan"""
+
+    def test_search_matches_scan(self):
+        rng = random.Random(11)
+        library = VideoLibrary()
+        for i in range(400):
+            library.add_video(_video(rng, i))
+
+        for _ in range(500):
+            filters = _random_filters(rng)
+            assert library.search_videos(**filters) == _scan_search(library, **filters), filters
+
+    def test_incremental_updates(self):
+        rng = random.Random(12)
+        library = VideoLibrary()
+        for i in range(200):
+            library.add_video(_video(rng, i))
+
+        for i in range(300):
+            video_id = f"clip_{rng.randint(0, 199):05d}"
+            action = rng.random()
+            if action < 0.5:
+                library.increment_view_count(video_id)
+            elif action < 0.8:
+                library.update_video(video_id, {
+                    "title": " ".join(rng.sample(WORDS, 2)),
+                    "tags": set(rng.sample(TAGS, 2)),
+                    "featured": rng.random() < 0.5,
+                })
+            elif library.delete_video(video_id):
+                library.add_video(_video(rng, 1000 + i))
+
+        for _ in range(300):
+            filters = _random_filters(rng)
+            assert library.search_videos(**filters) == _scan_search(library, **filters), filters
+        assert library.get_all_tags() == set().union(*(v.tags for v in library.videos.values()))
+        for stage in DrillStage:
+            assert library.get_videos_by_stage(stage) == \
+                [v for v in library.videos.values() if v.drill_stage == stage]
+        assert library.get_videos_for_drill("drill_7") == \
+            [v for v in library.videos.values() if "drill_7" in v.drill_ids]
+
+    def test_sample_library(self):
+        library = VideoLibrary()
+        titles = [v.title for v in library.search_videos(query="hip rotation")]
+        assert titles == ["Hip-Only Rotation Drill", "Hip Rotation with Arm Hold - Integration"]
+        assert len(library.search_videos(tags={"foundation"})) == 7
+        assert library.search_videos(query="45°")[0].video_id == "vid_open_stance_45_001"
+
+        library.increment_view_count("vid_hip_rotation_arm_hold_002")
+        library.update_video("vid_hip_rotation_arm_hold_002", {"featured": True})
+        assert library.search_videos(query="hip rotation")[0].video_id == "vid_hip_rotation_arm_hold_002"
@@ -0,0 +1,313 @@
+"""
+Whop Membership Cache Tests
+TTL / negative / stale-while-revalidate caching, single-flight fetches,
+webhook invalidation and the async Whop client
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, Depends
+from fastapi.testclient import TestClient
+
+import whop_membership_cache
+import whop_webhooks
+from whop_integration import (
+    AsyncWhopClient, WhopAPIError, SubscriptionTier, WHOP_PRODUCTS, membership_from_data
+)
+from whop_membership_cache import MembershipCache, ERROR_RETRY_SECONDS
+from whop_middleware import get_current_user, require_tier
+
+PRO_PRODUCT = WHOP_PRODUCTS[SubscriptionTier.PRO]["id"]
+ULTIMATE_PRODUCT = WHOP_PRODUCTS[SubscriptionTier.ULTIMATE]["id"]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeWhop:
+    """Stands in for AsyncWhopClient.validate_membership"""
+
+    def __init__(self, delay=0.0):
+        self.memberships = {}
+        self.calls = 0
+        self.delay = delay
+        self.fail = False
+
+    def set(self, membership_id, product_id=PRO_PRODUCT, status="active"):
+        self.memberships[membership_id] = membership_from_data(membership_id, {
+            "user_id": "user_1", "product_id": product_id, "status": status
+        })
+
+    async def __call__(self, membership_id):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise WhopAPIError("down")
+        return self.memberships.get(membership_id)
+
+
+def _cache(whop, clock, **kwargs):
+    return MembershipCache(fetcher=whop, ttl_seconds=60, negative_ttl_seconds=10,
+                           stale_seconds=600, clock=clock, **kwargs)
+
+
+class TestMembershipCache:
+    """Fresh, negative and stale entries"""
+
+    def test_ttl_and_negative_caching(self):
+        whop, clock = FakeWhop(), FakeClock()
+        whop.set("mem_1")
+        cache = _cache(whop, clock)
+
+        async def run():
+            assert (await cache.get_membership("mem_1")).tier == SubscriptionTier.PRO
+            await cache.get_membership("mem_1")
+            assert await cache.get_membership("missing") is None
+            assert await cache.get_membership("missing") is None
+            assert whop.calls == 2
+
+            clock.now += 11  # negative entry stale, refetched in the background
+            assert await cache.get_membership("missing") is None
+            await asyncio.sleep(0)
+            assert whop.calls == 3
+
+        asyncio.run(run())
+        assert cache.stats["hits"] == 2 and cache.stats["misses"] == 2
+
+    def test_stale_while_revalidate(self):
+        whop, clock = FakeWhop(delay=0.01), FakeClock()
+        whop.set("mem_1")
+        cache = _cache(whop, clock)
+
+        async def run():
+            await cache.get_membership("mem_1")
+            whop.set("mem_1", product_id=ULTIMATE_PRODUCT)
+            clock.now += 61
+
+            # Stale value returned immediately, one refresh in flight
+            started = time.perf_counter()
+            stale = await asyncio.gather(*[cache.get_membership("mem_1") for _ in range(20)])
+            assert time.perf_counter() - started < 0.01
+            assert {m.tier for m in stale} == {SubscriptionTier.PRO}
+            await asyncio.sleep(0.05)
+            assert whop.calls == 2
+            assert (await cache.get_membership("mem_1")).tier == SubscriptionTier.ULTIMATE
+
+            clock.now += 61 + 600  # beyond the stale window: blocking refetch
+            assert (await cache.get_membership("mem_1")).tier == SubscriptionTier.ULTIMATE
+            assert whop.calls == 3
+
+        asyncio.run(run())
+
+    def test_single_flight_misses(self):
+        whop, clock = FakeWhop(delay=0.01), FakeClock()
+        whop.set("mem_1")
+        cache = _cache(whop, clock)
+
+        async def run():
+            results = await asyncio.gather(*[cache.get_membership("mem_1") for _ in range(50)])
+            assert len({id(m) for m in results}) == 1
+
+        asyncio.run(run())
+        assert whop.calls == 1
+
+    def test_whop_outage(self):
+        whop, clock = FakeWhop(), FakeClock()
+        whop.set("mem_1")
+        cache = _cache(whop, clock)
+
+        async def run():
+            await cache.get_membership("mem_1")
+            whop.fail = True
+            clock.now += 61
+            await cache.get_membership("mem_1")
+            await asyncio.sleep(0)
+            # Still served from cache, retried only after the back-off
+            assert (await cache.get_membership("mem_1")).valid
+            assert whop.calls == 2
+            assert await cache.get_membership("other") is None
+            assert await cache.get_membership("other") is None
+            assert whop.calls == 3
+            clock.now += ERROR_RETRY_SECONDS + 1
+            whop.fail = False
+            assert (await cache.get_membership("mem_1")).valid
+
+        asyncio.run(run())
+        assert cache.stats["errors"] == 2
+
+    def test_max_entries(self):
+        whop, clock = FakeWhop(), FakeClock()
+        cache = _cache(whop, clock, max_entries=3)
+
+        async def run():
+            for i in range(5):
+                await cache.get_membership(f"mem_{i}")
+
+        asyncio.run(run())
+        assert len(cache) == 3 and cache.peek("mem_0") is None
+
+
+class TestWebhookInvalidation:
+    """Membership events update or drop cached entries"""
+
+    def test_apply_webhook(self):
+        whop, clock = FakeWhop(), FakeClock()
+        whop.set("mem_1")
+        cache = _cache(whop, clock)
+
+        async def run():
+            await cache.get_membership("mem_1")
+            cache.apply_webhook("membership.updated", {
+                "id": "mem_1", "user_id": "user_1", "product_id": ULTIMATE_PRODUCT, "status": "active"
+            }, verified=True)
+            assert (await cache.get_membership("mem_1")).tier == SubscriptionTier.ULTIMATE
+
+            cache.apply_webhook("membership.deleted", {"id": "mem_1", "user_id": "user_1"}, verified=True)
+            assert not (await cache.get_membership("mem_1")).valid
+
+            cache.apply_webhook("membership.updated", {"id": "mem_1", "status": "past_due"}, verified=True)  # partial
+            assert cache.peek("mem_1") is None
+            assert (await cache.get_membership("mem_1")).tier == SubscriptionTier.PRO
+            assert whop.calls == 2
+
+            # Unsigned payloads never write through, they only make Whop decide
+            cache.apply_webhook("membership.updated", {
+                "id": "mem_1", "user_id": "user_1", "product_id": ULTIMATE_PRODUCT, "status": "active"
+            })
+            assert cache.peek("mem_1") is None
+            assert (await cache.get_membership("mem_1")).tier == SubscriptionTier.PRO
+            assert whop.calls == 3
+
+            assert not cache.apply_webhook("membership.updated", {}, verified=True)
+
+        asyncio.run(run())
+
+    def test_webhook_wins_over_inflight_fetch(self):
+        whop, clock = FakeWhop(delay=0.02), FakeClock()
+        whop.set("mem_1")  # Whop still returns PRO
+        cache = _cache(whop, clock)
+
+        async def run():
+            fetch = asyncio.ensure_future(cache.get_membership("mem_1"))
+            await asyncio.sleep(0.005)
+            cache.apply_webhook("membership.created", {
+                "id": "mem_1", "user_id": "user_1", "product_id": ULTIMATE_PRODUCT, "status": "active"
+            }, verified=True)
+            assert (await fetch).tier == SubscriptionTier.ULTIMATE
+            assert cache.peek("mem_1").tier == SubscriptionTier.ULTIMATE
+
+        asyncio.run(run())
+
+    def test_webhook_endpoint_updates_gating(self, monkeypatch):
+        whop = FakeWhop()
+        whop.set("mem_1")
+        monkeypatch.setattr(whop_membership_cache, "_membership_cache", _cache(whop, FakeClock()))
+
+        app = FastAPI()
+        app.include_router(whop_webhooks.router)
+
+        @app.get("/ultimate")
+        @require_tier(SubscriptionTier.ULTIMATE)
+        async def ultimate(user: dict = Depends(get_current_user)):
+            return {"tier": user["tier"].value}
+
+        client = TestClient(app)
+        headers = {"X-User-Id": "user_1", "X-Membership-Id": "mem_1"}
+        assert client.get("/ultimate", headers=headers).status_code == 403
+
+        body = json.dumps({"type": "membership.updated", "data": {
+            "id": "mem_1", "user_id": "user_1", "product_id": ULTIMATE_PRODUCT, "status": "active"
+        }}).encode()
+        signature = hmac.new(b"whsec_test", body, hashlib.sha256).hexdigest()
+
+        # No secret configured: the event is not trusted, Whop still says PRO
+        assert client.post("/webhooks/whop", content=body).status_code == 200
+        assert client.get("/ultimate", headers=headers).status_code == 403
+        assert whop.calls == 2
+
+        monkeypatch.setattr(whop_webhooks, "WHOP_WEBHOOK_SECRET", "whsec_test")
+        assert client.post("/webhooks/whop", content=body).status_code == 401
+        assert client.post("/webhooks/whop", content=body, headers={"X-Whop-Signature": "0" * 64}).status_code == 401
+        assert client.post("/webhooks/whop", content=body, headers={"X-Whop-Signature": signature}).status_code == 200
+        assert client.get("/ultimate", headers=headers).json() == {"tier": "ultimate"}
+        assert whop.calls == 2
+
+    def test_forged_membership_gets_no_tier(self, monkeypatch):
+        whop = FakeWhop()  # Whop knows no membership "forged"
+        monkeypatch.setattr(whop_membership_cache, "_membership_cache", _cache(whop, FakeClock()))
+
+        app = FastAPI()
+        app.include_router(whop_webhooks.router)
+
+        @app.get("/ultimate")
+        @require_tier(SubscriptionTier.ULTIMATE)
+        async def ultimate(user: dict = Depends(get_current_user)):
+            return {"tier": user["tier"].value}
+
+        client = TestClient(app)
+        client.post("/webhooks/whop", json={"type": "membership.created", "data": {
+            "id": "forged", "product_id": ULTIMATE_PRODUCT, "status": "active"
+        }})
+        assert client.get("/ultimate", headers={"X-User-Id": "x", "X-Membership-Id": "forged"}).status_code == 403
+
+    def test_cached_user_lookup_is_microseconds(self, monkeypatch):
+        whop = FakeWhop()
+        whop.set("mem_1")
+        monkeypatch.setattr(whop_membership_cache, "_membership_cache", _cache(whop, FakeClock()))
+
+        async def run(n):
+            await get_current_user(x_user_id="user_1", x_membership_id="mem_1")
+            started = time.perf_counter()
+            for _ in range(n):
+                user = await get_current_user(x_user_id="user_1", x_membership_id="mem_1")
+            return (time.perf_counter() - started) / n, user
+
+        per_call, user = asyncio.run(run(20000))
+        print(f"\n📊 cached get_current_user: {per_call * 1e6:.2f} µs")
+        assert user["tier"] == SubscriptionTier.PRO
+        assert per_call < 50e-6
+        assert whop.calls == 1
+
+
+class TestAsyncWhopClient:
+    """One pooled httpx client; 4xx is 'no membership', 5xx/network is an error"""
+
+    def test_responses(self):
+        def handler(request):
+            membership_id = request.url.path.rsplit("/", 1)[-1]
+            if membership_id == "mem_1":
+                return httpx.Response(200, json={
+                    "id": "mem_1", "user_id": "user_1", "product_id": PRO_PRODUCT,
+                    "status": "active", "expires_at": "2026-01-01T00:00:00Z"
+                })
+            if membership_id == "boom":
+                return httpx.Response(503)
+            return httpx.Response(404)
+
+        client = AsyncWhopClient(transport=httpx.MockTransport(handler))
+
+        async def run():
+            membership = await client.validate_membership("mem_1")
+            http_client = client._client
+            assert await client.validate_membership("missing") is None
+            assert client._client is http_client  # connection pool reused
+            with pytest.raises(WhopAPIError):
+                await client.validate_membership("boom")
+            await client.aclose()
+            return membership
+
+        membership = asyncio.run(run())
+        assert membership.tier == SubscriptionTier.PRO and membership.valid
+        assert membership.expires_at.year == 2026
@@ -0,0 +1,404 @@
+"""
+Usage Metering
+==============
+
+Durable usage counters per user, usage type and billing period, backed by
+the `usage_counters` table.
+
+- try_consume() is the limit check: one conditional
+  UPDATE ... SET count = count + n WHERE count + n <= limit RETURNING count.
+  The database serializes it, so concurrent uploads from the same user
+  across uvicorn workers can never overshoot the limit
+- record() is for unmetered usage (unlimited tiers, sessions, videos):
+  increments are coalesced in memory and written behind in one upsert
+  per flush
+- rollup() loads every counter of a period into a snapshot that
+  usage_summary() (and SubscriptionManager.get_usage_stats) read from
+- start() runs the flushes and rollup_if_due() in a daemon thread, so
+  record() never writes to the database on the caller's thread (the
+  shared get_usage_meter() is started)
+
+Works on PostgreSQL and SQLite (>= 3.35 for RETURNING).
+
+Usage:
+    from usage_metering import get_usage_meter
+
+    result = get_usage_meter().try_consume(user_id, "swings", limit=10)
+    if not result.allowed:
+        ...  # 429
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import UsageCounter
+
+logger = logging.getLogger(__name__)
+
+UNLIMITED = -1
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+DEFAULT_MAX_PENDING = 500            # Flush early once this many counters are dirty
+DEFAULT_ROLLUP_MAX_AGE_SECONDS = 60.0
+
+CounterKey = Tuple[str, str, datetime]  # (user_id, usage_type, period_start)
+
+_counters = UsageCounter.__table__
+
+
+def current_period_start(now: Optional[datetime] = None) -> datetime:
+    """Start of the calendar-month billing period containing `now` (UTC)"""
+    now = now or datetime.utcnow()
+    return datetime(now.year, now.month, 1)
+
+
+def _dialect_insert(dialect_name: str):
+    """INSERT construct with ON CONFLICT support, if the dialect has one"""
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+        return insert
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+        return insert
+    return None
+
+
+@dataclass
+class MeterResult:
+    """Outcome of a check-and-increment"""
+    allowed: bool
+    used: int   # Count after the increment (or the current count if refused)
+    limit: int  # -1 = unlimited
+
+    @property
+    def remaining(self) -> Optional[int]:
+        if self.limit == UNLIMITED:
+            return None
+        return max(0, self.limit - self.used)
+
+
+class UsageMeter:
+    """Atomic SQL counters with a write-behind batcher and period rollups"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        rollup_max_age_seconds: float = DEFAULT_ROLLUP_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.session_factory = session_factory
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max_pending
+        self.rollup_max_age_seconds = rollup_max_age_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._pending: Dict[CounterKey, int] = {}
+        self._last_flush = clock()
+        self._rollup: Dict[str, Dict[str, int]] = {}  # user_id -> usage_type -> count
+        self._rollup_period: Optional[datetime] = None
+        self._rollup_at: Optional[float] = None
+        self._worker: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._stopping = False
+
+    # ========================================
+    # CHECK-AND-INCREMENT
+    # ========================================
+
+    def try_consume(self, user_id: str, usage_type: str = "swings", limit: int = UNLIMITED,
+                    amount: int = 1, period_start: Optional[datetime] = None) -> MeterResult:
+        """
+        Atomically add `amount` unless that would exceed `limit`
+
+        Args:
+            user_id: User ID
+            usage_type: 'swings', 'sessions', 'videos'
+            limit: Maximum per period (-1 = unlimited)
+            amount: Units to consume
+            period_start: Billing period (default: current calendar month)
+
+        Returns:
+            MeterResult; nothing is consumed when allowed is False
+        """
+        period_start = period_start or current_period_start()
+        key = (user_id, usage_type, period_start)
+        matches = (
+            (_counters.c.user_id == user_id) &
+            (_counters.c.usage_type == usage_type) &
+            (_counters.c.period_start == period_start)
+        )
+
+        with self.session_factory() as db:
+            self._ensure_counter(db, key)
+            statement = (
+                update(_counters)
+                .where(matches)
+                .values(count=_counters.c.count + amount, updated_at=datetime.utcnow())
+                .returning(_counters.c.count)
+            )
+            if limit != UNLIMITED:
+                statement = statement.where(_counters.c.count + amount <= limit)
+            used = db.execute(statement).scalar_one_or_none()
+            allowed = used is not None
+            if not allowed:
+                used = db.execute(select(_counters.c.count).where(matches)).scalar_one()
+            db.commit()
+
+        self._note_count(key, used)
+        if not allowed:
+            logger.info(f"🚫 {user_id} reached {usage_type} limit ({used}/{limit})")
+        return MeterResult(allowed=allowed, used=used, limit=limit)
+
+    def _ensure_counter(self, db: Session, key: CounterKey):
+        """Create the counter row at 0 if it does not exist yet"""
+        user_id, usage_type, period_start = key
+        values = dict(user_id=user_id, usage_type=usage_type, period_start=period_start,
+                      count=0, created_at=datetime.utcnow(), updated_at=datetime.utcnow())
+        insert = _dialect_insert(db.get_bind().dialect.name)
+        if insert is not None:
+            db.execute(insert(_counters).values(**values).on_conflict_do_nothing())
+            return
+        # Generic fallback: rely on the unique constraint
+        try:
+            with db.begin_nested():
+                db.execute(_counters.insert().values(**values))
+        except IntegrityError:
+            pass
+
+    # ========================================
+    # WRITE-BEHIND
+    # ========================================
+
+    def record(self, user_id: str, usage_type: str, amount: int = 1,
+               period_start: Optional[datetime] = None):
+        """
+        Count unmetered usage without a database round trip
+
+        Increments are coalesced per counter and written on the next
+        flush (every flush_interval_seconds, or once max_pending counters
+        are dirty). With the background worker running, a due flush is
+        handed to it; otherwise it runs here.
+        """
+        key = (user_id, usage_type, period_start or current_period_start())
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0) + amount
+            due = (len(self._pending) >= self.max_pending or
+                   self.clock() - self._last_flush >= self.flush_interval_seconds)
+        if due:
+            if self._worker is not None:
+                self._wake.set()
+            else:
+                self.flush()
+
+    def pending(self, user_id: str, usage_type: str, period_start: Optional[datetime] = None) -> int:
+        """Increments recorded here but not flushed yet"""
+        key = (user_id, usage_type, period_start or current_period_start())
+        with self._lock:
+            return self._pending.get(key, 0)
+
+    def flush(self) -> int:
+        """
+        Write all coalesced increments (one upsert for the batch)
+
+        Returns:
+            Number of counters written (0 if the write failed; the
+            increments stay pending)
+        """
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._last_flush = self.clock()
+        if not batch:
+            return 0
+
+        try:
+            with self.session_factory() as db:
+                self._upsert_increments(db, batch)
+                db.commit()
+        except Exception as e:
+            # Put the increments back so the next flush retries them
+            with self._lock:
+                for key, amount in batch.items():
+                    self._pending[key] = self._pending.get(key, 0) + amount
+            logger.error(f"❌ Usage flush failed ({len(batch)} counters): {e}")
+            return 0
+
+        with self._lock:
+            for key, amount in batch.items():
+                self._bump_rollup(key, amount)
+        logger.debug(f"💾 Flushed {len(batch)} usage counters")
+        return len(batch)
+
+    def _upsert_increments(self, db: Session, batch: Dict[CounterKey, int]):
+        now = datetime.utcnow()
+        rows = [
+            dict(user_id=user_id, usage_type=usage_type, period_start=period_start,
+                 count=amount, created_at=now, updated_at=now)
+            for (user_id, usage_type, period_start), amount in batch.items()
+        ]
+        insert = _dialect_insert(db.get_bind().dialect.name)
+        if insert is not None:
+            statement = insert(_counters)
+            statement = statement.on_conflict_do_update(
+                index_elements=["user_id", "usage_type", "period_start"],
+                set_={"count": _counters.c.count + statement.excluded.count,
+                      "updated_at": statement.excluded.updated_at}
+            )
+            db.execute(statement, rows)
+            return
+        for row in rows:
+            self._ensure_counter(db, (row["user_id"], row["usage_type"], row["period_start"]))
+            db.execute(
+                update(_counters)
+                .where((_counters.c.user_id == row["user_id"]) &
+                       (_counters.c.usage_type == row["usage_type"]) &
+                       (_counters.c.period_start == row["period_start"]))
+                .values(count=_counters.c.count + row["count"], updated_at=now)
+            )
+
+    def start(self) -> threading.Thread:
+        """
+        Flush and roll up the current period in a daemon thread, every
+        flush_interval_seconds (sooner when record() finds a flush due)
+        """
+        with self._lock:
+            if self._worker is None:
+                self._stopping = False
+                self._worker = threading.Thread(target=self._run_worker, name="usage-meter", daemon=True)
+                self._worker.start()
+            return self._worker
+
+    def _run_worker(self):
+        while not self._stopping:
+            self._wake.wait(self.flush_interval_seconds)
+            self._wake.clear()
+            if self._stopping:
+                break
+            try:
+                self.flush()
+                self.rollup_if_due()
+            except Exception as e:
+                logger.error(f"❌ Usage meter background run failed: {e}")
+
+    def close(self):
+        """Stop the background worker and flush outstanding increments (call on shutdown)"""
+        with self._lock:
+            worker, self._worker = self._worker, None
+            self._stopping = True
+        if worker is not None:
+            self._wake.set()
+            worker.join(timeout=self.flush_interval_seconds + 5)
+        self.flush()
+
+    # ========================================
+    # READS & ROLLUPS
+    # ========================================
+
+    def rollup(self, period_start: Optional[datetime] = None) -> int:
+        """
+        Flush, then load every counter of a period into the snapshot
+
+        Returns:
+            Number of users in the period
+        """
+        period_start = period_start or current_period_start()
+        self.flush()
+        with self.session_factory() as db:
+            rows = db.execute(
+                select(_counters.c.user_id, _counters.c.usage_type, _counters.c.count)
+                .where(_counters.c.period_start == period_start)
+            ).all()
+
+        snapshot: Dict[str, Dict[str, int]] = {}
+        for user_id, usage_type, count in rows:
+            snapshot.setdefault(user_id, {})[usage_type] = count
+        with self._lock:
+            self._rollup = snapshot
+            self._rollup_period = period_start
+            self._rollup_at = self.clock()
+        logger.info(f"📊 Usage rollup: {len(snapshot)} users for {period_start:%Y-%m}")
+        return len(snapshot)
+
+    def rollup_if_due(self, period_start: Optional[datetime] = None) -> bool:
+        """Periodic hook: roll up only when the snapshot is older than rollup_max_age_seconds"""
+        period_start = period_start or current_period_start()
+        if self._rollup_fresh(period_start):
+            return False
+        self.rollup(period_start)
+        return True
+
+    def usage_summary(self, user_id: str, period_start: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Counts by usage type for one user and period
+
+        Served from the rollup snapshot while it is fresh, otherwise read
+        from the database. Unflushed local increments are included.
+        """
+        period_start = period_start or current_period_start()
+        with self._lock:
+            counts = dict(self._rollup.get(user_id, {})) if self._rollup_fresh(period_start) else None
+            pending = {
+                usage_type: amount
+                for (pending_user, usage_type, pending_period), amount in self._pending.items()
+                if pending_user == user_id and pending_period == period_start
+            }
+
+        if counts is None:
+            with self.session_factory() as db:
+                counts = dict(db.execute(
+                    select(_counters.c.usage_type, _counters.c.count)
+                    .where((_counters.c.user_id == user_id) & (_counters.c.period_start == period_start))
+                ).all())
+
+        for usage_type, amount in pending.items():
+            counts[usage_type] = counts.get(usage_type, 0) + amount
+        return counts
+
+    def period_start(self, now: Optional[datetime] = None) -> datetime:
+        """Billing period counted when no period_start is given"""
+        return current_period_start(now)
+
+    def get_usage(self, user_id: str, usage_type: str = "swings",
+                  period_start: Optional[datetime] = None) -> int:
+        return self.usage_summary(user_id, period_start).get(usage_type, 0)
+
+    def _rollup_fresh(self, period_start: datetime) -> bool:
+        return (self._rollup_at is not None and self._rollup_period == period_start and
+                self.clock() - self._rollup_at < self.rollup_max_age_seconds)
+
+    def _note_count(self, key: CounterKey, count: int):
+        """Keep this worker's snapshot current with counts it just read"""
+        user_id, usage_type, period_start = key
+        with self._lock:
+            if self._rollup_period == period_start:
+                self._rollup.setdefault(user_id, {})[usage_type] = count
+
+    def _bump_rollup(self, key: CounterKey, amount: int):
+        user_id, usage_type, period_start = key
+        if self._rollup_period == period_start:
+            counts = self._rollup.setdefault(user_id, {})
+            counts[usage_type] = counts.get(usage_type, 0) + amount
+
+
+# Singleton instance
+_usage_meter: Optional[UsageMeter] = None
+
+
+def get_usage_meter() -> UsageMeter:
+    """Get singleton usage meter (on database.SessionLocal, background worker started)"""
+    global _usage_meter
+    if _usage_meter is None:
+        import atexit
+        from database import SessionLocal
+        _usage_meter = UsageMeter(SessionLocal)
+        _usage_meter.start()
+        atexit.register(_usage_meter.close)
+    return _usage_meter
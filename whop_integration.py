@@ -8,7 +8,8 @@ Features:
 - Subscription tier management (Free/Pro/Premium/Ultimate)
 - Webhook handling for membership events
 - Feature access control
-- User membership validation
+- User membership validation (sync client, and an async client with
+  connection reuse for request-path lookups)
 
 Author: Builder 2
 Date: 2024-12-25
@@ -16,11 +17,16 @@ Date: 2024-12-25
 
 import os
 import requests
-from typing import Dict, Optional, List
+from typing import TYPE_CHECKING, Dict, FrozenSet, Optional, List
 from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime
 
+from stage_metrics import timed
+
+if TYPE_CHECKING:
+    import httpx  # imported when an AsyncWhopClient is created (keeps cold start light)
+
 
 # Whop API Configuration
 WHOP_API_KEY = os.getenv(
@@ -99,6 +105,14 @@ WHOP_PRODUCTS = {
     }
 }
 
+# Precomputed lookups for request-path tier checks
+TIER_FEATURES: Dict[SubscriptionTier, FrozenSet[str]] = {
+    tier: frozenset(config["features"]) for tier, config in WHOP_PRODUCTS.items()
+}
+PRODUCT_TIERS: Dict[str, SubscriptionTier] = {
+    config["id"]: tier for tier, config in WHOP_PRODUCTS.items()
+}
+
 # Seasonal Products
 WHOP_SEASONAL_PRODUCTS = {
     "in_person_assessment": {
@@ -128,6 +142,46 @@ class WhopMembership:
     expires_at: Optional[datetime] = None
 
 
+def membership_from_data(membership_id: str, membership_data: Dict) -> WhopMembership:
+    """
+    Build a WhopMembership from a Whop API / webhook membership payload
+    
+    Args:
+        membership_id: Whop membership ID
+        membership_data: Membership JSON (product_id, status, user_id, expires_at)
+        
+    Returns:
+        WhopMembership (tier FREE for unknown products, valid only when active)
+    """
+    product_id = membership_data.get("product_id")
+    status = membership_data.get("status")
+    
+    # Parse expiration date
+    expires_at = None
+    if membership_data.get("expires_at"):
+        try:
+            expires_at = datetime.fromisoformat(
+                membership_data["expires_at"].replace("Z", "+00:00")
+            )
+        except (AttributeError, ValueError):
+            pass
+    
+    return WhopMembership(
+        membership_id=membership_id,
+        user_id=membership_data.get("user_id"),
+        product_id=product_id,
+        status=status,
+        tier=PRODUCT_TIERS.get(product_id, SubscriptionTier.FREE),
+        valid=status == "active",
+        expires_at=expires_at
+    )
+
+
+class WhopAPIError(Exception):
+    """Whop API unreachable or returned a server error"""
+    pass
+
+
 class WhopClient:
     """
     Whop API Client
@@ -158,11 +212,12 @@ class WhopClient:
             Membership data or None
         """
         try:
-            response = requests.get(
-                f"{self.base_url}/memberships/{membership_id}",
-                headers=self.headers,
-                timeout=10
-            )
+            with timed("http.whop"):
+                response = requests.get(
+                    f"{self.base_url}/memberships/{membership_id}",
+                    headers=self.headers,
+                    timeout=10
+                )
             
             if response.status_code == 200:
                 return response.json()
@@ -218,45 +273,12 @@ class WhopClient:
         if not membership_data:
             return None
         
-        # Extract key fields
-        product_id = membership_data.get("product_id")
-        status = membership_data.get("status")
-        user_id = membership_data.get("user_id")
-        
-        # Determine tier from product ID
-        tier = self._get_tier_from_product_id(product_id)
-        
-        # Check if membership is valid
-        valid = status == "active"
-        
-        # Parse expiration date
-        expires_at = None
-        if "expires_at" in membership_data:
-            try:
-                expires_at = datetime.fromisoformat(
-                    membership_data["expires_at"].replace("Z", "+00:00")
-                )
-            except:
-                pass
-        
-        return WhopMembership(
-            membership_id=membership_id,
-            user_id=user_id,
-            product_id=product_id,
-            status=status,
-            tier=tier,
-            valid=valid,
-            expires_at=expires_at
-        )
+        return membership_from_data(membership_id, membership_data)
     
     def _get_tier_from_product_id(self, product_id: str) -> SubscriptionTier:
         """Map product ID to subscription tier"""
-        for tier, config in WHOP_PRODUCTS.items():
-            if config["id"] == product_id:
-                return tier
-        
         # Default to FREE if product not found
-        return SubscriptionTier.FREE
+        return PRODUCT_TIERS.get(product_id, SubscriptionTier.FREE)
     
     def check_feature_access(
         self, 
@@ -273,11 +295,8 @@ class WhopClient:
         Returns:
             True if user has access, False otherwise
         """
-        if tier not in WHOP_PRODUCTS:
-            return False
-        
-        features = WHOP_PRODUCTS[tier]["features"]
-        return feature in features
+        features = TIER_FEATURES.get(tier)
+        return features is not None and feature in features
     
     def get_swing_limit(self, tier: SubscriptionTier) -> int:
         """
@@ -335,6 +354,88 @@ class WhopClient:
             return None
 
 
+class AsyncWhopClient:
+    """
+    Async Whop API client for lookups on the request path
+    
+    One httpx.AsyncClient (keep-alive connection pool) is shared by every
+    call, with a short timeout, so a membership lookup never blocks the
+    event loop and never pays for a new TLS handshake.
+    """
+    
+    def __init__(
+        self,
+        api_key: str = WHOP_API_KEY,
+        timeout: float = 5.0,
+        max_connections: int = 20,
+        transport: Optional["httpx.AsyncBaseTransport"] = None
+    ):
+        import httpx
+        
+        self.api_key = api_key
+        self.base_url = WHOP_API_BASE
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self.timeout = httpx.Timeout(timeout, connect=min(timeout, 2.0))
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections
+        )
+        self.transport = transport
+        self._client: Optional["httpx.AsyncClient"] = None
+    
+    def _get_client(self) -> "httpx.AsyncClient":
+        import httpx
+        
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=self.limits,
+                transport=self.transport
+            )
+        return self._client
+    
+    async def get_membership(self, membership_id: str) -> Optional[Dict]:
+        """
+        Get membership by ID
+        
+        Returns:
+            Membership data, or None if Whop says it does not exist (4xx)
+        
+        Raises:
+            WhopAPIError: network failure, timeout or 5xx (not cacheable as "no membership")
+        """
+        import httpx
+        
+        try:
+            with timed("http.whop"):
+                response = await self._get_client().get(f"/memberships/{membership_id}")
+        except httpx.HTTPError as e:
+            raise WhopAPIError(f"Error fetching membership: {e}") from e
+        
+        if response.status_code == 200:
+            return response.json()
+        if response.status_code >= 500 or response.status_code == 429:
+            raise WhopAPIError(f"Failed to get membership: {response.status_code}")
+        return None
+    
+    async def validate_membership(self, membership_id: str) -> Optional[WhopMembership]:
+        """Async validate_membership (raises WhopAPIError when Whop is unavailable)"""
+        membership_data = await self.get_membership(membership_id)
+        if not membership_data:
+            return None
+        return membership_from_data(membership_id, membership_data)
+    
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
 # Singleton instance
 _whop_client = None
 
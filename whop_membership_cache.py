@@ -0,0 +1,231 @@
+"""
+Whop Membership Cache
+=====================
+
+Keeps Whop membership lookups off the request path.
+
+- Fresh entries (TTL) are returned straight from memory
+- Unknown/invalid memberships are cached too (negative TTL), so a bad
+  X-Membership-Id header cannot hammer the Whop API
+- Expired entries inside the stale window are served immediately while
+  one background task revalidates them (stale-while-revalidate)
+- Concurrent misses for the same membership share one API call
+- whop_webhooks pushes membership.created/updated/deleted events in, so
+  tier changes apply without waiting for the TTL
+
+Usage:
+    from whop_membership_cache import get_membership_cache
+
+    membership = await get_membership_cache().get_membership(membership_id)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional
+
+from whop_integration import (
+    AsyncWhopClient,
+    WhopAPIError,
+    WhopMembership,
+    membership_from_data
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300          # Fresh membership
+DEFAULT_NEGATIVE_TTL_SECONDS = 60  # Membership not found
+DEFAULT_STALE_SECONDS = 3600       # Serve-stale window after the TTL
+ERROR_RETRY_SECONDS = 5            # Back-off after Whop was unreachable
+DEFAULT_MAX_ENTRIES = 100_000
+
+Fetcher = Callable[[str], Awaitable[Optional[WhopMembership]]]
+
+
+@dataclass
+class _CacheEntry:
+    membership: Optional[WhopMembership]  # None = negative entry
+    fresh_until: float
+    stale_until: float
+
+
+class MembershipCache:
+    """TTL + negative + stale-while-revalidate cache keyed by membership ID"""
+
+    def __init__(
+        self,
+        fetcher: Optional[Fetcher] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+        stale_seconds: float = DEFAULT_STALE_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if fetcher is None:
+            fetcher = AsyncWhopClient().validate_membership
+        self.fetcher = fetcher
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: Dict[str, _CacheEntry] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._generation: Dict[str, int] = {}  # bumped by webhooks/invalidation
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "fetches": 0, "errors": 0}
+
+    # ========================================
+    # LOOKUP
+    # ========================================
+
+    async def get_membership(self, membership_id: str) -> Optional[WhopMembership]:
+        """
+        Membership for an ID (None if Whop does not know it)
+
+        Fresh hit: no await on I/O. Stale hit: returned now, refreshed in
+        the background. Miss: one shared fetch per membership ID.
+        """
+        entry = self._entries.get(membership_id)
+        now = self.clock()
+        if entry is not None:
+            if now < entry.fresh_until:
+                self.stats["hits"] += 1
+                return entry.membership
+            if now < entry.stale_until:
+                self.stats["stale_hits"] += 1
+                self._refresh(membership_id)
+                return entry.membership
+
+        self.stats["misses"] += 1
+        return await self._refresh(membership_id)
+
+    def peek(self, membership_id: str) -> Optional[WhopMembership]:
+        """Cached membership if fresh or stale (never fetches)"""
+        entry = self._entries.get(membership_id)
+        if entry is not None and self.clock() < entry.stale_until:
+            return entry.membership
+        return None
+
+    def _refresh(self, membership_id: str) -> asyncio.Task:
+        """Start (or join) the single in-flight fetch for a membership"""
+        task = self._inflight.get(membership_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(membership_id))
+            self._inflight[membership_id] = task
+            task.add_done_callback(lambda done: self._forget_inflight(membership_id, done))
+        return task
+
+    def _forget_inflight(self, membership_id: str, task: asyncio.Task):
+        if self._inflight.get(membership_id) is task:
+            del self._inflight[membership_id]
+            self._generation.pop(membership_id, None)
+
+    async def _fetch(self, membership_id: str) -> Optional[WhopMembership]:
+        self.stats["fetches"] += 1
+        generation = self._generation.get(membership_id, 0)
+        try:
+            membership = await self.fetcher(membership_id)
+        except WhopAPIError as e:
+            self.stats["errors"] += 1
+            entry = self._entries.get(membership_id)
+            now = self.clock()
+            if entry is not None and now < entry.stale_until:
+                # Keep serving the last known membership; retry shortly
+                entry.fresh_until = now + ERROR_RETRY_SECONDS
+                logger.warning(f"⚠️  Whop unavailable, serving cached membership {membership_id}: {e}")
+                return entry.membership
+            logger.warning(f"⚠️  Whop unavailable, no cached membership {membership_id}: {e}")
+            self._store(membership_id, None, ttl=ERROR_RETRY_SECONDS)
+            return None
+
+        if self._generation.get(membership_id, 0) != generation:
+            # A webhook landed while we were fetching; it is newer than our response
+            entry = self._entries.get(membership_id)
+            return entry.membership if entry is not None else membership
+
+        self._store(membership_id, membership)
+        return membership
+
+    def _store(self, membership_id: str, membership: Optional[WhopMembership],
+               ttl: Optional[float] = None):
+        if ttl is None:
+            ttl = self.ttl_seconds if membership is not None else self.negative_ttl_seconds
+        if membership_id not in self._entries and len(self._entries) >= self.max_entries:
+            # Evict the oldest insertion (dicts keep insertion order)
+            self._entries.pop(next(iter(self._entries)))
+        now = self.clock()
+        self._entries[membership_id] = _CacheEntry(
+            membership=membership,
+            fresh_until=now + ttl,
+            stale_until=now + ttl + self.stale_seconds
+        )
+
+    # ========================================
+    # INVALIDATION
+    # ========================================
+
+    def put(self, membership: WhopMembership):
+        """Store a membership we already know is current (e.g. from a webhook)"""
+        self._bump(membership.membership_id)
+        self._store(membership.membership_id, membership)
+
+    def invalidate(self, membership_id: str):
+        """Drop a membership; the next request fetches it again"""
+        self._bump(membership_id)
+        self._inflight.pop(membership_id, None)
+        self._entries.pop(membership_id, None)
+
+    def clear(self):
+        for membership_id in list(self._inflight):
+            self._bump(membership_id)
+        self._entries.clear()
+
+    def _bump(self, membership_id: str):
+        """Fetches already in flight must not overwrite newer data"""
+        if membership_id in self._inflight:
+            self._generation[membership_id] = self._generation.get(membership_id, 0) + 1
+
+    def apply_webhook(self, event_type: str, data: Dict, verified: bool = False) -> bool:
+        """
+        Apply a Whop membership webhook
+
+        Only events with a verified signature are written through:
+        membership.created / membership.updated carrying product_id and
+        status are stored as sent, membership.deleted stores the
+        membership as canceled (FREE). Anything else (unverified events,
+        partial payloads, payment events) invalidates, so the next
+        request asks the Whop API.
+
+        Returns:
+            True if the event touched a membership
+        """
+        membership_id = data.get("id") or data.get("membership_id")
+        if not membership_id:
+            return False
+
+        if not verified:
+            self.invalidate(membership_id)
+        elif event_type in ("membership.created", "membership.updated") and \
+                "product_id" in data and "status" in data:
+            self.put(membership_from_data(membership_id, data))
+        elif event_type == "membership.deleted":
+            self.put(membership_from_data(membership_id, {**data, "status": "canceled"}))
+        else:
+            self.invalidate(membership_id)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Singleton instance
+_membership_cache: Optional[MembershipCache] = None
+
+
+def get_membership_cache() -> MembershipCache:
+    """Get singleton membership cache"""
+    global _membership_cache
+    if _membership_cache is None:
+        _membership_cache = MembershipCache()
+    return _membership_cache
@@ -4,6 +4,11 @@ Whop Feature Gate Middleware
 
 Middleware for protecting API endpoints based on subscription tier.
 
+Memberships are resolved through whop_membership_cache (TTL, negative
+caching, stale-while-revalidate, webhook invalidation), so a cache hit
+never touches the Whop API. Swing limits are enforced by usage_metering
+(atomic per-period counters in the database).
+
 Usage:
     @app.post("/api/endpoint")
     @require_feature("ai_coach")
@@ -15,6 +20,7 @@ Date: 2024-12-25
 """
 
 from fastapi import HTTPException, Depends, Header
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional, Callable
 from functools import wraps
 
@@ -22,8 +28,19 @@ from whop_integration import (
     get_whop_client, 
     SubscriptionTier, 
     WHOP_PRODUCTS,
+    TIER_FEATURES,
     WhopMembership
 )
+from whop_membership_cache import get_membership_cache
+from usage_metering import get_usage_meter
+
+# Tier hierarchy
+TIER_LEVELS = {
+    SubscriptionTier.FREE: 0,
+    SubscriptionTier.PRO: 1,
+    SubscriptionTier.PREMIUM: 2,
+    SubscriptionTier.ULTIMATE: 3
+}
 
 
 # ============================================================================
@@ -58,8 +75,7 @@ async def get_current_user(
     
     # Validate membership if provided
     if x_membership_id:
-        client = get_whop_client()
-        membership = client.validate_membership(x_membership_id)
+        membership = await get_membership_cache().get_membership(x_membership_id)
         
         if membership and membership.valid:
             return {
@@ -100,10 +116,9 @@ def require_feature(feature: str):
         @wraps(func)
         async def wrapper(*args, user: dict = Depends(get_current_user), **kwargs):
             # Check feature access
-            client = get_whop_client()
             tier = user.get("tier", SubscriptionTier.FREE)
             
-            if not client.check_feature_access(tier, feature):
+            if feature not in TIER_FEATURES.get(tier, ()):
                 raise HTTPException(
                     status_code=403,
                     detail={
@@ -132,20 +147,14 @@ def require_tier(min_tier: SubscriptionTier):
     Raises:
         HTTPException 403 if user's tier is below minimum
     """
-    # Tier hierarchy
-    tier_levels = {
-        SubscriptionTier.FREE: 0,
-        SubscriptionTier.PRO: 1,
-        SubscriptionTier.PREMIUM: 2,
-        SubscriptionTier.ULTIMATE: 3
-    }
+    required_level = TIER_LEVELS.get(min_tier, 0)
     
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, user: dict = Depends(get_current_user), **kwargs):
             user_tier = user.get("tier", SubscriptionTier.FREE)
             
-            if tier_levels.get(user_tier, 0) < tier_levels.get(min_tier, 0):
+            if TIER_LEVELS.get(user_tier, 0) < required_level:
                 raise HTTPException(
                     status_code=403,
                     detail={
@@ -175,29 +184,32 @@ def check_swing_limit(func: Callable):
         client = get_whop_client()
         
         swing_limit = client.get_swing_limit(tier)
+        meter = get_usage_meter()
         
-        # -1 means unlimited
+        # -1 means unlimited: count the swing without a database round trip
+        # (the meter's background worker writes it; record() never flushes
+        # on the event loop)
         if swing_limit == -1:
+            meter.record(user.get("user_id"), "swings")
             return await func(*args, user=user, **kwargs)
         
-        # Check usage (this would come from database)
-        swings_used = _get_swings_used(user.get("user_id"))
+        # Atomic check-and-increment, correct across workers
+        result = await run_in_threadpool(
+            meter.try_consume, user.get("user_id"), "swings", swing_limit
+        )
         
-        if swings_used >= swing_limit:
+        if not result.allowed:
             raise HTTPException(
                 status_code=429,
                 detail={
                     "error": "swing_limit_exceeded",
                     "message": f"You've used all {swing_limit} swings on your {tier.value} plan",
-                    "swings_used": swings_used,
+                    "swings_used": result.used,
                     "swing_limit": swing_limit,
                     "upgrade_message": "Upgrade to Pro for unlimited swings!"
                 }
             )
         
-        # Increment usage (this would update database)
-        _increment_swings_used(user.get("user_id"))
-        
         return await func(*args, user=user, **kwargs)
     
     return wrapper
@@ -216,16 +228,9 @@ def _get_tiers_with_feature(feature: str) -> list:
     return tiers
 
 
-# In-memory swing usage tracking (replace with database)
-_swing_usage = {}
-
 def _get_swings_used(user_id: str) -> int:
-    """Get number of swings used by user this month"""
-    return _swing_usage.get(user_id, 0)
-
-def _increment_swings_used(user_id: str):
-    """Increment swing count for user"""
-    _swing_usage[user_id] = _swing_usage.get(user_id, 0) + 1
+    """Get number of swings used by user this billing period"""
+    return get_usage_meter().get_usage(user_id, "swings")
 
 
 # ============================================================================
@@ -237,6 +242,18 @@ from fastapi import APIRouter
 router = APIRouter(prefix="/api/subscription", tags=["Subscription"])
 
 
+@router.on_event("startup")
+def start_usage_meter():
+    """Start the usage meter's background flushes and period rollups"""
+    get_usage_meter()
+
+
+@router.on_event("shutdown")
+def stop_usage_meter():
+    """Write outstanding usage increments"""
+    get_usage_meter().close()
+
+
 @router.get("/status")
 async def get_subscription_status(user: dict = Depends(get_current_user)):
     """Get user's subscription status and usage"""
@@ -244,7 +261,7 @@ async def get_subscription_status(user: dict = Depends(get_current_user)):
     client = get_whop_client()
     
     swing_limit = client.get_swing_limit(tier)
-    swings_used = _get_swings_used(user.get("user_id"))
+    swings_used = await run_in_threadpool(_get_swings_used, user.get("user_id"))
     
     # Get available features
     features = WHOP_PRODUCTS[tier]["features"]
@@ -20,13 +20,18 @@ from typing import Optional
 import hmac
 import hashlib
 import json
+import os
 from datetime import datetime
 
 from whop_integration import get_whop_client, SubscriptionTier, WHOP_PRODUCTS
+from whop_membership_cache import get_membership_cache
 
 
 router = APIRouter(prefix="/webhooks", tags=["Whop Webhooks"])
 
+# Without a secret nothing is verified, and webhooks only invalidate cached memberships
+WHOP_WEBHOOK_SECRET = os.getenv("WHOP_WEBHOOK_SECRET", "")
+
 
 # In-memory user database (replace with actual database)
 # Format: {user_id: {membership_data}}
@@ -86,11 +91,12 @@ async def whop_webhook(
     # Get raw body for signature verification
     body = await request.body()
     
-    # Verify signature (skip in development)
-    webhook_secret = ""  # TODO: Set actual webhook secret
-    if webhook_secret and x_whop_signature:
-        if not verify_whop_signature(body, x_whop_signature, webhook_secret):
+    # Verify signature (skipped in development, when no secret is set)
+    verified = False
+    if WHOP_WEBHOOK_SECRET:
+        if not x_whop_signature or not verify_whop_signature(body, x_whop_signature, WHOP_WEBHOOK_SECRET):
             raise HTTPException(status_code=401, detail="Invalid signature")
+        verified = True
     
     # Parse JSON payload
     try:
@@ -104,6 +110,11 @@ async def whop_webhook(
     
     print(f"📬 Whop Webhook Received: {event_type}")
     
+    # Keep feature gating in sync before the handlers run; unverified
+    # payloads can only drop a cached membership, never grant a tier
+    if event_type and event_type.startswith("membership."):
+        get_membership_cache().apply_webhook(event_type, data, verified=verified)
+    
     # Handle different event types
     if event_type == "membership.created":
         await handle_membership_created(data)